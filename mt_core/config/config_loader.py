@@ -125,6 +125,7 @@ class ValidatorsConfig(BaseModel):
 
     min_for_consensus: int = 2
     required_percentage: float = 0.6
+    quorum_stake_weighted: bool = False  # Weigh quorum by stake instead of count
 
 
 class ConsensusConfig(BaseModel):
@@ -149,6 +150,49 @@ class ConsensusConfig(BaseModel):
     CONSENSUS_NUM_MINERS_TO_SELECT: int = 10
     CONSENSUS_MINIBATCH_SIZE: int = 5  # Send to 5 miners per batch
     CONSENSUS_BATCH_TIMEOUT: float = 30.0
+    CONSENSUS_MAX_INFLIGHT_BATCHES: int = 2  # Minibatches dispatched concurrently
+    CONSENSUS_TASK_BATCH_SIZE: int = 32  # Tasks/results per batched request (1 = no batching)
+    CONSENSUS_MAX_TASKS_PER_MINER: int = 4  # Tasks in flight on one miner (capped by its capacity)
+    CONSENSUS_TASKS_PER_MINER_PER_SLOT: int = 3  # Tasks one miner gets per slot if time allows
+    CONSENSUS_SCHEDULER_LATENCY_ALPHA: float = 0.3  # Weight of new samples in miner latency EWMA
+    CONSENSUS_MINER_BREAKER_FAILURES: int = 3  # Consecutive send failures that open a miner's breaker
+    CONSENSUS_MINER_BREAKER_RESET_SECONDS: float = 30.0  # Open breaker waits this long before a probe
+    CONSENSUS_SCORE_RETENTION_SLOTS: int = 8  # Slots kept in the score store
+    CONSENSUS_COORDINATION_BACKEND: str = "file"  # file | memory | network
+    CONSENSUS_ADAPTIVE_TIMING: bool = False  # Phase lengths from observed latencies
+    CONSENSUS_TIMING_EXECUTION_PERCENTILE: float = 0.95
+    CONSENSUS_TIMING_PHASE_PERCENTILE: float = 0.95
+    CONSENSUS_TIMING_MARGIN: float = 1.25
+    CONSENSUS_TIMING_MIN_SAMPLES: int = 20
+    CONSENSUS_EARLY_COMPLETION: bool = False  # Next slot starts once everyone is done
+    CONSENSUS_EARLY_COMPLETION_GRACE: float = 5.0
+    HTTP_POOL_MAX_CONNECTIONS: int = 100  # Shared outbound HTTP pool (all peers)
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_POOL_MAX_PER_HOST: int = 10  # Concurrent requests to one peer
+    HTTP_POOL_HTTP2: bool = True  # Used when the h2 package is installed
+    INGRESS_CONSENSUS_CONCURRENCY: int = 32  # Validator API lane for peer traffic
+    INGRESS_CONSENSUS_QUEUE: int = 256
+    INGRESS_PEER_RATE: float = 50.0  # Requests per second per peer address
+    INGRESS_PEER_BURST: int = 100
+    INGRESS_RESULTS_CONCURRENCY: int = 16  # Validator API lane for miner results
+    INGRESS_RESULTS_QUEUE: int = 512
+    INGRESS_MINER_RATE: float = 20.0  # Requests per second per miner address
+    INGRESS_MINER_BURST: int = 40
+    INGRESS_RETRY_AFTER: float = 1.0  # Seconds suggested by 429 answers for a full lane
+    CONSENSUS_BINARY_SCORES: bool = True  # Binary score broadcasts to peers that accept them
+    CONSENSUS_SCORE_COMPRESSION: bool = True
+    SIGNATURE_VERIFY_BATCH_SIZE: int = 64  # Signatures checked per worker call
+    SIGNATURE_VERIFY_CACHE_SIZE: int = 4096
+    SIGNATURE_VERIFY_WORKERS: int = 2
+    REPLAY_FILTER_SIZE: int = 8192  # Recent P2P broadcasts remembered exactly
+    REPLAY_FILTER_BLOOM_CAPACITY: int = 0  # Older broadcasts per bloom generation (0 = off)
+    REPLAY_FILTER_BLOOM_ERROR_RATE: float = 0.001
+    CONSENSUS_SCORE_GOSSIP: bool = False  # Gossip score bundles instead of all-to-all
+    CONSENSUS_GOSSIP_FANOUT: int = 3
+    CONSENSUS_GOSSIP_REDUNDANCY: int = 2  # Overlay trees per slot
+    CONSENSUS_GOSSIP_FLUSH_INTERVAL: float = 0.05
+    CONSENSUS_SCORE_STREAMING: bool = False  # Stream score deltas per scored minibatch
     CONSENSUS_PARAM_BETA: float = 0.2
     CONSENSUS_PARAM_MAX_TIME_BONUS: int = 10
     max_performance_history_len: int = 100
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Adaptive Timing Module
+
+Phase lengths derived from observed latencies instead of fixed minutes:
+- LatencyHistogram: bounded-window histogram with percentile queries
+- TimingProposal: phase windows and batch timeout one validator proposes
+- AdaptiveTimingController: records per-miner and per-phase latencies and
+  turns them into a proposal; agree() merges the proposals of all
+  validators deterministically
+
+Validators publish their proposal with the metagraph_update announcement of a
+slot. At the start of slot s every validator merges the proposals announced
+for slot s - TIMING_AGREEMENT_LAG (complete by then) with a field-wise median,
+and the result takes effect from slot s + 1. Proposals never exceed the
+configured phase lengths, so the slot only shrinks when the network is fast.
+"""
+
+import bisect
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+TIMING_PROPOSAL_KEY = "timing_proposal"  # extra_data key in phase announcements
+ACTIVE_TIMING_KEY = "active_timing"
+TIMING_AGREEMENT_LAG = 2  # Proposals of slot s-2 decide the timing of slot s+1
+
+# Exponential buckets from 50ms to ~20min (upper bounds, seconds)
+DEFAULT_LATENCY_BUCKETS = tuple(round(0.05 * 1.25**i, 3) for i in range(58))
+
+
+class LatencyHistogram:
+    """
+    Histogram over the last `window` observations.
+
+    Recording is O(1); percentiles are answered from the bucket counts and
+    return the upper bound of the bucket holding the requested rank, which
+    errs on the generous side.
+    """
+
+    def __init__(
+        self,
+        bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        window: int = 512,
+    ):
+        self.bounds = tuple(bounds)
+        self.window = window
+        self._counts = [0] * (len(self.bounds) + 1)  # last bucket: overflow
+        self._recent: Deque[int] = deque()
+
+    def record(self, seconds: float):
+        index = bisect.bisect_left(self.bounds, max(0.0, seconds))
+        self._counts[index] += 1
+        self._recent.append(index)
+        if len(self._recent) > self.window:
+            self._counts[self._recent.popleft()] -= 1
+
+    @property
+    def count(self) -> int:
+        return len(self._recent)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Latency below which a fraction q of the observations fall.
+
+        Returns:
+            The bucket upper bound, or None without observations
+        """
+        if not self._recent:
+            return None
+        rank = max(1, math.ceil(q * len(self._recent)))
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return self.bounds[min(index, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+
+@dataclass(frozen=True)
+class TimingProposal:
+    """Phase lengths (seconds) and minibatch timeout for one slot."""
+
+    task_assignment_seconds: int
+    consensus_seconds: int
+    metagraph_update_seconds: int
+    batch_timeout_seconds: float
+
+    @property
+    def slot_duration_seconds(self) -> int:
+        return (
+            self.task_assignment_seconds
+            + self.consensus_seconds
+            + self.metagraph_update_seconds
+        )
+
+    @classmethod
+    def from_slot_config(cls, slot_config: Any, batch_timeout: float) -> "TimingProposal":
+        """Timing of a FlexibleSlotConfig."""
+        return cls(
+            task_assignment_seconds=int(slot_config.min_task_assignment_seconds),
+            consensus_seconds=int(slot_config.min_consensus_seconds),
+            metagraph_update_seconds=int(slot_config.min_metagraph_update_seconds),
+            batch_timeout_seconds=float(batch_timeout),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimingProposal":
+        """
+        Raises:
+            ValueError: If a field is missing, malformed or not positive
+        """
+        try:
+            proposal = cls(
+                task_assignment_seconds=int(data["task_assignment_seconds"]),
+                consensus_seconds=int(data["consensus_seconds"]),
+                metagraph_update_seconds=int(data["metagraph_update_seconds"]),
+                batch_timeout_seconds=float(data["batch_timeout_seconds"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid timing proposal: {e}")
+        if min(proposal.to_dict().values()) <= 0:
+            raise ValueError(f"Invalid timing proposal: non-positive field in {data}")
+        return proposal
+
+
+def collect_timing_proposals(announcements: Iterable[Any]) -> List[TimingProposal]:
+    """Timing proposals carried by phase announcements (malformed ones skipped)."""
+    proposals = []
+    for announcement in announcements:
+        data = announcement.extra_data.get(TIMING_PROPOSAL_KEY)
+        if not data:
+            continue
+        try:
+            proposals.append(TimingProposal.from_dict(data))
+        except ValueError as e:
+            logger.debug(f"Ignoring timing proposal from {announcement.validator_uid}: {e}")
+    return proposals
+
+
+class AdaptiveTimingController:
+    """
+    Turns observed latencies into a TimingProposal.
+
+    - batch timeout: the slowest miner's execution percentile (each miner with
+      enough samples), so slow but valid miners are not cut off; timeouts
+      are counted but not recorded as latencies, so dead miners do not
+      stretch the window
+    - task assignment window: `batch_rounds` batches plus the cutoff buffer
+    - consensus / metagraph windows: percentile of the observed phase time
+
+    Every value is multiplied by `margin`, rounded up to `quantum` seconds
+    and clamped between `floor` and `baseline` (the configured lengths).
+    """
+
+    def __init__(
+        self,
+        baseline: TimingProposal,
+        floor: Optional[TimingProposal] = None,
+        execution_percentile: float = 0.95,
+        phase_percentile: float = 0.95,
+        margin: float = 1.25,
+        min_samples: int = 20,
+        batch_rounds: int = 3,
+        cutoff_buffer: float = 12.0,
+        quantum: int = 5,
+        min_proposals: int = 2,
+    ):
+        self.baseline = baseline
+        self.floor = floor or TimingProposal(
+            task_assignment_seconds=min(30, baseline.task_assignment_seconds),
+            consensus_seconds=min(10, baseline.consensus_seconds),
+            metagraph_update_seconds=min(10, baseline.metagraph_update_seconds),
+            batch_timeout_seconds=min(5.0, baseline.batch_timeout_seconds),
+        )
+        self.execution_percentile = execution_percentile
+        self.phase_percentile = phase_percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.batch_rounds = batch_rounds
+        self.cutoff_buffer = cutoff_buffer
+        self.quantum = quantum
+        self.min_proposals = min_proposals
+
+        self.active = baseline  # Timing currently in effect
+        self.miner_latency: Dict[str, LatencyHistogram] = {}
+        self.all_latency = LatencyHistogram()
+        self.phase_latency: Dict[str, LatencyHistogram] = {}
+        self.miner_timeouts: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(
+        cls, settings: Any, slot_config: Any, batch_timeout: float
+    ) -> "AdaptiveTimingController":
+        """Controller whose baseline is the configured slot timing."""
+        return cls(
+            TimingProposal.from_slot_config(slot_config, batch_timeout),
+            execution_percentile=getattr(
+                settings, "CONSENSUS_TIMING_EXECUTION_PERCENTILE", 0.95
+            ),
+            phase_percentile=getattr(settings, "CONSENSUS_TIMING_PHASE_PERCENTILE", 0.95),
+            margin=getattr(settings, "CONSENSUS_TIMING_MARGIN", 1.25),
+            min_samples=getattr(settings, "CONSENSUS_TIMING_MIN_SAMPLES", 20),
+        )
+
+    # === Observations ===
+
+    def record_miner_latency(self, miner_uid: str, seconds: float):
+        """Time from sending a task to receiving its result."""
+        self.miner_latency.setdefault(miner_uid, LatencyHistogram()).record(seconds)
+        self.all_latency.record(seconds)
+
+    def record_timeout(self, miner_uid: str):
+        self.miner_timeouts[miner_uid] = self.miner_timeouts.get(miner_uid, 0) + 1
+
+    def record_phase(self, phase: str, seconds: float):
+        """Time a phase handler actually needed."""
+        self.phase_latency.setdefault(phase, LatencyHistogram()).record(seconds)
+
+    # === Proposal ===
+
+    def _fit(
+        self,
+        value: Optional[float],
+        lower: float,
+        upper: float,
+        margin: Optional[float] = None,
+    ) -> float:
+        if value is None:
+            return upper
+        margin = self.margin if margin is None else margin
+        value = math.ceil(value * margin / self.quantum) * self.quantum
+        return float(min(upper, max(lower, value)))
+
+    def _execution_latency(self) -> Optional[float]:
+        per_miner = [
+            histogram.percentile(self.execution_percentile)
+            for histogram in self.miner_latency.values()
+            if histogram.count >= self.min_samples
+        ]
+        if per_miner:
+            return max(per_miner)
+        if self.all_latency.count >= self.min_samples:
+            return self.all_latency.percentile(self.execution_percentile)
+        return None
+
+    def _phase_latency(self, phase: str) -> Optional[float]:
+        histogram = self.phase_latency.get(phase)
+        if histogram is None or histogram.count < max(1, self.min_samples // 4):
+            return None
+        return histogram.percentile(self.phase_percentile)
+
+    def propose(self) -> TimingProposal:
+        """Timing this validator would like, from its own observations."""
+        execution = self._execution_latency()
+        batch_timeout = self._fit(
+            execution,
+            self.floor.batch_timeout_seconds,
+            self.baseline.batch_timeout_seconds,
+        )
+        task_window = None
+        if execution is not None:
+            task_window = self.batch_rounds * batch_timeout + self.cutoff_buffer
+        return TimingProposal(
+            task_assignment_seconds=int(
+                self._fit(
+                    task_window,
+                    self.floor.task_assignment_seconds,
+                    self.baseline.task_assignment_seconds,
+                    margin=1.0,  # The batch timeout already has its margin
+                )
+            ),
+            consensus_seconds=int(
+                self._fit(
+                    self._phase_latency("consensus_scoring"),
+                    self.floor.consensus_seconds,
+                    self.baseline.consensus_seconds,
+                )
+            ),
+            metagraph_update_seconds=int(
+                self._fit(
+                    self._phase_latency("metagraph_update"),
+                    self.floor.metagraph_update_seconds,
+                    self.baseline.metagraph_update_seconds,
+                )
+            ),
+            batch_timeout_seconds=batch_timeout,
+        )
+
+    def agree(self, proposals: Iterable[TimingProposal]) -> Optional[TimingProposal]:
+        """
+        Merge the proposals of several validators.
+
+        Each field is the upper median of the proposed values, clamped to
+        [floor, baseline]. The result does not depend on the order in which
+        proposals were received, so validators that saw the same proposals
+        pick the same timing.
+
+        Returns:
+            The agreed timing, or None with fewer than min_proposals
+        """
+        proposals = list(proposals)
+        if len(proposals) < self.min_proposals:
+            return None
+
+        def median(name: str):
+            values = sorted(getattr(p, name) for p in proposals)
+            value = values[len(values) // 2]
+            return min(getattr(self.baseline, name), max(getattr(self.floor, name), value))
+
+        return TimingProposal(
+            task_assignment_seconds=int(median("task_assignment_seconds")),
+            consensus_seconds=int(median("consensus_seconds")),
+            metagraph_update_seconds=int(median("metagraph_update_seconds")),
+            batch_timeout_seconds=float(median("batch_timeout_seconds")),
+        )
@@ -0,0 +1,828 @@
+#!/usr/bin/env python3
+"""
+Coordination Backend Module
+
+This module defines how validators announce and observe slot phase entries:
+- PhaseAnnouncement: one validator entering one phase of one slot
+- PhaseIndex: in-memory index answering readiness queries in O(1)
+- FileCoordinationBackend: the original slot_{n}_{phase}_{uid}.json files,
+  for validators sharing a filesystem
+- InMemoryCoordinationBackend: a shared in-process index, for tests and
+  single-process simulations
+- NetworkCoordinationBackend: signed announcements exchanged over the
+  validators' HTTP API
+
+SlotCoordinator and FlexibleSlotCoordinator only talk to the
+CoordinationBackend interface.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COORDINATION_DIR = "slot_coordination"
+COORDINATION_PHASE_ENDPOINT = "/coordination/phase"
+
+# Announced by a validator once it has nothing left to do in a slot
+SLOT_COMPLETE_PHASE = "slot_complete"
+
+# Phase names used by SlotPhase and FlexibleSlotPhase (file names embed them)
+KNOWN_PHASES = (
+    "task_assignment",
+    "task_execution",
+    "consensus_scoring",
+    "metagraph_update",
+    "cycle_transition",
+    SLOT_COMPLETE_PHASE,
+)
+
+
+def phase_key(phase: Any) -> str:
+    """Normalize a SlotPhase / FlexibleSlotPhase / string to its value."""
+    return getattr(phase, "value", phase)
+
+
+def sanitize_extra_data(extra_data: Optional[Dict]) -> Dict:
+    """
+    Reduce extra_data to JSON-serializable primitives.
+
+    Args:
+        extra_data: Original extra data that might contain complex objects
+
+    Returns:
+        Simplified data that can be JSON serialized
+    """
+    if not extra_data:
+        return {}
+
+    def simplify(value):
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, dict):
+            return {str(k): simplify(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple, set)):
+            return [simplify(item) for item in value]
+        if hasattr(value, "model_dump"):  # Pydantic v2
+            return simplify(value.model_dump())
+        if hasattr(value, "dict"):  # Pydantic v1
+            return simplify(value.dict())
+        if hasattr(value, "__dataclass_fields__"):
+            return simplify(asdict(value))
+        return str(value)
+
+    simplified = {}
+    for key, value in extra_data.items():
+        try:
+            simplified[str(key)] = simplify(value)
+        except Exception as e:
+            logger.debug(f"Error simplifying key {key}: {e}")
+            simplified[str(key)] = f"<error_serializing_{type(value).__name__}>"
+    return simplified
+
+
+def parse_coordination_filename(name: str) -> Optional[Tuple[int, str, str]]:
+    """
+    Split "slot_{n}_{phase}_{uid}.json" into (slot, phase, validator_uid).
+
+    Returns:
+        The parsed parts, or None if the name does not match
+    """
+    if not name.startswith("slot_") or not name.endswith(".json"):
+        return None
+    slot_part, _, rest = name[len("slot_") : -len(".json")].partition("_")
+    try:
+        slot = int(slot_part)
+    except ValueError:
+        return None
+    for phase in KNOWN_PHASES:
+        if rest.startswith(phase + "_"):
+            return slot, phase, rest[len(phase) + 1 :]
+    return None
+
+
+def collect_announced_scores(
+    announcements: Iterable["PhaseAnnouncement"],
+) -> Dict[str, List[float]]:
+    """
+    Gather the miner scores carried in consensus_scoring announcements.
+
+    Accepts extra_data["scores"] either as {miner_uid: score} or as a list of
+    {"miner_uid": ..., "score": ...} entries.
+
+    Returns:
+        miner_uid -> scores from every announcing validator
+    """
+    all_scores: Dict[str, List[float]] = {}
+    for announcement in announcements:
+        scores = announcement.extra_data.get("scores", {})
+        if isinstance(scores, dict):
+            for miner_uid, score in scores.items():
+                all_scores.setdefault(miner_uid, []).append(score)
+        elif isinstance(scores, list):
+            for score_entry in scores:
+                if (
+                    isinstance(score_entry, dict)
+                    and "miner_uid" in score_entry
+                    and "score" in score_entry
+                ):
+                    all_scores.setdefault(score_entry["miner_uid"], []).append(
+                        score_entry["score"]
+                    )
+        else:
+            logger.warning(
+                f"Invalid scores format from {announcement.validator_uid}: {type(scores)}"
+            )
+    return all_scores
+
+
+@dataclass
+class PhaseAnnouncement:
+    """A validator's entry into a phase of a slot."""
+
+    validator_uid: str
+    slot: int
+    phase: str
+    timestamp: float = field(default_factory=time.time)
+    extra_data: Dict[str, Any] = field(default_factory=dict)
+    joined_mid_slot: bool = False
+    signature: Optional[str] = None
+    received_at: float = 0.0  # Local arrival time, never transmitted
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "validator_uid": self.validator_uid,
+            "slot": self.slot,
+            "phase": self.phase,
+            "timestamp": self.timestamp,
+            "joined_mid_slot": self.joined_mid_slot,
+            "extra_data": self.extra_data,
+        }
+        if self.signature:
+            data["signature"] = self.signature
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseAnnouncement":
+        """
+        Build an announcement from its wire/file form.
+
+        Raises:
+            ValueError: If required fields are missing or malformed
+        """
+        try:
+            return cls(
+                validator_uid=str(data["validator_uid"]),
+                slot=int(data["slot"]),
+                phase=phase_key(data["phase"]),
+                timestamp=float(data.get("timestamp", time.time())),
+                extra_data=data.get("extra_data") or {},
+                joined_mid_slot=bool(data.get("joined_mid_slot", False)),
+                signature=data.get("signature"),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid phase announcement: {e}")
+
+    def signing_bytes(self) -> bytes:
+        """Canonical bytes covered by the signature."""
+        payload = {
+            "validator_uid": self.validator_uid,
+            "slot": self.slot,
+            "phase": self.phase,
+            "timestamp": self.timestamp,
+            "joined_mid_slot": self.joined_mid_slot,
+            "extra_data": sanitize_extra_data(self.extra_data),
+        }
+        return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+class PhaseIndex:
+    """
+    slot -> phase -> validator_uid -> PhaseAnnouncement.
+
+    Readiness checks (count, membership) are O(1); listing the ready
+    validators is proportional to the number of validators in that phase.
+    """
+
+    def __init__(self):
+        self._slots: Dict[int, Dict[str, Dict[str, PhaseAnnouncement]]] = {}
+        self._validators: Dict[int, Set[str]] = {}
+
+    def add(self, announcement: PhaseAnnouncement):
+        if not announcement.received_at:
+            announcement.received_at = time.time()
+        phases = self._slots.setdefault(announcement.slot, {})
+        phases.setdefault(announcement.phase, {})[
+            announcement.validator_uid
+        ] = announcement
+        self._validators.setdefault(announcement.slot, set()).add(
+            announcement.validator_uid
+        )
+
+    def replace_slot(self, slot: int, announcements: List[PhaseAnnouncement]):
+        """Replace everything known about a slot."""
+        self.remove_slot(slot)
+        for announcement in announcements:
+            self.add(announcement)
+
+    def remove_slot(self, slot: int):
+        self._slots.pop(slot, None)
+        self._validators.pop(slot, None)
+
+    def discard(self, slot: int, phase: str, validator_uid: str):
+        """Forget one announcement."""
+        phases = self._slots.get(slot)
+        if not phases or validator_uid not in phases.get(phase, {}):
+            return
+        del phases[phase][validator_uid]
+        if not phases[phase]:
+            del phases[phase]
+        if not phases:
+            self.remove_slot(slot)
+        elif not any(validator_uid in entries for entries in phases.values()):
+            self._validators[slot].discard(validator_uid)
+
+    def get(self, slot: int, phase: str, validator_uid: str) -> Optional[PhaseAnnouncement]:
+        return self._slots.get(slot, {}).get(phase, {}).get(validator_uid)
+
+    def entries(self, slot: int, phase: str) -> Dict[str, PhaseAnnouncement]:
+        return self._slots.get(slot, {}).get(phase, {})
+
+    def ready_count(self, slot: int, phase: str) -> int:
+        return len(self.entries(slot, phase))
+
+    def is_ready(self, slot: int, phase: str, validator_uid: str) -> bool:
+        return validator_uid in self.entries(slot, phase)
+
+    def ready_validators(
+        self, slot: int, phase: str, max_age: Optional[float] = None
+    ) -> List[str]:
+        entries = self.entries(slot, phase)
+        if max_age is None:
+            return list(entries)
+        cutoff = time.time() - max_age
+        return [uid for uid, entry in entries.items() if entry.received_at >= cutoff]
+
+    def active_validators(self, slot: int) -> List[str]:
+        return list(self._validators.get(slot, ()))
+
+    def slots(self) -> List[int]:
+        return sorted(self._slots)
+
+    def latest_active_slot(
+        self, max_age: float
+    ) -> Tuple[Optional[int], Dict[str, int]]:
+        """Newest slot with a recent announcement and its per-phase counts."""
+        cutoff = time.time() - max_age
+        for slot in sorted(self._slots, reverse=True):
+            counts = {
+                phase: sum(1 for e in entries.values() if e.received_at > cutoff)
+                for phase, entries in self._slots[slot].items()
+            }
+            counts = {phase: n for phase, n in counts.items() if n}
+            if counts:
+                return slot, counts
+        return None, {}
+
+    def prune(self, before_slot: int) -> int:
+        stale = [slot for slot in self._slots if slot < before_slot]
+        for slot in stale:
+            self.remove_slot(slot)
+        return len(stale)
+
+    def prune_older_than(self, cutoff: float) -> int:
+        """Drop announcements that arrived before cutoff (a timestamp)."""
+        removed = 0
+        for slot in list(self._slots):
+            phases = self._slots[slot]
+            for phase in list(phases):
+                entries = phases[phase]
+                for uid in [u for u, e in entries.items() if e.received_at < cutoff]:
+                    del entries[uid]
+                    removed += 1
+                if not entries:
+                    del phases[phase]
+            if not phases:
+                self.remove_slot(slot)
+            else:
+                self._validators[slot] = {
+                    uid for entries in phases.values() for uid in entries
+                }
+        return removed
+
+
+class CoordinationBackend(ABC):
+    """
+    Transport and storage for phase announcements.
+
+    Subclasses implement `publish`; backends whose state can change outside
+    this process (files written by other validators) override `refresh`.
+    """
+
+    def __init__(self, index: Optional[PhaseIndex] = None):
+        self.index = index if index is not None else PhaseIndex()
+
+    @abstractmethod
+    async def publish(self, announcement: PhaseAnnouncement) -> bool:
+        """
+        Announce a phase entry of this validator.
+
+        Returns:
+            True if the announcement was stored locally
+        """
+
+    def refresh(self, slot: Optional[int] = None):
+        """Bring the index up to date with external state (no-op by default)."""
+
+    # === Queries ===
+
+    def ready_validators(
+        self, slot: int, phase: Any, max_age: Optional[float] = None
+    ) -> List[str]:
+        """Validators that announced a phase of a slot."""
+        self.refresh(slot)
+        return self.index.ready_validators(slot, phase_key(phase), max_age)
+
+    def ready_count(self, slot: int, phase: Any) -> int:
+        self.refresh(slot)
+        return self.index.ready_count(slot, phase_key(phase))
+
+    def is_ready(self, slot: int, phase: Any, validator_uid: str) -> bool:
+        self.refresh(slot)
+        return self.index.is_ready(slot, phase_key(phase), validator_uid)
+
+    def active_validators(self, slot: int) -> List[str]:
+        """Validators that announced any phase of a slot."""
+        self.refresh(slot)
+        return self.index.active_validators(slot)
+
+    def announcement(
+        self, slot: int, phase: Any, validator_uid: str
+    ) -> Optional[PhaseAnnouncement]:
+        self.refresh(slot)
+        return self.index.get(slot, phase_key(phase), validator_uid)
+
+    def announcements(self, slot: int, phase: Any) -> List[PhaseAnnouncement]:
+        self.refresh(slot)
+        return list(self.index.entries(slot, phase_key(phase)).values())
+
+    def latest_active_slot(
+        self, max_age: float = 600
+    ) -> Tuple[Optional[int], Dict[str, int]]:
+        """
+        Newest slot with announcements received in the last max_age seconds.
+
+        Returns:
+            Tuple of (slot or None, {phase: number of recent announcements})
+        """
+        self.refresh()
+        return self.index.latest_active_slot(max_age)
+
+    # === Retention ===
+
+    def prune(self, before_slot: int) -> int:
+        """Forget every slot older than before_slot. Returns slots removed."""
+        return self.index.prune(before_slot)
+
+    def prune_older_than(self, max_age: float) -> int:
+        """Forget announcements older than max_age seconds. Returns entries removed."""
+        return self.index.prune_older_than(time.time() - max_age)
+
+    def request_compaction(self, before_slot: int):
+        """
+        Ask for slots older than before_slot to be dropped.
+
+        Called from hot paths such as get_current_slot_and_phase, so backends
+        with slow storage do the work in the background; pruning the index
+        is cheap enough to do inline.
+        """
+        self.index.prune(before_slot)
+
+
+class InMemoryCoordinationBackend(CoordinationBackend):
+    """
+    Announcements kept in a PhaseIndex.
+
+    Several backends constructed with the same index behave like validators
+    sharing one coordination service, which is what tests need.
+    """
+
+    async def publish(self, announcement: PhaseAnnouncement) -> bool:
+        announcement.received_at = time.time()
+        self.index.add(announcement)
+        return True
+
+
+class FileCoordinationBackend(CoordinationBackend):
+    """
+    Announcements stored as slot_{n}_{phase}_{uid}.json in a shared directory.
+
+    Parsed files are cached by name together with their (mtime, size), so a
+    refresh only re-reads files that were added or rewritten since the last
+    one. Writers always rename files into place, which bumps the directory
+    mtime; while it is unchanged a refresh is a single stat() call, whatever
+    the number of files or validators. A full listing is still forced every
+    rescan_interval seconds to catch writers that edit files in place.
+
+    The arrival time of an entry is its file modification time.
+    """
+
+    # Directory mtimes can be as coarse as one second on some filesystems:
+    # a change in the same tick as the last scan would not alter the mtime.
+    MTIME_GRANULARITY = 1.0
+
+    def __init__(
+        self,
+        coordination_dir: str = DEFAULT_COORDINATION_DIR,
+        json_encoder: Optional[type] = None,
+        rescan_interval: float = 5.0,
+    ):
+        super().__init__()
+        self.coordination_dir = Path(coordination_dir)
+        self.coordination_dir.mkdir(exist_ok=True)
+        self.json_encoder = json_encoder
+        self.rescan_interval = rescan_interval
+
+        # file name -> (mtime_ns, size, parsed announcement or None if invalid)
+        self._files: Dict[str, Tuple[int, int, Optional[PhaseAnnouncement]]] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        self._last_scan = 0.0
+        self._compact_before: Optional[int] = None
+        self._compaction_task: Optional[asyncio.Task] = None
+
+        # Counters, mostly for tests and diagnostics
+        self.scans = 0
+        self.files_parsed = 0
+
+    def _path(self, slot: int, phase: str, validator_uid: str) -> Path:
+        return self.coordination_dir / f"slot_{slot}_{phase}_{validator_uid}.json"
+
+    async def publish(self, announcement: PhaseAnnouncement) -> bool:
+        phase_file = self._path(
+            announcement.slot, announcement.phase, announcement.validator_uid
+        )
+        temp_file = phase_file.with_suffix(".tmp")
+        data = announcement.to_dict()
+
+        try:
+            try:
+                content = json.dumps(data, cls=self.json_encoder, indent=2)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ [V:{announcement.validator_uid}] Using simplified extra_data for "
+                    f"{announcement.phase} entry due to serialization issues: {e}"
+                )
+                data["extra_data"] = sanitize_extra_data(announcement.extra_data)
+                content = json.dumps(data, indent=2)
+
+            # Write to a temporary file first, then rename (atomic operation)
+            with open(temp_file, "w") as f:
+                f.write(content)
+                f.flush()
+            temp_file.rename(phase_file)
+
+            # Index the entry as other validators will read it, and remember
+            # the file so it never needs to be parsed back
+            stored = PhaseAnnouncement.from_dict(json.loads(content))
+            stored.received_at = time.time()
+            self.index.add(stored)
+            try:
+                stat = phase_file.stat()
+                self._files[phase_file.name] = (stat.st_mtime_ns, stat.st_size, stored)
+            except OSError:
+                pass
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"❌ [V:{announcement.validator_uid}] Failed to write phase file {phase_file.name}: {e}"
+            )
+            if temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except OSError:
+                    pass
+            return False
+
+    def _read(
+        self, file_path: Path, parsed: Tuple[int, str, str], mtime: float
+    ) -> Optional[PhaseAnnouncement]:
+        try:
+            with open(file_path, "r") as f:
+                announcement = PhaseAnnouncement.from_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Error reading phase file {file_path}: {e}")
+            return None
+        if (
+            announcement.slot,
+            announcement.phase,
+            announcement.validator_uid,
+        ) != parsed:
+            return None
+        announcement.received_at = mtime
+        return announcement
+
+    def _forget(self, name: str):
+        _, _, announcement = self._files.pop(name)
+        if announcement is not None:
+            self.index.discard(
+                announcement.slot, announcement.phase, announcement.validator_uid
+            )
+
+    def refresh(self, slot: Optional[int] = None):
+        """
+        Sync the index with the directory.
+
+        The whole directory is synced regardless of slot: with the file cache
+        this costs the same as syncing a single slot.
+        """
+        try:
+            dir_mtime_ns = os.stat(self.coordination_dir).st_mtime_ns
+        except OSError as e:
+            logger.debug(f"Error reading coordination directory: {e}")
+            return
+
+        now = time.time()
+        if (
+            dir_mtime_ns == self._dir_mtime_ns
+            and dir_mtime_ns / 1e9 < self._last_scan - self.MTIME_GRANULARITY
+            and now - self._last_scan < self.rescan_interval
+        ):
+            return
+
+        self._dir_mtime_ns = dir_mtime_ns
+        self._last_scan = now
+        self.scans += 1
+
+        seen: Set[str] = set()
+        try:
+            with os.scandir(self.coordination_dir) as entries:
+                for entry in entries:
+                    parsed = parse_coordination_filename(entry.name)
+                    if parsed is None:
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    seen.add(entry.name)
+                    cached = self._files.get(entry.name)
+                    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    if cached:
+                        self._forget(entry.name)
+                    announcement = self._read(
+                        Path(entry.path), parsed, stat.st_mtime
+                    )
+                    self.files_parsed += 1
+                    self._files[entry.name] = (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        announcement,
+                    )
+                    if announcement is not None:
+                        self.index.add(announcement)
+        except OSError as e:
+            logger.debug(f"Error scanning coordination directory: {e}")
+            return
+
+        for name in [name for name in self._files if name not in seen]:
+            self._forget(name)
+
+    # === Retention ===
+
+    def _unlink(self, names: List[str]) -> int:
+        removed = 0
+        for name in names:
+            try:
+                (self.coordination_dir / name).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Error removing phase file {name}: {e}")
+        return removed
+
+    def _names_where(self, predicate: Callable[[int, int], bool]) -> List[str]:
+        """Cached file names matching predicate(slot, mtime_ns)."""
+        return [
+            name
+            for name, (mtime_ns, _, _) in self._files.items()
+            if predicate(parse_coordination_filename(name)[0], mtime_ns)
+        ]
+
+    def _drop(self, names: List[str]):
+        for name in names:
+            if name in self._files:
+                self._forget(name)
+
+    def prune(self, before_slot: int) -> int:
+        self.refresh()
+        names = self._names_where(lambda slot, _: slot < before_slot)
+        removed = self._unlink(names)
+        self._drop(names)
+        self.index.prune(before_slot)
+        return removed
+
+    def prune_older_than(self, max_age: float) -> int:
+        self.refresh()
+        cutoff = time.time() - max_age
+        names = self._names_where(lambda _, mtime_ns: mtime_ns / 1e9 < cutoff)
+        removed = self._unlink(names)
+        self._drop(names)
+        self.index.prune_older_than(cutoff)
+        return removed
+
+    def request_compaction(self, before_slot: int):
+        """
+        Delete files of slots older than before_slot in the background.
+
+        Only one compaction runs at a time; requests made while it runs
+        raise the target it works towards. Without a running event loop the
+        request is remembered and served by the next one made inside a loop.
+        """
+        if self._compact_before is None or before_slot > self._compact_before:
+            self._compact_before = before_slot
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._compaction_task = loop.create_task(self._compact())
+
+    async def _compact(self):
+        compacted: Optional[int] = None
+        while self._compact_before is not None and self._compact_before != compacted:
+            compacted = self._compact_before
+            names = self._names_where(lambda slot, _: slot < compacted)
+            if not names and not any(s < compacted for s in self.index.slots()):
+                continue
+            try:
+                await asyncio.to_thread(self._unlink, names)
+            except Exception as e:
+                logger.error(f"Error compacting coordination directory: {e}")
+                return
+            self._drop(names)
+            self.index.prune(compacted)
+
+
+class NetworkCoordinationBackend(CoordinationBackend):
+    """
+    Signed announcements exchanged over the validators' HTTP API.
+
+    Outgoing announcements are signed with the validator's account and
+    broadcast to peers through the attached transport (normally
+    ValidatorNodeNetwork.broadcast_p2p_message). Peers deliver theirs to
+    COORDINATION_PHASE_ENDPOINT, whose handler calls `receive`.
+    """
+
+    def __init__(
+        self,
+        validator_uid: str,
+        account: Any = None,
+        address_of: Optional[Callable[[str], Optional[str]]] = None,
+        transport: Optional[Callable[[str, Dict], Awaitable[Any]]] = None,
+        index: Optional[PhaseIndex] = None,
+    ):
+        """
+        Args:
+            validator_uid: UID of this validator
+            account: eth_account account used to sign announcements
+            address_of: Returns the known address of a validator UID
+            transport: Coroutine (endpoint, payload) broadcasting to peers
+            index: Optional shared index
+        """
+        super().__init__(index)
+        self.validator_uid = validator_uid
+        self.account = account
+        self.address_of = address_of or (lambda uid: None)
+        self.transport = transport
+
+    def attach_transport(self, transport: Callable[[str, Dict], Awaitable[Any]]):
+        self.transport = transport
+
+    def sign(self, announcement: PhaseAnnouncement) -> Optional[str]:
+        if self.account is None:
+            return None
+        signed = self.account.sign_message(
+            encode_defunct(primitive=announcement.signing_bytes())
+        )
+        return signed.signature.hex()
+
+    def verify(self, announcement: PhaseAnnouncement) -> bool:
+        """Check the announcement was signed by the validator's known address."""
+        expected_address = self.address_of(announcement.validator_uid)
+        if not expected_address or not announcement.signature:
+            return False
+        try:
+            recovered = Account.recover_message(
+                encode_defunct(primitive=announcement.signing_bytes()),
+                signature=announcement.signature,
+            )
+        except Exception as e:
+            logger.debug(
+                f"Signature recovery failed for {announcement.validator_uid}: {e}"
+            )
+            return False
+        return recovered.lower() == expected_address.lower()
+
+    async def publish(self, announcement: PhaseAnnouncement) -> bool:
+        announcement.signature = self.sign(announcement)
+        announcement.received_at = time.time()
+        self.index.add(announcement)
+
+        if self.transport is None:
+            logger.debug(
+                f"[V:{self.validator_uid}] No transport attached; "
+                f"{announcement.phase} entry for slot {announcement.slot} kept locally"
+            )
+            return True
+
+        payload = announcement.to_dict()
+        payload["extra_data"] = sanitize_extra_data(announcement.extra_data)
+        try:
+            await self.transport(COORDINATION_PHASE_ENDPOINT, payload)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ [V:{self.validator_uid}] Failed to broadcast {announcement.phase} entry: {e}"
+            )
+        return True
+
+    def receive(self, payload: Dict[str, Any]) -> bool:
+        """
+        Accept a peer's announcement delivered over HTTP.
+
+        Returns:
+            True if the announcement was valid and indexed
+        """
+        try:
+            announcement = PhaseAnnouncement.from_dict(payload)
+        except ValueError as e:
+            logger.warning(f"[V:{self.validator_uid}] Rejected phase announcement: {e}")
+            return False
+
+        if not self.verify(announcement):
+            logger.warning(
+                f"[V:{self.validator_uid}] Rejected phase announcement from "
+                f"{announcement.validator_uid}: invalid signature"
+            )
+            return False
+
+        announcement.received_at = time.time()
+        self.index.add(announcement)
+        return True
+
+
+def create_coordination_backend(
+    kind: str = "file",
+    validator_uid: str = "",
+    coordination_dir: str = DEFAULT_COORDINATION_DIR,
+    account: Any = None,
+    address_of: Optional[Callable[[str], Optional[str]]] = None,
+) -> CoordinationBackend:
+    """
+    Build the coordination backend selected in configuration.
+
+    Args:
+        kind: "file", "memory" or "network"
+        validator_uid: UID of this validator (network backend)
+        coordination_dir: Shared directory (file backend)
+        account: Signing account (network backend)
+        address_of: Known-address lookup for peers (network backend)
+
+    Raises:
+        ValueError: If the backend kind is unknown
+    """
+    kind = (kind or "file").lower()
+    if kind == "file":
+        return FileCoordinationBackend(coordination_dir)
+    if kind == "memory":
+        return InMemoryCoordinationBackend()
+    if kind == "network":
+        return NetworkCoordinationBackend(
+            validator_uid, account=account, address_of=address_of
+        )
+    raise ValueError(f"Unknown coordination backend: {kind}")
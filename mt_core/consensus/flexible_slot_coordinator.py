@@ -16,10 +16,21 @@ import json
 import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import logging
 
+from .coordination_backend import (
+    SLOT_COMPLETE_PHASE,
+    CoordinationBackend,
+    FileCoordinationBackend,
+    PhaseAnnouncement,
+    collect_announced_scores,
+    sanitize_extra_data,
+)
+from .adaptive_timing import ACTIVE_TIMING_KEY, TimingProposal
+from .slot_scheduler import SlotSchedule
+
 logger = logging.getLogger(__name__)
 
 # Flexible timing constants
@@ -27,6 +38,8 @@ CONSENSUS_CHECK_INTERVAL = 3  # Check every 3 seconds
 MAJORITY_THRESHOLD = 2  # Need 2 out of 3 validators
 DEFAULT_BUFFER_SECONDS = 30  # Buffer time for late validators
 MIN_TASK_EXECUTION_TIME = 45  # Minimum 45 seconds for task execution
+EARLY_COMPLETION_GRACE_SECONDS = 5.0  # Last completion -> next slot start
+EARLY_COMPLETION_POLL_INTERVAL = 1.0
 
 # FIXED EPOCH START FOR ALL VALIDATORS SYNCHRONIZATION
 FIXED_EPOCH_START = datetime.datetime(2024, 1, 1, 0, 0, 0).timestamp()
@@ -95,6 +108,20 @@ class FlexibleSlotConfig:
     auto_extend_on_consensus: bool = True  # Auto-extend if consensus not reached
     max_auto_extension_seconds: int = 60  # Max auto-extension time
 
+    def get_phase_boundaries(self) -> Dict[FlexibleSlotPhase, Tuple[float, float]]:
+        """Get start/end minutes for each phase (same split as _calculate_current_phase)"""
+        task_assignment_end = self.min_task_assignment_seconds / 60.0
+        consensus_end = task_assignment_end + self.min_consensus_seconds / 60.0
+
+        return {
+            FlexibleSlotPhase.TASK_ASSIGNMENT: (0.0, task_assignment_end),
+            FlexibleSlotPhase.CONSENSUS_SCORING: (task_assignment_end, consensus_end),
+            FlexibleSlotPhase.METAGRAPH_UPDATE: (
+                consensus_end,
+                float(self.slot_duration_minutes),
+            ),
+        }
+
 
 class FlexibleSlotCoordinator:
     """
@@ -107,10 +134,13 @@ class FlexibleSlotCoordinator:
         validator_uid: str,
         coordination_dir: str = "slot_coordination",
         slot_config: Optional[FlexibleSlotConfig] = None,
+        backend: Optional[CoordinationBackend] = None,
     ):
         self.validator_uid = validator_uid
         self.coordination_dir = Path(coordination_dir)
-        self.coordination_dir.mkdir(exist_ok=True)
+        self.backend = backend or FileCoordinationBackend(
+            coordination_dir, json_encoder=FlexibleJSONEncoder
+        )
         self.slot_config = slot_config or FlexibleSlotConfig()
 
         # Dynamic state tracking
@@ -120,6 +150,11 @@ class FlexibleSlotCoordinator:
         self.slot_start_time = None
         self.joined_mid_slot = False
 
+        # Adaptive timing: (effective_slot, timing, epoch_start) waiting for
+        # its slot, and (effective_slot, timing) currently in effect
+        self.pending_timing: Optional[Tuple[int, TimingProposal, float]] = None
+        self.active_timing: Optional[Tuple[int, TimingProposal]] = None
+
         # Event tracking
         self.phase_events = {}  # slot -> phase -> event_timestamp
         self.validator_readiness = {}  # slot -> phase -> [validator_list]
@@ -246,8 +281,8 @@ class FlexibleSlotCoordinator:
                 f"🗑️ {self.validator_uid} ignoring stale coordination slot {active_slot} (time-based is {calculated_slot})"
             )
 
-        # Force cleanup stale files when using time-based calculation
-        self._force_cleanup_stale_coordination_files(calculated_slot)
+        # Stale slots are compacted in the background, off this hot path
+        self.backend.request_compaction(calculated_slot)
 
         # Use time-based calculation as fallback
         phase_info = {
@@ -265,15 +300,10 @@ class FlexibleSlotCoordinator:
     def _cleanup_old_coordination_files(self):
         """Clean up old coordination files to prevent confusion - AGGRESSIVE CLEANUP"""
         try:
-            current_time = time.time()
-            cutoff_time = current_time - (5 * 60)  # 5 minutes ago (more aggressive)
-
-            for file_path in self.coordination_dir.glob("slot_*.json"):
-                if file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()
-                    logger.debug(
-                        f"🗑️ Cleaned up old coordination file: {file_path.name}"
-                    )
+            # Entries older than 5 minutes (more aggressive)
+            removed = self.backend.prune_older_than(5 * 60)
+            if removed:
+                logger.debug(f"🗑️ Cleaned up {removed} old coordination entries")
 
         except Exception as e:
             logger.warning(f"Error cleaning up coordination files: {e}")
@@ -281,40 +311,19 @@ class FlexibleSlotCoordinator:
     def _force_cleanup_stale_coordination_files(self, current_slot: int):
         """Force cleanup of coordination files for slots older than current"""
         try:
-            for file_path in self.coordination_dir.glob("slot_*.json"):
-                filename = file_path.name
-                # Extract slot number from filename like "slot_5_task_assignment_uid.json"
-                if filename.startswith("slot_"):
-                    try:
-                        slot_part = filename.split("_")[1]
-                        file_slot = int(slot_part)
-                        if file_slot < current_slot:  # Remove files for older slots
-                            file_path.unlink()
-                            logger.debug(
-                                f"🗑️ Force cleaned stale slot {file_slot} file: {filename}"
-                            )
-                    except (IndexError, ValueError):
-                        continue  # Skip files with unexpected format
+            removed = self.backend.prune(current_slot)
+            if removed:
+                logger.debug(
+                    f"🗑️ Force cleaned {removed} stale entries before slot {current_slot}"
+                )
         except Exception as e:
             logger.warning(f"Error force cleaning stale coordination files: {e}")
 
     def _cleanup_old_coordination_files_original(self):
         """Clean up old coordination files to prevent getting stuck in old states"""
         try:
-            coordination_files = list(self.coordination_dir.glob("slot_*_*.json"))
-            current_time = time.time()
-
-            # Remove files older than 30 minutes
-            cleanup_threshold = current_time - 1800  # 30 minutes
-            cleaned_count = 0
-
-            for file_path in coordination_files:
-                try:
-                    if file_path.stat().st_mtime < cleanup_threshold:
-                        file_path.unlink()
-                        cleaned_count += 1
-                except OSError:
-                    continue
+            # Remove entries older than 30 minutes
+            cleaned_count = self.backend.prune_older_than(1800)
 
             if cleaned_count > 0:
                 logger.info(f"🧹 Cleaned up {cleaned_count} old coordination files")
@@ -335,44 +344,13 @@ class FlexibleSlotCoordinator:
     def _detect_active_slot_from_coordination(
         self,
     ) -> Tuple[Optional[int], Optional[FlexibleSlotPhase]]:
-        """Detect active slot by scanning coordination files"""
-        coordination_files = list(self.coordination_dir.glob("slot_*_*.json"))
-
-        if not coordination_files:
-            return None, None
-
-        # Find the most recent slot with active validators
-        active_slots = {}
-        current_time = time.time()
+        """Detect the newest slot with phase entries from the last 10 minutes"""
+        latest_slot, phase_counts = self.backend.latest_active_slot(max_age=600)
 
-        for file_path in coordination_files:
-            try:
-                parts = file_path.stem.split("_")
-                if len(parts) >= 4:  # slot_X_phase_validator.json
-                    slot_num = int(parts[1])
-                    phase = parts[2]
-
-                    # Check if file is recent (within last 10 minutes)
-                    if file_path.stat().st_mtime > current_time - 600:
-                        if slot_num not in active_slots:
-                            active_slots[slot_num] = []
-                        active_slots[slot_num].append(phase)
-
-            except (ValueError, IndexError, OSError):
-                continue
-
-        if not active_slots:
+        if latest_slot is None:
             return None, None
 
-        # Return the highest slot number with recent activity
-        latest_slot = max(active_slots.keys())
-        phases = active_slots[latest_slot]
-
         # Determine most common phase
-        phase_counts = {}
-        for phase in phases:
-            phase_counts[phase] = phase_counts.get(phase, 0) + 1
-
         most_common_phase = max(phase_counts.keys(), key=lambda x: phase_counts[x])
 
         try:
@@ -403,6 +381,231 @@ class FlexibleSlotCoordinator:
 
         return seconds_into_slot
 
+    def slot_schedule(self) -> SlotSchedule:
+        """Phase windows of every slot, anchored on the fixed epoch start."""
+        if not hasattr(self, "_epoch_start"):
+            self._epoch_start = get_fixed_epoch_start()
+        return SlotSchedule.from_boundaries(
+            self._epoch_start,
+            self.slot_config.slot_duration_minutes * 60,
+            self.slot_config.get_phase_boundaries(),
+        )
+
+    def _config_for_timing(self, timing: TimingProposal) -> FlexibleSlotConfig:
+        return replace(
+            self.slot_config,
+            slot_duration_minutes=timing.slot_duration_seconds / 60.0,
+            min_task_assignment_seconds=timing.task_assignment_seconds,
+            min_consensus_seconds=timing.consensus_seconds,
+            min_metagraph_update_seconds=timing.metagraph_update_seconds,
+        )
+
+    def adopt_timing(self, timing: TimingProposal, effective_slot: int) -> SlotSchedule:
+        """
+        Use new phase lengths from effective_slot on.
+
+        The epoch is re-anchored so that effective_slot still starts where the
+        current timing puts it, keeping slot numbers continuous.
+
+        Args:
+            timing: Agreed phase lengths
+            effective_slot: First slot that uses them
+
+        Returns:
+            The schedule that applies from effective_slot
+        """
+        if not hasattr(self, "_epoch_start"):
+            self._epoch_start = get_fixed_epoch_start()
+        boundary = self._epoch_start + effective_slot * (
+            self.slot_config.slot_duration_minutes * 60
+        )
+        epoch_start = boundary - effective_slot * timing.slot_duration_seconds
+        self.pending_timing = (effective_slot, timing, epoch_start)
+
+        logger.info(
+            f"⏱️ {self.validator_uid} Slot timing from slot {effective_slot}: "
+            f"{timing.task_assignment_seconds}s/{timing.consensus_seconds}s/"
+            f"{timing.metagraph_update_seconds}s (batch timeout {timing.batch_timeout_seconds}s)"
+        )
+        return SlotSchedule.from_boundaries(
+            epoch_start,
+            timing.slot_duration_seconds,
+            self._config_for_timing(timing).get_phase_boundaries(),
+        )
+
+    def activate_timing(self, slot: int) -> Optional[TimingProposal]:
+        """
+        Switch to the adopted timing once its first slot has started.
+
+        Returns:
+            The timing that became active, or None if nothing changed
+        """
+        if self.pending_timing is None or slot < self.pending_timing[0]:
+            return None
+        effective_slot, timing, epoch_start = self.pending_timing
+        self.pending_timing = None
+        self._epoch_start = epoch_start
+        self.slot_config = self._config_for_timing(timing)
+        self.active_timing = (effective_slot, timing)
+        return timing
+
+    def timing_announcement(self) -> Optional[Dict[str, Any]]:
+        """Active timing in the form published to other validators."""
+        if self.active_timing is None:
+            return None
+        effective_slot, timing = self.active_timing
+        return {
+            "effective_slot": effective_slot,
+            "epoch_start": self._epoch_start,
+            **timing.to_dict(),
+        }
+
+    def adopt_announced_timing(self) -> Optional[TimingProposal]:
+        """
+        Take over the timing other validators announce, when joining late.
+
+        Looks at the metagraph_update announcements of the latest active slot
+        and applies the timing with the highest effective slot right away.
+
+        Returns:
+            The adopted timing, or None if none was announced
+        """
+        latest_slot, _ = self.backend.latest_active_slot()
+        if latest_slot is None:
+            return None
+
+        candidates = []
+        for slot in (latest_slot, latest_slot - 1):
+            for announcement in self.backend.announcements(
+                slot, FlexibleSlotPhase.METAGRAPH_UPDATE
+            ):
+                data = announcement.extra_data.get(ACTIVE_TIMING_KEY)
+                if not data:
+                    continue
+                try:
+                    candidates.append(
+                        (
+                            int(data["effective_slot"]),
+                            float(data["epoch_start"]),
+                            TimingProposal.from_dict(data),
+                        )
+                    )
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Ignoring announced timing: {e}")
+        if not candidates:
+            return None
+
+        effective_slot, epoch_start, timing = max(
+            candidates, key=lambda c: (c[0], c[2].slot_duration_seconds)
+        )
+        self._epoch_start = epoch_start
+        self.slot_config = self._config_for_timing(timing)
+        self.active_timing = (effective_slot, timing)
+        logger.info(
+            f"⏱️ {self.validator_uid} Adopted announced slot timing effective from slot {effective_slot}"
+        )
+        return timing
+
+    # === Early slot completion ===
+
+    async def announce_slot_complete(self, slot: int) -> bool:
+        """Tell other validators this validator has nothing left to do in slot."""
+        return await self.backend.publish(
+            PhaseAnnouncement(
+                validator_uid=self.validator_uid,
+                slot=slot,
+                phase=SLOT_COMPLETE_PHASE,
+            )
+        )
+
+    def slot_participants(self, slot: int) -> List[str]:
+        """This validator and every validator that assigned tasks or scored in slot."""
+        participants = {self.validator_uid}
+        for phase in (
+            FlexibleSlotPhase.TASK_ASSIGNMENT,
+            FlexibleSlotPhase.CONSENSUS_SCORING,
+        ):
+            participants.update(self.backend.ready_validators(slot, phase))
+        return sorted(participants)
+
+    def early_slot_start(
+        self, slot: int, grace: float = EARLY_COMPLETION_GRACE_SECONDS
+    ) -> Optional[float]:
+        """
+        Start time of slot + 1 once every participant of slot is complete.
+
+        Derived only from the announcements (latest completion plus grace),
+        so every validator that sees them all computes the same time.
+
+        Returns:
+            The wall-clock start, or None while a participant is not done
+        """
+        completed = {
+            entry.validator_uid: entry.timestamp
+            for entry in self.backend.announcements(slot, SLOT_COMPLETE_PHASE)
+        }
+        if any(uid not in completed for uid in self.slot_participants(slot)):
+            return None
+        return max(completed.values()) + grace
+
+    async def wait_for_slot_complete(
+        self,
+        slot: int,
+        until: float,
+        grace: float = EARLY_COMPLETION_GRACE_SECONDS,
+    ) -> Optional[float]:
+        """
+        Wait until every participant announced slot complete, or until.
+
+        Returns:
+            The agreed start of slot + 1, or None if someone did not finish
+        """
+        while True:
+            start = self.early_slot_start(slot, grace)
+            if start is not None or time.time() + EARLY_COMPLETION_POLL_INTERVAL >= until:
+                return start
+            await asyncio.sleep(EARLY_COMPLETION_POLL_INTERVAL)
+
+    def shift_epoch(
+        self, from_slot: int, start_time: float, timing: TimingProposal
+    ) -> Optional[SlotSchedule]:
+        """
+        Start from_slot at start_time instead of its scheduled boundary.
+
+        Every later slot moves by the same amount, including a timing adopted
+        for from_slot that is not active yet. The shifted anchor is announced
+        like an adaptive timing, so late joiners follow it.
+
+        Args:
+            from_slot: First slot that starts earlier
+            start_time: Agreed wall-clock start of from_slot
+            timing: Timing in effect for from_slot (announced with the anchor)
+
+        Returns:
+            The schedule that applies from from_slot, or None if start_time
+            is not before the current boundary
+        """
+        schedule = self.slot_schedule()
+        shift = schedule.slot_start(from_slot) - start_time
+        if shift <= 0:
+            return None
+
+        self._epoch_start -= shift
+        logger.info(
+            f"⏩ {self.validator_uid} Slot {from_slot} starts {shift:.1f}s early: every validator completed slot {from_slot - 1}"
+        )
+        if self.pending_timing is not None and self.pending_timing[0] >= from_slot:
+            effective_slot, pending, epoch_start = self.pending_timing
+            self.pending_timing = (effective_slot, pending, epoch_start - shift)
+            if effective_slot == from_slot:
+                return SlotSchedule.from_boundaries(
+                    epoch_start - shift,
+                    pending.slot_duration_seconds,
+                    self._config_for_timing(pending).get_phase_boundaries(),
+                )
+        self.active_timing = (from_slot, timing)
+        return self.slot_schedule()
+
     def _calculate_current_phase(
         self, slot: int, current_time: float
     ) -> FlexibleSlotPhase:
@@ -429,47 +632,26 @@ class FlexibleSlotCoordinator:
         self, slot: int, phase: FlexibleSlotPhase, extra_data: Dict = None
     ):
         """Register phase entry with flexible timing support"""
-        phase_file = (
-            self.coordination_dir
-            / f"slot_{slot}_{phase.value}_{self.validator_uid}.json"
+        announcement = PhaseAnnouncement(
+            validator_uid=self.validator_uid,
+            slot=slot,
+            phase=phase.value,
+            joined_mid_slot=getattr(self, "joined_mid_slot", False),
+            extra_data=extra_data or {},
         )
 
-        phase_data = {
-            "validator_uid": self.validator_uid,
-            "slot": slot,
-            "phase": phase.value,
-            "timestamp": time.time(),
-            "joined_mid_slot": getattr(self, "joined_mid_slot", False),
-            "extra_data": extra_data or {},
-        }
-
         try:
-            with open(phase_file, "w") as f:
-                json.dump(phase_data, f, indent=2, cls=FlexibleJSONEncoder)
-
-            logger.info(
-                f"✅ {self.validator_uid} registered {phase.value} phase for slot {slot}"
-            )
+            if await self.backend.publish(announcement):
+                logger.info(
+                    f"✅ {self.validator_uid} registered {phase.value} phase for slot {slot}"
+                )
+            else:
+                logger.error(
+                    f"❌ {self.validator_uid} failed to register {phase.value} phase for slot {slot}"
+                )
 
         except Exception as e:
             logger.error(f"❌ Error registering phase: {e}")
-            logger.debug(f"❌ Phase data: {phase_data}")
-
-            # Try to serialize with basic data types only as fallback
-            try:
-                safe_phase_data = {
-                    "validator_uid": self.validator_uid,
-                    "slot": slot,
-                    "phase": phase.value,
-                    "timestamp": time.time(),
-                    "joined_mid_slot": getattr(self, "joined_mid_slot", False),
-                    "extra_data": self._sanitize_extra_data(extra_data or {}),
-                }
-                with open(phase_file, "w") as f:
-                    json.dump(safe_phase_data, f, indent=2)
-                logger.warning(f"⚠️ Used fallback serialization for phase registration")
-            except Exception as fallback_error:
-                logger.error(f"❌ Fallback serialization also failed: {fallback_error}")
 
     async def wait_for_consensus_deadline(
         self, slot: int, phase: FlexibleSlotPhase, deadline_buffer: Optional[int] = None
@@ -545,74 +727,24 @@ class FlexibleSlotCoordinator:
     def _get_ready_validators_flexible(
         self, slot: int, phase: FlexibleSlotPhase
     ) -> List[str]:
-        """Get ready validators with flexible file detection"""
-        ready_validators = []
-        current_time = time.time()
-
-        # Look for any coordination files for this slot/phase
-        pattern = f"slot_{slot}_{phase.value}_*.json"
-        coordination_files = list(self.coordination_dir.glob(pattern))
-
-        for file_path in coordination_files:
-            try:
-                # Check if file is recent (within last 5 minutes)
-                if file_path.stat().st_mtime < current_time - 300:
-                    continue
-
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-
-                if data.get("slot") == slot and data.get("phase") == phase.value:
-
-                    validator_uid = data.get("validator_uid")
-                    if validator_uid:
-                        ready_validators.append(validator_uid)
-
-            except (json.JSONDecodeError, OSError):
-                continue
-
-        return ready_validators
+        """Get validators that entered the phase within the last 5 minutes"""
+        try:
+            return self.backend.ready_validators(slot, phase, max_age=300)
+        except Exception as e:
+            logger.debug(f"Error reading ready validators for slot {slot}: {e}")
+            return []
 
     def _get_active_validators_in_slot(self, slot: int) -> List[str]:
         """Get list of validators active in the given slot"""
-        active_validators = set()
-
-        # Scan all coordination files for this slot
-        pattern = f"slot_{slot}_*.json"
-        coordination_files = list(self.coordination_dir.glob(pattern))
-
-        for file_path in coordination_files:
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    if data.get("slot") == slot:
-                        validator_uid = data.get("validator_uid")
-                        if validator_uid:
-                            active_validators.add(validator_uid)
-            except:
-                continue
-
-        return list(active_validators)
+        return self.backend.active_validators(slot)
 
     def _estimate_phase_start_time(self, slot: int, phase: FlexibleSlotPhase) -> float:
         """Estimate when the current phase started"""
-        # Look for the earliest coordination file for this slot/phase
-        pattern = f"slot_{slot}_{phase.value}_*.json"
-        coordination_files = list(self.coordination_dir.glob(pattern))
-
-        earliest_time = time.time()
-
-        for file_path in coordination_files:
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    timestamp = data.get("timestamp", time.time())
-                    if timestamp < earliest_time:
-                        earliest_time = timestamp
-            except:
-                continue
-
-        return earliest_time
+        # Earliest announcement for this slot/phase
+        timestamps = [
+            entry.timestamp for entry in self.backend.announcements(slot, phase)
+        ]
+        return min(timestamps, default=time.time())
 
     async def handle_flexible_phase_transition(
         self,
@@ -691,17 +823,12 @@ class FlexibleSlotCoordinator:
 
     def cleanup_old_coordination_files(self, keep_slots: int = 5):
         """Clean up old coordination files to prevent disk buildup"""
-        current_time = time.time()
-        cutoff_time = current_time - (
-            keep_slots * self.slot_config.slot_duration_minutes * 60
-        )
-
-        for file_path in self.coordination_dir.glob("slot_*.json"):
-            try:
-                if file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()
-            except OSError:
-                pass
+        try:
+            self.backend.prune_older_than(
+                keep_slots * self.slot_config.slot_duration_minutes * 60
+            )
+        except Exception as e:
+            logger.debug(f"Error cleaning up coordination files: {e}")
 
     async def enforce_task_assignment_cutoff(self, slot: int) -> bool:
         """
@@ -799,30 +926,15 @@ class FlexibleSlotCoordinator:
         ready_validators = [self.validator_uid]  # Always include self
 
         while time.time() - start_time < timeout_seconds:
-            # Look for consensus scoring files from other validators
-            consensus_files = list(
-                self.coordination_dir.glob(f"slot_{slot}_consensus_scoring_*.json")
-            )
-
-            for file_path in consensus_files:
-                try:
-                    # Extract validator UID from filename
-                    filename = file_path.name
-                    # slot_0_consensus_scoring_validator_001.json
-                    parts = (
-                        filename.replace("slot_", "").replace(".json", "").split("_")
+            # Look for consensus scoring entries from other validators
+            for validator_uid in self.backend.ready_validators(
+                slot, FlexibleSlotPhase.CONSENSUS_SCORING
+            ):
+                if validator_uid not in ready_validators:
+                    ready_validators.append(validator_uid)
+                    logger.info(
+                        f"🔗 {self.validator_uid} Found validator {validator_uid} ready for consensus"
                     )
-                    if len(parts) >= 3:
-                        validator_uid = "_".join(
-                            parts[2:]
-                        )  # Everything after "consensus_scoring"
-                        if validator_uid not in ready_validators:
-                            ready_validators.append(validator_uid)
-                            logger.info(
-                                f"🔗 {self.validator_uid} Found validator {validator_uid} ready for consensus"
-                            )
-                except Exception:
-                    continue
 
             if len(ready_validators) > 1:  # Found other validators
                 break
@@ -838,47 +950,14 @@ class FlexibleSlotCoordinator:
         self, slot: int, participating_validators: list
     ) -> dict:
         """Calculate consensus scores using existing SlotCoordinator logic"""
-        all_scores = {}
-
         # Collect scores from all participating validators
-        for validator_uid in participating_validators:
-            score_file = (
-                self.coordination_dir
-                / f"slot_{slot}_consensus_scoring_{validator_uid}.json"
+        entries = [
+            self.backend.announcement(
+                slot, FlexibleSlotPhase.CONSENSUS_SCORING, validator_uid
             )
-            if score_file.exists():
-                try:
-                    with open(score_file, "r") as f:
-                        data = json.load(f)
-                        scores = data.get("extra_data", {}).get("scores", {})
-
-                        # Handle both dict and list formats (copied from SlotCoordinator)
-                        if isinstance(scores, dict):
-                            # Standard dict format: {miner_uid: score}
-                            for miner_uid, score in scores.items():
-                                if miner_uid not in all_scores:
-                                    all_scores[miner_uid] = []
-                                all_scores[miner_uid].append(score)
-                        elif isinstance(scores, list):
-                            # List format: [{"miner_uid": "...", "score": 0.5}]
-                            for score_entry in scores:
-                                if (
-                                    isinstance(score_entry, dict)
-                                    and "miner_uid" in score_entry
-                                    and "score" in score_entry
-                                ):
-                                    miner_uid = score_entry["miner_uid"]
-                                    score = score_entry["score"]
-                                    if miner_uid not in all_scores:
-                                        all_scores[miner_uid] = []
-                                    all_scores[miner_uid].append(score)
-                        else:
-                            logger.warning(
-                                f"⚠️ Invalid scores format from {validator_uid}: {type(scores)}"
-                            )
-
-                except Exception as e:
-                    logger.error(f"❌ Error reading scores from {validator_uid}: {e}")
+            for validator_uid in participating_validators
+        ]
+        all_scores = collect_announced_scores(entry for entry in entries if entry)
 
         # Calculate consensus (simple average) - same logic as SlotCoordinator
         consensus_scores = {}
@@ -953,30 +1032,13 @@ class FlexibleSlotCoordinator:
         ready_validators = [self.validator_uid]  # Always include self
 
         while time.time() - start_time < timeout:
-            # Look for phase files from other validators
-            phase_files = list(
-                self.coordination_dir.glob(f"slot_{slot}_{flexible_phase.value}_*.json")
-            )
-
-            for file_path in phase_files:
-                try:
-                    # Extract validator UID from filename
-                    filename = file_path.name
-                    # slot_0_task_assignment_validator_001.json
-                    parts = (
-                        filename.replace("slot_", "").replace(".json", "").split("_")
+            # Look for phase entries from other validators
+            for validator_uid in self.backend.ready_validators(slot, flexible_phase):
+                if validator_uid not in ready_validators:
+                    ready_validators.append(validator_uid)
+                    logger.info(
+                        f"🔗 {self.validator_uid} Found validator {validator_uid} in phase {flexible_phase.value}"
                     )
-                    if len(parts) >= 3:
-                        validator_uid = "_".join(
-                            parts[2:]
-                        )  # Everything after phase name
-                        if validator_uid not in ready_validators:
-                            ready_validators.append(validator_uid)
-                            logger.info(
-                                f"🔗 {self.validator_uid} Found validator {validator_uid} in phase {flexible_phase.value}"
-                            )
-                except Exception:
-                    continue
 
             # For flexible mode, don't require majority - any validator is good
             if len(ready_validators) >= 1:
@@ -1034,44 +1096,4 @@ class FlexibleSlotCoordinator:
 
     def _sanitize_extra_data(self, extra_data: Dict) -> Dict:
         """Sanitize extra_data to be JSON serializable"""
-        sanitized = {}
-
-        for key, value in extra_data.items():
-            try:
-                if hasattr(value, "model_dump"):
-                    # Pydantic v2 BaseModel
-                    sanitized[key] = value.model_dump()
-                elif hasattr(value, "dict"):
-                    # Pydantic v1 BaseModel
-                    sanitized[key] = value.dict()
-                elif hasattr(value, "__dict__"):
-                    # Regular Python object
-                    sanitized[key] = value.__dict__
-                elif isinstance(value, (list, tuple)):
-                    # Handle lists/tuples of objects
-                    sanitized[key] = [
-                        (
-                            item.model_dump()
-                            if hasattr(item, "model_dump")
-                            else (
-                                item.dict()
-                                if hasattr(item, "dict")
-                                else (
-                                    item.__dict__ if hasattr(item, "__dict__") else item
-                                )
-                            )
-                        )
-                        for item in value
-                    ]
-                elif isinstance(value, dict):
-                    # Recursively sanitize nested dicts
-                    sanitized[key] = self._sanitize_extra_data(value)
-                else:
-                    # Basic JSON-serializable types
-                    json.dumps(value)  # Test if it's serializable
-                    sanitized[key] = value
-            except Exception:
-                # If all else fails, convert to string
-                sanitized[key] = str(value)
-
-        return sanitized
+        return sanitize_extra_data(extra_data)
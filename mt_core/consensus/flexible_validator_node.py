@@ -9,7 +9,6 @@ This module provides enhanced validator functionality that allows:
 - Graceful handling of mid-slot joins
 """
 
-import asyncio
 import logging
 import time
 from typing import Dict, List, Optional, Any
@@ -19,6 +18,7 @@ from .flexible_slot_coordinator import (
     FlexibleSlotPhase,
     FlexibleSlotConfig,
 )
+from .slot_scheduler import SlotScheduler
 from .validator_node_core import ValidatorNodeCore
 from .validator_node_consensus import ValidatorNodeConsensus
 from ..core.datatypes import ValidatorInfo
@@ -56,10 +56,14 @@ class FlexibleValidatorNode:
 
         # Enhanced flexible coordinator
         self.flexible_coordinator = FlexibleSlotCoordinator(
-            validator_uid=self.core.info.uid, slot_config=flexible_config
+            validator_uid=self.core.info.uid,
+            slot_config=flexible_config,
+            backend=getattr(self.core, "coordination_backend", None),
         )
 
         # State tracking
+        self.current_slot = None
+        self.slot_scheduler = None
         self.current_mode = "flexible"  # vs "rigid"
         self.network_sync_status = "unknown"  # unknown, synced, behind, ahead
         self.last_successful_consensus = None
@@ -181,50 +185,52 @@ class FlexibleValidatorNode:
     async def _run_flexible_consensus_loop(self, starting_slot: int):
         """
         Main flexible consensus loop that handles phase transitions gracefully.
-        """
-        current_slot = starting_slot
-        logger.info(f"🔄 Starting flexible consensus loop from slot {current_slot}")
-
-        while True:
-            try:
-                # Check current network state
-                detected_slot, detected_phase, phase_info = (
-                    self.flexible_coordinator.get_current_slot_and_phase()
-                )
-
-                # Handle slot transitions
-                if detected_slot > current_slot:
-                    logger.info(
-                        f"🔄 Slot transition detected: {current_slot} → {detected_slot}"
-                    )
-                    current_slot = detected_slot
-
-                    # Clean up old coordination files
-                    self.flexible_coordinator.cleanup_old_coordination_files()
 
-                # Execute phase-specific logic
-                await self._execute_phase_logic(current_slot, detected_phase)
-
-                # Check for phase transitions
-                next_phase = self._get_next_phase(detected_phase)
-                if next_phase:
-                    transition_success = await self.flexible_coordinator.handle_flexible_phase_transition(
-                        current_slot, detected_phase, next_phase
-                    )
-
-                    if transition_success:
-                        self.successful_transitions += 1
+        Phase handlers are pushed by a SlotScheduler at each phase boundary
+        (or earlier, when a phase signals completion) instead of polling.
+        """
+        self.current_slot = starting_slot
+        logger.info(f"🔄 Starting flexible consensus loop from slot {starting_slot}")
 
-                    # Update metrics
-                    self.phases_completed += 1
+        self.slot_scheduler = SlotScheduler(
+            self.flexible_coordinator.slot_schedule(),
+            self._on_phase,
+            name=self.core.info.uid,
+        )
+        self.core.slot_scheduler = self.slot_scheduler
+        self.slot_scheduler.start(starting_slot)
+        try:
+            await self.slot_scheduler.run()
+        finally:
+            self.core.slot_scheduler = None
+
+    async def _on_phase(self, slot: int, phase: FlexibleSlotPhase):
+        """Handle one phase boundary pushed by the slot scheduler."""
+        # Handle slot transitions
+        if slot > self.current_slot:
+            logger.info(f"🔄 Slot transition detected: {self.current_slot} → {slot}")
+            self.current_slot = slot
+
+            # Clean up old coordination files
+            self.flexible_coordinator.cleanup_old_coordination_files()
+
+        # Execute phase-specific logic
+        await self._execute_phase_logic(slot, phase)
+
+        # Check for phase transitions
+        next_phase = self._get_next_phase(phase)
+        if next_phase:
+            transition_success = (
+                await self.flexible_coordinator.handle_flexible_phase_transition(
+                    slot, phase, next_phase
+                )
+            )
 
-                # Adaptive sleep based on phase and network activity
-                sleep_time = self._calculate_adaptive_sleep(detected_phase)
-                await asyncio.sleep(sleep_time)
+            if transition_success:
+                self.successful_transitions += 1
 
-            except Exception as e:
-                logger.error(f"❌ Error in consensus loop: {e}")
-                await asyncio.sleep(10)  # Error recovery delay
+            # Update metrics
+            self.phases_completed += 1
 
     async def _execute_phase_logic(self, slot: int, phase: FlexibleSlotPhase):
         """Execute the logic specific to each phase."""
@@ -346,25 +352,6 @@ class FlexibleValidatorNode:
         except ValueError:
             return FlexibleSlotPhase.TASK_ASSIGNMENT
 
-    def _calculate_adaptive_sleep(self, phase: FlexibleSlotPhase) -> float:
-        """Calculate adaptive sleep time based on phase and network activity."""
-        base_sleep = {
-            FlexibleSlotPhase.TASK_ASSIGNMENT: 5.0,
-            FlexibleSlotPhase.TASK_EXECUTION: 8.0,
-            FlexibleSlotPhase.CONSENSUS_SCORING: 3.0,
-            FlexibleSlotPhase.METAGRAPH_UPDATE: 2.0,
-        }
-
-        sleep_time = base_sleep.get(phase, 5.0)
-
-        # Adjust based on network sync status
-        if self.network_sync_status == "joined_mid_slot":
-            sleep_time *= 0.7  # More frequent checks when catching up
-        elif self.network_sync_status == "ahead":
-            sleep_time *= 1.5  # Less frequent checks when ahead
-
-        return sleep_time
-
     def _should_assign_tasks(self, slot: int) -> bool:
         """Determine if we should assign new tasks in this slot."""
         # Don't assign tasks if we joined very late in the assignment phase
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Score Gossip Module
+
+Dissemination of signed score bundles over a bounded-degree overlay instead
+of every validator posting its scores to every other validator:
+- Overlay: `redundancy` k-ary trees over the validator set, each a
+  deterministic permutation seeded by the slot, so every validator derives
+  the same neighbours without coordination and the load rotates per slot
+- ScoreGossip: floods each new bundle to the overlay neighbours it did not
+  come from, deduplicating by the digest of the bundle's canonical bytes;
+  bundles queued for the same peer within a flush interval travel in one
+  message
+- Bundles are the binary score broadcasts of score_codec, signed by their
+  origin and forwarded verbatim, so relays cannot alter them
+- Bundles for slots outside a window around the local current slot are
+  dropped on receipt
+
+Each validator sends to at most redundancy * (fanout + 1) peers and a bundle
+reaches every validator within 2 * ceil(log_fanout(V)) hops when the trees
+are intact; a second tree covers validators cut off by a faulty ancestor.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from ..bcs import BCSDecoder, BCSEncoder, BCSError
+from ..network.score_codec import (
+    ScoreBroadcast,
+    ScoreCodecError,
+    decode_score_broadcast,
+)
+
+logger = logging.getLogger(__name__)
+
+GOSSIP_ENDPOINT = "/consensus/gossip_scores"
+GOSSIP_CONTENT_TYPE = "application/x-mt-score-bundles"
+GOSSIP_SENDER_HEADER = "X-Validator-Uid"
+
+DEFAULT_FANOUT = 3
+DEFAULT_REDUNDANCY = 2
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_RETENTION_SLOTS = 4
+
+_BUNDLE_ID_PREFIX = "gossip_slot_"
+
+GossipTransport = Callable[[str, bytes], Awaitable[Any]]
+
+
+def gossip_bundle_id(slot: int) -> str:
+    """Broadcast ID of a gossip bundle; binds the slot into the signed bytes."""
+    return f"{_BUNDLE_ID_PREFIX}{slot}"
+
+
+def bundle_slot(broadcast_id: str) -> Optional[int]:
+    """Slot of a gossip bundle, or None for other broadcast IDs."""
+    if not broadcast_id.startswith(_BUNDLE_ID_PREFIX):
+        return None
+    try:
+        return int(broadcast_id[len(_BUNDLE_ID_PREFIX) :])
+    except ValueError:
+        return None
+
+
+def bundle_digest(body: bytes) -> bytes:
+    """Deduplication key of a bundle (its canonical bytes)."""
+    return hashlib.sha256(body).digest()
+
+
+def encode_envelope(bundles: Sequence[bytes]) -> bytes:
+    """One gossip message carrying several encoded bundles."""
+    encoder = BCSEncoder()
+    encoder.encode_vector(list(bundles), encoder.encode_bytes)
+    return encoder.to_bytes()
+
+
+def decode_envelope(data: bytes) -> List[bytes]:
+    """
+    Raises:
+        ValueError: If the message is malformed
+    """
+    decoder = BCSDecoder(data)
+    try:
+        bundles = [decoder.decode_bytes() for _ in range(decoder.decode_uleb128())]
+    except BCSError as e:
+        raise ValueError(f"Malformed gossip envelope: {e}")
+    if not decoder.is_finished():
+        raise ValueError("Trailing bytes after gossip envelope")
+    return bundles
+
+
+def gossip_neighbours(
+    validator_uid: str,
+    validators: Sequence[str],
+    slot: int,
+    fanout: int = DEFAULT_FANOUT,
+    redundancy: int = DEFAULT_REDUNDANCY,
+) -> List[str]:
+    """
+    Overlay neighbours of a validator for a slot.
+
+    Tree t orders the validators with a permutation seeded by (slot, t);
+    position i has parent (i - 1) // fanout and children i * fanout + 1 ..
+    i * fanout + fanout. The neighbours are the parents and children over
+    all trees.
+
+    Args:
+        validator_uid: Validator whose neighbours are wanted
+        validators: All validator UIDs (order does not matter)
+        slot: Slot seeding the permutations
+        fanout: Children per tree node
+        redundancy: Number of trees
+    """
+    members = sorted(set(validators) | {validator_uid})
+    neighbours: Set[str] = set()
+    for tree in range(redundancy):
+        seed = hashlib.sha256(f"gossip:{slot}:{tree}".encode()).digest()
+        order = list(members)
+        random.Random(seed).shuffle(order)
+        position = order.index(validator_uid)
+        if position > 0:
+            neighbours.add(order[(position - 1) // fanout])
+        first_child = position * fanout + 1
+        neighbours.update(order[first_child : first_child + fanout])
+    neighbours.discard(validator_uid)
+    return sorted(neighbours)
+
+
+class ScoreGossip:
+    """
+    Gossip state of one validator.
+
+    publish() injects this validator's signed bundle; receive() handles a
+    peer's message. New bundles are verified (verify callback), delivered
+    (deliver callback) and queued for every neighbour except the sender.
+    """
+
+    def __init__(
+        self,
+        validator_uid: str,
+        members: Callable[[int], Sequence[str]],
+        transport: Optional[GossipTransport] = None,
+        verify: Optional[Callable[[ScoreBroadcast, bytes], Awaitable[bool]]] = None,
+        deliver: Optional[Callable[[int, ScoreBroadcast], Awaitable[Any]]] = None,
+        accepts_slot: Optional[Callable[[int], bool]] = None,
+        fanout: int = DEFAULT_FANOUT,
+        redundancy: int = DEFAULT_REDUNDANCY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        retention_slots: int = DEFAULT_RETENTION_SLOTS,
+        name: str = "",
+    ):
+        """
+        Args:
+            validator_uid: UID of this validator
+            members: Returns the validator UIDs taking part in a slot
+            transport: Coroutine (peer_uid, message) sending to a peer
+            verify: Coroutine checking a bundle's origin signature
+            deliver: Coroutine receiving each new bundle from another origin
+            accepts_slot: Whether a bundle's slot is near enough to the local
+                current slot; bundles for other slots are dropped before they
+                are marked seen, relayed or delivered
+            fanout: Children per overlay tree node
+            redundancy: Number of overlay trees
+            flush_interval: Seconds bundles wait to share a message
+            retention_slots: Slots whose digests are remembered
+            name: Prefix for log messages
+        """
+        if fanout < 1 or redundancy < 1:
+            raise ValueError("fanout and redundancy must be at least 1")
+        self.validator_uid = validator_uid
+        self.members = members
+        self.transport = transport
+        self.verify = verify
+        self.deliver = deliver
+        self.accepts_slot = accepts_slot
+        self.fanout = fanout
+        self.redundancy = redundancy
+        self.flush_interval = flush_interval
+        self.retention_slots = retention_slots
+        self.name = name
+
+        self._seen: Dict[int, Set[bytes]] = {}  # slot -> digests
+        self._neighbours: Dict[int, List[str]] = {}
+        self._outbox: Dict[str, List[bytes]] = {}  # peer -> encoded bundles
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sends: Set[asyncio.Task] = set()
+
+        self.messages_sent = 0
+        self.bundles_sent = 0
+        self.bundles_received = 0
+        self.duplicates = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any, validator_uid: str, **kwargs) -> "ScoreGossip":
+        """Gossip configured from the CONSENSUS_GOSSIP_* settings."""
+        return cls(
+            validator_uid,
+            fanout=getattr(settings, "CONSENSUS_GOSSIP_FANOUT", DEFAULT_FANOUT),
+            redundancy=getattr(settings, "CONSENSUS_GOSSIP_REDUNDANCY", DEFAULT_REDUNDANCY),
+            flush_interval=getattr(
+                settings, "CONSENSUS_GOSSIP_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL
+            ),
+            **kwargs,
+        )
+
+    def attach_transport(self, transport: GossipTransport):
+        self.transport = transport
+
+    def attach_delivery(self, deliver: Callable[[int, ScoreBroadcast], Awaitable[Any]]):
+        self.deliver = deliver
+
+    def neighbours(self, slot: int) -> List[str]:
+        """Overlay neighbours for a slot (cached per slot)."""
+        if slot not in self._neighbours:
+            self._neighbours[slot] = gossip_neighbours(
+                self.validator_uid,
+                self.members(slot),
+                slot,
+                self.fanout,
+                self.redundancy,
+            )
+        return self._neighbours[slot]
+
+    def _mark_seen(self, slot: int, digest: bytes) -> bool:
+        """Remember a digest; False if it was already known."""
+        seen = self._seen.get(slot)
+        if seen is None:
+            if self._is_stale(slot):
+                return False  # Older than every remembered slot: treat as seen
+            seen = self._seen[slot] = set()
+            for old in sorted(self._seen)[: -self.retention_slots]:
+                self._seen.pop(old, None)
+                self._neighbours.pop(old, None)
+        if digest in seen:
+            return False
+        seen.add(digest)
+        return True
+
+    def _is_stale(self, slot: int) -> bool:
+        return (
+            slot not in self._seen
+            and len(self._seen) >= self.retention_slots
+            and slot < min(self._seen)
+        )
+
+    def _enqueue(self, slot: int, bundle: bytes, exclude: Optional[str] = None) -> int:
+        peers = [peer for peer in self.neighbours(slot) if peer != exclude]
+        for peer in peers:
+            self._outbox.setdefault(peer, []).append(bundle)
+        if peers and self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._flush
+            )
+        return len(peers)
+
+    async def publish(self, slot: int, bundle: bytes) -> int:
+        """
+        Start disseminating this validator's encoded, signed bundle.
+
+        Returns:
+            Number of neighbours the bundle was queued for
+
+        Raises:
+            ScoreCodecError: If the bundle cannot be decoded
+        """
+        _, body = decode_score_broadcast(bundle)
+        if not self._mark_seen(slot, bundle_digest(body)):
+            return 0
+        return self._enqueue(slot, bundle)
+
+    async def receive(self, data: bytes, sender_uid: Optional[str] = None) -> int:
+        """
+        Handle a gossip message from a peer.
+
+        Returns:
+            Number of bundles that were new to this validator
+
+        Raises:
+            ValueError: If the message itself is malformed
+        """
+        fresh = 0
+        for bundle in decode_envelope(data):
+            self.bundles_received += 1
+            try:
+                broadcast, body = decode_score_broadcast(bundle)
+            except ScoreCodecError as e:
+                self.rejected += 1
+                logger.warning(f"{self.name} Dropping malformed gossip bundle: {e}")
+                continue
+            slot = bundle_slot(broadcast.broadcast_id)
+            if slot is None:
+                self.rejected += 1
+                continue
+            if self.accepts_slot is not None and not self.accepts_slot(slot):
+                # A signed bundle for a far-off slot must not push live slots
+                # out of the seen set
+                self.rejected += 1
+                logger.warning(
+                    f"{self.name} Dropping gossip bundle from {broadcast.sender_uid} for out-of-range slot {slot}"
+                )
+                continue
+
+            digest = bundle_digest(body)
+            if digest in self._seen.get(slot, ()) or self._is_stale(slot):
+                self.duplicates += 1
+                continue
+            if self.verify is not None and not await self.verify(broadcast, body):
+                self.rejected += 1
+                logger.warning(
+                    f"{self.name} Dropping gossip bundle from {broadcast.sender_uid}: invalid signature"
+                )
+                continue
+            if not self._mark_seen(slot, digest):
+                self.duplicates += 1  # Arrived again while verifying
+                continue
+
+            fresh += 1
+            self._enqueue(slot, bundle, exclude=sender_uid)
+            if self.deliver is not None and broadcast.sender_uid != self.validator_uid:
+                try:
+                    await self.deliver(slot, broadcast)
+                except Exception as e:
+                    logger.error(f"{self.name} Error delivering gossip bundle: {e}")
+        return fresh
+
+    def _flush(self):
+        self._flush_handle = None
+        outbox, self._outbox = self._outbox, {}
+        if self.transport is None:
+            logger.debug(f"{self.name} No gossip transport attached; dropping outbox")
+            return
+        for peer, bundles in outbox.items():
+            self.messages_sent += 1
+            self.bundles_sent += len(bundles)
+            task = asyncio.ensure_future(self._send(peer, encode_envelope(bundles)))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+
+    async def _send(self, peer: str, message: bytes):
+        try:
+            await self.transport(peer, message)
+        except Exception as e:
+            logger.warning(f"{self.name} Gossip to {peer} failed: {e}")
+
+    async def drain(self):
+        """Send anything still queued and wait for in-flight messages."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+        if self._sends:
+            await asyncio.gather(*list(self._sends), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Gossip counters for status endpoints and monitoring."""
+        return {
+            "messages_sent": self.messages_sent,
+            "bundles_sent": self.bundles_sent,
+            "bundles_received": self.bundles_received,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "tracked_slots": len(self._seen),
+        }
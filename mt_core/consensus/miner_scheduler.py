@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Miner Scheduler Module
+
+Capacity- and latency-aware assignment of a slot's tasks to miners:
+- Per-miner load: tasks in flight, latency EWMA, success rate and the
+  number of tasks the miner says it runs at once (X-MT-Miner-Capacity)
+- Each miner is kept at its concurrency limit: its advertised capacity,
+  capped by CONSENSUS_MAX_TASKS_PER_MINER and scaled down by its success
+  rate, so a failing miner drops back to one task at a time
+- Pending tasks wait in a heap ordered by round, then by the latest time
+  they can start and still finish in the window; the most urgent task whose
+  miner has a free slot is sent first
+- Each miner gets up to CONSENSUS_TASKS_PER_MINER_PER_SLOT tasks, sent as
+  its free slots allow and only while one can still finish in the window.
+  Every selected miner gets its first task before any follow-up, so the
+  selection probabilities still decide which miners are scored; fast and
+  high-capacity miners just contribute more samples
+- Tasks of a miner whose endpoint circuit breaker is open are dropped when
+  they reach the front of the queue, so the slots they would have used go
+  to the follow-up tasks of healthy miners
+"""
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from ..core.datatypes import MinerInfo
+from ..monitoring.circuit_breaker import CircuitBreakerRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TASKS_PER_MINER = 4
+DEFAULT_TASKS_PER_MINER_PER_SLOT = 3
+DEFAULT_LATENCY_ALPHA = 0.3
+
+
+@dataclass
+class MinerLoad:
+    """Scheduling state of one miner."""
+
+    in_flight: int = 0
+    latency_ewma: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace-smoothed, so one early failure does not zero a new miner
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+
+@dataclass(order=True)
+class PendingTask:
+    """A task waiting for its miner to have a free slot."""
+
+    round: int  # 1 for a miner's first task in the slot
+    start_by: float  # Latest start that still finishes within the window
+    seq: int
+    miner: MinerInfo = field(compare=False)
+
+
+class MinerScheduler:
+    """
+    Tracks miner load and orders a slot's pending tasks.
+
+    Load statistics persist across slots; the pending queue is per dispatch
+    run (clear() it before a new slot).
+    """
+
+    def __init__(
+        self,
+        max_tasks_per_miner: int = DEFAULT_MAX_TASKS_PER_MINER,
+        tasks_per_miner_per_slot: int = DEFAULT_TASKS_PER_MINER_PER_SLOT,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
+        """
+        Args:
+            max_tasks_per_miner: Most tasks in flight on one miner at once
+            tasks_per_miner_per_slot: Most tasks one miner gets in a slot
+            latency_alpha: Weight of the newest sample in the latency EWMA
+            breakers: Per-endpoint circuit breakers consulted before a task
+                is handed out (None disables the check)
+        """
+        self.max_tasks_per_miner = max(1, max_tasks_per_miner)
+        self.tasks_per_miner_per_slot = max(1, tasks_per_miner_per_slot)
+        self.latency_alpha = latency_alpha
+        self.breakers = breakers
+        self.skipped_open = 0  # Tasks dropped because the miner's breaker was open
+
+        self.loads: Dict[str, MinerLoad] = {}
+        self.capacity: Dict[str, int] = {}  # Miner endpoint -> advertised capacity
+        self._pending: List[PendingTask] = []
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Any, breakers: Optional[CircuitBreakerRegistry] = None
+    ) -> "MinerScheduler":
+        """Scheduler configured from the CONSENSUS_* scheduling settings."""
+        return cls(
+            max_tasks_per_miner=getattr(
+                settings, "CONSENSUS_MAX_TASKS_PER_MINER", DEFAULT_MAX_TASKS_PER_MINER
+            ),
+            tasks_per_miner_per_slot=getattr(
+                settings,
+                "CONSENSUS_TASKS_PER_MINER_PER_SLOT",
+                DEFAULT_TASKS_PER_MINER_PER_SLOT,
+            ),
+            latency_alpha=getattr(
+                settings, "CONSENSUS_SCHEDULER_LATENCY_ALPHA", DEFAULT_LATENCY_ALPHA
+            ),
+            breakers=breakers,
+        )
+
+    # === Miner load ===
+
+    def load(self, miner: MinerInfo) -> MinerLoad:
+        return self.loads.setdefault(miner.uid, MinerLoad())
+
+    def set_capacity(self, endpoint: str, capacity: int):
+        """Record the concurrency a miner endpoint advertises."""
+        if capacity > 0:
+            self.capacity[endpoint.rstrip("/")] = capacity
+
+    def limit(self, miner: MinerInfo) -> int:
+        """Tasks the miner should have in flight at once."""
+        endpoint = (miner.api_endpoint or "").rstrip("/")
+        advertised = min(self.capacity.get(endpoint, 1), self.max_tasks_per_miner)
+        return max(1, int(advertised * self.load(miner).success_rate + 0.5))
+
+    def available(self, miner: MinerInfo) -> bool:
+        """Whether the miner can take another task now."""
+        return self.load(miner).in_flight < self.limit(miner)
+
+    def reachable(self, miner: MinerInfo) -> bool:
+        """Whether the miner's circuit breaker lets a request through."""
+        return self.breakers is None or self.breakers.available(miner.api_endpoint or "")
+
+    def expected_latency(self, miner: MinerInfo, default: float) -> float:
+        latency = self.load(miner).latency_ewma
+        return default if latency is None else latency
+
+    def started(self, miner: MinerInfo):
+        self.load(miner).in_flight += 1
+
+    def finished(self, miner: MinerInfo, latency: Optional[float]):
+        """
+        Record the end of a task.
+
+        Args:
+            miner: Miner that ran the task
+            latency: Seconds from send to result, or None if the task failed
+                or timed out
+        """
+        load = self.load(miner)
+        load.in_flight = max(0, load.in_flight - 1)
+        if latency is None:
+            load.failures += 1
+            return
+        load.successes += 1
+        if load.latency_ewma is None:
+            load.latency_ewma = latency
+        else:
+            load.latency_ewma += self.latency_alpha * (latency - load.latency_ewma)
+
+    # === Pending tasks ===
+
+    def clear(self):
+        """Drop pending tasks (start of a new dispatch run)."""
+        self._pending = []
+
+    def push(self, miner: MinerInfo, window_end: float, default_latency: float):
+        """Queue a miner's first task of the slot, to finish by window_end."""
+        start_by = window_end - self.expected_latency(miner, default_latency)
+        heapq.heappush(self._pending, PendingTask(1, start_by, next(self._seq), miner))
+
+    def pop_ready(self, now: float) -> Optional[PendingTask]:
+        """
+        Most urgent pending task whose miner has a free slot, if any.
+
+        Popping a miner's task queues its next one (while it has rounds left),
+        which waits until the miner has a free slot. Follow-up tasks that can
+        no longer finish in the window, and tasks of miners whose circuit
+        breaker is open, are dropped.
+        """
+        skipped = []
+        ready = None
+        while self._pending:
+            item = heapq.heappop(self._pending)
+            if item.round > 1 and now > item.start_by:
+                continue
+            if not self.reachable(item.miner):
+                self.skipped_open += 1
+                continue
+            if self.available(item.miner):
+                ready = item
+                break
+            skipped.append(item)
+        for item in skipped:
+            heapq.heappush(self._pending, item)
+        if ready is not None and ready.round < self.tasks_per_miner_per_slot:
+            heapq.heappush(
+                self._pending,
+                PendingTask(ready.round + 1, ready.start_by, next(self._seq), ready.miner),
+            )
+        return ready
+
+    def drop_pending(self, miner: MinerInfo):
+        """Drop a miner's pending tasks (e.g. after a failed send)."""
+        self._pending = [item for item in self._pending if item.miner.uid != miner.uid]
+        heapq.heapify(self._pending)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "in_flight": sum(load.in_flight for load in self.loads.values()),
+            "skipped_open": self.skipped_open,
+            "miners": {
+                uid: {
+                    "in_flight": load.in_flight,
+                    "latency_ewma": load.latency_ewma,
+                    "success_rate": round(load.success_rate, 3),
+                }
+                for uid, load in self.loads.items()
+            },
+        }
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Online Consensus Aggregation Module
+
+This module maintains per-slot, per-miner running statistics of validator scores
+so consensus can be read at any moment instead of being rebuilt at the end of the
+consensus phase:
+- Trust-weighted running sums, counts and second moments per miner
+- O(1) update as each local or received ValidatorScore arrives
+- Interim consensus queries for early finalization once quorum is reached
+
+Each (miner, validator) pair contributes one score per slot. A newer score from
+the same validator replaces its previous contribution, matching the
+"last score wins" behaviour of the former nested-dict aggregation.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.datatypes import ValidatorScore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MinerScoreStats:
+    """Snapshot of the aggregated scores for one miner in one slot."""
+
+    mean: float
+    variance: float
+    count: int
+    total_weight: float
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class _MinerAccumulator:
+    """Running sums for one miner. All updates are O(1)."""
+
+    __slots__ = ("count", "sum_score", "sum_weight", "sum_weighted", "sum_weighted_sq")
+
+    def __init__(self):
+        self.count = 0
+        self.sum_score = 0.0
+        self.sum_weight = 0.0
+        self.sum_weighted = 0.0
+        self.sum_weighted_sq = 0.0
+
+    def add(self, score: float, weight: float, sign: int = 1):
+        self.count += sign
+        self.sum_score += sign * score
+        self.sum_weight += sign * weight
+        self.sum_weighted += sign * weight * score
+        self.sum_weighted_sq += sign * weight * score * score
+
+    def mean(self) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        if self.sum_weight > 1e-12:
+            return self.sum_weighted / self.sum_weight
+        # All contributing validators have zero trust: fall back to plain mean
+        return self.sum_score / self.count
+
+    def stats(self) -> Optional[MinerScoreStats]:
+        mean = self.mean()
+        if mean is None:
+            return None
+        if self.sum_weight > 1e-12:
+            variance = self.sum_weighted_sq / self.sum_weight - mean * mean
+        else:
+            variance = 0.0
+        return MinerScoreStats(
+            mean=mean,
+            variance=max(0.0, variance),
+            count=self.count,
+            total_weight=self.sum_weight,
+        )
+
+
+class _SlotAggregate:
+    """Aggregated state for a single slot."""
+
+    __slots__ = ("miners", "contributions", "validators")
+
+    def __init__(self):
+        self.miners: Dict[str, _MinerAccumulator] = {}
+        # (miner_uid, validator_uid) -> (score, weight) currently counted
+        self.contributions: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self.validators: Dict[str, int] = {}  # validator_uid -> miners scored
+
+
+class OnlineScoreAggregator:
+    """
+    Incremental trust-weighted consensus over validator scores, keyed by slot.
+
+    The consensus score of a miner is the trust-weighted mean of the latest score
+    each validator gave it in the slot. If every contributing validator has zero
+    weight, the unweighted mean is used instead.
+    """
+
+    def __init__(self):
+        self._slots: Dict[int, _SlotAggregate] = {}
+
+    # === Updates ===
+
+    def add_score(
+        self,
+        slot: int,
+        miner_uid: str,
+        validator_uid: str,
+        score: float,
+        weight: float = 1.0,
+    ):
+        """
+        Add or replace the score a validator gave a miner in a slot.
+
+        Args:
+            slot: Slot (or cycle) the score belongs to
+            miner_uid: UID of the scored miner
+            validator_uid: UID of the validator that produced the score
+            score: Score value
+            weight: Trust weight of the validator (negative values count as 0)
+        """
+        aggregate = self._slots.get(slot)
+        if aggregate is None:
+            aggregate = self._slots[slot] = _SlotAggregate()
+
+        accumulator = aggregate.miners.get(miner_uid)
+        if accumulator is None:
+            accumulator = aggregate.miners[miner_uid] = _MinerAccumulator()
+
+        score = float(score)
+        weight = max(0.0, float(weight))
+        key = (miner_uid, validator_uid)
+        previous = aggregate.contributions.get(key)
+        if previous is not None:
+            accumulator.add(previous[0], previous[1], sign=-1)
+        else:
+            aggregate.validators[validator_uid] = (
+                aggregate.validators.get(validator_uid, 0) + 1
+            )
+
+        accumulator.add(score, weight)
+        aggregate.contributions[key] = (score, weight)
+
+    def add_scores(
+        self,
+        slot: int,
+        validator_uid: str,
+        scores: Iterable[ValidatorScore],
+        weight: float = 1.0,
+    ) -> int:
+        """
+        Add every score of one validator submission.
+
+        Args:
+            slot: Slot (or cycle) the scores belong to
+            validator_uid: UID of the submitting validator
+            scores: Scores from that validator
+            weight: Trust weight of the validator
+
+        Returns:
+            Number of scores added
+        """
+        added = 0
+        for score in scores:
+            self.add_score(slot, score.miner_uid, validator_uid, score.score, weight)
+            added += 1
+        return added
+
+    def merge_slot(self, source_slot: int, target_slot: int) -> int:
+        """
+        Copy every contribution from one slot key into another.
+
+        Used where scores were received under a cycle number but are finalized
+        under a slot number.
+
+        Returns:
+            Number of contributions copied
+        """
+        source = self._slots.get(source_slot)
+        if source is None or source_slot == target_slot:
+            return 0
+        for (miner_uid, validator_uid), (score, weight) in list(
+            source.contributions.items()
+        ):
+            self.add_score(target_slot, miner_uid, validator_uid, score, weight)
+        return len(source.contributions)
+
+    def discard_slot(self, slot: int):
+        """Forget all state for a slot."""
+        self._slots.pop(slot, None)
+
+    def prune(self, keep_from_slot: int) -> int:
+        """
+        Drop every slot older than keep_from_slot.
+
+        Returns:
+            Number of slots removed
+        """
+        stale = [slot for slot in self._slots if slot < keep_from_slot]
+        for slot in stale:
+            del self._slots[slot]
+        return len(stale)
+
+    # === Queries ===
+
+    def has_slot(self, slot: int) -> bool:
+        return slot in self._slots
+
+    def consensus(self, slot: int) -> Dict[str, float]:
+        """
+        Current consensus score of every miner in a slot.
+
+        Can be called at any time, e.g. for early finalization once quorum is
+        reached. The cost is one read per miner.
+        """
+        aggregate = self._slots.get(slot)
+        if aggregate is None:
+            return {}
+        result = {}
+        for miner_uid, accumulator in aggregate.miners.items():
+            mean = accumulator.mean()
+            if mean is not None:
+                result[miner_uid] = mean
+        return result
+
+    def miner_consensus(self, slot: int, miner_uid: str) -> Optional[float]:
+        """Current consensus score of one miner, or None if it has no scores."""
+        aggregate = self._slots.get(slot)
+        if aggregate is None or miner_uid not in aggregate.miners:
+            return None
+        return aggregate.miners[miner_uid].mean()
+
+    def miner_stats(self, slot: int, miner_uid: str) -> Optional[MinerScoreStats]:
+        """Mean, weighted variance, count and weight of one miner's scores."""
+        aggregate = self._slots.get(slot)
+        if aggregate is None or miner_uid not in aggregate.miners:
+            return None
+        return aggregate.miners[miner_uid].stats()
+
+    def validators(self, slot: int) -> Set[str]:
+        """UIDs of validators that contributed at least one score to a slot."""
+        aggregate = self._slots.get(slot)
+        return set(aggregate.validators) if aggregate else set()
+
+    def validator_count(self, slot: int) -> int:
+        aggregate = self._slots.get(slot)
+        return len(aggregate.validators) if aggregate else 0
+
+    def miner_count(self, slot: int) -> int:
+        aggregate = self._slots.get(slot)
+        return len(aggregate.miners) if aggregate else 0
+
+    def slots(self) -> List[int]:
+        return sorted(self._slots)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Quorum Tracking Module
+
+This module tracks which validators have delivered their scores for a slot (or
+cycle) and wakes waiters the moment a quorum is reached:
+- Participants are recorded directly by the score receive endpoints
+- Count-weighted or stake-weighted quorum rules, configured in one place
+- Waiters are resolved on the recording call, with no polling interval
+"""
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUORUM_FRACTION = 0.6
+DEFAULT_QUORUM_MIN_COUNT = 2
+
+
+@dataclass(frozen=True)
+class QuorumRule:
+    """
+    Threshold a set of participating validators must reach.
+
+    Attributes:
+        fraction: Share of the expected validators (by count, or by stake when
+            stake_weighted is set) that must have participated
+        min_count: Minimum number of participating validators
+        stake_weighted: Weigh participants by stake instead of counting them
+    """
+
+    fraction: float = DEFAULT_QUORUM_FRACTION
+    min_count: int = DEFAULT_QUORUM_MIN_COUNT
+    stake_weighted: bool = False
+
+    def is_met(
+        self,
+        participants: Set[str],
+        expected: Optional[Mapping[str, float]] = None,
+        local_uid: Optional[str] = None,
+    ) -> bool:
+        """
+        Check whether the participants satisfy this rule.
+
+        Args:
+            participants: UIDs of validators whose scores were received
+            expected: Validators expected to participate, mapped to their stake
+            local_uid: UID of this validator, always counted as participating
+
+        Returns:
+            True if the quorum is reached
+        """
+        present = set(participants)
+        if local_uid is not None:
+            present.add(local_uid)
+        expected = expected or {}
+
+        if len(present) < self.min_count:
+            return False
+
+        if self.stake_weighted:
+            total_stake = sum(max(0.0, stake) for stake in expected.values())
+            if total_stake > 0:
+                present_stake = sum(
+                    max(0.0, expected.get(uid, 0.0)) for uid in present
+                )
+                return present_stake >= self.fraction * total_stake
+
+        # Count-weighted (also used when no stake information is available)
+        return len(present) >= math.ceil(self.fraction * len(expected) - 1e-9)
+
+
+def quorum_rule_from_settings(settings: Any) -> QuorumRule:
+    """
+    Build the node's quorum rule from consensus settings.
+
+    Reads ``settings.validators`` (min_for_consensus, required_percentage,
+    quorum_stake_weighted) and falls back to the module defaults.
+    """
+    validators_config = getattr(settings, "validators", None)
+    return QuorumRule(
+        fraction=float(
+            getattr(validators_config, "required_percentage", DEFAULT_QUORUM_FRACTION)
+        ),
+        min_count=int(
+            getattr(validators_config, "min_for_consensus", DEFAULT_QUORUM_MIN_COUNT)
+        ),
+        stake_weighted=bool(
+            getattr(validators_config, "quorum_stake_weighted", False)
+        ),
+    )
+
+
+class QuorumTracker:
+    """
+    Per-slot record of participating validators with quorum notification.
+
+    Receive handlers call `record` for every accepted score submission. Waiters
+    registered through `wait_for` are checked on each `record` call and resolved
+    as soon as their rule is satisfied.
+    """
+
+    def __init__(self):
+        self._participants: Dict[Any, Set[str]] = {}
+        self._waiters: Dict[
+            Any, List[Tuple[Callable[[Set[str]], bool], asyncio.Future]]
+        ] = {}
+
+    def record(self, key: Any, validator_uid: str):
+        """
+        Record that a validator delivered its scores for a slot.
+
+        Args:
+            key: Slot (or cycle) number
+            validator_uid: UID of the submitting validator
+        """
+        participants = self._participants.setdefault(key, set())
+        participants.add(validator_uid)
+
+        for check, waiter in self._waiters.get(key, ()):
+            if not waiter.done() and check(participants):
+                waiter.set_result(True)
+
+    def participants(self, key: Any) -> Set[str]:
+        """UIDs of validators recorded for a slot."""
+        return set(self._participants.get(key, ()))
+
+    def count(self, key: Any) -> int:
+        return len(self._participants.get(key, ()))
+
+    def is_met(
+        self,
+        key: Any,
+        rule: QuorumRule,
+        expected: Optional[Mapping[str, float]] = None,
+        local_uid: Optional[str] = None,
+    ) -> bool:
+        """Check the rule against the current participants, without waiting."""
+        return rule.is_met(self._participants.get(key, set()), expected, local_uid)
+
+    async def wait_for(
+        self,
+        key: Any,
+        rule: QuorumRule,
+        expected: Optional[Mapping[str, float]] = None,
+        local_uid: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait until the quorum rule is met for a slot.
+
+        Args:
+            key: Slot (or cycle) number
+            rule: Quorum rule to satisfy
+            expected: Validators expected to participate, mapped to their stake
+            local_uid: UID of this validator, always counted as participating
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the quorum was reached, False on timeout
+        """
+
+        def check(participants: Set[str]) -> bool:
+            return rule.is_met(participants, expected, local_uid)
+
+        if check(self._participants.get(key, set())):
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (check, waiter)
+        self._waiters.setdefault(key, []).append(entry)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.remove(entry)
+                if not waiters:
+                    del self._waiters[key]
+
+    def discard(self, key: Any):
+        """Forget the participants of a slot (pending waiters are kept)."""
+        self._participants.pop(key, None)
+
+    def prune(self, keep_from: int) -> int:
+        """
+        Drop participant records older than keep_from.
+
+        Returns:
+            Number of slots removed
+        """
+        stale = [
+            key
+            for key in self._participants
+            if isinstance(key, int) and key < keep_from and key not in self._waiters
+        ]
+        for key in stale:
+            del self._participants[key]
+        return len(stale)
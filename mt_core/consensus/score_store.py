@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+"""
+Score Store Module
+
+This module keeps every validator score a node produces or receives in one
+bounded store of per-slot tables:
+- One table per slot (or cycle) key, holding local scores, per-task scores,
+  scores received from peers and the aggregated consensus of that slot
+- A (miner, validator, task) index per table, so all scores for a miner in a
+  slot are found with a single lookup
+- A retention window relative to the current slot (and, separately, the
+  current cycle): tables more than the window behind are evicted, and keys
+  outside [current - window + 1, current + 1] are ignored instead of opening
+  tables, so scores a peer sends for made-up slots cannot push out live ones
+- A memory estimate exported as a metric
+
+The legacy attributes of ValidatorNodeCore (slot_scores, cycle_scores,
+validator_scores, received_validator_scores, slot_aggregated_scores) are
+mapping views over this store, so existing readers and writers keep their
+shapes while the underlying state stays bounded.
+"""
+
+import logging
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.datatypes import ValidatorScore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCORE_RETENTION_SLOTS = 8
+
+TASK_SCORE_KINDS = ("cycle", "validator")
+
+IndexKey = Tuple[str, str]  # (validator_uid, task_id)
+
+
+class ScoreList(list):
+    """
+    List of ValidatorScore objects owned by a slot table.
+
+    Appends are indexed incrementally; any other mutation marks the table
+    index stale so it is rebuilt on the next query. A list handed out for a
+    slot that has no table yet is detached: its first write calls attach,
+    which opens the table and adopts the list.
+    """
+
+    __slots__ = ("_table", "_attach")
+
+    def __init__(
+        self,
+        scores: Iterable[ValidatorScore] = (),
+        table=None,
+        attach: Optional[Callable[["ScoreList"], None]] = None,
+    ):
+        super().__init__(scores)
+        self._table = table
+        self._attach = attach
+
+    def _bind(self):
+        if self._attach is not None:
+            attach, self._attach = self._attach, None
+            attach(self)
+
+    def _changed(self):
+        if self._table is not None:
+            self._table.invalidate_index()
+
+    def append(self, score):
+        self._bind()
+        super().append(score)
+        if self._table is not None:
+            self._table.index_score(score)
+
+    def extend(self, scores):
+        self._bind()
+        scores = list(scores)
+        super().extend(scores)
+        if self._table is not None:
+            for score in scores:
+                self._table.index_score(score)
+
+    def __iadd__(self, scores):
+        self.extend(scores)
+        return self
+
+    def insert(self, index, score):
+        self._bind()
+        super().insert(index, score)
+        self._changed()
+
+    def __setitem__(self, index, value):
+        self._bind()
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def remove(self, score):
+        super().remove(score)
+        self._changed()
+
+    def pop(self, *args):
+        score = super().pop(*args)
+        self._changed()
+        return score
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
+class ReceivedScores(dict):
+    """
+    Scores received from peers for one slot: validator_uid -> {task_id: score}.
+
+    Whole submissions are assigned per validator. Nested task maps should be
+    replaced rather than mutated in place so the index stays current.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, submissions: Optional[Dict] = None, table=None):
+        super().__init__()
+        self._table = table
+        for validator_uid, task_scores in (submissions or {}).items():
+            self[validator_uid] = task_scores
+
+    def __setitem__(self, validator_uid, task_scores):
+        replaced = validator_uid in self
+        super().__setitem__(validator_uid, dict(task_scores))
+        if self._table is None:
+            return
+        if replaced:
+            self._table.invalidate_index()
+        else:
+            for score in task_scores.values():
+                self._table.index_score(score)
+
+    def __delitem__(self, validator_uid):
+        super().__delitem__(validator_uid)
+        if self._table is not None:
+            self._table.invalidate_index()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        if self._table is not None:
+            self._table.invalidate_index()
+        return value
+
+    def clear(self):
+        super().clear()
+        if self._table is not None:
+            self._table.invalidate_index()
+
+    def update(self, *args, **kwargs):
+        for validator_uid, task_scores in dict(*args, **kwargs).items():
+            self[validator_uid] = task_scores
+
+    def merge(self, validator_uid, task_scores):
+        """Add to a validator's submission; scores for known tasks are replaced."""
+        existing = super().get(validator_uid)
+        if existing is None:
+            self[validator_uid] = task_scores
+            return
+        replaced = any(task_id in existing for task_id in task_scores)
+        existing.update(task_scores)
+        if self._table is None:
+            return
+        if replaced:
+            self._table.invalidate_index()
+        else:
+            for score in task_scores.values():
+                self._table.index_score(score)
+
+    def setdefault(self, validator_uid, default=None):
+        if validator_uid not in self:
+            self[validator_uid] = default if default is not None else {}
+        return super().__getitem__(validator_uid)
+
+
+class SlotScoreTable:
+    """All scores held for a single slot (or cycle) key."""
+
+    __slots__ = ("key", "local", "task_scores", "received", "aggregated", "_by_miner")
+
+    def __init__(self, key: int):
+        self.key = key
+        self.local: Optional[ScoreList] = None  # Scores this validator produced
+        self.task_scores: Dict[str, Dict[str, ScoreList]] = {}  # kind -> task_id -> scores
+        self.received: Optional[ReceivedScores] = None
+        self.aggregated: Optional[Dict[str, Any]] = None  # miner_uid -> consensus
+        # miner_uid -> {(validator_uid, task_id): score}; None when stale
+        self._by_miner: Optional[Dict[str, Dict[IndexKey, ValidatorScore]]] = {}
+
+    # === Mutation ===
+
+    def set_local(self, scores: Iterable[ValidatorScore]) -> ScoreList:
+        self.local = ScoreList(scores, table=self)
+        self.invalidate_index()
+        return self.local
+
+    def task_list(self, kind: str, task_id: str) -> ScoreList:
+        tasks = self.task_scores.setdefault(kind, {})
+        scores = tasks.get(task_id)
+        if scores is None:
+            scores = tasks[task_id] = ScoreList(table=self)
+        return scores
+
+    def set_received(self, submissions: Optional[Dict]) -> ReceivedScores:
+        self.received = ReceivedScores(submissions, table=self)
+        self.invalidate_index()
+        return self.received
+
+    # === Index ===
+
+    def invalidate_index(self):
+        self._by_miner = None
+
+    def index_score(self, score: ValidatorScore):
+        if self._by_miner is None:
+            return  # Rebuilt in full on the next query
+        miner_uid = getattr(score, "miner_uid", None)
+        if miner_uid is None:
+            return
+        key = (getattr(score, "validator_uid", None), getattr(score, "task_id", None))
+        self._by_miner.setdefault(miner_uid, {})[key] = score
+
+    def iter_scores(self) -> Iterable[ValidatorScore]:
+        """Every score in the table: local, per-task, then received."""
+        if self.local:
+            yield from self.local
+        for tasks in self.task_scores.values():
+            for scores in tasks.values():
+                yield from scores
+        if self.received:
+            for task_scores in self.received.values():
+                yield from task_scores.values()
+
+    def _index(self) -> Dict[str, Dict[IndexKey, ValidatorScore]]:
+        if self._by_miner is None:
+            self._by_miner = {}
+            for score in self.iter_scores():
+                self.index_score(score)
+        return self._by_miner
+
+    def scores_for_miner(self, miner_uid: str) -> List[ValidatorScore]:
+        return list(self._index().get(miner_uid, {}).values())
+
+    def get_score(
+        self, miner_uid: str, validator_uid: str, task_id: str
+    ) -> Optional[ValidatorScore]:
+        return self._index().get(miner_uid, {}).get((validator_uid, task_id))
+
+    def miners(self) -> List[str]:
+        return list(self._index())
+
+    # === Accounting ===
+
+    def score_count(self) -> int:
+        return sum(len(scores) for scores in self._index().values())
+
+    def memory_bytes(self, seen: set) -> int:
+        """Approximate size of the table, counting each score object once."""
+        size = sys.getsizeof(self)
+        containers: List[Any] = [self.local, self.received, self.aggregated]
+        containers.extend(self.task_scores.values())
+        for tasks in self.task_scores.values():
+            containers.extend(tasks.values())
+        if self.received:
+            containers.extend(self.received.values())
+        if self._by_miner:
+            containers.append(self._by_miner)
+            containers.extend(self._by_miner.values())
+        for container in containers:
+            if container is not None:
+                size += sys.getsizeof(container)
+
+        for score in self.iter_scores():
+            if id(score) in seen:
+                continue
+            seen.add(id(score))
+            size += sys.getsizeof(score)
+            fields = getattr(score, "__dict__", None)
+            if fields is not None:
+                size += sys.getsizeof(fields)
+        return size
+
+
+class ScoreStore:
+    """
+    Bounded collection of per-slot score tables.
+
+    Retention is relative to the current keys: the clock's current slot and
+    cycle, plus the newest key this validator stored local scores under.
+    Each current key c keeps the keys in [c - retention_slots + 1, c + 1], so
+    slot and cycle keys each have their own window. Tables that fall out of
+    every window are evicted; eviction callbacks let other per-slot state
+    (online aggregation, quorum tracking) follow. Before any current key is
+    known, the oldest tables beyond retention_slots are evicted instead.
+    """
+
+    def __init__(
+        self,
+        retention_slots: int = DEFAULT_SCORE_RETENTION_SLOTS,
+        clock: Optional[Callable[[], Iterable[Optional[int]]]] = None,
+    ):
+        """
+        Args:
+            retention_slots: Keys kept behind each current key
+            clock: Returns the current key of each key space (slot, cycle);
+                None entries are ignored
+        """
+        self.retention_slots = max(1, int(retention_slots))
+        self.clock = clock
+        self._tables: "OrderedDict[int, SlotScoreTable]" = OrderedDict()
+        self._task_keys: Dict[str, Dict[str, int]] = {}  # kind -> task_id -> key
+        self._evict_callbacks: List[Callable[[int], None]] = []
+        self._latest_local: Optional[int] = None  # Newest key with local scores
+        self.rejected = 0  # Writes ignored because their key was out of window
+
+        self.slot_scores = SlotScoresView(self)
+        self.slot_aggregated_scores = AggregatedScoresView(self)
+        self.received_validator_scores = ReceivedScoresView(self)
+
+    # === Tables ===
+
+    def table(self, key: int, create: bool = True) -> Optional[SlotScoreTable]:
+        """
+        Get the table for a slot, opening it (and applying retention) if needed.
+
+        Args:
+            key: Slot (or cycle) number
+            create: Open the table if it does not exist yet
+
+        Returns:
+            The table, or None if it does not exist and either create is
+            False or the key is outside the retention window
+        """
+        table = self._tables.get(key)
+        if table is None and create:
+            if not self.accepts(key):
+                self.rejected += 1
+                logger.debug(f"Score store ignored out-of-window key {key}")
+                return None
+            table = self._tables[key] = SlotScoreTable(key)
+            self._enforce_retention()
+        return table
+
+    def current_keys(self) -> List[int]:
+        """Keys retention is measured from (empty until one is known)."""
+        keys = []
+        if self.clock is not None:
+            try:
+                keys = [int(key) for key in self.clock() if key is not None]
+            except Exception as e:
+                logger.debug(f"Score store clock unavailable: {e}")
+        if self._latest_local is not None:
+            keys.append(self._latest_local)
+        return keys
+
+    def _in_window(self, key: int, current: List[int]) -> bool:
+        return any(c - self.retention_slots < key <= c + 1 for c in current)
+
+    def accepts(self, key: int) -> bool:
+        """Whether scores for key are kept (it lies in a retention window)."""
+        if key in self._tables:
+            return True
+        current = self.current_keys()
+        return not current or self._in_window(key, current)
+
+    def _note_local(self, key: int):
+        if self._latest_local is None or key > self._latest_local:
+            self._latest_local = key
+
+    def keys(self) -> List[int]:
+        return list(self._tables)
+
+    def on_evict(self, callback: Callable[[int], None]):
+        """Register a callback invoked with the key of every evicted table."""
+        self._evict_callbacks.append(callback)
+
+    def discard(self, key: int):
+        """Drop a table and its task index entries."""
+        table = self._tables.pop(key, None)
+        if table is None:
+            return
+        for kind, tasks in table.task_scores.items():
+            task_keys = self._task_keys.get(kind, {})
+            for task_id in tasks:
+                if task_keys.get(task_id) == key:
+                    del task_keys[task_id]
+
+    def _enforce_retention(self):
+        current = self.current_keys()
+        if current:
+            expired = [key for key in self._tables if not self._in_window(key, current)]
+        else:
+            expired = list(self._tables)[: max(0, len(self._tables) - self.retention_slots)]
+        for key in expired:
+            self._evict(key)
+
+    def _evict(self, key: int):
+        self.discard(key)
+        for callback in self._evict_callbacks:
+            try:
+                callback(key)
+            except Exception as e:
+                logger.warning(f"Score store eviction callback failed for {key}: {e}")
+        logger.debug(f"Score store evicted slot {key}")
+
+    # === Writers ===
+
+    def add_local_score(self, key: int, score: ValidatorScore):
+        """Record a score this validator produced for a slot."""
+        self._note_local(key)
+        table = self.table(key)
+        if table is None:
+            return
+        if table.local is None:
+            table.set_local(())
+        table.local.append(score)
+
+    def add_received_scores(
+        self,
+        key: int,
+        validator_uid: str,
+        scores: Iterable[ValidatorScore],
+        merge: bool = False,
+    ) -> int:
+        """
+        Record (or replace) one peer validator's score submission for a slot.
+
+        Args:
+            key: Slot (or cycle) number
+            validator_uid: UID of the submitting validator
+            scores: Scores of the submission
+            merge: Add to the validator's earlier scores for the slot instead
+                of replacing them (streamed deltas)
+
+        Returns:
+            Number of scores stored (0 if the key is out of window)
+        """
+        table = self.table(key)
+        if table is None:
+            return 0
+        if table.received is None:
+            table.set_received(None)
+        task_scores = {score.task_id: score for score in scores}
+        if merge:
+            table.received.merge(validator_uid, task_scores)
+        else:
+            table.received[validator_uid] = task_scores
+        return len(task_scores)
+
+    def task_scores(self, kind: str, task_id: str, key: int) -> ScoreList:
+        """Score list of a task, created in the table of key if not present."""
+        existing = self._task_keys.get(kind, {}).get(task_id)
+        if existing is not None and existing in self._tables:
+            return self._tables[existing].task_list(kind, task_id)
+        table = self.table(key)
+        if table is None:
+            return ScoreList()  # Not retained
+        self._task_keys.setdefault(kind, {})[task_id] = key
+        return table.task_list(kind, task_id)
+
+    def adopt_local(self, key: int, scores: ScoreList):
+        """Make a detached list the local scores of key (see SlotScoresView)."""
+        self._note_local(key)
+        table = self.table(key)
+        if table is None:
+            return
+        if table.local:
+            list.extend(scores, table.local)  # Keep scores written meanwhile
+        scores._table = table
+        table.local = scores
+        table.invalidate_index()
+
+    # === Queries ===
+
+    def scores_for_miner(self, key: int, miner_uid: str) -> List[ValidatorScore]:
+        """All scores (local and received) for a miner in a slot."""
+        table = self._tables.get(key)
+        return table.scores_for_miner(miner_uid) if table else []
+
+    def get_score(
+        self, key: int, miner_uid: str, validator_uid: str, task_id: str
+    ) -> Optional[ValidatorScore]:
+        """The score a validator gave a miner for a task in a slot."""
+        table = self._tables.get(key)
+        return table.get_score(miner_uid, validator_uid, task_id) if table else None
+
+    def miners(self, key: int) -> List[str]:
+        table = self._tables.get(key)
+        return table.miners() if table else []
+
+    def score_count(self) -> int:
+        return sum(table.score_count() for table in self._tables.values())
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the store, in bytes."""
+        seen: set = set()
+        size = sys.getsizeof(self._tables)
+        for tasks in self._task_keys.values():
+            size += sys.getsizeof(tasks)
+        for table in self._tables.values():
+            size += table.memory_bytes(seen)
+        return size
+
+    def task_view(self, kind: str, current_key: Callable[[], int]) -> "TaskScoresView":
+        """
+        Mapping view of task_id -> scores across retained tables.
+
+        Args:
+            kind: Name of the task collection ("cycle" or "validator")
+            current_key: Returns the slot new task entries are filed under
+        """
+        return TaskScoresView(self, kind, current_key)
+
+
+class SlotScoresView(MutableMapping):
+    """
+    slot -> list of local scores.
+
+    Reading a missing slot returns an empty detached list and opens nothing;
+    the slot's table is opened when that list is first written to.
+    """
+
+    def __init__(self, store: ScoreStore):
+        self._store = store
+
+    def _tables(self):
+        return (t for t in self._store._tables.values() if t.local is not None)
+
+    def __getitem__(self, key):
+        table = self._store._tables.get(key)
+        if table is not None and table.local is not None:
+            return table.local
+        return ScoreList(attach=lambda scores: self._store.adopt_local(key, scores))
+
+    def __setitem__(self, key, scores):
+        self._store._note_local(key)
+        table = self._store.table(key)
+        if table is not None:
+            table.set_local(scores)
+
+    def __delitem__(self, key):
+        table = self._store.table(key, create=False)
+        if table is None or table.local is None:
+            raise KeyError(key)
+        table.local = None
+        table.invalidate_index()
+
+    def __contains__(self, key):
+        table = self._store._tables.get(key)
+        return table is not None and table.local is not None
+
+    def get(self, key, default=None):
+        table = self._store._tables.get(key)
+        if table is None or table.local is None:
+            return default
+        return table.local
+
+    def __iter__(self):
+        return iter([t.key for t in self._tables()])
+
+    def __len__(self):
+        return sum(1 for _ in self._tables())
+
+
+class AggregatedScoresView(MutableMapping):
+    """slot -> {miner_uid: consensus score}."""
+
+    def __init__(self, store: ScoreStore):
+        self._store = store
+
+    def _tables(self):
+        return (t for t in self._store._tables.values() if t.aggregated is not None)
+
+    def __getitem__(self, key):
+        table = self._store._tables.get(key)
+        if table is None or table.aggregated is None:
+            raise KeyError(key)
+        return table.aggregated
+
+    def __setitem__(self, key, scores):
+        table = self._store.table(key)
+        if table is not None:
+            table.aggregated = scores
+
+    def __delitem__(self, key):
+        table = self._store._tables.get(key)
+        if table is None or table.aggregated is None:
+            raise KeyError(key)
+        table.aggregated = None
+
+    def __iter__(self):
+        return iter([t.key for t in self._tables()])
+
+    def __len__(self):
+        return sum(1 for _ in self._tables())
+
+
+class ReceivedScoresView(MutableMapping):
+    """cycle -> {validator_uid: {task_id: score}}."""
+
+    def __init__(self, store: ScoreStore):
+        self._store = store
+
+    def _tables(self):
+        return (t for t in self._store._tables.values() if t.received is not None)
+
+    def __getitem__(self, key):
+        table = self._store._tables.get(key)
+        if table is None or table.received is None:
+            raise KeyError(key)
+        return table.received
+
+    def __setitem__(self, key, submissions):
+        table = self._store.table(key)
+        if table is not None:
+            table.set_received(submissions)
+
+    def __delitem__(self, key):
+        table = self._store._tables.get(key)
+        if table is None or table.received is None:
+            raise KeyError(key)
+        table.received = None
+        table.invalidate_index()
+
+    def __iter__(self):
+        return iter([t.key for t in self._tables()])
+
+    def __len__(self):
+        return sum(1 for _ in self._tables())
+
+
+class TaskScoresView(MutableMapping):
+    """
+    task_id -> list of scores, spread over the retained slot tables.
+
+    Missing tasks are created on access in the table of the current slot.
+    Tasks disappear with the slot table they were filed under.
+    """
+
+    def __init__(self, store: ScoreStore, kind: str, current_key: Callable[[], int]):
+        self._store = store
+        self._kind = kind
+        self._current_key = current_key
+
+    def _task_keys(self) -> Dict[str, int]:
+        return self._store._task_keys.get(self._kind, {})
+
+    def __getitem__(self, task_id):
+        return self._store.task_scores(self._kind, task_id, self._current_key())
+
+    def __setitem__(self, task_id, scores):
+        self[task_id][:] = list(scores)
+
+    def __delitem__(self, task_id):
+        key = self._task_keys().pop(task_id, None)
+        table = self._store._tables.get(key) if key is not None else None
+        if table is None:
+            raise KeyError(task_id)
+        table.task_scores.get(self._kind, {}).pop(task_id, None)
+        table.invalidate_index()
+
+    def __contains__(self, task_id):
+        return task_id in self._task_keys()
+
+    def get(self, task_id, default=None):
+        key = self._task_keys().get(task_id)
+        table = self._store._tables.get(key) if key is not None else None
+        if table is None:
+            return default
+        return table.task_scores.get(self._kind, {}).get(task_id, default)
+
+    def __iter__(self):
+        return iter(list(self._task_keys()))
+
+    def __len__(self):
+        return len(self._task_keys())
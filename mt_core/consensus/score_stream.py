@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Score Stream Module
+
+Incremental delivery of a validator's slot scores while tasks are still
+running, instead of one burst at the start of the consensus phase:
+- After each scored minibatch the validator sends a delta holding the
+  per-miner averages that changed since the previous delta
+- Deltas are signed binary score broadcasts (score_codec) whose broadcast ID
+  carries the slot, a per-slot sequence number and a final marker, so the
+  receiver can order them and detect gaps
+- ScoreStreamSender keeps the encoded deltas of recent slots to resend the
+  ones a peer reports missing
+- ScoreStreamReceiver applies deltas in sequence order and reports the gaps;
+  a stream is complete once the final delta and everything before it arrived;
+  deltas for slots outside a window around the local current slot are
+  refused, so they cannot push live streams out
+
+Applied in order, a complete stream leaves the receiver with exactly the
+averaged scores a full broadcast would have carried.
+"""
+
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..core.datatypes import ValidatorScore
+from ..network.score_codec import ScoreBroadcast
+
+logger = logging.getLogger(__name__)
+
+SCORE_STREAM_ENDPOINT = "/consensus/score_deltas"
+SCORE_STREAM_CONTENT_TYPE = "application/x-mt-score-deltas"
+
+DEFAULT_RETENTION_SLOTS = 4
+MAX_PENDING_DELTAS = 1024  # Out-of-order deltas buffered per stream
+
+_DELTA_ID = re.compile(r"^delta_(\d+)_(\d+)(_final)?$")
+
+
+def score_delta_id(slot: int, seq: int, final: bool = False) -> str:
+    """Broadcast ID of a score delta; binds slot, sequence and final marker into the signed bytes."""
+    return f"delta_{slot}_{seq}" + ("_final" if final else "")
+
+
+def parse_score_delta_id(broadcast_id: str) -> Optional[Tuple[int, int, bool]]:
+    """(slot, seq, final) of a score delta, or None for other broadcast IDs."""
+    match = _DELTA_ID.match(broadcast_id)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2)), match.group(3) is not None
+
+
+def _open_slot(slots: Dict[int, Any], slot: int, retention_slots: int, factory) -> Any:
+    """
+    Per-slot state, created if needed; the oldest slots beyond retention are dropped.
+
+    Returns:
+        The state, or None if the slot is older than every retained slot
+    """
+    if slot not in slots:
+        if len(slots) >= retention_slots and slot < min(slots):
+            return None
+        slots[slot] = factory()
+        for old in sorted(slots)[:-retention_slots]:
+            del slots[old]
+    return slots[slot]
+
+
+class _OutgoingStream:
+    __slots__ = ("deltas", "streamed", "final", "complete_peers")
+
+    def __init__(self):
+        self.deltas: List[bytes] = []  # seq -> encoded delta
+        self.streamed: Dict[str, float] = {}  # miner_uid -> last score sent
+        self.final = False
+        self.complete_peers: Set[str] = set()
+
+
+class ScoreStreamSender:
+    """Outgoing score deltas of this validator, per slot."""
+
+    def __init__(self, retention_slots: int = DEFAULT_RETENTION_SLOTS):
+        self.retention_slots = max(1, retention_slots)
+        self._slots: Dict[int, _OutgoingStream] = {}
+        self._trigger: Optional[Callable[[int], Any]] = None
+        self.deltas_sent = 0
+        self.resent = 0
+
+    def attach_trigger(self, trigger: Callable[[int], Any]):
+        """Callback (slot) that schedules the next delta; see notify()."""
+        self._trigger = trigger
+
+    def notify(self, slot: int):
+        """New local scores were stored for a slot (called by the task pipeline)."""
+        if self._trigger is not None:
+            self._trigger(slot)
+
+    def changes(self, slot: int, averages: Dict[str, float]) -> Dict[str, float]:
+        """Averages that differ from what was last streamed for the slot."""
+        stream = self._slots.get(slot)
+        streamed = stream.streamed if stream else {}
+        return {
+            miner_uid: score
+            for miner_uid, score in averages.items()
+            if streamed.get(miner_uid) != score
+        }
+
+    def next_seq(self, slot: int) -> int:
+        stream = self._slots.get(slot)
+        return len(stream.deltas) if stream else 0
+
+    def is_final(self, slot: int) -> bool:
+        stream = self._slots.get(slot)
+        return bool(stream and stream.final)
+
+    def record(
+        self, slot: int, encoded: bytes, changes: Dict[str, float], final: bool = False
+    ) -> int:
+        """
+        Remember a delta built with next_seq(slot).
+
+        Returns:
+            Sequence number of the delta
+
+        Raises:
+            ValueError: If the slot's stream is already final or too old
+        """
+        stream = _open_slot(self._slots, slot, self.retention_slots, _OutgoingStream)
+        if stream is None or stream.final:
+            raise ValueError(f"Score stream for slot {slot} is closed")
+        stream.deltas.append(encoded)
+        stream.streamed.update(changes)
+        stream.final = final
+        self.deltas_sent += 1
+        return len(stream.deltas) - 1
+
+    def deltas(self, slot: int, seqs: Sequence[int]) -> List[bytes]:
+        """Encoded deltas of a slot, for the sequence numbers still retained."""
+        stream = self._slots.get(slot)
+        if stream is None:
+            return []
+        found = [stream.deltas[seq] for seq in seqs if 0 <= seq < len(stream.deltas)]
+        self.resent += len(found)
+        return found
+
+    def final_delta(self, slot: int) -> Optional[bytes]:
+        stream = self._slots.get(slot)
+        return stream.deltas[-1] if stream and stream.final else None
+
+    def mark_complete(self, slot: int, peer_uid: str):
+        stream = self._slots.get(slot)
+        if stream is not None:
+            stream.complete_peers.add(peer_uid)
+
+    def complete_peers(self, slot: int) -> Set[str]:
+        """Peers that confirmed receiving the whole stream of a slot."""
+        stream = self._slots.get(slot)
+        return set(stream.complete_peers) if stream else set()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "deltas_sent": self.deltas_sent,
+            "deltas_resent": self.resent,
+            "tracked_slots": len(self._slots),
+        }
+
+
+class _IncomingStream:
+    __slots__ = ("next_seq", "pending", "final_seq")
+
+    def __init__(self):
+        self.next_seq = 0
+        self.pending: Dict[int, List[ValidatorScore]] = {}
+        self.final_seq: Optional[int] = None
+
+    def missing(self) -> List[int]:
+        if self.final_seq is not None:
+            end = self.final_seq + 1
+        elif self.pending:
+            end = max(self.pending)
+        else:
+            return []
+        return [seq for seq in range(self.next_seq, end) if seq not in self.pending]
+
+    def complete(self) -> bool:
+        return self.final_seq is not None and self.next_seq > self.final_seq
+
+
+DeltaDelivery = Callable[[str, int, List[ValidatorScore], bool], Awaitable[Any]]
+
+
+class ScoreStreamReceiver:
+    """
+    Incoming score delta streams, per slot and sending validator.
+
+    receive() takes a verified delta and hands every delta that is now in
+    order to the deliver callback (sender_uid, slot, scores, complete).
+    """
+
+    def __init__(
+        self,
+        deliver: Optional[DeltaDelivery] = None,
+        retention_slots: int = DEFAULT_RETENTION_SLOTS,
+        accepts_slot: Optional[Callable[[int], bool]] = None,
+    ):
+        """
+        Args:
+            deliver: Coroutine merging a delta into the sender's submission;
+                complete is True with the delta that completes the stream
+            retention_slots: Slots whose streams are remembered
+            accepts_slot: Whether a delta's slot is near enough to the local
+                current slot (None accepts every slot)
+        """
+        self.deliver = deliver
+        self.accepts_slot = accepts_slot
+        self.retention_slots = max(1, retention_slots)
+        self._slots: Dict[int, Dict[str, _IncomingStream]] = {}
+        self.deltas_applied = 0
+        self.duplicates = 0
+
+    def attach_delivery(self, deliver: DeltaDelivery):
+        self.deliver = deliver
+
+    async def receive(self, delta: ScoreBroadcast) -> Dict[str, object]:
+        """
+        Handle a streamed score delta whose signature was already checked.
+
+        Returns:
+            Acknowledgement for the sender (see status())
+
+        Raises:
+            ValueError: If the broadcast is not a score delta, its slot is out
+                of range or it contradicts the sender's stream
+        """
+        parsed = parse_score_delta_id(delta.broadcast_id)
+        if parsed is None:
+            raise ValueError(f"Not a score delta: {delta.broadcast_id}")
+        slot, seq, final = parsed
+        if self.accepts_slot is not None and not self.accepts_slot(slot):
+            raise ValueError(f"Score delta slot {slot} is out of range")
+
+        ready = self.accept(slot, delta.sender_uid, seq, final, delta.scores)
+        complete = self.complete(slot, delta.sender_uid)
+        if self.deliver is not None:
+            for i, scores in enumerate(ready):
+                await self.deliver(
+                    delta.sender_uid, slot, scores, complete and i == len(ready) - 1
+                )
+        return self.status(slot, delta.sender_uid)
+
+    def accept(
+        self,
+        slot: int,
+        sender_uid: str,
+        seq: int,
+        final: bool,
+        scores: List[ValidatorScore],
+    ) -> List[List[ValidatorScore]]:
+        """
+        Take in one delta.
+
+        Returns:
+            The deltas that can now be applied, in sequence order (empty if
+            this one is a duplicate or waits for an earlier one)
+
+        Raises:
+            ValueError: If the delta contradicts the stream or is too far ahead
+        """
+        streams = _open_slot(self._slots, slot, self.retention_slots, dict)
+        if streams is None:
+            self.duplicates += 1  # Slot already dropped
+            return []
+        stream = streams.setdefault(sender_uid, _IncomingStream())
+
+        if seq < stream.next_seq or seq in stream.pending:
+            self.duplicates += 1
+            return []
+        if stream.final_seq is not None and seq > stream.final_seq:
+            raise ValueError(f"Score delta {seq} after final delta {stream.final_seq}")
+        if seq - stream.next_seq > MAX_PENDING_DELTAS:
+            raise ValueError(f"Score delta {seq} too far ahead of {stream.next_seq}")
+        if final:
+            if stream.pending and max(stream.pending) > seq:
+                raise ValueError(f"Final score delta {seq} precedes received deltas")
+            stream.final_seq = seq
+
+        stream.pending[seq] = scores
+        ready = []
+        while stream.next_seq in stream.pending:
+            ready.append(stream.pending.pop(stream.next_seq))
+            stream.next_seq += 1
+        self.deltas_applied += len(ready)
+        return ready
+
+    def missing(self, slot: int, sender_uid: str) -> List[int]:
+        """Sequence numbers known to be missing from a stream."""
+        stream = self._slots.get(slot, {}).get(sender_uid)
+        return stream.missing() if stream else []
+
+    def complete(self, slot: int, sender_uid: str) -> bool:
+        stream = self._slots.get(slot, {}).get(sender_uid)
+        return bool(stream and stream.complete())
+
+    def status(self, slot: int, sender_uid: str) -> Dict[str, object]:
+        """Acknowledgement returned to the sender of a delta."""
+        stream = self._slots.get(slot, {}).get(sender_uid)
+        return {
+            "slot": slot,
+            "next_seq": stream.next_seq if stream else 0,
+            "missing": stream.missing() if stream else [],
+            "complete": bool(stream and stream.complete()),
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "deltas_applied": self.deltas_applied,
+            "duplicates": self.duplicates,
+            "tracked_slots": len(self._slots),
+            "open_streams": sum(
+                1
+                for streams in self._slots.values()
+                for stream in streams.values()
+                if not stream.complete()
+            ),
+        }
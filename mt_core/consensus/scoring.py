@@ -28,8 +28,7 @@ from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 
 # Third-party imports
 import httpx
-import nacl.signing
-from nacl.exceptions import CryptoError
+from eth_keys import keys
 from pydantic import BaseModel
 
 # Updated imports for Core blockchain
@@ -41,6 +40,7 @@ from eth_account.signers.local import LocalAccount
 # from eth_account import Account
 
 from ..config.settings import settings
+from ..network.score_codec import sign_score_broadcast
 from ..core.datatypes import (
     ValidatorInfo,
     MinerInfo,
@@ -115,8 +115,8 @@ ADVANCED_SCORING_CONFIG = {
 def canonical_json_serialize(data: Any) -> str:
     """Serialize dữ liệu thành chuỗi JSON ổn định (sắp xếp key).
 
-    Recursively converts dataclasses and dictionaries, handling bytes by
-    encoding them as hex strings. Ensures consistent output for signing
+    Recursively converts dataclasses, pydantic models and dictionaries,
+    handling bytes by encoding them as hex strings. Ensures consistent output for signing
     by sorting dictionary keys.
 
     Args:
@@ -134,6 +134,8 @@ def canonical_json_serialize(data: Any) -> str:
                 value = getattr(obj, f.name)
                 result[f.name] = convert_to_dict(value)
             return result
+        elif isinstance(obj, BaseModel):
+            return convert_to_dict(obj.model_dump())
         elif isinstance(obj, list):
             return [convert_to_dict(item) for item in obj]
         elif isinstance(obj, dict):
@@ -660,9 +662,9 @@ async def broadcast_scores_logic(
        by this validator (`self_uid`).
     3. If no local scores generated, logs a debug message and returns.
     4. Serializes the filtered list of scores into a canonical JSON string.
-    5. Signs the serialized data using the validator's signing key.
+    5. Signs the serialized data with the validator's account (secp256k1).
     6. Creates a `ScoreSubmissionPayload` containing the scores, signature (hex),
-       and the validator's public key.
+       and the account's public key, from which peers derive its address.
     7. Iterates through the list of active validator peers (excluding self).
     8. Sends the payload via HTTP POST to the `/submit_scores` endpoint of each peer.
 
@@ -677,15 +679,14 @@ async def broadcast_scores_logic(
     Raises:
         AttributeError: If `validator_node` is missing required attributes/methods.
         TypeError: If the derived verification key type is unexpected.
-        CryptoError: If signing fails.
         httpx.RequestError: If sending the request to a peer fails (e.g., connection error, timeout).
         Exception: For other unexpected errors during setup, signing, or sending.
     """
     try:
         # Lấy thông tin cần thiết từ validator_node
         self_validator_info = validator_node.info
-        # Lấy signing key từ validator_node
-        signing_key = validator_node.signing_key  # type: ignore
+        # Lấy account (khoá ký on-chain) từ validator_node
+        account = validator_node.account
         # Lấy danh sách validator *active* từ node
         active_validator_peers = await validator_node._get_active_validators()
         current_cycle = validator_node.current_cycle
@@ -729,14 +730,11 @@ async def broadcast_scores_logic(
         data_to_sign_str = canonical_json_serialize(local_scores_list)
         data_to_sign_bytes = data_to_sign_str.encode("utf-8")
 
-        # Ký bằng PyNaCl hoặc Aptos SDK (tùy vào validator_node.signing_key là gì)
-        # Ví dụ sử dụng PyNaCl
-        nacl_signing_key = nacl.signing.SigningKey(signing_key.private_key)
-        signed_data = nacl_signing_key.sign(data_to_sign_bytes)
-        signature_bytes = signed_data.signature
+        # Ký bằng account của validator; peer khôi phục địa chỉ từ chữ ký
+        signature_bytes = sign_score_broadcast(data_to_sign_bytes, account)
 
-        # Lấy public key
-        public_key_bytes = nacl_signing_key.verify_key.encode()
+        # Lấy public key (dạng không nén, 64 byte)
+        public_key_bytes = keys.PrivateKey(bytes(account.key)).public_key.to_bytes()
 
         signature_hex = binascii.hexlify(signature_bytes).decode("utf-8")
         public_key_hex = binascii.hexlify(public_key_bytes).decode("utf-8")
@@ -747,11 +745,6 @@ async def broadcast_scores_logic(
             f"[V:{self_uid}] Type error during key derivation or serialization: {type_e}"
         )
         return
-    except CryptoError as sign_e:  # USE IMPORTED CryptoError
-        logger.exception(
-            f"[V:{self_uid}] Failed to sign broadcast payload (PyNaCl): {sign_e}"
-        )
-        return
     except Exception as sign_e:  # Bắt lỗi chung khác
         logger.exception(
             f"[V:{self_uid}] Failed to prepare or sign broadcast payload: {sign_e}"
@@ -1,43 +1,104 @@
 # sdk/consensus/selection.py
 """
 Logic chọn lựa miners cho chu trình đồng thuận.
+
+- Hệ số chọn (trust score x bonus thời gian chờ) được tính cho mọi miner
+  cùng lúc bằng NumPy
+- Chọn đúng k miner khác nhau trong một lượt bằng sampler khoá mũ
+  (Efraimidis–Spirakis): mỗi miner nhận khoá log(u) / w, lấy k khoá lớn nhất
+- Có thể truyền seed (ví dụ selection_seed(slot)) để mọi validator chọn ra
+  cùng một tập miner từ cùng dữ liệu
 """
-import random
+import hashlib
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import numpy as np
 
 # Import các thành phần cần thiết
 try:
     from ..config.settings import settings
     from ..core.datatypes import MinerInfo
     from ..metagraph.metagraph_datum import STATUS_ACTIVE
-    from ..formulas.trust_score import calculate_selection_probability
 except ImportError as e:
     raise ImportError(f"Error importing dependencies in selection.py: {e}")
 
 logger = logging.getLogger(__name__)
 
 
+def selection_seed(slot: int, salt: str = "") -> int:
+    """Seed chọn miner của một slot, giống nhau trên mọi validator."""
+    digest = hashlib.sha256(f"selection:{slot}:{salt}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def selection_factors(
+    trust_scores: np.ndarray,
+    last_selected: np.ndarray,
+    current_cycle: int,
+    beta: float,
+    max_time_bonus: int,
+) -> np.ndarray:
+    """
+    Hệ số chọn của nhiều miner cùng lúc.
+
+    Cùng công thức với formulas.trust_score.calculate_selection_probability:
+    trust * (1 + beta * min(max(0, cycle - last_selected), max_time_bonus)),
+    không âm.
+    """
+    time_since = np.maximum(0, current_cycle - last_selected)
+    effective_time = np.minimum(time_since, max_time_bonus)
+    return np.maximum(0.0, trust_scores * (1 + beta * effective_time))
+
+
+def weighted_sample_without_replacement(
+    weights: np.ndarray, k: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Chọn k chỉ số khác nhau, xác suất theo trọng số (Efraimidis–Spirakis).
+
+    Khi có ít hơn k phần tử trọng số dương, các phần tử trọng số 0 được chọn
+    ngẫu nhiên đều để đủ k.
+
+    Returns:
+        Mảng k chỉ số, theo thứ tự được chọn
+    """
+    n = len(weights)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    positive = weights > 0
+    keys = np.full(n, -np.inf)
+    # log(u) / w: u ~ U(0, 1]; khoá lớn nhất tương đương u^(1/w) lớn nhất
+    keys[positive] = np.log1p(-rng.random(np.count_nonzero(positive))) / weights[positive]
+
+    n_positive = int(np.count_nonzero(positive))
+    if n_positive >= k:
+        top = np.argpartition(keys, n - k)[n - k :]
+        return top[np.argsort(keys[top])[::-1]]
+
+    chosen = np.flatnonzero(positive)
+    chosen = chosen[np.argsort(keys[chosen])[::-1]]
+    filler = rng.choice(np.flatnonzero(~positive), k - n_positive, replace=False)
+    return np.concatenate([chosen, filler])
+
+
 def select_miners_logic(
     miners_info: Dict[str, MinerInfo],
     current_cycle: int,
     num_to_select: int,
     beta: float,
     max_time_bonus: int,
+    seed: Optional[int] = None,
 ) -> List[MinerInfo]:
     """
     Logic chọn miners dựa trên trust score và thời gian chờ.
 
-    Selects miners using a weighted random choice mechanism where the probability
-    factor for each miner is calculated based on their trust score and the time
-    since they were last selected (using `calculate_selection_probability`).
-    Only active miners are considered.
-
-    Handles edge cases:
-    - No miners or no active miners: Returns empty list.
-    - Zero total probability factor: Selects randomly among active miners.
-    - Fails to select the requested number of unique miners within max attempts:
-      Returns the miners selected so far with a warning.
+    Selects exactly min(num_to_select, active miners) distinct active miners,
+    weighted by their selection factor (trust score and time since they were
+    last selected, see `selection_factors`). Miners with a zero factor are
+    only picked, uniformly, when too few miners have a positive factor.
 
     Args:
         miners_info: Dictionary chứa thông tin các miner hiện có ({uid: MinerInfo}).
@@ -45,6 +106,8 @@ def select_miners_logic(
         num_to_select: Số lượng miner cần chọn.
         beta: Hệ số bonus công bằng (ảnh hưởng đến bonus thời gian chờ).
         max_time_bonus: Giới hạn bonus thời gian chờ (tính bằng số chu kỳ).
+        seed: Seed của bộ sinh ngẫu nhiên; cùng seed và cùng miners_info cho
+            cùng kết quả trên mọi validator (None = ngẫu nhiên).
 
     Returns:
         Danh sách các MinerInfo đã được chọn.
@@ -64,82 +127,31 @@ def select_miners_logic(
     if not active_miners:
         logger.warning("No active miners found for selection.")
         return []
+    if seed is not None:
+        # Thứ tự dict có thể khác nhau giữa các validator
+        active_miners.sort(key=lambda m: m.uid)
 
     logger.debug(f"Found {len(active_miners)} active miners to consider for selection.")
 
-    miner_probabilities = []
-    total_prob_factor = 0.0
-
-    for miner in active_miners:
-        time_since = max(0, current_cycle - miner.last_selected_time)
-        prob_factor = calculate_selection_probability(
-            trust_score=miner.trust_score,
-            time_since_last_selection=time_since,
-            beta=beta,
-            max_time_bonus_effect=max_time_bonus,
-        )
-        prob_factor = max(0.0, prob_factor)  # Đảm bảo không âm
-        miner_probabilities.append((miner, prob_factor))
-        total_prob_factor += prob_factor
-        logger.debug(
-            f"Miner {miner.uid}: Trust={miner.trust_score:.3f}, TimeSince={time_since}, ProbFactor={prob_factor:.4f}"
-        )
-
-    if total_prob_factor <= 1e-9:
+    factors = selection_factors(
+        np.fromiter((m.trust_score for m in active_miners), float, len(active_miners)),
+        np.fromiter(
+            (m.last_selected_time for m in active_miners), float, len(active_miners)
+        ),
+        current_cycle,
+        beta,
+        max_time_bonus,
+    )
+    if factors.sum() <= 1e-9:
         logger.warning(
             "Total probability factor is zero or negligible. Selecting randomly among active miners."
         )
-        k = min(num_to_select, len(active_miners))
-        selected_miners = random.sample(active_miners, k)
-        logger.info(
-            f"Randomly selected {len(selected_miners)} miners: {[m.uid for m in selected_miners]}"
-        )
-        return selected_miners
+        factors = np.zeros(len(active_miners))
 
-    try:
-        probabilities = [p / total_prob_factor for _, p in miner_probabilities]
-    except ZeroDivisionError:
-        logger.error(
-            "Division by zero during probability normalization. Selecting randomly."
-        )
-        k = min(num_to_select, len(active_miners))
-        selected_miners = random.sample(active_miners, k)
-        logger.info(
-            f"Randomly selected {len(selected_miners)} miners due to normalization error."
-        )
-        return selected_miners
-
-    miners_population = [m for m, _ in miner_probabilities]
-
-    selected_miners_dict: Dict[str, MinerInfo] = {}
-    attempts = 0
-    max_attempts = num_to_select * 5
-    target_count = min(num_to_select, len(miners_population))
-
-    while len(selected_miners_dict) < target_count and attempts < max_attempts:
-        try:
-            # Chọn có trọng số, không thay thế (nếu dùng random.sample với weights - cần numpy hoặc logic phức tạp hơn)
-            # random.choices cho phép chọn lại, nên dùng dict để lọc trùng
-            chosen_miner = random.choices(
-                population=miners_population, weights=probabilities, k=1
-            )[0]
-            selected_miners_dict[chosen_miner.uid] = chosen_miner
-        except IndexError:
-            logger.warning("Random choices returned empty list unexpectedly.")
-            break
-        except Exception as e:
-            logger.exception(f"Error during random weighted choice: {e}")
-            break
-        attempts += 1
-
-    selected_miners = list(selected_miners_dict.values())
-
-    if len(selected_miners) < target_count:
-        logger.warning(
-            f"Could only select {len(selected_miners)} unique miners out of {target_count} requested after {max_attempts} attempts."
-        )
+    rng = np.random.default_rng(seed)
+    indices = weighted_sample_without_replacement(factors, num_to_select, rng)
+    selected_miners = [active_miners[i] for i in indices]
 
-    logger.info(
-        f"Selected {len(selected_miners)} unique miners: {[m.uid for m in selected_miners]}"
-    )
+    logger.info(f"Selected {len(selected_miners)} unique miners")
+    logger.debug(f"Selected miners: {[m.uid for m in selected_miners]}")
     return selected_miners
@@ -9,7 +9,7 @@ This module provides SlotCoordinator class that ensures all validators:
 - Update metagraph together after reaching consensus
 
 Key Features:
-- File-based coordination using JSON files
+- Pluggable coordination backend (shared files, in-memory, or signed HTTP)
 - Majority consensus (2/3 validators)
 - Precise timing based on blockchain epochs
 - Automatic cleanup of old coordination files
@@ -24,6 +24,15 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+from .coordination_backend import (
+    CoordinationBackend,
+    FileCoordinationBackend,
+    PhaseAnnouncement,
+    collect_announced_scores,
+    sanitize_extra_data,
+)
+from .slot_scheduler import SlotSchedule
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -141,22 +150,26 @@ class SlotCoordinator:
         validator_uid: str,
         coordination_dir: str = "slot_coordination",
         slot_config: Optional[SlotConfig] = None,
+        backend: Optional[CoordinationBackend] = None,
     ):
         """
         Initialize SlotCoordinator
 
         Args:
             validator_uid: Unique identifier for this validator
-            coordination_dir: Directory for coordination files
+            coordination_dir: Directory for coordination files (file backend)
             slot_config: Optional slot configuration (uses default if None)
+            backend: Coordination backend (file backend in coordination_dir if None)
         """
         self.validator_uid = validator_uid
         self.coordination_dir = Path(coordination_dir)
-        self.coordination_dir.mkdir(exist_ok=True)
+        self.backend = backend or FileCoordinationBackend(
+            coordination_dir, json_encoder=CustomJSONEncoder
+        )
         self.slot_config = slot_config or SlotConfig()
 
         logger.info(f"🔧 SlotCoordinator initialized for {validator_uid}")
-        logger.info(f"🔧 Coordination dir: {self.coordination_dir.absolute()}")
+        logger.info(f"🔧 Coordination backend: {type(self.backend).__name__}")
         logger.info(
             f"🔧 Slot config: {self.slot_config.slot_duration_minutes}min slots, {self.slot_config.task_assignment_minutes}min assignment"
         )
@@ -221,30 +234,9 @@ class SlotCoordinator:
             logger.info("🔄 Dynamic epoch start set to current time")
 
     def _detect_active_slot_from_coordination(self) -> Optional[int]:
-        """Detect active slot by scanning coordination files"""
-        coordination_files = list(self.coordination_dir.glob("slot_*_*.json"))
-
-        if not coordination_files:
-            return None
-
-        # Find the most recent slot with active validators
-        active_slots = set()
-        current_time = time.time()
-
-        for file_path in coordination_files:
-            try:
-                parts = file_path.stem.split("_")
-                if len(parts) >= 2 and parts[0] == "slot":
-                    slot_num = int(parts[1])
-
-                    # Check if file is recent (within last 10 minutes)
-                    if file_path.stat().st_mtime > current_time - 600:
-                        active_slots.add(slot_num)
-
-            except (ValueError, IndexError, OSError):
-                continue
-
-        return max(active_slots) if active_slots else None
+        """Detect the newest slot with phase entries from the last 10 minutes"""
+        active_slot, _ = self.backend.latest_active_slot(max_age=600)
+        return active_slot
 
     def get_slot_phase(self, slot_number: int) -> Tuple[SlotPhase, int, int]:
         """
@@ -279,6 +271,14 @@ class SlotCoordinator:
         # Default to task assignment if outside boundaries
         return SlotPhase.TASK_ASSIGNMENT, seconds_into_slot, 0
 
+    def slot_schedule(self) -> SlotSchedule:
+        """Phase windows of every slot, anchored on EPOCH_START"""
+        return SlotSchedule.from_boundaries(
+            EPOCH_START,
+            self.slot_config.slot_duration_minutes * 60,
+            self.slot_config.get_phase_boundaries(),
+        )
+
     def _get_time_until_next_phase(self, slot_number: int) -> Tuple[SlotPhase, int]:
         """Get next phase and seconds until it starts"""
         current_time = int(time.time())
@@ -317,80 +317,22 @@ class SlotCoordinator:
         logger.info(
             f"🔧 REGISTER_PHASE_ENTRY: Validator {self.validator_uid} entering {phase.value} for slot {slot}"
         )
-        logger.info(f"🔧 Coordination dir: {self.coordination_dir.absolute()}")
-
-        phase_file = (
-            self.coordination_dir
-            / f"slot_{slot}_{phase.value}_{self.validator_uid}.json"
+        announcement = PhaseAnnouncement(
+            validator_uid=self.validator_uid,
+            slot=slot,
+            phase=phase.value,
+            extra_data=extra_data or {},
         )
 
-        logger.info(f"🔧 Phase file will be: {phase_file.absolute()}")
-
-        # Prepare phase data
-        phase_data = {
-            "validator_uid": self.validator_uid,
-            "slot": slot,
-            "phase": phase.value,
-            "timestamp": time.time(),
-            "extra_data": extra_data or {},
-        }
-
-        try:
-            # Pre-validate the data by attempting to serialize it
-            test_json = json.dumps(phase_data, cls=CustomJSONEncoder, indent=2)
-
-            # Write to a temporary file first, then rename (atomic operation)
-            temp_file = phase_file.with_suffix(".tmp")
-
-            with open(temp_file, "w") as f:
-                f.write(test_json)
-                f.flush()  # Ensure data is written to disk
-
-            # Atomic rename to final filename
-            temp_file.rename(phase_file)
-
+        if await self.backend.publish(announcement):
             logger.info(
                 f"✅ [V:{self.validator_uid}] Registered entry to {phase.value} phase of slot {slot}"
             )
-
-        except Exception as e:
+        else:
             logger.error(
-                f"❌ [V:{self.validator_uid}] Failed to register phase entry: {e}"
+                f"❌ [V:{self.validator_uid}] Failed to register {phase.value} phase entry for slot {slot}"
             )
 
-            # Clean up temp file if it exists
-            temp_file = phase_file.with_suffix(".tmp")
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except:
-                    pass
-
-            # If the error is related to serialization, try a simplified version
-            try:
-                # Create a simplified version without problematic objects
-                simplified_data = {
-                    "validator_uid": str(self.validator_uid),
-                    "slot": int(slot),
-                    "phase": str(phase.value),
-                    "timestamp": float(time.time()),
-                    "extra_data": self._simplify_extra_data(extra_data),
-                }
-
-                with open(phase_file, "w") as f:
-                    json.dump(simplified_data, f, indent=2)
-                    f.flush()
-
-                logger.warning(
-                    f"⚠️ [V:{self.validator_uid}] Used simplified data for phase entry due to serialization issues"
-                )
-
-            except Exception as e2:
-                logger.error(
-                    f"❌ [V:{self.validator_uid}] Failed even with simplified data: {e2}"
-                )
-                raise
-
     def _simplify_extra_data(self, extra_data: Dict) -> Dict:
         """
         Simplify extra_data to make it JSON serializable
@@ -401,54 +343,7 @@ class SlotCoordinator:
         Returns:
             Simplified data that can be JSON serialized
         """
-        if not extra_data:
-            return {}
-
-        simplified = {}
-
-        for key, value in extra_data.items():
-            try:
-                if value is None:
-                    simplified[key] = None
-                elif isinstance(value, (str, int, float, bool)):
-                    simplified[key] = value
-                elif isinstance(value, (list, tuple)):
-                    # Simplify list/tuple items
-                    simplified_list = []
-                    for item in value:
-                        if hasattr(item, "__dict__"):
-                            # Convert objects to dict representation
-                            if hasattr(item, "dict"):  # Pydantic
-                                simplified_list.append(item.dict())
-                            elif hasattr(item, "__dataclass_fields__"):  # dataclass
-                                simplified_list.append(asdict(item))
-                            else:
-                                simplified_list.append(str(item))
-                        elif isinstance(item, dict):
-                            simplified_list.append(self._simplify_extra_data(item))
-                        else:
-                            simplified_list.append(str(item))
-                    simplified[key] = simplified_list
-                elif isinstance(value, dict):
-                    # Recursively simplify nested dicts
-                    simplified[key] = self._simplify_extra_data(value)
-                elif hasattr(value, "__dict__"):
-                    # Convert objects to dict representation
-                    if hasattr(value, "dict"):  # Pydantic
-                        simplified[key] = value.dict()
-                    elif hasattr(value, "__dataclass_fields__"):  # dataclass
-                        simplified[key] = asdict(value)
-                    else:
-                        simplified[key] = str(value)
-                else:
-                    # Fallback: convert to string
-                    simplified[key] = str(value)
-
-            except Exception as e:
-                logger.debug(f"Error simplifying key {key}: {e}")
-                simplified[key] = f"<error_serializing_{type(value).__name__}>"
-
-        return simplified
+        return sanitize_extra_data(extra_data)
 
     async def wait_for_phase_consensus(
         self, slot: int, phase: SlotPhase, timeout: int = 60
@@ -644,69 +539,15 @@ class SlotCoordinator:
 
     def _get_all_active_validators_in_slot(self, slot: int) -> List[str]:
         """Get all validators active in the given slot across all phases"""
-        active_validators = set()
-
-        # Scan all coordination files for this slot
-        pattern = f"slot_{slot}_*.json"
-        coordination_files = list(self.coordination_dir.glob(pattern))
-
-        for file_path in coordination_files:
-            try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                    if data.get("slot") == slot:
-                        validator_uid = data.get("validator_uid")
-                        if validator_uid:
-                            active_validators.add(validator_uid)
-            except:
-                continue
-
-        return list(active_validators)
+        return self.backend.active_validators(slot)
 
     def _get_ready_validators(self, slot: int, phase: SlotPhase) -> List[str]:
         """Get list of validators ready for given slot and phase"""
-        ready_validators = []
-
-        # Dynamic validator detection: scan for all phase files matching the pattern
-        pattern = f"slot_{slot}_{phase.value}_*.json"
-
         try:
-            for phase_file in self.coordination_dir.glob(pattern):
-                try:
-                    with open(phase_file, "r") as f:
-                        data = json.load(f)
-                        if (
-                            data.get("slot") == slot
-                            and data.get("phase") == phase.value
-                        ):
-                            validator_uid = data.get("validator_uid")
-                            if validator_uid and validator_uid not in ready_validators:
-                                ready_validators.append(validator_uid)
-                except Exception as e:
-                    logger.debug(f"Error reading phase file {phase_file}: {e}")
+            return self.backend.ready_validators(slot, phase)
         except Exception as e:
-            logger.debug(f"Error scanning coordination directory: {e}")
-
-        # Fallback to EXPECTED_VALIDATORS for backward compatibility
-        if not ready_validators:
-            for validator_uid in EXPECTED_VALIDATORS:
-                phase_file = (
-                    self.coordination_dir
-                    / f"slot_{slot}_{phase.value}_{validator_uid}.json"
-                )
-                if phase_file.exists():
-                    try:
-                        with open(phase_file, "r") as f:
-                            data = json.load(f)
-                            if (
-                                data.get("slot") == slot
-                                and data.get("phase") == phase.value
-                            ):
-                                ready_validators.append(validator_uid)
-                    except Exception as e:
-                        logger.debug(f"Error reading phase file {phase_file}: {e}")
-
-        return ready_validators
+            logger.debug(f"Error reading ready validators for slot {slot}: {e}")
+            return []
 
     async def synchronized_phase_transition(
         self, slot: int, current_phase: SlotPhase, next_phase: SlotPhase
@@ -896,47 +737,12 @@ class SlotCoordinator:
         self, slot: int, participating_validators: List[str]
     ) -> Dict[str, float]:
         """Calculate consensus scores from all participating validators"""
-        all_scores = {}
-
         # Collect scores from all participating validators
-        for validator_uid in participating_validators:
-            score_file = (
-                self.coordination_dir
-                / f"slot_{slot}_consensus_scoring_{validator_uid}.json"
-            )
-            if score_file.exists():
-                try:
-                    with open(score_file, "r") as f:
-                        data = json.load(f)
-                        scores = data.get("extra_data", {}).get("scores", {})
-
-                        # Handle both dict and list formats
-                        if isinstance(scores, dict):
-                            # Standard dict format: {miner_uid: score}
-                            for miner_uid, score in scores.items():
-                                if miner_uid not in all_scores:
-                                    all_scores[miner_uid] = []
-                                all_scores[miner_uid].append(score)
-                        elif isinstance(scores, list):
-                            # List format: [{"miner_uid": "...", "score": 0.5}]
-                            for score_entry in scores:
-                                if (
-                                    isinstance(score_entry, dict)
-                                    and "miner_uid" in score_entry
-                                    and "score" in score_entry
-                                ):
-                                    miner_uid = score_entry["miner_uid"]
-                                    score = score_entry["score"]
-                                    if miner_uid not in all_scores:
-                                        all_scores[miner_uid] = []
-                                    all_scores[miner_uid].append(score)
-                        else:
-                            logger.warning(
-                                f"Invalid scores format from {validator_uid}: {type(scores)}"
-                            )
-
-                except Exception as e:
-                    logger.error(f"Error reading scores from {validator_uid}: {e}")
+        entries = [
+            self.backend.announcement(slot, SlotPhase.CONSENSUS_SCORING, validator_uid)
+            for validator_uid in participating_validators
+        ]
+        all_scores = collect_announced_scores(entry for entry in entries if entry)
 
         # Calculate consensus (simple average)
         consensus_scores = {}
@@ -960,18 +766,7 @@ class SlotCoordinator:
             keep_slots: Number of recent slots to keep files for
         """
         try:
-            cleaned_count = 0
-            for file_path in self.coordination_dir.glob("slot_*.json"):
-                try:
-                    # Extract slot number from filename
-                    parts = file_path.name.split("_")
-                    if len(parts) >= 2:
-                        slot_num = int(parts[1])
-                        if slot_num < current_slot - keep_slots:
-                            file_path.unlink()
-                            cleaned_count += 1
-                except (ValueError, IndexError):
-                    continue
+            cleaned_count = self.backend.prune(current_slot - keep_slots)
 
             if cleaned_count > 0:
                 logger.debug(f"Cleaned up {cleaned_count} old coordination files")
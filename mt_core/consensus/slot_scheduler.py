@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Slot Scheduler Module
+
+Push-based driver for slot phases:
+- SlotSchedule: the phase windows of every slot, derived once from a slot
+  configuration and the shared epoch start
+- SlotScheduler: fires a callback at each phase boundary from a timer heap on
+  the monotonic clock, and lets the node end a phase early (quorum reached,
+  all results in) instead of waiting out its deadline
+
+The node no longer wakes up periodically to recompute the slot and phase from
+wall-clock time; it sleeps until the next boundary or an early-advance signal.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Sequence, Tuple
+
+from .coordination_backend import phase_key
+
+logger = logging.getLogger(__name__)
+
+PhaseCallback = Callable[[int, Any], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class PhaseWindow:
+    """A phase and its [start, end) offsets in seconds from the slot start."""
+
+    phase: Any
+    start: float
+    end: float
+
+
+class SlotSchedule:
+    """
+    Phase windows shared by every slot.
+
+    Slot n starts at epoch_start + n * slot_duration (wall-clock seconds), so
+    all validators using the same epoch agree on slot numbers and boundaries.
+    Windows may share a start offset; they then fire back to back, in order.
+    """
+
+    def __init__(
+        self,
+        epoch_start: float,
+        slot_duration: float,
+        windows: Sequence[PhaseWindow],
+    ):
+        """
+        Args:
+            epoch_start: Wall-clock start of slot 0
+            slot_duration: Slot length in seconds
+            windows: Phase windows in firing order
+
+        Raises:
+            ValueError: If the slot length or the windows are invalid
+        """
+        if slot_duration <= 0:
+            raise ValueError(f"slot_duration must be positive, got {slot_duration}")
+        if not windows:
+            raise ValueError("A slot schedule needs at least one phase window")
+        starts = [window.start for window in windows]
+        if starts != sorted(starts) or starts[0] < 0 or starts[-1] >= slot_duration:
+            raise ValueError(f"Phase windows out of order or outside the slot: {starts}")
+
+        self.epoch_start = float(epoch_start)
+        self.slot_duration = float(slot_duration)
+        self.windows: List[PhaseWindow] = list(windows)
+
+    @classmethod
+    def from_boundaries(
+        cls,
+        epoch_start: float,
+        slot_duration_seconds: float,
+        boundaries: Mapping[Any, Tuple[float, float]],
+    ) -> "SlotSchedule":
+        """
+        Build a schedule from a config's get_phase_boundaries() (in minutes).
+
+        Args:
+            epoch_start: Wall-clock start of slot 0
+            slot_duration_seconds: Slot length in seconds
+            boundaries: phase -> (start_minute, end_minute), in firing order
+        """
+        windows = [
+            PhaseWindow(phase, start_min * 60.0, end_min * 60.0)
+            for phase, (start_min, end_min) in boundaries.items()
+        ]
+        windows.sort(key=lambda window: window.start)  # stable: keeps config order
+        return cls(epoch_start, slot_duration_seconds, windows)
+
+    def slot_start(self, slot: int) -> float:
+        """Wall-clock start of a slot."""
+        return self.epoch_start + slot * self.slot_duration
+
+    def index_of(self, phase: Any) -> int:
+        """
+        Position of a phase in the slot.
+
+        Raises:
+            ValueError: If the phase is not part of the schedule
+        """
+        key = phase_key(phase)
+        for index, window in enumerate(self.windows):
+            if phase_key(window.phase) == key:
+                return index
+        raise ValueError(f"Phase {key} is not part of this schedule")
+
+    def locate(self, wall_time: float) -> Tuple[int, int]:
+        """
+        Slot and window index in effect at wall_time.
+
+        When several windows start at the same offset, the first of them is
+        returned so that they all fire.
+        """
+        slot = int((wall_time - self.epoch_start) // self.slot_duration)
+        offset = wall_time - self.slot_start(slot)
+        current = 0
+        for index, window in enumerate(self.windows):
+            if window.start > offset:
+                break
+            if window.start > self.windows[current].start:
+                current = index
+        return slot, current
+
+
+class SlotScheduler:
+    """
+    Fires on_phase(slot, phase) at every phase boundary.
+
+    Deadlines are converted from wall-clock boundaries to the monotonic clock
+    once per slot and kept in a heap, so the scheduler sleeps exactly until
+    the next one. Callbacks run one at a time; a callback that overruns past
+    later boundaries makes the phases it overran be skipped, like a node that
+    polled late would have done.
+
+    advance() ends the current phase early: the next phase of the same slot
+    fires as soon as the running callback returns. Slot starts always stay on
+    their wall-clock boundary, which keeps slot numbers aligned across
+    validators.
+    """
+
+    def __init__(
+        self,
+        schedule: SlotSchedule,
+        on_phase: PhaseCallback,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        name: str = "",
+    ):
+        """
+        Args:
+            schedule: Phase windows and epoch to follow
+            on_phase: Coroutine function called with (slot, phase)
+            clock: Monotonic clock used for deadlines
+            wall_clock: Wall clock the schedule is expressed in
+            name: Prefix for log messages
+        """
+        self.schedule = schedule
+        self.on_phase = on_phase
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.name = name
+
+        # (monotonic deadline, sequence, slot, window index)
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._sequence = itertools.count()
+        self._wake = asyncio.Event()
+        self._early: Optional[Tuple[int, str]] = None
+        self._pending_schedule: Optional[Tuple[int, SlotSchedule]] = None
+        self._running = False
+
+        self.current: Optional[Tuple[int, Any]] = None
+        self.fired = 0
+        self.skipped = 0
+        self.early_advances = 0
+
+    def _to_monotonic(self, wall_time: float) -> float:
+        return self.clock() + (wall_time - self.wall_clock())
+
+    def set_schedule(self, schedule: SlotSchedule, from_slot: int):
+        """
+        Switch to another schedule from from_slot on.
+
+        Earlier slots keep their deadlines. If boundaries of from_slot are
+        already queued (set from the last phase of the slot before), they are
+        recomputed with the new schedule, which may bring the slot forward.
+        """
+        queued = [entry for entry in self._heap if entry[2] >= from_slot]
+        if not queued:
+            self._pending_schedule = (from_slot, schedule)
+            return
+
+        self._heap = [entry for entry in self._heap if entry[2] < from_slot]
+        heapq.heapify(self._heap)
+        self.schedule = schedule
+        self._pending_schedule = None
+        for slot in sorted({entry[2] for entry in queued}):
+            self._schedule_slot(slot, min(e[3] for e in queued if e[2] == slot))
+        self._wake.set()
+
+    def _schedule_slot(self, slot: int, from_index: int = 0):
+        if self._pending_schedule and slot >= self._pending_schedule[0]:
+            self.schedule = self._pending_schedule[1]
+            self._pending_schedule = None
+        slot_start = self._to_monotonic(self.schedule.slot_start(slot))
+        for index in range(from_index, len(self.schedule.windows)):
+            deadline = slot_start + self.schedule.windows[index].start
+            heapq.heappush(self._heap, (deadline, next(self._sequence), slot, index))
+
+    def start(self, slot: Optional[int] = None, phase: Any = None):
+        """
+        Choose where the schedule begins.
+
+        Args:
+            slot: First slot to run (defaults to the current one)
+            phase: First phase of that slot (defaults to the phase in effect
+                now, or the first phase for a future slot)
+        """
+        self._heap.clear()
+        now_slot, now_index = self.schedule.locate(self.wall_clock())
+        if slot is None:
+            slot = now_slot
+        if phase is not None:
+            index = self.schedule.index_of(phase)
+        elif slot == now_slot:
+            index = now_index
+        else:
+            index = 0
+        self._schedule_slot(slot, index)
+
+    def next_deadline(self) -> Optional[Tuple[float, int, Any]]:
+        """(seconds until, slot, phase) of the next boundary, if any."""
+        if not self._heap:
+            return None
+        deadline, _, slot, index = self._heap[0]
+        return deadline - self.clock(), slot, self.schedule.windows[index].phase
+
+    def advance(self, slot: int, phase: Any, reason: str = "") -> bool:
+        """
+        Signal that a phase has nothing left to wait for.
+
+        Args:
+            slot: Slot the signal refers to
+            phase: Phase that is complete
+            reason: Short description for the logs (e.g. "quorum_reached")
+
+        Returns:
+            True if the signal applies to the current phase and a later phase
+            of the same slot exists
+        """
+        if self.current is None:
+            return False
+        current_slot, current_phase = self.current
+        if (slot, phase_key(phase)) != (current_slot, phase_key(current_phase)):
+            logger.debug(
+                f"{self.name} Ignoring stale advance for slot {slot} phase {phase_key(phase)}"
+            )
+            return False
+        if self.schedule.index_of(current_phase) == len(self.schedule.windows) - 1:
+            return False
+
+        logger.info(
+            f"⏩ {self.name} Phase {phase_key(phase)} of slot {slot} complete early"
+            + (f" ({reason})" if reason else "")
+        )
+        self._early = (slot, phase_key(phase))
+        self._wake.set()
+        return True
+
+    def stop(self):
+        """Stop run() after the running callback returns."""
+        self._running = False
+        self._wake.set()
+
+    def _early_due(self) -> bool:
+        if self._early is None or self.current is None:
+            return False
+        _, _, slot, _ = self._heap[0]
+        return self._early[0] == slot == self.current[0]
+
+    async def _sleep_until(self, deadline: float):
+        delay = deadline - self.clock()
+        if delay <= 0:
+            return
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self):
+        """Drive the schedule until stop() is called or the task is cancelled."""
+        if not self._heap:
+            self.start()
+        self._running = True
+
+        while self._running and self._heap:
+            deadline = self._heap[0][0]
+            if self._early_due():
+                self._early = None
+                self.early_advances += 1
+            elif deadline > self.clock():
+                await self._sleep_until(deadline)
+                continue  # Re-check: woken by a deadline, advance() or stop()
+
+            deadline, _, slot, index = heapq.heappop(self._heap)
+            if index == len(self.schedule.windows) - 1:
+                self._schedule_slot(slot + 1)
+            phase = self.schedule.windows[index].phase
+
+            # A later boundary is already due: this window closed while the
+            # previous callback was running
+            if deadline < self._heap[0][0] <= self.clock():
+                self.skipped += 1
+                logger.warning(
+                    f"⏭️ {self.name} Skipping phase {phase_key(phase)} of slot {slot}: window already closed"
+                )
+                continue
+
+            self._early = None
+            self.current = (slot, phase)
+            self.fired += 1
+            try:
+                await self.on_phase(slot, phase)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"{self.name} Error handling phase {phase_key(phase)} of slot {slot}: {e}",
+                    exc_info=True,
+                )
+
+        self._running = False
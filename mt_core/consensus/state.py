@@ -42,10 +42,7 @@ from ..core.datatypes import (
     ValidatorScore,
     TaskAssignment,
 )
-from ..formulas.performance import (
-    calculate_adjusted_miner_performance,
-    calculate_validator_performance,
-)
+from ..formulas.performance import calculate_validator_performance
 from ..formulas.trust_score import update_trust_score
 from ..formulas.penalty import calculate_fraud_severity_value, calculate_slash_amount
 from ..formulas.incentive import (
@@ -109,6 +106,156 @@ def calculate_historical_consistency(
     return max(0.0, min(1.0, consistency_score))
 
 
+def calculate_historical_consistency_batch(
+    histories: List[List[float]], max_stddev_penalty: float = 2.0
+) -> np.ndarray:
+    """
+    Vectorized form of `calculate_historical_consistency` for many score histories.
+
+    Histories of equal length are stacked into one matrix so the standard
+    deviation of each group is computed with a single `np.std(axis=1)` call.
+
+    Args:
+        histories (List[List[float]]): One list of historical scores per entry.
+        max_stddev_penalty (float): See `calculate_historical_consistency`.
+
+    Returns:
+        np.ndarray: Quality scores in [0.0, 1.0], aligned with `histories`.
+    """
+    result = np.full(len(histories), 0.5)  # Average value if insufficient data
+    if max_stddev_penalty <= 0:
+        max_stddev_penalty = 0.5  # Giá trị an toàn
+
+    rows_by_length: Dict[int, List[int]] = defaultdict(list)
+    for row, scores in enumerate(histories):
+        if scores and len(scores) >= 2:
+            rows_by_length[len(scores)].append(row)
+
+    for rows in rows_by_length.values():
+        stddev = np.std(np.asarray([histories[r] for r in rows], dtype=float), axis=1)
+        normalized_penalty = np.minimum(1.0, stddev / max_stddev_penalty)
+        result[rows] = np.clip(1.0 - normalized_penalty, 0.0, 1.0)
+
+    return result
+
+
+class SparseScoreMatrix:
+    """
+    Sparse (COO) validator×miner score matrix built from P2P scores of one cycle.
+
+    Each entry is one (task, validator) score from an active validator. Entries
+    are stored in the order the scores appear in `received_scores` (task by task,
+    then validator by validator), so reductions over them add the same terms in
+    the same order as the original per-miner loops and give identical floats.
+    """
+
+    def __init__(
+        self,
+        received_scores: Dict[str, Dict[str, ValidatorScore]],
+        validators_info: Dict[str, ValidatorInfo],
+    ):
+        self.miner_index: Dict[str, int] = {}
+        self.validator_index: Dict[str, int] = {}
+        self.tasks_by_miner: Dict[str, Set[str]] = defaultdict(set)
+
+        miner_idx: List[int] = []
+        validator_idx: List[int] = []
+        entry_tasks: List[str] = []
+        scores: List[float] = []
+        trusts: List[float] = []
+
+        for task_id, validator_scores_dict in received_scores.items():
+            first_score = next(iter(validator_scores_dict.values()), None)
+            if not first_score:
+                continue
+            miner_uid_hex = first_score.miner_uid
+            self.tasks_by_miner[miner_uid_hex].add(task_id)
+
+            for validator_uid_hex, score_entry in validator_scores_dict.items():
+                validator = validators_info.get(validator_uid_hex)
+                if not (
+                    validator
+                    and getattr(validator, "status", STATUS_ACTIVE) == STATUS_ACTIVE
+                ):
+                    continue  # Chỉ tính điểm từ validator active
+                miner_idx.append(
+                    self.miner_index.setdefault(miner_uid_hex, len(self.miner_index))
+                )
+                validator_idx.append(
+                    self.validator_index.setdefault(
+                        validator_uid_hex, len(self.validator_index)
+                    )
+                )
+                entry_tasks.append(task_id)
+                scores.append(score_entry.score)
+                trusts.append(validator.trust_score)
+
+        self.miner_idx = np.asarray(miner_idx, dtype=np.intp)
+        self.validator_idx = np.asarray(validator_idx, dtype=np.intp)
+        self.scores = np.asarray(scores, dtype=float)
+        self.trusts = np.asarray(trusts, dtype=float)
+        self._entry_tasks = entry_tasks
+
+    @property
+    def num_miners(self) -> int:
+        return len(self.miner_index)
+
+    @property
+    def num_validators(self) -> int:
+        return len(self.validator_index)
+
+    def adjusted_miner_performance(self) -> np.ndarray:
+        """
+        Trust-weighted P_adj per miner, as `calculate_adjusted_miner_performance`.
+
+        Returns:
+            np.ndarray: P_adj in [0, 1], indexed like `miner_index`.
+        """
+        numerator = np.bincount(
+            self.miner_idx, weights=self.trusts * self.scores, minlength=self.num_miners
+        )
+        total_trust = np.bincount(
+            self.miner_idx, weights=self.trusts, minlength=self.num_miners
+        )
+        p_adj = np.zeros(self.num_miners)
+        np.divide(numerator, total_trust, out=p_adj, where=total_trust != 0)
+        return np.clip(p_adj, 0.0, 1.0)
+
+    def average_validator_deviations(self, p_adj: np.ndarray) -> np.ndarray:
+        """
+        Mean |score - P_adj| per validator over every task it scored.
+
+        Args:
+            p_adj (np.ndarray): Output of `adjusted_miner_performance`.
+
+        Returns:
+            np.ndarray: Average deviation, indexed like `validator_index`.
+        """
+        # Visit entries miner by miner, then task by task, like the scalar loop
+        task_rank: Dict[str, int] = {}
+        for miner_uid_hex in self.miner_index:
+            for task_id in self.tasks_by_miner[miner_uid_hex]:
+                task_rank[task_id] = len(task_rank)
+        order = np.argsort(
+            np.fromiter(
+                (task_rank[t] for t in self._entry_tasks),
+                dtype=np.intp,
+                count=len(self._entry_tasks),
+            ),
+            kind="stable",
+        )
+
+        deviations = np.abs(self.scores - p_adj[self.miner_idx])[order]
+        validator_idx = self.validator_idx[order]
+        totals = np.bincount(
+            validator_idx, weights=deviations, minlength=self.num_validators
+        )
+        counts = np.bincount(validator_idx, minlength=self.num_validators)
+        avg_dev = np.zeros(self.num_validators)
+        np.divide(totals, counts, out=avg_dev, where=counts > 0)
+        return avg_dev
+
+
 # --- Hàm tìm dữ liệu theo UID trên Aptos ---
 async def find_resource_by_uid(
     client: Web3,
@@ -237,9 +384,6 @@ def run_consensus_logic(
     """
     logger.info(f":brain: Running consensus calculations for cycle {current_cycle}...")
     final_miner_scores: Dict[str, float] = {}  # {miner_uid_hex: P_adj}
-    validator_deviations: Dict[str, List[float]] = defaultdict(
-        list
-    )  # {validator_uid_hex: [deviation1, deviation2,...]}
     calculated_validator_states: Dict[str, Any] = {}  # {validator_uid_hex: {state}}
     total_validator_contribution: float = 0.0  # Tổng W*E để tính thưởng validator
     if not consensus_possible:
@@ -282,64 +426,30 @@ def run_consensus_logic(
         )  # Trả về kết quả rỗng/chỉ decay
 
     # --- 1. Tính điểm đồng thuận Miner (P_miner_adjusted) và độ lệch ---
-    scores_by_miner: Dict[str, List[Tuple[float, float]]] = defaultdict(
-        list
-    )  # {miner_uid_hex: [(score, validator_trust)]}
-    tasks_processed_by_miner: Dict[str, Set[str]] = defaultdict(
-        set
-    )  # {miner_uid_hex: {task_id1, task_id2,...}}
-    validator_scores_by_task: Dict[str, Dict[str, float]] = defaultdict(
-        dict
-    )  # {task_id: {validator_uid: score}}
-
-    # Gom điểm theo miner VÀ theo task
-    for task_id, validator_scores_dict in received_scores.items():
-        first_score = next(iter(validator_scores_dict.values()), None)
-        if not first_score:
-            continue
-        miner_uid_hex = first_score.miner_uid
-        tasks_processed_by_miner[miner_uid_hex].add(
-            task_id
-        )  # Lưu tất cả task miner đã làm
-
-        for validator_uid_hex, score_entry in validator_scores_dict.items():
-            validator = validators_info.get(validator_uid_hex)
-            if (
-                validator
-                and getattr(validator, "status", STATUS_ACTIVE) == STATUS_ACTIVE
-            ):  # Chỉ tính điểm từ validator active
-                # Lưu (điểm, trust của validator chấm điểm) cho miner
-                scores_by_miner[miner_uid_hex].append(
-                    (score_entry.score, validator.trust_score)
-                )
-                # Lưu điểm của validator cho task này
-                validator_scores_by_task[task_id][validator_uid_hex] = score_entry.score
-            # else: logger.warning(...) # Bỏ qua validator không tồn tại hoặc inactive
-
-    # Tính P_adj và độ lệch
-    for miner_uid_hex, scores_trusts in scores_by_miner.items():
-        if not scores_trusts:
-            continue
-        scores = [s for s, t in scores_trusts]
-        trusts = [t for s, t in scores_trusts]
-
-        p_adj = calculate_adjusted_miner_performance(scores, trusts)
-        final_miner_scores[miner_uid_hex] = p_adj
-        logger.info(
-            f"  :chart_with_upwards_trend: Consensus score (P_adj) for Miner [cyan]{miner_uid_hex}[/cyan]: [yellow]{p_adj:.4f}[/yellow]"
+    # Gom điểm của validator active vào ma trận thưa validator×miner
+    score_matrix = SparseScoreMatrix(received_scores, validators_info)
+    p_adj_by_miner = score_matrix.adjusted_miner_performance()
+    avg_dev_by_validator = score_matrix.average_validator_deviations(p_adj_by_miner)
+
+    final_miner_scores = dict(zip(score_matrix.miner_index, p_adj_by_miner.tolist()))
+    validator_avg_deviation: Dict[str, Tuple[float, int]] = {
+        validator_uid_hex: (avg_dev, count)
+        for validator_uid_hex, avg_dev, count in zip(
+            score_matrix.validator_index,
+            avg_dev_by_validator.tolist(),
+            np.bincount(
+                score_matrix.validator_idx, minlength=score_matrix.num_validators
+            ).tolist(),
         )
-
-        # Tính độ lệch cho từng validator đã chấm điểm miner này, trên từng task
-        related_task_ids = tasks_processed_by_miner.get(miner_uid_hex, set())
-        for task_id in related_task_ids:
-            scores_for_this_task = validator_scores_by_task.get(task_id, {})
-            for validator_uid_hex, score in scores_for_this_task.items():
-                # Độ lệch = |điểm validator chấm - điểm đồng thuận của miner|
-                deviation = abs(score - p_adj)
-                validator_deviations[validator_uid_hex].append(deviation)
-                logger.debug(
-                    f"  Deviation for V:{validator_uid_hex} on M:{miner_uid_hex} (Task:{task_id}): {deviation:.4f}"
-                )
+    }
+    logger.info(
+        f"  :chart_with_upwards_trend: Consensus scores (P_adj) computed for {len(final_miner_scores)} miners from {len(score_matrix.scores)} validator scores"
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for miner_uid_hex, p_adj in final_miner_scores.items():
+            logger.debug(
+                f"  Consensus score (P_adj) for Miner {miner_uid_hex}: {p_adj:.4f}"
+            )
 
     # --- 2. Tính E_validator, Trust mới dự kiến, và Đóng góp cho thưởng ---
     temp_validator_contributions: Dict[str, float] = {}
@@ -379,29 +489,35 @@ def run_consensus_logic(
         f"  Weighted E_avg (based on start-of-cycle active validator stake): {e_avg_weighted:.4f}"
     )
 
+    # Metric Quality Placeholder
+    # Giả định validator_info.performance_history chứa list điểm số float
+    # Cần lấy tham số max_stddev_penalty từ settings hoặc đặt mặc định
+    max_penalty_for_consistency = getattr(
+        config, "CONSENSUS_METRIC_MAX_STDDEV", 0.2
+    )  # Ví dụ: ngưỡng 0.2
+    metric_quality_by_validator = calculate_historical_consistency_batch(
+        [
+            getattr(validator_info, "performance_history", [])
+            for validator_info in validators_info.values()
+        ],
+        max_penalty_for_consistency,
+    ).tolist()
+
     # Tính toán cho từng validator (kể cả inactive/jailed để có trạng thái dự kiến nếu họ quay lại)
-    for validator_uid_hex, validator_info in validators_info.items():
-        deviations = validator_deviations.get(validator_uid_hex, [])
-        avg_dev = sum(deviations) / len(deviations) if deviations else 0.0
+    for (validator_uid_hex, validator_info), metric_quality in zip(
+        validators_info.items(), metric_quality_by_validator
+    ):
+        avg_dev, num_deviations = validator_avg_deviation.get(
+            validator_uid_hex, (0.0, 0)
+        )
 
         # Nếu validator không chấm điểm nào thì avg_dev = 0.
         # Cân nhắc: Có nên phạt validator không tham gia chấm điểm không? (Hiện tại thì không)
         logger.debug(
-            f"  Validator {validator_uid_hex}: Average deviation = {avg_dev:.4f} ({len(deviations)} scores evaluated)"
-        )
-
-        # Metric Quality Placeholder
-        # Giả định validator_info.performance_history chứa list điểm số float
-        historical_scores = getattr(validator_info, "performance_history", [])
-        # Cần lấy tham số max_stddev_penalty từ settings hoặc đặt mặc định
-        max_penalty_for_consistency = getattr(
-            config, "CONSENSUS_METRIC_MAX_STDDEV", 0.2
-        )  # Ví dụ: ngưỡng 0.2
-        metric_quality = calculate_historical_consistency(
-            historical_scores, max_penalty_for_consistency
+            f"  Validator {validator_uid_hex}: Average deviation = {avg_dev:.4f} ({num_deviations} scores evaluated)"
         )
         logger.debug(
-            f"  Validator {validator_uid_hex}: Historical Consistency Metric = {metric_quality:.3f} (based on {len(historical_scores)} scores)"
+            f"  Validator {validator_uid_hex}: Historical Consistency Metric = {metric_quality:.3f}"
         )
 
         # Kiểm tra xem UID của validator này có trong danh sách điểm miner cuối cùng không
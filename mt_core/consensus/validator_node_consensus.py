@@ -17,9 +17,8 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 
-import httpx
 from web3 import Web3
 from eth_account import Account
 
@@ -32,11 +31,27 @@ from ..core.datatypes import (
 
 # Import TaskModel from network.server (miner-compatible format)
 from ..network.server import TaskModel
+from ..network.score_codec import (
+    ACCEPT_POST_HEADER,
+    JSON_CONTENT_TYPE,
+    SCORE_BATCH_CONTENT_TYPE,
+    ScoreBroadcast,
+    accepts_binary_scores,
+    canonical_bytes,
+    encode_score_broadcast,
+    sign_score_broadcast,
+)
 from ..formulas.incentive import calculate_miner_incentive
 from ..formulas.performance import calculate_adjusted_miner_performance
 from ..formulas.trust_score import update_trust_score
 from .scoring import score_results_logic, broadcast_scores_logic
 from .slot_coordinator import SlotPhase
+from .gossip import encode_envelope, gossip_bundle_id
+from .score_stream import (
+    SCORE_STREAM_CONTENT_TYPE,
+    SCORE_STREAM_ENDPOINT,
+    score_delta_id,
+)
 from ..core_client.contract_client import ModernTensorCoreClient
 from .modern_consensus import (
     ModernConsensus,
@@ -60,6 +75,27 @@ CORE_CONFIRMATION_BLOCKS = 12  # Number of blocks for confirmation
 BITCOIN_STAKING_EPOCHS = 144  # Blocks per epoch for Bitcoin staking rewards
 
 
+def mean_score_per_miner(scores: Iterable[ValidatorScore]) -> Dict[str, float]:
+    """
+    Local score of each miner: the mean over the tasks it ran.
+
+    A miner may run several tasks per slot; this matches the value the task
+    dispatcher feeds into the online aggregator.
+
+    Args:
+        scores: ValidatorScore objects produced by this validator
+
+    Returns:
+        Dictionary mapping miner UID to its mean score
+    """
+    totals: Dict[str, List[float]] = {}
+    for score in scores:
+        total = totals.setdefault(score.miner_uid, [0.0, 0])
+        total[0] += score.score
+        total[1] += 1
+    return {miner_uid: total[0] / total[1] for miner_uid, total in totals.items()}
+
+
 class ValidatorNodeConsensus:
     """
     Consensus functionality for ValidatorNode on Core blockchain.
@@ -107,6 +143,11 @@ class ValidatorNodeConsensus:
             "total_consensus_attempts": 0,
         }
 
+        # Last encoded broadcast: (broadcast_id, scores id, JSON payload, binary body)
+        self._score_wire_cache = None
+        self._stream_sends = {}  # slot -> task sending its score deltas
+        self._stream_dirty = set()  # Slots with scores not yet streamed
+
         # Initialize Core client if account is available
         if hasattr(core_node, "account") and core_node.account:
             self._initialize_core_client()
@@ -461,28 +502,29 @@ class ValidatorNodeConsensus:
 
         # Prioritize slot_scores if available
         if slot in self.core.slot_scores and self.core.slot_scores[slot]:
-            for score in self.core.slot_scores[slot]:
-                local_scores[score.miner_uid] = score.score
+            local_scores = mean_score_per_miner(self.core.slot_scores[slot])
             logger.info(
                 f"{self.uid_prefix} Collected {len(local_scores)} local scores from slot_scores for slot {slot}"
             )
 
         # Fallback to cycle_scores if slot_scores not available
         elif self.core.cycle_scores:
-            for task_id, scores_list in self.core.cycle_scores.items():
-                if scores_list:
-                    latest_score = scores_list[-1]
-                    local_scores[latest_score.miner_uid] = latest_score.score
+            local_scores = mean_score_per_miner(
+                scores_list[-1]
+                for scores_list in self.core.cycle_scores.values()
+                if scores_list
+            )
             logger.info(
                 f"{self.uid_prefix} Collected {len(local_scores)} local scores from cycle_scores for slot {slot}"
             )
 
         # Fallback to validator_scores
         elif self.core.validator_scores:
-            for task_id, scores_list in self.core.validator_scores.items():
-                if scores_list:
-                    latest_score = scores_list[-1]
-                    local_scores[latest_score.miner_uid] = latest_score.score
+            local_scores = mean_score_per_miner(
+                scores_list[-1]
+                for scores_list in self.core.validator_scores.values()
+                if scores_list
+            )
             logger.info(
                 f"{self.uid_prefix} Collected {len(local_scores)} local scores from validator_scores for slot {slot}"
             )
@@ -571,7 +613,10 @@ class ValidatorNodeConsensus:
 
     async def _wait_for_validator_coordination(self, slot: int, timeout: float = 30.0):
         """
-        Wait for other validators to reach consensus phase.
+        Wait for other validators to deliver their scores for the current cycle.
+
+        Returns as soon as the receive endpoints record enough participants to
+        satisfy the node's quorum rule.
 
         Args:
             slot: Current slot number
@@ -582,32 +627,25 @@ class ValidatorNodeConsensus:
                 f"{self.uid_prefix} Waiting for validator coordination for slot {slot}"
             )
 
-            start_time = time.time()
-            min_validators = getattr(
-                self.core.settings, "min_validators_for_consensus", 2
+            active_validators = await self._get_active_validators()
+            reached = await self.core.quorum_tracker.wait_for(
+                self.core.current_cycle,
+                self.core.quorum_rule,
+                expected=self._expected_validator_stakes(active_validators),
+                local_uid=self.core.info.uid,
+                timeout=timeout,
             )
 
-            while time.time() - start_time < timeout:
-                # Check how many validators have reached consensus phase
-                active_validators = await self._get_active_validators()
-                participating_validators = len(
-                    [v for v in active_validators if v.uid != self.core.info.uid]
+            if reached:
+                logger.info(
+                    f"{self.uid_prefix} Sufficient validators ready for consensus: "
+                    f"{self.core.quorum_tracker.count(self.core.current_cycle) + 1}"
                 )
-
-                if (
-                    participating_validators >= min_validators - 1
-                ):  # -1 because we don't count ourselves
-                    logger.info(
-                        f"{self.uid_prefix} Sufficient validators ready for consensus: {participating_validators + 1}"
-                    )
-                    return True
-
-                await asyncio.sleep(2.0)  # Check every 2 seconds
-
-            logger.warning(
-                f"{self.uid_prefix} Timeout waiting for validator coordination"
-            )
-            return False
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Timeout waiting for validator coordination"
+                )
+            return reached
 
         except Exception as e:
             logger.error(
@@ -615,6 +653,32 @@ class ValidatorNodeConsensus:
             )
             return False
 
+    def _expected_validator_stakes(
+        self, validators: List[Union[ValidatorInfo, str]]
+    ) -> Dict[str, float]:
+        """
+        Map the validators expected to participate to their stake.
+
+        Args:
+            validators: ValidatorInfo objects or validator UIDs
+
+        Returns:
+            Dictionary mapping validator UID to stake (0.0 if unknown)
+        """
+        expected = {}
+        for validator in validators:
+            if isinstance(validator, str):
+                uid = validator
+                validator = (
+                    self.core.info
+                    if uid == self.core.info.uid
+                    else self.core.validators_info.get(uid)
+                )
+            else:
+                uid = validator.uid
+            expected[uid] = float(getattr(validator, "stake", 0.0) or 0.0)
+        return expected
+
     async def _check_validator_participation(self, slot: int) -> bool:
         """
         Check if we have sufficient validator participation for consensus.
@@ -632,31 +696,23 @@ class ValidatorNodeConsensus:
 
             # Count validators with scores for this slot/cycle
             current_cycle = self.core.current_cycle
-            participating_validators = 1  # Count ourselves
-
-            if current_cycle in self.core.received_validator_scores:
-                participating_validators += len(
-                    self.core.received_validator_scores[current_cycle]
-                )
-
-            # Check if we have minimum participation
-            min_validators = getattr(
-                self.core.settings, "min_validators_for_consensus", 2
-            )
-            required_percentage = getattr(
-                self.core.settings, "required_consensus_percentage", 0.6
-            )
-
-            min_required = max(
-                min_validators, int(total_validators * required_percentage)
+            participating_validators = (
+                self.core.quorum_tracker.count(current_cycle) + 1
+            )  # Count ourselves
+
+            sufficient = self.core.quorum_tracker.is_met(
+                current_cycle,
+                self.core.quorum_rule,
+                expected=self._expected_validator_stakes(active_validators),
+                local_uid=self.core.info.uid,
             )
 
             logger.info(
                 f"{self.uid_prefix} Validator participation: {participating_validators}/{total_validators} "
-                f"(required: {min_required})"
+                f"(rule: {self.core.quorum_rule})"
             )
 
-            return participating_validators >= min_required
+            return sufficient
 
         except Exception as e:
             logger.error(
@@ -1008,49 +1064,50 @@ class ValidatorNodeConsensus:
                 )
                 return False
 
-            # Prepare score data for transmission
-            scores_data = []
-            for score in scores:
-                scores_data.append(
-                    {
-                        "task_id": score.task_id,
-                        "miner_uid": score.miner_uid,
-                        "score": score.score,
-                        "timestamp": score.timestamp,
-                        "validator_uid": score.validator_uid,
-                        "cycle": getattr(score, "cycle", 0),
-                    }
-                )
-
-            # Create request payload
-            payload = {
-                "broadcast_id": broadcast_id,
-                "sender_uid": self.core.info.uid,
-                "scores": scores_data,
-                "timestamp": int(time.time()),
-            }
-
-            # Send HTTP request
             url = f"{validator_endpoint.rstrip('/')}/consensus/receive_scores"
+            json_payload, binary_body = self._encode_score_broadcast(
+                scores, broadcast_id
+            )
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.post(
+            # Binary only to peers that advertised it; JSON otherwise
+            binary = binary_body is not None and url in self.core.binary_score_peers
+            if binary:
+                response = await self.core.http_pool.post(
                     url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
+                    content=binary_body,
+                    headers={"Content-Type": SCORE_BATCH_CONTENT_TYPE},
+                    timeout=HTTP_TIMEOUT,
                 )
+                if response.status_code == 415:
+                    # Peer downgraded: forget it and resend as JSON
+                    self.core.binary_score_peers.discard(url)
+                    binary = False
+            if not binary:
+                response = await self.core.http_pool.post(
+                    url,
+                    json=json_payload,
+                    headers={
+                        "Content-Type": JSON_CONTENT_TYPE,
+                        "Accept": f"{JSON_CONTENT_TYPE}, {SCORE_BATCH_CONTENT_TYPE}",
+                    },
+                    timeout=HTTP_TIMEOUT,
+                )
+            if binary_body is not None and accepts_binary_scores(
+                response.headers.get(ACCEPT_POST_HEADER)
+            ):
+                self.core.binary_score_peers.add(url)
 
-                if response.status_code == 200:
-                    logger.debug(
-                        f"{self.uid_prefix} Successfully sent {len(scores)} scores to {validator.uid}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Failed to send scores to {validator.uid}: "
-                        f"HTTP {response.status_code}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.debug(
+                    f"{self.uid_prefix} Successfully sent {len(scores)} scores to {validator.uid}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Failed to send scores to {validator.uid}: "
+                    f"HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -1058,6 +1115,47 @@ class ValidatorNodeConsensus:
             )
             return False
 
+    def _encode_score_broadcast(
+        self, scores: List[ValidatorScore], broadcast_id: str
+    ) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """
+        JSON payload and signed binary body of a broadcast, built once per
+        broadcast and reused for every peer.
+
+        Returns:
+            (JSON payload, binary body or None when binary scores are disabled)
+        """
+        key = (broadcast_id, id(scores), len(scores))
+        if self._score_wire_cache and self._score_wire_cache[0] == key:
+            return self._score_wire_cache[1:]
+
+        broadcast = ScoreBroadcast(
+            sender_uid=self.core.info.uid,
+            broadcast_id=broadcast_id,
+            timestamp=int(time.time()),
+            scores=scores,
+        )
+        binary_body = None
+        if getattr(self.core.settings, "CONSENSUS_BINARY_SCORES", True):
+            try:
+                body = canonical_bytes(broadcast)
+                if getattr(self.core, "account", None) is not None:
+                    broadcast.signature = sign_score_broadcast(body, self.core.account)
+                binary_body = encode_score_broadcast(
+                    broadcast,
+                    compress=getattr(
+                        self.core.settings, "CONSENSUS_SCORE_COMPRESSION", True
+                    ),
+                    body=body,
+                )
+            except Exception as e:
+                logger.error(
+                    f"{self.uid_prefix} Error encoding binary score broadcast: {e}"
+                )
+
+        self._score_wire_cache = (key, broadcast.to_json_payload(), binary_body)
+        return self._score_wire_cache[1:]
+
     async def core_broadcast_scores(self, slot: int):
         """
         Broadcast scores for Core blockchain consensus.
@@ -1129,21 +1227,23 @@ class ValidatorNodeConsensus:
         try:
             url = f"{validator.api_endpoint.rstrip('/')}/consensus/scores"
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.post(
-                    url, json=payload, headers={"Content-Type": "application/json"}
-                )
+            response = await self.core.http_pool.post(
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=HTTP_TIMEOUT,
+            )
 
-                if response.status_code == 200:
-                    logger.debug(
-                        f"{self.uid_prefix} Scores sent successfully to {validator.uid}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Failed to send scores to {validator.uid}: HTTP {response.status_code}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.debug(
+                    f"{self.uid_prefix} Scores sent successfully to {validator.uid}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Failed to send scores to {validator.uid}: HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -1312,8 +1412,13 @@ class ValidatorNodeConsensus:
     # === Received Scores Handling ===
 
     async def add_received_score(
-        self, submitter_uid: str, cycle: int, scores: List[ValidatorScore]
-    ):
+        self,
+        submitter_uid: str,
+        cycle: int,
+        scores: List[ValidatorScore],
+        merge: bool = False,
+        complete: bool = True,
+    ) -> bool:
         """
         Add received scores from other validators.
 
@@ -1321,22 +1426,46 @@ class ValidatorNodeConsensus:
             submitter_uid: UID of the validator who submitted the scores
             cycle: Cycle number
             scores: List of validator scores
+            merge: Add to the validator's earlier scores for the cycle instead
+                of replacing them (streamed deltas)
+            complete: Whether the validator's submission is now complete; only
+                complete submissions count towards quorum
+
+        Returns:
+            False if the scores were dropped because the cycle is outside the
+            score store's retention window (or could not be stored)
         """
+        if not self.core.score_store.accepts(cycle):
+            logger.warning(
+                f"{self.uid_prefix} Ignored {len(scores)} scores from validator {submitter_uid} for out-of-window cycle {cycle}"
+            )
+            return False
         try:
             async with self.core.received_scores_lock:
-                if cycle not in self.core.received_validator_scores:
-                    self.core.received_validator_scores[cycle] = {}
+                self.core.score_store.add_received_scores(
+                    cycle, submitter_uid, scores, merge=merge
+                )
 
-                self.core.received_validator_scores[cycle][submitter_uid] = {
-                    score.task_id: score for score in scores
-                }
+                # Fold into the running consensus as the scores arrive
+                self.core.score_aggregator.add_scores(
+                    cycle,
+                    submitter_uid,
+                    scores,
+                    self.core.validator_trust_weight(submitter_uid),
+                )
+
+                # Wake anyone waiting for quorum on this slot/cycle
+                if complete:
+                    self.core.quorum_tracker.record(cycle, submitter_uid)
 
                 logger.debug(
                     f"{self.uid_prefix} Added {len(scores)} scores from validator {submitter_uid} for cycle {cycle}"
                 )
+            return True
 
         except Exception as e:
             logger.error(f"{self.uid_prefix} Error adding received scores: {e}")
+            return False
 
     async def wait_for_consensus_scores(self, wait_timeout_seconds: float) -> bool:
         """
@@ -1352,27 +1481,25 @@ class ValidatorNodeConsensus:
             f"{self.uid_prefix} Waiting for consensus scores (timeout: {wait_timeout_seconds}s)"
         )
 
-        start_time = time.time()
-
-        while time.time() - start_time < wait_timeout_seconds:
-            async with self.core.received_scores_lock:
-                current_cycle = self.core.current_cycle
-
-                if current_cycle in self.core.received_validator_scores:
-                    received_count = len(
-                        self.core.received_validator_scores[current_cycle]
-                    )
-
-                    if received_count >= MIN_VALIDATORS_FOR_CONSENSUS:
-                        logger.info(
-                            f"{self.uid_prefix} Sufficient consensus scores received: {received_count}"
-                        )
-                        return True
-
-            await asyncio.sleep(1)
+        current_cycle = self.core.current_cycle
+        reached = await self.core.quorum_tracker.wait_for(
+            current_cycle,
+            self.core.quorum_rule,
+            expected=self._expected_validator_stakes(
+                list(self.core.validators_info.values())
+            ),
+            local_uid=self.core.info.uid,
+            timeout=wait_timeout_seconds,
+        )
 
-        logger.warning(f"{self.uid_prefix} Timeout waiting for consensus scores")
-        return False
+        if reached:
+            logger.info(
+                f"{self.uid_prefix} Sufficient consensus scores received: "
+                f"{self.core.quorum_tracker.count(current_cycle)}"
+            )
+        else:
+            logger.warning(f"{self.uid_prefix} Timeout waiting for consensus scores")
+        return reached
 
     # === Blockchain Submission Methods ===
 
@@ -1842,6 +1969,9 @@ class ValidatorNodeConsensus:
         """
         Aggregate local scores with P2P received scores into slot_aggregated_scores.
 
+        P2P scores are already folded into the online aggregator as they arrive,
+        so this only adds the local scores and reads the running consensus.
+
         Args:
             slot: Current slot number
             local_scores: Local validator scores
@@ -1849,111 +1979,38 @@ class ValidatorNodeConsensus:
         try:
             logger.info(f"{self.uid_prefix} Aggregating all scores for slot {slot}")
 
-            # Initialize slot aggregated scores
-            if slot not in self.core.slot_aggregated_scores:
-                self.core.slot_aggregated_scores[slot] = {}
+            aggregator = self.core.score_aggregator
+            own_uid = self.core.info.uid
+            own_weight = self.core.validator_trust_weight(own_uid)
 
             # Add local scores
             for miner_uid, score in local_scores.items():
-                if miner_uid not in self.core.slot_aggregated_scores[slot]:
-                    self.core.slot_aggregated_scores[slot][miner_uid] = {}
-
-                # Add this validator's local score
-                self.core.slot_aggregated_scores[slot][miner_uid][
-                    self.core.info.uid
-                ] = score
+                aggregator.add_score(slot, miner_uid, own_uid, score, own_weight)
 
-            # Add P2P received scores - check both current cycle and slot-based storage
-            p2p_scores_added = 0
-
-            # Method 1: Check current cycle based scores
+            # P2P scores received under the current cycle number belong to this slot
             current_cycle = self.core.current_cycle
-            if current_cycle in self.core.received_validator_scores:
-                p2p_scores = self.core.received_validator_scores[current_cycle]
-
-                for validator_uid, validator_scores in p2p_scores.items():
-                    for task_id, score_obj in validator_scores.items():
-                        miner_uid = score_obj.miner_uid
-                        score_value = score_obj.score
-
-                        # Initialize miner entry if needed
-                        if miner_uid not in self.core.slot_aggregated_scores[slot]:
-                            self.core.slot_aggregated_scores[slot][miner_uid] = {}
-
-                        # Add P2P score from this validator
-                        self.core.slot_aggregated_scores[slot][miner_uid][
-                            validator_uid
-                        ] = score_value
-                        p2p_scores_added += 1
-
-                        logger.debug(
-                            f"{self.uid_prefix} Added P2P score: Miner {miner_uid[:8]}... "
-                            f"from Validator {validator_uid[:8]}...: {score_value:.4f}"
-                        )
-
-            # Method 2: Check if there's slot-based P2P storage (fallback)
-            if (
-                hasattr(self.core, "slot_received_scores")
-                and slot in self.core.slot_received_scores
-            ):
-                slot_p2p_scores = self.core.slot_received_scores[slot]
-
-                for validator_uid, validator_scores in slot_p2p_scores.items():
-                    for task_id, score_obj in validator_scores.items():
-                        miner_uid = score_obj.miner_uid
-                        score_value = score_obj.score
-
-                        # Initialize miner entry if needed
-                        if miner_uid not in self.core.slot_aggregated_scores[slot]:
-                            self.core.slot_aggregated_scores[slot][miner_uid] = {}
-
-                        # Add P2P score from this validator (avoid duplicates)
-                        if (
-                            validator_uid
-                            not in self.core.slot_aggregated_scores[slot][miner_uid]
-                        ):
-                            self.core.slot_aggregated_scores[slot][miner_uid][
-                                validator_uid
-                            ] = score_value
-                            p2p_scores_added += 1
-
-                            logger.debug(
-                                f"{self.uid_prefix} Added slot-based P2P score: Miner {miner_uid[:8]}... "
-                                f"from Validator {validator_uid[:8]}...: {score_value:.4f}"
-                            )
+            p2p_scores_added = aggregator.merge_slot(current_cycle, slot)
 
-            # Log P2P aggregation status
-            if p2p_scores_added > 0:
+            p2p_validators = aggregator.validators(slot) - {own_uid}
+            if p2p_validators:
                 logger.info(
-                    f"{self.uid_prefix} Successfully added {p2p_scores_added} P2P scores for slot {slot}"
+                    f"{self.uid_prefix} Aggregated P2P scores from {len(p2p_validators)} validators for slot {slot} "
+                    f"({p2p_scores_added} merged from cycle {current_cycle})"
                 )
             else:
                 logger.warning(
                     f"{self.uid_prefix} No P2P scores found to aggregate for slot {slot}"
                 )
-
-                # Debug: Log what's available
                 logger.debug(
-                    f"{self.uid_prefix} Debug - current_cycle: {current_cycle}"
+                    f"{self.uid_prefix} Debug - current_cycle: {current_cycle}, aggregator slots: {aggregator.slots()}"
                 )
-                logger.debug(
-                    f"{self.uid_prefix} Debug - received_validator_scores keys: {list(self.core.received_validator_scores.keys())}"
-                )
-                if hasattr(self.core, "slot_received_scores"):
-                    logger.debug(
-                        f"{self.uid_prefix} Debug - slot_received_scores keys: {list(getattr(self.core, 'slot_received_scores', {}).keys())}"
-                    )
 
-            # Log aggregation summary
-            # Note: slot_aggregated_scores[slot] is Dict[miner_uid, float] after P2P consensus
-            total_miners = len(self.core.slot_aggregated_scores[slot])
-            total_scores = len(
-                self.core.slot_aggregated_scores[slot]
-            )  # Each miner has 1 final score
+            self.core.slot_aggregated_scores[slot] = aggregator.consensus(slot)
 
             logger.info(
                 f"{self.uid_prefix} Aggregated scores for slot {slot}: "
-                f"{total_miners} miners, {total_scores} total scores"
+                f"{len(self.core.slot_aggregated_scores[slot])} miners from "
+                f"{aggregator.validator_count(slot)} validators"
             )
 
         except Exception as e:
@@ -1980,20 +2037,20 @@ class ValidatorNodeConsensus:
                 )
             else:
                 # Last resort: Check if we have any cycle scores or validator scores
-                fallback_scores = {}
-
                 # Try cycle_scores
-                for task_id, scores_list in self.core.cycle_scores.items():
-                    if scores_list:
-                        latest_score = scores_list[-1]
-                        fallback_scores[latest_score.miner_uid] = latest_score.score
+                fallback_scores = mean_score_per_miner(
+                    scores_list[-1]
+                    for scores_list in self.core.cycle_scores.values()
+                    if scores_list
+                )
 
                 # Try validator_scores if cycle_scores is empty
                 if not fallback_scores and hasattr(self.core, "validator_scores"):
-                    for task_id, scores_list in self.core.validator_scores.items():
-                        if scores_list:
-                            latest_score = scores_list[-1]
-                            fallback_scores[latest_score.miner_uid] = latest_score.score
+                    fallback_scores = mean_score_per_miner(
+                        scores_list[-1]
+                        for scores_list in self.core.validator_scores.values()
+                        if scores_list
+                    )
 
                 if fallback_scores:
                     await self._aggregate_all_scores_for_slot(slot, fallback_scores)
@@ -2081,6 +2138,8 @@ class ValidatorNodeConsensus:
                 len(scores) for scores in self.core.slot_scores.values()
             ),
             "received_scores_cycles": len(self.core.received_validator_scores),
+            "score_store_slots": len(self.core.score_store.keys()),
+            "score_store_bytes": self.core.score_store.memory_bytes(),
             "consensus_cache_size": len(self.core.consensus_results_cache),
         }
 
@@ -2343,6 +2402,10 @@ class ValidatorNodeConsensus:
                                     f"❌ {self.uid_prefix} Error scoring task from miner {getattr(miner, 'uid', 'unknown')}: {e}"
                                 )
 
+                        # STEP 4: Stream this minibatch's score changes to peers
+                        if batch_scores:
+                            self.schedule_score_delta(slot)
+
                     task_round += 1
                     logger.info(
                         f"✅ {self.uid_prefix} Mini-batch {task_round-1} completed: {batch_scores} scores from {len(batch_tasks)} miners"
@@ -2430,6 +2493,7 @@ class ValidatorNodeConsensus:
                                 logger.info(
                                     f"📥 {self.uid_prefix} Late results scored: +{stats_after - stats_before}"
                                 )
+                                self.schedule_score_delta(slot)
 
                         else:
                             await asyncio.sleep(2)
@@ -2588,6 +2652,9 @@ class ValidatorNodeConsensus:
             logger.warning(f"⚠️ {self.uid_prefix} No scores available in slot {slot}")
             averaged_scores = {}
 
+        # Close the score stream: peers already hold most of these scores
+        await self.finish_score_stream(slot)
+
         # STEP 2: Register consensus participation
         await self.core.slot_coordinator.register_phase_entry(
             slot,
@@ -2652,9 +2719,7 @@ class ValidatorNodeConsensus:
                 )
                 # Convert ValidatorScore list to Dict[miner_uid, score] format
                 slot_scores_list = self.core.slot_scores.get(slot, [])
-                local_scores = {}
-                for score_obj in slot_scores_list:
-                    local_scores[score_obj.miner_uid] = score_obj.score
+                local_scores = mean_score_per_miner(slot_scores_list)
 
                 logger.debug(
                     f"🔄 {self.uid_prefix} Converted {len(slot_scores_list)} ValidatorScore objects to {len(local_scores)} local_scores dict"
@@ -2766,14 +2831,19 @@ class ValidatorNodeConsensus:
             return
 
         scores = self.core.slot_scores[slot]
+        if await self.gossip_scores(slot, scores):
+            return
+        # Validators that hold the complete score stream need no full broadcast
+        streamed = await self.finish_score_stream(slot, validators)
         logger.info(
             f"📡 {self.uid_prefix} Broadcasting {len(scores)} scores to {len(validators)} validators"
+            f" ({len(streamed)} already streamed)"
         )
 
         # Use existing broadcast logic but with flexible validator set
         broadcast_tasks = []
         for validator_uid in validators:
-            if validator_uid != self.core.info.uid:  # Don't broadcast to self
+            if validator_uid != self.core.info.uid and validator_uid not in streamed:
                 task = self.broadcast_scores_to_validator(validator_uid, scores, slot)
                 broadcast_tasks.append(task)
 
@@ -2784,6 +2854,252 @@ class ValidatorNodeConsensus:
                 f"📡 {self.uid_prefix} Broadcast complete: {successful}/{len(broadcast_tasks)} successful"
             )
 
+    async def gossip_scores(self, slot: int, scores: List[ValidatorScore]) -> bool:
+        """
+        Hand this validator's signed score bundle to the gossip overlay.
+
+        Returns:
+            True if gossip took over; False when it is disabled or the bundle
+            cannot be signed (the caller then broadcasts directly)
+        """
+        gossip = getattr(self.core, "score_gossip", None)
+        if gossip is None:
+            return False
+        if getattr(self.core, "account", None) is None:
+            logger.warning(
+                f"{self.uid_prefix} Score gossip needs a signing account; broadcasting directly"
+            )
+            return False
+
+        try:
+            bundle = ScoreBroadcast(
+                sender_uid=self.core.info.uid,
+                broadcast_id=gossip_bundle_id(slot),
+                timestamp=int(time.time()),
+                scores=list(scores),
+            )
+            body = canonical_bytes(bundle)
+            bundle.signature = sign_score_broadcast(body, self.core.account)
+            encoded = encode_score_broadcast(
+                bundle,
+                compress=getattr(self.core.settings, "CONSENSUS_SCORE_COMPRESSION", True),
+                body=body,
+            )
+            peers = await gossip.publish(slot, encoded)
+            logger.info(
+                f"📡 {self.uid_prefix} Gossiping {len(scores)} scores for slot {slot} via {peers} overlay peers"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"{self.uid_prefix} Error gossiping scores: {e}")
+            return False
+
+    async def deliver_gossip_bundle(self, slot: int, bundle: ScoreBroadcast):
+        """Store a score bundle that reached this validator through gossip."""
+        await self.add_received_score(bundle.sender_uid, slot, bundle.scores)
+
+    # === Streamed Score Deltas ===
+
+    def _score_streaming_enabled(self) -> bool:
+        """Streaming needs a signing account; gossip, when enabled, takes over instead."""
+        return (
+            getattr(self.core, "score_stream_sender", None) is not None
+            and getattr(self.core, "score_gossip", None) is None
+            and getattr(self.core, "account", None) is not None
+        )
+
+    def _build_score_delta(self, slot: int, final: bool = False) -> Optional[bytes]:
+        """
+        Encode and sign the next delta of this validator's score stream.
+
+        The delta holds the per-miner averages that changed since the previous
+        delta of the slot.
+
+        Returns:
+            The encoded delta, or None if nothing changed and it is not final
+        """
+        sender = self.core.score_stream_sender
+        averages = self._average_scores_by_miner(self.core.slot_scores.get(slot, []))
+        changes = sender.changes(slot, averages)
+        if not changes and not final:
+            return None
+
+        delta = ScoreBroadcast(
+            sender_uid=self.core.info.uid,
+            broadcast_id=score_delta_id(slot, sender.next_seq(slot), final),
+            timestamp=int(time.time()),
+            scores=[
+                self._averaged_score(slot, miner_uid, score)
+                for miner_uid, score in sorted(changes.items())
+            ],
+        )
+        body = canonical_bytes(delta)
+        delta.signature = sign_score_broadcast(body, self.core.account)
+        encoded = encode_score_broadcast(
+            delta,
+            compress=getattr(self.core.settings, "CONSENSUS_SCORE_COMPRESSION", True),
+            body=body,
+        )
+        sender.record(slot, encoded, changes, final)
+        return encoded
+
+    def _stream_peers(self, validators: Optional[List[str]] = None) -> List[ValidatorInfo]:
+        uids = validators if validators is not None else list(self.core.validators_info)
+        return [
+            self.core.validators_info[uid]
+            for uid in uids
+            if uid != self.core.info.uid and uid in self.core.validators_info
+        ]
+
+    def schedule_score_delta(self, slot: int):
+        """
+        Stream newly scored results without waiting for the sends.
+
+        At most one delta per slot is in flight; scores that arrive meanwhile
+        go out in the next delta as soon as it completes.
+        """
+        if not self._score_streaming_enabled():
+            return
+        if slot in self._stream_dirty or self.core.score_stream_sender.is_final(slot):
+            return
+        self._stream_dirty.add(slot)
+        running = self._stream_sends.get(slot)
+        if running is not None and not running.done():
+            return  # Picked up when the running delta completes
+        for finished in [key for key, task in self._stream_sends.items() if task.done()]:
+            del self._stream_sends[finished]
+        self._stream_sends[slot] = asyncio.ensure_future(self._stream_score_changes(slot))
+
+    async def _stream_score_changes(self, slot: int):
+        while slot in self._stream_dirty:
+            self._stream_dirty.discard(slot)
+            await self.stream_score_delta(slot)
+
+    async def stream_score_delta(self, slot: int) -> int:
+        """
+        Send the next score delta of a slot to every known validator.
+
+        Returns:
+            Number of validators that acknowledged the delta
+        """
+        try:
+            delta = self._build_score_delta(slot)
+        except Exception as e:
+            logger.error(f"{self.uid_prefix} Error building score delta: {e}")
+            return 0
+        if delta is None:
+            return 0
+
+        peers = self._stream_peers()
+        acks = await asyncio.gather(
+            *(self._send_score_deltas(peer, slot, [delta]) for peer in peers)
+        )
+        reached = sum(1 for ack in acks if ack is not None)
+        logger.debug(
+            f"📡 {self.uid_prefix} Streamed score delta "
+            f"{self.core.score_stream_sender.next_seq(slot) - 1} for slot {slot} "
+            f"to {reached}/{len(peers)} validators"
+        )
+        return reached
+
+    async def finish_score_stream(
+        self, slot: int, validators: Optional[List[str]] = None
+    ) -> set:
+        """
+        Close this validator's score stream for a slot.
+
+        Sends the final delta (the averages that changed since the last one)
+        to the validators that have not confirmed the whole stream yet; their
+        missing deltas are resent. Calling it again retries the rest.
+
+        Args:
+            slot: Slot number
+            validators: Validator UIDs to finish with (default: all known)
+
+        Returns:
+            UIDs of validators holding the complete stream (empty when
+            streaming is disabled)
+        """
+        if not self._score_streaming_enabled():
+            return set()
+        sender = self.core.score_stream_sender
+        running = self._stream_sends.pop(slot, None)
+        if running is not None:
+            await asyncio.gather(running, return_exceptions=True)
+
+        try:
+            final = sender.final_delta(slot) or self._build_score_delta(slot, final=True)
+        except Exception as e:
+            logger.error(f"{self.uid_prefix} Error building final score delta: {e}")
+            return set()
+
+        done = sender.complete_peers(slot)
+        peers = [peer for peer in self._stream_peers(validators) if peer.uid not in done]
+        await asyncio.gather(
+            *(self._send_score_deltas(peer, slot, [final]) for peer in peers)
+        )
+        complete = sender.complete_peers(slot)
+        logger.info(
+            f"📡 {self.uid_prefix} Score stream for slot {slot} complete at "
+            f"{len(complete)}/{len(peers) + len(done)} validators"
+        )
+        return complete
+
+    async def _send_score_deltas(
+        self, validator: ValidatorInfo, slot: int, deltas: List[bytes]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send score deltas to a validator and resend the ones it reports missing.
+
+        Returns:
+            The validator's last acknowledgement, or None if the send failed
+        """
+        endpoint = getattr(validator, "api_endpoint", None)
+        if not endpoint:
+            return None
+        url = f"{endpoint.rstrip('/')}{SCORE_STREAM_ENDPOINT}"
+        sender = self.core.score_stream_sender
+
+        try:
+            ack = await self._post_score_deltas(url, deltas)
+            if ack is None:
+                return None
+            missing = sender.deltas(slot, ack.get("missing", []))
+            if missing:
+                ack = await self._post_score_deltas(url, missing) or ack
+            if ack.get("complete"):
+                sender.mark_complete(slot, validator.uid)
+            return ack
+        except Exception as e:
+            logger.warning(
+                f"{self.uid_prefix} Error streaming scores to {validator.uid}: {e}"
+            )
+            return None
+
+    async def _post_score_deltas(
+        self, url: str, deltas: List[bytes]
+    ) -> Optional[Dict[str, Any]]:
+        response = await self.core.http_pool.post(
+            url,
+            content=encode_envelope(deltas),
+            headers={"Content-Type": SCORE_STREAM_CONTENT_TYPE},
+            timeout=HTTP_TIMEOUT,
+        )
+        if response.status_code != 200:
+            logger.debug(
+                f"{self.uid_prefix} Score delta rejected by {url}: HTTP {response.status_code}"
+            )
+            return None
+        return response.json()
+
+    async def deliver_score_delta(
+        self, sender_uid: str, slot: int, scores: List[ValidatorScore], complete: bool
+    ):
+        """Merge a peer's streamed score delta (applied in sequence order)."""
+        await self.add_received_score(
+            sender_uid, slot, scores, merge=True, complete=complete
+        )
+
     async def broadcast_scores_to_validator(
         self, validator_uid: str, scores: List[ValidatorScore], slot: int
     ) -> bool:
@@ -2884,26 +3200,22 @@ class ValidatorNodeConsensus:
         else:
             timeout = base_timeout
 
-        # Use existing collection logic with adaptive timeout
-        start_time = time.time()
+        # Wake as soon as the receive endpoints record a quorum for this slot
         expected_validators = [v for v in validators if v != self.core.info.uid]
-
-        while time.time() - start_time < timeout:
-            # Check collection progress
-            if slot in self.core.received_validator_scores:
-                received_count = len(self.core.received_validator_scores[slot])
-                logger.debug(
-                    f"📥 {self.uid_prefix} Received scores from {received_count}/{len(expected_validators)} validators"
-                )
-
-                # Flexible threshold: proceed if we have enough scores
-                if received_count >= len(expected_validators) * 0.6:  # 60% threshold
-                    logger.info(
-                        f"✅ {self.uid_prefix} Sufficient scores collected: {received_count}/{len(expected_validators)}"
-                    )
-                    break
-
-            await asyncio.sleep(2)
+        reached = await self.core.quorum_tracker.wait_for(
+            slot,
+            self.core.quorum_rule,
+            expected=self._expected_validator_stakes(
+                expected_validators + [self.core.info.uid]
+            ),
+            local_uid=self.core.info.uid,
+            timeout=timeout,
+        )
+        if reached:
+            logger.info(
+                f"✅ {self.uid_prefix} Sufficient scores collected: "
+                f"{self.core.quorum_tracker.count(slot)}/{len(expected_validators)}"
+            )
 
         final_count = len(self.core.received_validator_scores.get(slot, {}))
         logger.info(
@@ -2914,92 +3226,36 @@ class ValidatorNodeConsensus:
         """
         Aggregate validator scores for a given slot.
 
-        This method aggregates both local scores and P2P received scores
-        into the slot_aggregated_scores structure.
+        P2P received scores are folded into the online aggregator on arrival;
+        this adds the local scores and stores the trust-weighted consensus
+        ({miner_uid: score}) in slot_aggregated_scores.
 
         Args:
             slot: Current slot number
+
+        Returns:
+            Dictionary of consensus scores for the slot
         """
         try:
             logger.info(
                 f"🔄 {self.uid_prefix} Aggregating validator scores for slot {slot}"
             )
 
-            # Initialize slot aggregated scores if needed
-            if slot not in self.core.slot_aggregated_scores:
-                self.core.slot_aggregated_scores[slot] = {}
+            aggregator = self.core.score_aggregator
+            own_uid = self.core.info.uid
+            own_weight = self.core.validator_trust_weight(own_uid)
 
-            # Get local scores for this slot
-            local_scores = {}
-            if slot in self.core.slot_scores:
-                for score in self.core.slot_scores[slot]:
-                    local_scores[score.miner_uid] = score.score
-
-            # Add local scores to aggregated scores
+            # Add local scores for this slot (mean over each miner's tasks)
+            local_scores = mean_score_per_miner(self.core.slot_scores.get(slot, []))
             for miner_uid, score in local_scores.items():
-                if miner_uid not in self.core.slot_aggregated_scores[slot]:
-                    self.core.slot_aggregated_scores[slot][miner_uid] = {}
-
-                # Add this validator's local score
-                self.core.slot_aggregated_scores[slot][miner_uid][
-                    self.core.info.uid
-                ] = score
-
-            # Add P2P received scores from other validators
-            p2p_scores_added = 0
+                aggregator.add_score(slot, miner_uid, own_uid, score, own_weight)
 
-            # Check if we have received scores for this slot
-            if slot in self.core.received_validator_scores:
-                p2p_scores = self.core.received_validator_scores[slot]
-
-                for validator_uid, validator_scores in p2p_scores.items():
-                    if isinstance(validator_scores, dict):
-                        for task_id, score_obj in validator_scores.items():
-                            miner_uid = getattr(score_obj, "miner_uid", None)
-                            score_value = getattr(score_obj, "score", 0.0)
-
-                            if miner_uid:
-                                # Initialize miner entry if needed
-                                if (
-                                    miner_uid
-                                    not in self.core.slot_aggregated_scores[slot]
-                                ):
-                                    self.core.slot_aggregated_scores[slot][
-                                        miner_uid
-                                    ] = {}
-
-                                # Add P2P score from this validator
-                                self.core.slot_aggregated_scores[slot][miner_uid][
-                                    validator_uid
-                                ] = score_value
-                                p2p_scores_added += 1
-                    elif isinstance(validator_scores, list):
-                        # Handle list of scores
-                        for score_obj in validator_scores:
-                            miner_uid = getattr(score_obj, "miner_uid", None)
-                            score_value = getattr(score_obj, "score", 0.0)
-
-                            if miner_uid:
-                                if (
-                                    miner_uid
-                                    not in self.core.slot_aggregated_scores[slot]
-                                ):
-                                    self.core.slot_aggregated_scores[slot][
-                                        miner_uid
-                                    ] = {}
-
-                                self.core.slot_aggregated_scores[slot][miner_uid][
-                                    validator_uid
-                                ] = score_value
-                                p2p_scores_added += 1
-
-            # Log aggregation results
-            total_miners = len(self.core.slot_aggregated_scores[slot])
-            total_local_scores = len(local_scores)
+            self.core.slot_aggregated_scores[slot] = aggregator.consensus(slot)
 
             logger.info(
                 f"✅ {self.uid_prefix} Aggregated scores for slot {slot}: "
-                f"{total_miners} miners, {total_local_scores} local scores, {p2p_scores_added} P2P scores"
+                f"{aggregator.miner_count(slot)} miners, {len(local_scores)} local scores, "
+                f"{len(aggregator.validators(slot) - {own_uid})} P2P validators"
             )
 
             return self.core.slot_aggregated_scores[slot]
@@ -3010,6 +3266,18 @@ class ValidatorNodeConsensus:
             )
             return {}
 
+    def get_interim_consensus(self, slot: int) -> Dict[str, float]:
+        """
+        Read the running consensus for a slot without finalizing it.
+
+        Args:
+            slot: Slot number
+
+        Returns:
+            Dictionary mapping miner UID to current consensus score
+        """
+        return self.core.score_aggregator.consensus(slot)
+
     async def aggregate_scores_flexible(self, slot: int):
         """Aggregate scores with flexible validation"""
         logger.info(
@@ -3458,9 +3726,6 @@ class ValidatorNodeConsensus:
             True if sent successfully
         """
         try:
-            # Create new HTTP client for each request to avoid connection issues
-            import httpx
-
             url = f"{miner_endpoint.rstrip('/')}/receive-task"
             payload = task.dict() if hasattr(task, "dict") else task.__dict__
 
@@ -3468,14 +3733,13 @@ class ValidatorNodeConsensus:
             logger.info(f"📤 {self.uid_prefix} ATTEMPTING to send task to {url}")
             logger.info(f"📤 {self.uid_prefix} Task payload: {payload}")
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                logger.info(
-                    f"📤 {self.uid_prefix} HTTP client created, sending POST request..."
-                )
-                response = await client.post(url, json=payload)
-                logger.info(
-                    f"📤 {self.uid_prefix} HTTP response received: {response.status_code}"
-                )
+            logger.info(f"📤 {self.uid_prefix} Sending POST request over pooled client...")
+            response = await self.core.http_pool.post(
+                url, json=payload, timeout=HTTP_TIMEOUT
+            )
+            logger.info(
+                f"📤 {self.uid_prefix} HTTP response received: {response.status_code}"
+            )
 
             if response.status_code == 200:
                 logger.info(f"✅ {self.uid_prefix} Task sent successfully to miner")
@@ -3610,9 +3874,7 @@ class ValidatorNodeConsensus:
                                 )
 
                                 # Store score immediately
-                                if slot not in self.core.slot_scores:
-                                    self.core.slot_scores[slot] = []
-                                self.core.slot_scores[slot].append(validator_score)
+                                self.core.score_store.add_local_score(slot, validator_score)
 
                                 logger.info(
                                     f"🎯 Scored task {task_id}: {score_value:.3f} for miner {result.miner_uid}"
@@ -3649,9 +3911,7 @@ class ValidatorNodeConsensus:
                     cycle=slot,
                 )
 
-                if slot not in self.core.slot_scores:
-                    self.core.slot_scores[slot] = []
-                self.core.slot_scores[slot].append(validator_score)
+                self.core.score_store.add_local_score(slot, validator_score)
 
                 logger.info(
                     f"⏰ Scored task {task_id}: 0.0 (timeout) for miner {miner_uid}"
@@ -3798,9 +4058,7 @@ class ValidatorNodeConsensus:
                         )
 
                         # Store score immediately
-                        if slot not in self.core.slot_scores:
-                            self.core.slot_scores[slot] = []
-                        self.core.slot_scores[slot].append(validator_score)
+                        self.core.score_store.add_local_score(slot, validator_score)
 
                         scored_count += 1
                         logger.debug(f"📊 Scored task {task_id}: {score_value:.3f}")
@@ -3862,17 +4120,10 @@ class ValidatorNodeConsensus:
                 )
 
             # Replace slot_scores with averaged scores (one per miner)
-            averaged_score_objects = []
-            for miner_uid, avg_score in averaged_scores.items():
-                averaged_score = ValidatorScore(
-                    task_id=f"averaged_slot_{slot}_{miner_uid}",
-                    miner_uid=miner_uid,
-                    validator_uid=self.core.info.uid,
-                    score=avg_score,
-                    timestamp=time.time(),
-                    cycle=slot,
-                )
-                averaged_score_objects.append(averaged_score)
+            averaged_score_objects = [
+                self._averaged_score(slot, miner_uid, avg_score)
+                for miner_uid, avg_score in averaged_scores.items()
+            ]
 
             # Replace with averaged scores for P2P
             self.core.slot_scores[slot] = averaged_score_objects
@@ -3887,6 +4138,28 @@ class ValidatorNodeConsensus:
             logger.error(f"❌ {self.uid_prefix} Error calculating average scores: {e}")
             return {}
 
+    @staticmethod
+    def _average_scores_by_miner(scores: List[ValidatorScore]) -> Dict[str, float]:
+        """Mean score per miner."""
+        miner_scores = defaultdict(list)
+        for score in scores:
+            miner_scores[score.miner_uid].append(score.score)
+        return {
+            miner_uid: sum(score_list) / len(score_list)
+            for miner_uid, score_list in miner_scores.items()
+        }
+
+    def _averaged_score(self, slot: int, miner_uid: str, score: float) -> ValidatorScore:
+        """The one score per miner this validator shares for a slot."""
+        return ValidatorScore(
+            task_id=f"averaged_slot_{slot}_{miner_uid}",
+            miner_uid=miner_uid,
+            validator_uid=self.core.info.uid,
+            score=score,
+            timestamp=time.time(),
+            cycle=slot,
+        )
+
     # === SIMPLIFIED HELPERS USING EXISTING INFRASTRUCTURE ===
 
     async def _fallback_sequential_assignment(
@@ -3999,9 +4272,7 @@ class ValidatorNodeConsensus:
                         )
 
                         # Add to slot scores
-                        if slot not in self.core.slot_scores:
-                            self.core.slot_scores[slot] = []
-                        self.core.slot_scores[slot].append(validator_score)
+                        self.core.score_store.add_local_score(slot, validator_score)
 
                         # Remove from buffer
                         del self.core.results_buffer[task_id]
@@ -4168,9 +4439,7 @@ class ValidatorNodeConsensus:
             )
 
             # Add to slot scores
-            if slot not in self.core.slot_scores:
-                self.core.slot_scores[slot] = []
-            self.core.slot_scores[slot].append(validator_score)
+            self.core.score_store.add_local_score(slot, validator_score)
 
             # Cleanup busy state but keep task_sent until end of slot for late results
             self.core.miner_is_busy.discard(miner_uid)
@@ -18,7 +18,7 @@ import os
 import psutil
 import string
 import time
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 
 from web3 import Web3
@@ -32,9 +32,23 @@ from ..core.datatypes import (
     MinerConsensusResult,
 )
 from ..metagraph.hash.hash_datum import hash_data
-from ..monitoring.circuit_breaker import CircuitBreaker
+from ..monitoring.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
 from ..monitoring.rate_limiter import RateLimiter
 from ..monitoring.metrics import get_metrics_manager
+from ..network.http_pool import HttpPool
+from ..network.replay_filter import ReplayFilter
+from ..network.signature_verifier import (
+    SCHEME_ETH,
+    SignatureVerifier,
+    VerificationRequest,
+)
+from .gossip import ScoreGossip
+from .miner_scheduler import MinerScheduler
+from .online_aggregator import OnlineScoreAggregator
+from .coordination_backend import create_coordination_backend
+from .quorum import QuorumTracker, quorum_rule_from_settings
+from .score_store import DEFAULT_SCORE_RETENTION_SLOTS, ScoreStore
+from .score_stream import ScoreStreamReceiver, ScoreStreamSender
 from .slot_coordinator import SlotCoordinator, SlotPhase, SlotConfig
 
 logger = logging.getLogger(__name__)
@@ -45,6 +59,7 @@ DEFAULT_CONSENSUS_TIMEOUT = 60  # Reduced for 3.5 minute cycles
 DEFAULT_RESULT_TIMEOUT = 60.0
 HTTP_TIMEOUT = 10.0
 MAX_RETRIES = 3
+DEFAULT_VALIDATOR_TRUST_WEIGHT = 0.5  # Weight for validators missing from metagraph
 
 
 class ValidatorNodeCore:
@@ -126,32 +141,91 @@ class ValidatorNodeCore:
         self.slot_phase_start_time = time.time()
 
         # Slot coordinator for synchronized consensus
+        self.coordination_backend = create_coordination_backend(
+            getattr(self.settings, "CONSENSUS_COORDINATION_BACKEND", "file"),
+            validator_uid=self.info.uid,
+            account=self.account,
+            address_of=self._validator_address,
+        )
         self.slot_coordinator = SlotCoordinator(
-            validator_uid=self.info.uid, slot_config=self.slot_config
+            validator_uid=self.info.uid,
+            slot_config=self.slot_config,
+            backend=self.coordination_backend,
         )
+        self.slot_scheduler = None  # Set by the node while its slot loop runs
+        self.timing_controller = None  # AdaptiveTimingController, if enabled
 
         # Network and P2P state
         self.miners_info = {}
         self.validators_info = {}
-        self.http_client = None
+        self.http_pool = HttpPool.from_settings(self.settings, name=self.uid_prefix)
+        self.http_client = None  # Shared pooled client, set by the network module
+        self.binary_score_peers = set()  # Endpoints that accept binary score broadcasts
+        self.batch_task_miners = {}  # Miner endpoint -> tasks it accepts per request
+        self.task_batcher = None  # Coalescer for batched task sends, set on first use
+        self.signature_verifier = SignatureVerifier.from_settings(
+            self.settings, name=self.uid_prefix
+        )
+        self.replay_filter = ReplayFilter.from_settings(self.settings)  # Seen broadcasts
+        self.score_gossip = None  # Gossip dissemination of score bundles, if enabled
+        if getattr(self.settings, "CONSENSUS_SCORE_GOSSIP", False):
+            self.score_gossip = ScoreGossip.from_settings(
+                self.settings,
+                self.info.uid,
+                members=self._gossip_members,
+                verify=self._verify_gossip_bundle,
+                accepts_slot=self.accepts_peer_slot,
+                name=self.uid_prefix,
+            )
+        # Score deltas streamed per minibatch: ours (if enabled) and peers'
+        self.score_stream_sender = None
+        if getattr(self.settings, "CONSENSUS_SCORE_STREAMING", False):
+            self.score_stream_sender = ScoreStreamSender()
+        self.score_stream_receiver = ScoreStreamReceiver(accepts_slot=self.accepts_peer_slot)
         self.contract_client = None
 
         # Task management
         self.tasks_sent = {}
         self.miner_is_busy = set()
+        # One circuit breaker per miner endpoint, consulted before each dispatch
+        self.miner_breakers = CircuitBreakerRegistry.from_settings(self.settings)
+        self.miner_scheduler = MinerScheduler.from_settings(
+            self.settings, breakers=self.miner_breakers
+        )  # Per-miner load
         self.results_buffer = {}
         self.results_buffer_lock = asyncio.Lock()
+        self.result_waiters = {}  # task_id -> Future resolved by add_miner_result
+        self.unanswered_tasks = {}  # slot -> tasks that failed or timed out
 
         # Scoring and consensus
-        self.cycle_scores = defaultdict(list)
-        self.validator_scores = defaultdict(list)
-        self.slot_scores = defaultdict(list)  # For slot-based scoring
+        self.score_aggregator = OnlineScoreAggregator()  # Online consensus per slot
+        self.quorum_tracker = QuorumTracker()  # Validators that sent scores per slot
+        self.quorum_rule = quorum_rule_from_settings(self.settings)
+        self.score_store = ScoreStore(
+            retention_slots=getattr(
+                self.settings,
+                "CONSENSUS_SCORE_RETENTION_SLOTS",
+                DEFAULT_SCORE_RETENTION_SLOTS,
+            ),
+            clock=self._score_store_clock,
+        )
+        self.score_store.on_evict(self.score_aggregator.discard_slot)
+        self.score_store.on_evict(self.quorum_tracker.discard)
+        self.score_store.on_evict(lambda slot: self.unanswered_tasks.pop(slot, None))
+        # Legacy views over the bounded score store
+        self.slot_scores = self.score_store.slot_scores  # slot -> local scores
         self.slot_aggregated_scores = (
-            {}
-        )  # slot -> {miner_uid: {validator_uid: avg_score}}
+            self.score_store.slot_aggregated_scores
+        )  # slot -> {miner_uid: consensus score}
+        self.received_validator_scores = self.score_store.received_validator_scores
+        self.cycle_scores = self.score_store.task_view(
+            "cycle", self._score_store_current_key
+        )  # task_id -> scores
+        self.validator_scores = self.score_store.task_view(
+            "validator", self._score_store_current_key
+        )
         self.consensus_results_cache = OrderedDict()
         self.consensus_results_cache_lock = asyncio.Lock()
-        self.received_validator_scores = {}
         self.received_scores_lock = asyncio.Lock()
 
         # Task tracking for continuous assignment
@@ -636,11 +710,148 @@ class ValidatorNodeCore:
         """Get current phase within a slot and time remaining."""
         return self.slot_coordinator.get_slot_phase(slot_number)
 
+    def current_batch_timeout(self) -> float:
+        """Minibatch timeout: agreed by adaptive timing if enabled, else configured."""
+        if self.timing_controller is not None:
+            return self.timing_controller.active.batch_timeout_seconds
+        return getattr(self.settings, "CONSENSUS_BATCH_TIMEOUT", 45.0)
+
+    def slot_tasks_resolved(self, slot: int) -> bool:
+        """True when every task sent in slot was answered and none is pending."""
+        return not self.result_waiters and not self.unanswered_tasks.get(slot)
+
+    def signal_phase_complete(self, slot: int, phase: Any, reason: str = "") -> bool:
+        """
+        Tell the slot scheduler a phase has nothing left to wait for.
+
+        Args:
+            slot: Slot the phase belongs to
+            phase: SlotPhase / FlexibleSlotPhase that is complete
+            reason: Short description for the logs
+
+        Returns:
+            True if the next phase was brought forward
+        """
+        if self.slot_scheduler is None:
+            return False
+        return self.slot_scheduler.advance(slot, phase, reason)
+
+    def validator_trust_weight(self, validator_uid: str) -> float:
+        """
+        Weight of a validator's scores in consensus aggregation.
+
+        Args:
+            validator_uid: UID of the validator that produced the scores
+
+        Returns:
+            The validator's trust score from the metagraph, or
+            DEFAULT_VALIDATOR_TRUST_WEIGHT if the validator is unknown
+        """
+        if validator_uid == self.info.uid:
+            validator = self.info
+        else:
+            validator = self.validators_info.get(validator_uid)
+        trust_score = getattr(validator, "trust_score", None)
+        if trust_score is None:
+            return DEFAULT_VALIDATOR_TRUST_WEIGHT
+        return max(0.0, float(trust_score))
+
+    def _validator_address(self, validator_uid: str) -> Optional[str]:
+        """Known on-chain address of a validator, used to verify its messages."""
+        validator = self.validators_info.get(validator_uid)
+        return getattr(validator, "address", None)
+
+    def accepts_peer_slot(self, slot: int) -> bool:
+        """
+        Whether a slot named in a peer's gossip bundle or score delta is near
+        enough to ours to act on: within the score retention window behind the
+        current blockchain slot, or at most one slot ahead of it.
+        """
+        current = self.get_current_blockchain_slot()
+        return current - self.score_store.retention_slots < slot <= current + 1
+
+    def _gossip_members(self, slot: int) -> List[str]:
+        """Validators in the gossip overlay (the metagraph view, plus self)."""
+        return sorted(set(self.validators_info) | {self.info.uid})
+
+    async def _verify_gossip_bundle(self, broadcast, body: bytes) -> bool:
+        """Gossip bundles are relayed, so they must carry their origin's signature."""
+        if not broadcast.signature:
+            return False
+        return await self.signature_verifier.verify(
+            VerificationRequest(
+                scheme=SCHEME_ETH,
+                message=body,
+                signature=broadcast.signature,
+                expected_address=self._validator_address(broadcast.sender_uid),
+            )
+        )
+
+    def _score_store_current_key(self) -> int:
+        """Slot that task-keyed score entries are filed under."""
+        current_slot = getattr(self, "current_slot", None)
+        if current_slot is not None:
+            return current_slot
+        return self._current_cycle
+
+    def _score_store_clock(self) -> List[Optional[int]]:
+        """Current blockchain slot, slot being processed and cycle (score store window)."""
+        return [
+            self.get_current_blockchain_slot(),
+            getattr(self, "current_slot", None),
+            self._current_cycle,
+        ]
+
+    def report_score_store_usage(self) -> int:
+        """
+        Export the score store memory footprint as a metric.
+
+        Returns:
+            Approximate size of the score store in bytes
+        """
+        try:
+            memory_bytes = self.score_store.memory_bytes()
+            self.metrics.update_score_store_usage(
+                memory_bytes, len(self.score_store.keys())
+            )
+            return memory_bytes
+        except Exception as e:
+            logger.warning(f"{self.uid_prefix} Failed to report score store usage: {e}")
+            return 0
+
+    def report_http_pool_usage(self) -> Dict[str, Any]:
+        """
+        Export the shared HTTP pool figures as metrics.
+
+        Returns:
+            The pool statistics
+        """
+        stats = self.http_pool.stats()
+        try:
+            self.metrics.update_http_pool_usage(stats)
+        except Exception as e:
+            logger.warning(f"{self.uid_prefix} Failed to report HTTP pool usage: {e}")
+        return stats
+
+    def report_replay_filter_usage(self) -> Dict[str, Any]:
+        """
+        Export the broadcast replay filter hit and miss counts as metrics.
+
+        Returns:
+            The filter statistics
+        """
+        stats = self.replay_filter.stats()
+        try:
+            self.metrics.update_replay_filter_usage(stats)
+        except Exception as e:
+            logger.warning(f"{self.uid_prefix} Failed to report replay filter usage: {e}")
+        return stats
+
     async def cleanup_resources(self):
         """Clean up resources when shutting down."""
         try:
-            if self.http_client:
-                await self.http_client.aclose()
+            await self.http_pool.aclose()
+            self.signature_verifier.close()
 
             # Clean up old coordination files
             current_slot = self.get_current_blockchain_slot()
@@ -685,7 +896,10 @@ class ValidatorNodeCore:
                 # Calculate final consensus scores by averaging across validators
                 final_consensus_scores = {}
                 for miner_uid, validator_scores in slot_scores.items():
-                    if validator_scores:
+                    if isinstance(validator_scores, (int, float)):
+                        # Already a consensus score from the online aggregator
+                        final_consensus_scores[miner_uid] = validator_scores
+                    elif validator_scores:
                         # Average scores from all validators for this miner
                         avg_score = sum(validator_scores.values()) / len(
                             validator_scores
@@ -714,6 +928,10 @@ class ValidatorNodeCore:
                 # Clear processed scores to free memory
                 if current_slot in self.slot_aggregated_scores:
                     del self.slot_aggregated_scores[current_slot]
+                self.score_aggregator.discard_slot(current_slot)
+                self.report_score_store_usage()
+                self.report_http_pool_usage()
+                self.report_replay_filter_usage()
 
                 logger.info(
                     f"{self.uid_prefix} Metagraph update completed for slot {current_slot}"
@@ -15,15 +15,50 @@ The network module manages all external communication for the validator node.
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
-import httpx
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
 import uvicorn
 
-from ..core.datatypes import ValidatorScore, MinerResult, ValidatorInfo
+from ..core.datatypes import ValidatorInfo
 from ..network.app.api.v1.endpoints.validator_health import router as health_router
-from ..network.server import TaskModel, ResultModel
+from ..network.server import TaskModel
+from ..network.score_codec import (
+    ACCEPT_POST_HEADER,
+    JSON_CONTENT_TYPE,
+    SCORE_BATCH_CONTENT_TYPE,
+    ScoreBroadcast,
+    ScoreCodecError,
+    accepts_binary_scores,
+    decode_score_broadcast,
+)
+from ..network.batching import (
+    BATCH_RESULTS_HEADER,
+    DEFAULT_MAX_BATCH,
+    RESULT_BATCH_ENDPOINT,
+)
+from ..network.ingest import (
+    IngestError,
+    parse_consensus_scores,
+    parse_miner_result,
+    parse_miner_results,
+    parse_score_broadcast,
+)
+from ..network.ingress import LANE_CONSENSUS, LANE_RESULTS, IngressController
+from ..network.replay_filter import replay_key
+from ..network.signature_verifier import SCHEME_ETH, VerificationRequest
+from .coordination_backend import (
+    COORDINATION_PHASE_ENDPOINT,
+    NetworkCoordinationBackend,
+)
+from .gossip import (
+    GOSSIP_CONTENT_TYPE,
+    GOSSIP_ENDPOINT,
+    GOSSIP_SENDER_HEADER,
+    decode_envelope,
+)
+from .score_stream import SCORE_STREAM_ENDPOINT
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +98,8 @@ class ValidatorNodeNetwork:
 
         # API app
         self.app = None
+        self.ingress = None  # Admission control for the API, set with the app
+        self._consensus = None  # Fallback consensus module when no node is attached
 
         # Initialize HTTP client (defer to first use to avoid event loop issues)
         self._http_client_initialized = False
@@ -70,15 +107,12 @@ class ValidatorNodeNetwork:
     # === HTTP Client Management ===
 
     async def _initialize_http_client(self):
-        """Initialize the HTTP client for P2P communication."""
+        """Open the node's shared HTTP pool used for all P2P and miner traffic."""
         if self._http_client_initialized:
             return
 
         try:
-            self.http_client = httpx.AsyncClient(
-                timeout=HTTP_TIMEOUT,
-                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-            )
+            self.http_client = self.core.http_pool.client
             self.core.http_client = self.http_client
             self._http_client_initialized = True
 
@@ -88,11 +122,12 @@ class ValidatorNodeNetwork:
             logger.error(f"{self.uid_prefix} Error initializing HTTP client: {e}")
 
     async def close_http_client(self):
-        """Close the HTTP client."""
+        """Close the shared HTTP pool."""
         if self.http_client:
-            await self.http_client.aclose()
+            await self.core.http_pool.aclose()
             self.http_client = None
             self.core.http_client = None
+            self._http_client_initialized = False
             logger.info(f"{self.uid_prefix} HTTP client closed")
 
     # === API Server Management ===
@@ -105,6 +140,15 @@ class ValidatorNodeNetwork:
             version="1.0.0",
         )
 
+        # Per-source rate limits and bounded lanes for peer and miner traffic
+        self.ingress = IngressController.from_settings(
+            self.core.settings,
+            routes=self._ingress_routes(),
+            metrics=self.core.metrics,
+            name=self.uid_prefix,
+        )
+        app.middleware("http")(self.ingress.dispatch)
+
         # Include health endpoints
         app.include_router(health_router, prefix="/api/v1")
 
@@ -113,219 +157,291 @@ class ValidatorNodeNetwork:
 
         return app
 
+    # === Node modules used by the handlers ===
+
+    def _tasks_module(self):
+        """The node's task module, created once if the node did not attach one."""
+        tasks = getattr(self.core, "tasks", None)
+        if tasks is None:
+            from .validator_node_tasks import ValidatorNodeTasks
+
+            tasks = self.core.tasks = ValidatorNodeTasks(self.core)
+        return tasks
+
+    def _consensus_module(self):
+        """The node's consensus module, created once if the core runs without a node."""
+        node = getattr(self.core, "validator_instance", None)
+        consensus = getattr(node, "consensus", None)
+        if consensus is None:
+            if self._consensus is None:
+                from .validator_node_consensus import ValidatorNodeConsensus
+
+                self._consensus = ValidatorNodeConsensus(self.core)
+            consensus = self._consensus
+        return consensus
+
+    def _max_result_batch(self) -> int:
+        return int(
+            getattr(self.core.settings, "CONSENSUS_TASK_BATCH_SIZE", DEFAULT_MAX_BATCH)
+        )
+
+    def _result_batch_headers(self) -> Dict[str, str]:
+        """Advertise batched result submission to miners (if enabled)."""
+        max_batch = self._max_result_batch()
+        return {BATCH_RESULTS_HEADER: str(max_batch)} if max_batch > 1 else {}
+
+    @staticmethod
+    def _ingress_routes() -> Dict[str, str]:
+        """Ingress lane of each endpoint; unlisted endpoints are not limited."""
+        routes = {
+            path: LANE_RESULTS
+            for path in ("/result", "/v1/miner/submit_result", RESULT_BATCH_ENDPOINT)
+        }
+        for path in (
+            "/consensus/scores",
+            "/consensus/receive_scores",
+            GOSSIP_ENDPOINT,
+            SCORE_STREAM_ENDPOINT,
+            COORDINATION_PHASE_ENDPOINT,
+        ):
+            routes[path] = LANE_CONSENSUS
+        return routes
+
     def _add_validator_endpoints(self, app: FastAPI):
         """Add validator-specific endpoints to the API app."""
 
         @app.post("/result")
-        async def receive_result(result_data: dict):
+        async def receive_result(request: Request):
             """Receive result from miner."""
             try:
-                # Validate result data
-                if not all(
-                    key in result_data for key in ["task_id", "miner_uid", "result"]
-                ):
-                    raise HTTPException(
-                        status_code=400, detail="Missing required fields"
-                    )
-
-                # Create MinerResult object
-                miner_result = MinerResult(
-                    task_id=result_data["task_id"],
-                    miner_uid=result_data["miner_uid"],
-                    result_data=result_data["result"],
-                    timestamp=time.time(),
-                    validator_uid=self.core.info.uid,
+                miner_result = parse_miner_result(
+                    await request.body(), time.time(), legacy=True
                 )
+            except IngestError as e:
+                raise HTTPException(status_code=400, detail=str(e))
 
-                # Add to results buffer
-                from .validator_node_tasks import ValidatorNodeTasks
-
-                tasks_module = ValidatorNodeTasks(self.core)
-                success = await tasks_module.add_miner_result(miner_result)
-
-                if success:
-                    logger.info(
-                        f"{self.uid_prefix} Received result from miner {miner_result.miner_uid}"
-                    )
-                    return {"status": "success", "message": "Result received"}
-                else:
-                    raise HTTPException(
-                        status_code=400, detail="Failed to process result"
-                    )
+            success = await self._tasks_module().add_miner_result(miner_result)
+            if not success:
+                raise HTTPException(status_code=400, detail="Failed to process result")
 
-            except Exception as e:
-                logger.error(f"{self.uid_prefix} Error receiving result: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            logger.info(
+                f"{self.uid_prefix} Received result from miner {miner_result.miner_uid}"
+            )
+            return {"status": "success", "message": "Result received"}
 
         @app.post("/v1/miner/submit_result")
-        async def submit_miner_result(result: ResultModel):
+        async def submit_miner_result(request: Request):
             """Receive result from miner using standard endpoint expected by BaseMiner."""
             try:
-                # Create MinerResult object from ResultModel
-                miner_result = MinerResult(
-                    task_id=result.task_id,
-                    miner_uid=result.miner_uid,
-                    result_data=result.result_data,
-                    timestamp_received=time.time(),
+                miner_result = parse_miner_result(await request.body(), time.time())
+            except IngestError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            success = await self._tasks_module().add_miner_result(miner_result)
+            if not success:
+                logger.warning(
+                    f"{self.uid_prefix} Failed to process result for task {miner_result.task_id} - task may not exist"
                 )
-
-                # Add to results buffer - use existing tasks instance if available
-                if hasattr(self.core, "tasks") and self.core.tasks:
-                    logger.debug(
-                        f"{self.uid_prefix} Using existing tasks instance for result {result.task_id}"
-                    )
-                    success = await self.core.tasks.add_miner_result(miner_result)
-                else:
-                    # Fallback to new instance
-                    logger.debug(
-                        f"{self.uid_prefix} Using fallback new tasks instance for result {result.task_id}"
-                    )
-                    from .validator_node_tasks import ValidatorNodeTasks
-
-                    tasks_module = ValidatorNodeTasks(self.core)
-                    success = await tasks_module.add_miner_result(miner_result)
-
-                logger.debug(
-                    f"{self.uid_prefix} add_miner_result returned: {success} for task {result.task_id}"
+                raise HTTPException(
+                    status_code=400,
+                    detail="Failed to process result",
+                    headers=self._result_batch_headers(),
                 )
 
-                if success:
-                    logger.info(
-                        f"{self.uid_prefix} Received result for task {result.task_id} from miner {result.miner_uid}"
-                    )
-                    return {"message": f"Result for task {result.task_id} received"}
+            logger.info(
+                f"{self.uid_prefix} Received result for task {miner_result.task_id} from miner {miner_result.miner_uid}"
+            )
+            return JSONResponse(
+                {"message": f"Result for task {miner_result.task_id} received"},
+                headers=self._result_batch_headers(),
+            )
+
+        @app.post(RESULT_BATCH_ENDPOINT)
+        async def submit_miner_results(request: Request):
+            """Receive several miner results; each is accepted or rejected on its own."""
+            try:
+                results, rejected = parse_miner_results(await request.body(), time.time())
+            except IngestError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            max_batch = self._max_result_batch()
+            accepted = []
+            tasks_module = self._tasks_module()
+            for index, miner_result in enumerate(results):
+                if index >= max_batch:
+                    rejected[miner_result.task_id] = "batch_too_large"
+                elif await tasks_module.add_miner_result(miner_result):
+                    accepted.append(miner_result.task_id)
                 else:
-                    logger.warning(
-                        f"{self.uid_prefix} Failed to process result for task {result.task_id} - task may not exist"
-                    )
-                    raise HTTPException(
-                        status_code=400, detail="Failed to process result"
-                    )
+                    rejected[miner_result.task_id] = "unknown_task"
 
-            except Exception as e:
-                logger.error(f"{self.uid_prefix} Error receiving miner result: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            logger.info(
+                f"{self.uid_prefix} Received batch of {len(results)} results: "
+                f"{len(accepted)} accepted, {len(rejected)} rejected"
+            )
+            return JSONResponse(
+                {"accepted": accepted, "rejected": rejected},
+                headers=self._result_batch_headers(),
+            )
 
         @app.post("/consensus/scores")
-        async def receive_consensus_scores(scores_data: dict):
+        async def receive_consensus_scores(request: Request):
             """Receive consensus scores from other validators."""
             try:
-                # Validate scores data
-                required_fields = ["validator_uid", "slot", "scores"]
-                if not all(field in scores_data for field in required_fields):
-                    raise HTTPException(
-                        status_code=400, detail="Missing required fields"
-                    )
-
-                # Parse scores
-                validator_uid = scores_data["validator_uid"]
-                slot = scores_data["slot"]
-                raw_scores = scores_data["scores"]
-
-                # Convert to ValidatorScore objects
-                scores = []
-                for score_data in raw_scores:
-                    score = ValidatorScore(
-                        task_id=score_data["task_id"],
-                        miner_uid=score_data["miner_uid"],
-                        validator_uid=validator_uid,
-                        score=score_data["score"],
-                        timestamp=score_data["timestamp"],
-                        cycle=slot,
-                    )
-                    scores.append(score)
-
-                # Add to received scores
-                from .validator_node_consensus import ValidatorNodeConsensus
-
-                consensus_module = ValidatorNodeConsensus(self.core)
-                await consensus_module.add_received_score(validator_uid, slot, scores)
-
-                logger.info(
-                    f"{self.uid_prefix} Received {len(scores)} consensus scores from validator {validator_uid}"
+                validator_uid, slot, scores = parse_consensus_scores(
+                    await request.body()
                 )
-                return {"status": "success", "message": "Scores received"}
+            except IngestError as e:
+                raise HTTPException(status_code=400, detail=str(e))
 
-            except Exception as e:
-                logger.error(f"{self.uid_prefix} Error receiving consensus scores: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+            if not self.core.score_store.accepts(slot):
+                raise HTTPException(status_code=400, detail=f"Slot {slot} is out of range")
+            await self._consensus_module().add_received_score(
+                validator_uid, slot, scores
+            )
+
+            logger.info(
+                f"{self.uid_prefix} Received {len(scores)} consensus scores from validator {validator_uid}"
+            )
+            return {"status": "success", "message": "Scores received"}
 
         @app.post("/consensus/receive_scores")
-        async def receive_p2p_consensus_scores(request_data: dict):
-            """Receive P2P consensus scores from other validators."""
-            try:
-                # Validate request data
-                required_fields = ["broadcast_id", "sender_uid", "scores", "timestamp"]
-                if not all(field in request_data for field in required_fields):
+        async def receive_p2p_consensus_scores(request: Request):
+            """Receive P2P consensus scores from other validators (JSON or binary)."""
+            binary_enabled = getattr(self.core.settings, "CONSENSUS_BINARY_SCORES", True)
+            body = await request.body()
+            broadcast = signed_body = None
+            if accepts_binary_scores(request.headers.get("content-type")):
+                if not binary_enabled:
+                    raise HTTPException(
+                        status_code=415, detail="Binary score broadcasts are disabled"
+                    )
+                broadcast, signed_body = self._decode_score_bytes(body)
+                sender_uid = broadcast.sender_uid
+                broadcast_id = broadcast.broadcast_id
+                scores = broadcast.scores
+            else:
+                try:
+                    sender_uid, broadcast_id, scores = parse_score_broadcast(
+                        body, name=self.uid_prefix
+                    )
+                except IngestError as e:
                     raise HTTPException(
                         status_code=400,
-                        detail="Missing required fields in P2P score broadcast",
+                        detail=f"Invalid P2P score broadcast: {e}",
                     )
 
-                sender_uid = request_data["sender_uid"]
-                broadcast_id = request_data["broadcast_id"]
-                raw_scores = request_data["scores"]
-
-                # Convert to ValidatorScore objects
-                scores = []
-                for score_data in raw_scores:
-                    try:
-                        score = ValidatorScore(
-                            task_id=score_data["task_id"],
-                            miner_uid=score_data["miner_uid"],
-                            validator_uid=score_data["validator_uid"],
-                            score=score_data["score"],
-                            timestamp=score_data["timestamp"],
-                            cycle=score_data.get("cycle", 0),
-                        )
-                        scores.append(score)
-                    except Exception as parse_error:
-                        logger.warning(
-                            f"{self.uid_prefix} Failed to parse score from {sender_uid}: {parse_error}"
-                        )
-                        continue
+            # Retries and re-sends stop here, before verification and aggregation
+            key = replay_key(sender_uid, broadcast_id, body)
+            if self.core.replay_filter.check(key):
+                logger.debug(
+                    f"{self.uid_prefix} Dropped duplicate broadcast {broadcast_id} from {sender_uid}"
+                )
+                return JSONResponse(
+                    {
+                        "status": "success",
+                        "message": "Duplicate broadcast",
+                        "broadcast_id": broadcast_id,
+                        "duplicate": True,
+                    },
+                    headers=self._score_format_headers(),
+                )
+
+            try:
+                if broadcast is not None:
+                    await self._verify_score_broadcast(broadcast, signed_body)
 
                 if not scores:
                     logger.warning(
                         f"{self.uid_prefix} No valid scores received from {sender_uid}"
                     )
-                    return {"status": "error", "message": "No valid scores"}
+                    self.core.replay_filter.forget(key)
+                    return JSONResponse(
+                        {"status": "error", "message": "No valid scores"},
+                        headers=self._score_format_headers(),
+                    )
 
                 # Store received scores for consensus processing
                 current_cycle = getattr(self.core, "current_cycle", 0)
 
-                # Use the consensus module to handle received scores
-                if hasattr(self.core, "consensus"):
-                    await self.core.consensus.add_received_score(
-                        sender_uid, current_cycle, scores
-                    )
-                else:
-                    # Fallback: store in received_validator_scores directly
-                    async with self.core.received_scores_lock:
-                        if current_cycle not in self.core.received_validator_scores:
-                            self.core.received_validator_scores[current_cycle] = {}
-
-                        self.core.received_validator_scores[current_cycle][
-                            sender_uid
-                        ] = {score.task_id: score for score in scores}
+                await self._consensus_module().add_received_score(
+                    sender_uid, current_cycle, scores
+                )
 
                 logger.info(
                     f"{self.uid_prefix} Received P2P scores from {sender_uid}: "
                     f"{len(scores)} scores in broadcast {broadcast_id}"
                 )
 
-                return {
-                    "status": "success",
-                    "message": f"Received {len(scores)} scores",
-                    "broadcast_id": broadcast_id,
-                }
+                return JSONResponse(
+                    {
+                        "status": "success",
+                        "message": f"Received {len(scores)} scores",
+                        "broadcast_id": broadcast_id,
+                    },
+                    headers=self._score_format_headers(),
+                )
 
+            except HTTPException:
+                self.core.replay_filter.forget(key)
+                raise
             except Exception as e:
+                self.core.replay_filter.forget(key)
                 logger.error(
                     f"{self.uid_prefix} Error receiving P2P consensus scores: {e}"
                 )
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @app.post(GOSSIP_ENDPOINT)
+        async def receive_gossip_scores(request: Request):
+            """Receive gossiped score bundles and relay the new ones."""
+            gossip = getattr(self.core, "score_gossip", None)
+            if gossip is None:
+                raise HTTPException(status_code=404, detail="Score gossip is not enabled")
+            try:
+                fresh = await gossip.receive(
+                    await request.body(), request.headers.get(GOSSIP_SENDER_HEADER)
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {"status": "success", "new_bundles": fresh}
+
+        @app.post(SCORE_STREAM_ENDPOINT)
+        async def receive_score_deltas(request: Request):
+            """Receive streamed score deltas; the reply lists any gaps to resend."""
+            try:
+                bundles = decode_envelope(await request.body())
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            # Checked together so the verifier can batch them
+            deltas = await asyncio.gather(
+                *(self._decode_binary_scores(bundle) for bundle in bundles)
+            )
+            ack = {}
+            try:
+                for delta in deltas:
+                    if delta.signature is None:
+                        raise HTTPException(status_code=403, detail="Unsigned score delta")
+                    ack = await self.core.score_stream_receiver.receive(delta)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {"status": "success", **ack}
+
+        @app.post(COORDINATION_PHASE_ENDPOINT)
+        async def receive_phase_announcement(announcement: dict):
+            """Receive a signed phase entry announcement from another validator."""
+            backend = getattr(self.core, "coordination_backend", None)
+            if not isinstance(backend, NetworkCoordinationBackend):
+                raise HTTPException(
+                    status_code=404, detail="Network coordination is not enabled"
+                )
+            if not backend.receive(announcement):
+                raise HTTPException(
+                    status_code=403, detail="Invalid phase announcement"
+                )
+            return {"status": "success"}
+
         @app.get("/health")
         async def health_check():
             """Health check endpoint."""
@@ -336,6 +452,8 @@ class ValidatorNodeNetwork:
                 "current_cycle": self.core.current_cycle,
                 "miners_count": len(self.core.miners_info),
                 "validators_count": len(self.core.validators_info),
+                "ingress": self.ingress.stats() if self.ingress else {},
+                "miner_breakers": self.core.miner_breakers.get_status(),
             }
 
         @app.get("/metagraph")
@@ -368,13 +486,9 @@ class ValidatorNodeNetwork:
         @app.get("/consensus/info")
         async def get_consensus_info():
             """Get consensus information."""
-            from .validator_node_consensus import ValidatorNodeConsensus
-
-            consensus_module = ValidatorNodeConsensus(self.core)
-
             return {
                 "current_cycle": self.core.current_cycle,
-                "statistics": consensus_module.get_consensus_statistics(),
+                "statistics": self._consensus_module().get_consensus_statistics(),
                 "timestamp": time.time(),
             }
 
@@ -450,6 +564,66 @@ class ValidatorNodeNetwork:
                 logger.error(f"{self.uid_prefix} Error getting scores: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
 
+    # === Score broadcast formats ===
+
+    def _score_format_headers(self) -> Dict[str, str]:
+        """Response headers advertising the score formats this node accepts."""
+        formats = JSON_CONTENT_TYPE
+        if getattr(self.core.settings, "CONSENSUS_BINARY_SCORES", True):
+            formats = f"{SCORE_BATCH_CONTENT_TYPE}, {JSON_CONTENT_TYPE}"
+        return {ACCEPT_POST_HEADER: formats}
+
+    async def _decode_binary_scores(self, data: bytes) -> ScoreBroadcast:
+        """
+        Decode a binary score broadcast and check its signature.
+
+        Signed broadcasts must verify against the sender's known address;
+        unsigned ones are accepted like JSON broadcasts. Verification runs on
+        the node's SignatureVerifier, off the event loop.
+
+        Raises:
+            HTTPException: 400 if malformed, 403 if the signature is invalid
+        """
+        broadcast, body = self._decode_score_bytes(data)
+        await self._verify_score_broadcast(broadcast, body)
+        return broadcast
+
+    def _decode_score_bytes(self, data: bytes) -> Tuple[ScoreBroadcast, bytes]:
+        """
+        Decode a binary score broadcast without checking its signature.
+
+        Returns:
+            (broadcast, signed bytes)
+
+        Raises:
+            HTTPException: 400 if malformed
+        """
+        try:
+            return decode_score_broadcast(data)
+        except ScoreCodecError as e:
+            logger.warning(f"{self.uid_prefix} Rejected binary score broadcast: {e}")
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def _verify_score_broadcast(self, broadcast: ScoreBroadcast, body: bytes):
+        """
+        Check the signature of a decoded broadcast, if it carries one.
+
+        Raises:
+            HTTPException: 403 if the signature is invalid
+        """
+        if broadcast.signature is not None and not await self.core.signature_verifier.verify(
+            VerificationRequest(
+                scheme=SCHEME_ETH,
+                message=body,
+                signature=broadcast.signature,
+                expected_address=self.core._validator_address(broadcast.sender_uid),
+            )
+        ):
+            logger.warning(
+                f"{self.uid_prefix} Rejected binary scores from {broadcast.sender_uid}: invalid signature"
+            )
+            raise HTTPException(status_code=403, detail="Invalid score signature")
+
     async def start_api_server(self, port: Optional[int] = None):
         """Start the API server."""
         logger.debug(
@@ -550,21 +724,23 @@ class ValidatorNodeNetwork:
         try:
             url = f"{target_validator.api_endpoint.rstrip('/')}/{endpoint.lstrip('/')}"
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.post(
-                    url, json=payload, headers={"Content-Type": "application/json"}
-                )
+            response = await self.core.http_pool.post(
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=HTTP_TIMEOUT,
+            )
 
-                if response.status_code == 200:
-                    logger.debug(
-                        f"{self.uid_prefix} P2P message sent to {target_validator.uid}: {endpoint}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} P2P message failed to {target_validator.uid}: HTTP {response.status_code}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.debug(
+                    f"{self.uid_prefix} P2P message sent to {target_validator.uid}: {endpoint}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} P2P message failed to {target_validator.uid}: HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -572,6 +748,43 @@ class ValidatorNodeNetwork:
             )
             return False
 
+    async def send_gossip_message(self, peer_uid: str, message: bytes) -> bool:
+        """
+        Send a gossip message (one or more score bundles) to an overlay peer.
+
+        Args:
+            peer_uid: Target validator UID
+            message: Encoded gossip envelope
+
+        Returns:
+            True if the peer accepted the message
+        """
+        peer = self.core.validators_info.get(peer_uid)
+        endpoint = getattr(peer, "api_endpoint", None)
+        if not endpoint:
+            logger.debug(f"{self.uid_prefix} No API endpoint for gossip peer {peer_uid}")
+            return False
+
+        try:
+            response = await self.core.http_pool.post(
+                f"{endpoint.rstrip('/')}{GOSSIP_ENDPOINT}",
+                content=message,
+                headers={
+                    "Content-Type": GOSSIP_CONTENT_TYPE,
+                    GOSSIP_SENDER_HEADER: self.core.info.uid,
+                },
+                timeout=HTTP_TIMEOUT,
+            )
+            if response.status_code != 200:
+                logger.warning(
+                    f"{self.uid_prefix} Gossip to {peer_uid} failed: HTTP {response.status_code}"
+                )
+                return False
+            return True
+        except Exception as e:
+            logger.warning(f"{self.uid_prefix} Error sending gossip to {peer_uid}: {e}")
+            return False
+
     async def broadcast_p2p_message(self, endpoint: str, payload: Dict) -> List[bool]:
         """
         Broadcast a P2P message to all active validators.
@@ -667,20 +880,19 @@ class ValidatorNodeNetwork:
         try:
             url = f"{validator.api_endpoint.rstrip('/')}/health"
 
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(url)
+            response = await self.core.http_pool.get(url, timeout=5.0)
 
-                if response.status_code == 200:
-                    health_data = response.json()
-                    logger.debug(
-                        f"{self.uid_prefix} Validator {validator.uid} is healthy"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Validator {validator.uid} health check failed: HTTP {response.status_code}"
-                    )
-                    return False
+            if response.status_code == 200:
+                health_data = response.json()
+                logger.debug(
+                    f"{self.uid_prefix} Validator {validator.uid} is healthy"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Validator {validator.uid} health check failed: HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.debug(
@@ -707,24 +919,41 @@ class ValidatorNodeNetwork:
             )
             return False
 
+        breakers = self.core.miner_breakers
+        if not breakers.allow_request(miner_endpoint):
+            logger.debug(
+                f"{self.uid_prefix} Circuit open for {miner_endpoint}, not sending task {task.task_id}"
+            )
+            return False
+
         try:
             url = f"{miner_endpoint.rstrip('/')}/receive-task"
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.post(
-                    url, json=task.dict(), headers={"Content-Type": "application/json"}
+            try:
+                response = await self.core.http_pool.post(
+                    url,
+                    json=task.dict(),
+                    headers={"Content-Type": "application/json"},
+                    timeout=HTTP_TIMEOUT,
                 )
-
-                if response.status_code == 200:
-                    logger.debug(
-                        f"{self.uid_prefix} Task {task.task_id} sent successfully to {miner_endpoint}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Task {task.task_id} failed: HTTP {response.status_code}"
-                    )
-                    return False
+            except Exception:
+                breakers.record_failure(miner_endpoint)
+                raise
+            if response.status_code >= 500:
+                breakers.record_failure(miner_endpoint)
+            else:
+                breakers.record_success(miner_endpoint)
+
+            if response.status_code == 200:
+                logger.debug(
+                    f"{self.uid_prefix} Task {task.task_id} sent successfully to {miner_endpoint}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Task {task.task_id} failed: HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -748,16 +977,15 @@ class ValidatorNodeNetwork:
         try:
             url = f"{miner_endpoint.rstrip('/')}/status"
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.get(url)
+            response = await self.core.http_pool.get(url, timeout=HTTP_TIMEOUT)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Failed to get miner status: HTTP {response.status_code}"
-                    )
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Failed to get miner status: HTTP {response.status_code}"
+                )
+                return None
 
         except Exception as e:
             logger.debug(f"{self.uid_prefix} Error getting miner status: {e}")
@@ -767,6 +995,19 @@ class ValidatorNodeNetwork:
         """Get network statistics."""
         return {
             "http_client_active": self.http_client is not None,
+            "http_pool": self.core.http_pool.stats(),
+            "signature_verifier": self.core.signature_verifier.stats(),
+            "score_gossip": (
+                self.core.score_gossip.stats() if self.core.score_gossip else None
+            ),
+            "score_stream": {
+                "sent": (
+                    self.core.score_stream_sender.stats()
+                    if self.core.score_stream_sender
+                    else None
+                ),
+                "received": self.core.score_stream_receiver.stats(),
+            },
             "api_server_active": self.server_task is not None,
             "validators_count": len(self.core.validators_info),
             "miners_count": len(self.core.miners_info),
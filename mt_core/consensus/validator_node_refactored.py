@@ -27,12 +27,23 @@ from .validator_node_tasks import ValidatorNodeTasks
 from .validator_node_consensus import ValidatorNodeConsensus
 from .validator_node_network import ValidatorNodeNetwork
 from .slot_coordinator import SlotPhase
+from .coordination_backend import NetworkCoordinationBackend
+from .slot_scheduler import SlotScheduler
+from .adaptive_timing import (
+    ACTIVE_TIMING_KEY,
+    TIMING_AGREEMENT_LAG,
+    TIMING_PROPOSAL_KEY,
+    AdaptiveTimingController,
+    TimingProposal,
+    collect_timing_proposals,
+)
 from .flexible_slot_coordinator import (
     FlexibleSlotCoordinator,
     FlexibleSlotPhase,
     get_fixed_epoch_start,
 )
 from ..config.config_loader import get_config
+from ..network.signature_verifier import SignatureVerifier
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +117,20 @@ class ValidatorNode:
         self.core.tasks = self.tasks
         self.core.validator_instance = self
 
+        # Signed phase announcements travel over the validator API
+        if isinstance(self.core.coordination_backend, NetworkCoordinationBackend):
+            self.core.coordination_backend.attach_transport(
+                self.network.broadcast_p2p_message
+            )
+
+        # Score bundles gossiped over the overlay instead of sent to everyone
+        if self.core.score_gossip is not None:
+            self.core.score_gossip.attach_transport(self.network.send_gossip_message)
+            self.core.score_gossip.attach_delivery(self.consensus.deliver_gossip_bundle)
+        self.core.score_stream_receiver.attach_delivery(self.consensus.deliver_score_delta)
+        if self.core.score_stream_sender is not None:
+            self.core.score_stream_sender.attach_trigger(self.consensus.schedule_score_delta)
+
         # Aliases for backward compatibility
         self.uid_prefix = self.core.uid_prefix
         self.info = self.core.info
@@ -113,11 +138,13 @@ class ValidatorNode:
         # Background tasks
         self.main_task = None
         self.health_monitor_task = None
+        self.slot_scheduler = None
 
         # === FLEXIBLE CONSENSUS INTEGRATION ===
         self.enable_flexible_consensus = enable_flexible_consensus
         self.flexible_mode = flexible_mode
         self.flexible_consensus_enabled = False
+        self.early_completion = False
 
         if enable_flexible_consensus:
             try:
@@ -125,10 +152,24 @@ class ValidatorNode:
                 # Correctly initialize and assign the Slot Coordinator
                 self.core.slot_coordinator = FlexibleSlotCoordinator(
                     validator_uid=self.core.info.uid,
-                    # coordination_dir can be customized if needed, default is fine
+                    backend=self.core.coordination_backend,
                 )
                 logger.info(f"   - FlexibleSlotCoordinator initialized and assigned.")
 
+                if getattr(self.core.settings, "CONSENSUS_ADAPTIVE_TIMING", False):
+                    self.core.timing_controller = AdaptiveTimingController.from_settings(
+                        self.core.settings,
+                        self.core.slot_coordinator.slot_config,
+                        self.core.current_batch_timeout(),
+                    )
+                    logger.info("   - Adaptive phase timing enabled.")
+
+                self.early_completion = getattr(
+                    self.core.settings, "CONSENSUS_EARLY_COMPLETION", False
+                )
+                if self.early_completion:
+                    logger.info("   - Early slot completion enabled.")
+
                 # Now, enable the mode in the consensus handler
                 self.consensus.enable_flexible_mode()
                 self.flexible_consensus_enabled = True
@@ -163,6 +204,11 @@ class ValidatorNode:
         """Get validators information."""
         return self.core.validators_info
 
+    @property
+    def signature_verifier(self) -> SignatureVerifier:
+        """Get the shared signature verification service."""
+        return self.core.signature_verifier
+
     @property
     def results_buffer(self) -> Dict[str, MinerResult]:
         """Get results buffer."""
@@ -257,275 +303,229 @@ class ValidatorNode:
             f"{self.uid_prefix} Starting flexible consensus loop with synchronized cutoffs"
         )
 
-        last_processed_slot = -1
-        last_processed_phase = None
-        task_assignment_completed_slots = (
-            set()
-        )  # Track slots where task assignment was completed
+        # Starting point honours the coordinator's late-join rules; every
+        # later transition is pushed by the scheduler at its exact deadline
+        coordinator = self.core.slot_coordinator
+        # Join with the timing (and slot anchor) the network already agreed on
+        announced = coordinator.adopt_announced_timing()
+        if announced and self.core.timing_controller is not None:
+            self.core.timing_controller.active = announced
+        start_slot, start_phase, _ = coordinator.get_current_slot_and_phase()
+        await self._run_slot_scheduler(
+            coordinator.slot_schedule(),
+            self._on_flexible_phase,
+            start_slot,
+            start_phase,
+        )
 
-        while True:
-            try:
-                # Get current slot and phase from the flexible coordinator
-                current_slot, current_phase, phase_info = (
-                    self.core.slot_coordinator.get_current_slot_and_phase()
-                )
+    async def _run_slot_scheduler(self, schedule, on_phase, start_slot=None, start_phase=None):
+        """Drive phase handlers from a SlotScheduler until cancelled."""
+        self.slot_scheduler = SlotScheduler(schedule, on_phase, name=self.uid_prefix)
+        self.core.slot_scheduler = self.slot_scheduler
+        self.slot_scheduler.start(start_slot, start_phase)
 
-                # Determine if we should process this slot/phase combination
-                should_process = False
+        next_boundary = self.slot_scheduler.next_deadline()
+        if next_boundary:
+            delay, slot, phase = next_boundary
+            logger.info(
+                f"⏰ {self.uid_prefix} Slot scheduler starting with slot {slot} phase {phase.value} in {max(0.0, delay):.1f}s"
+            )
 
-                if current_slot > last_processed_slot:
-                    # New slot - always process
-                    should_process = True
-                    logger.info(
-                        f"🔄 {self.uid_prefix} New slot detected: {current_slot} (last: {last_processed_slot})"
-                    )
-                elif (
-                    current_slot == last_processed_slot
-                    and current_phase != last_processed_phase
-                ):
-                    # Same slot but different phase - process if we haven't done this phase
-                    should_process = True
-                    logger.info(
-                        f"🔄 {self.uid_prefix} Phase transition in slot {current_slot}: {last_processed_phase} → {current_phase.value}"
-                    )
+        try:
+            await self.slot_scheduler.run()
+        finally:
+            self.core.slot_scheduler = None
 
-                    # 🔥 CYBERPUNK UI: Phase Transition
-                    try:
-                        from ..cli.cyberpunk_ui_extended import (
-                            print_cyberpunk_phase_transition,
-                        )
+    async def _on_flexible_phase(self, slot: int, phase: FlexibleSlotPhase):
+        """Run the handler of one flexible phase; called once per slot and phase."""
+        logger.info(
+            f"▶️ {self.uid_prefix} Processing slot {slot} in phase {phase.value}"
+        )
 
-                        from_phase = (
-                            last_processed_phase.value
-                            if last_processed_phase
-                            else "startup"
-                        )
-                        print_cyberpunk_phase_transition(
-                            from_phase, current_phase.value, current_slot
-                        )
-                    except ImportError:
-                        pass
-                elif (
-                    current_slot == last_processed_slot
-                    and current_phase == last_processed_phase
-                ):
-                    # Same slot and same phase - check if enough time has passed to force progression
-                    # INFINITE LOOP FIX: Add time-based progression check
-                    time_in_phase = self._get_time_in_current_phase()
-                    min_phase_duration = self._get_min_phase_duration(current_phase)
-
-                    if time_in_phase >= (
-                        min_phase_duration + 10
-                    ):  # 10s buffer for progression
-                        # Force progression if we've been in phase too long
-                        should_process = True
-                        logger.info(
-                            f"🚀 {self.uid_prefix} FORCING progression: {time_in_phase:.1f}s in {current_phase.value} (min: {min_phase_duration}s)"
-                        )
-                    else:
-                        # Normal case - already processed, don't repeat
-                        should_process = False
-                        logger.debug(
-                            f"⏭️ {self.uid_prefix} Already processed slot {current_slot} phase {current_phase.value}, skipping"
-                        )
+        if phase == FlexibleSlotPhase.TASK_ASSIGNMENT:
+            self._update_slot_timing(slot)
+            # Stale coordination entries are dropped once per slot, in the
+            # background; the slots timing agreement reads are kept
+            self.core.slot_coordinator.backend.request_compaction(
+                slot - TIMING_AGREEMENT_LAG
+            )
 
-                if should_process:
-                    logger.info(
-                        f"▶️ {self.uid_prefix} Processing slot {current_slot} in phase {current_phase.value}"
-                    )
+            await self._handle_task_assignment_phase(slot)
+            # Task execution is now included in task assignment phase
+            await self._handle_task_execution_phase(slot)
+            logger.info(
+                f"✅ {self.uid_prefix} Task assignment + execution completed for slot {slot}"
+            )
+            return
 
-                    # Handle phase-specific operations - SIMPLIFIED 3 PHASES
-                    if current_phase == FlexibleSlotPhase.TASK_ASSIGNMENT:
-                        # Prevent duplicate task assignments for same slot
-                        if current_slot not in task_assignment_completed_slots:
-                            await self._handle_task_assignment_phase(current_slot)
-                            # Task execution is now included in task assignment phase
-                            await self._handle_task_execution_phase(current_slot)
-                            task_assignment_completed_slots.add(current_slot)
-                            logger.info(
-                                f"✅ {self.uid_prefix} Task assignment + execution completed for slot {current_slot}"
-                            )
-                        else:
-                            logger.debug(
-                                f"⏭️ {self.uid_prefix} Task assignment + execution already completed for slot {current_slot}, skipping"
-                            )
+        # 🔥 CYBERPUNK UI: Phase Transition
+        try:
+            from ..cli.cyberpunk_ui_extended import print_cyberpunk_phase_transition
 
-                    elif current_phase == FlexibleSlotPhase.CONSENSUS_SCORING:
-                        result = await self._handle_consensus_scoring_phase(
-                            current_slot
-                        )
-                        if result and result.get("skipped"):
-                            logger.info(
-                                f"⏭️ {self.uid_prefix} Skipped consensus for slot {current_slot} ({result.get('reason')})"
-                            )
-                    elif current_phase == FlexibleSlotPhase.METAGRAPH_UPDATE:
-                        # Prevent reprocessing same slot in metagraph phase
-                        if (
-                            current_slot == last_processed_slot
-                            and last_processed_phase
-                            == FlexibleSlotPhase.METAGRAPH_UPDATE
-                        ):
-                            logger.debug(
-                                f"⏭️ {self.uid_prefix} Skipping already completed metagraph phase for slot {current_slot}"
-                            )
-                            await asyncio.sleep(5)  # Wait for next slot
-                            continue
-
-                        await self._handle_metagraph_update_phase(current_slot)
-
-                        # Clean up old task assignment tracking when slot is fully completed
-                        old_slots = {
-                            s
-                            for s in task_assignment_completed_slots
-                            if s < current_slot - 2
-                        }
-                        task_assignment_completed_slots -= old_slots
-                        if old_slots:
-                            logger.debug(
-                                f"🧹 {self.uid_prefix} Cleaned up task assignment tracking for old slots: {old_slots}"
-                            )
+            schedule = self.slot_scheduler.schedule
+            from_phase = schedule.windows[schedule.index_of(phase) - 1].phase
+            print_cyberpunk_phase_transition(from_phase.value, phase.value, slot)
+        except ImportError:
+            pass
 
-                    # Update tracking - update slot tracking IMMEDIATELY to prevent infinite loops
-                    if current_phase == FlexibleSlotPhase.METAGRAPH_UPDATE:
-                        # Final phase completed - WAIT FOR NEXT SLOT TIME-BASED PROGRESSION
-                        logger.info(
-                            f"✅ {self.uid_prefix} Completed ALL phases for slot {current_slot}"
-                        )
-                        logger.info(
-                            f"⏰ {self.uid_prefix} Waiting for natural time progression to next slot..."
-                        )
-                        # Mark this slot as fully completed
-                        last_processed_slot = current_slot
-                        last_processed_phase = FlexibleSlotPhase.METAGRAPH_UPDATE
-                        # Let natural timing take over - wait for coordinator to detect next slot
-                        await asyncio.sleep(
-                            10
-                        )  # Wait for time progression instead of forcing
-                    else:
-                        logger.info(
-                            f"🔄 {self.uid_prefix} Completed phase {current_phase.value} for slot {current_slot}"
-                        )
-                        last_processed_phase = current_phase
-                        last_processed_slot = current_slot
+        phase_started = time.monotonic()
+        if phase == FlexibleSlotPhase.CONSENSUS_SCORING:
+            result = await self._handle_consensus_scoring_phase(slot)
+            if result and result.get("skipped"):
+                logger.info(
+                    f"⏭️ {self.uid_prefix} Skipped consensus for slot {slot} ({result.get('reason')})"
+                )
+            logger.info(
+                f"🔄 {self.uid_prefix} Completed phase {phase.value} for slot {slot}"
+            )
 
-                else:
-                    # Already processed this slot/phase combination
-                    logger.debug(
-                        f"⏳ {self.uid_prefix} Waiting for progression (slot: {current_slot}, phase: {current_phase.value}, last_slot: {last_processed_slot}, last_phase: {last_processed_phase})"
-                    )
+        elif phase == FlexibleSlotPhase.METAGRAPH_UPDATE:
+            await self._handle_metagraph_update_phase(slot)
+            logger.info(f"✅ {self.uid_prefix} Completed ALL phases for slot {slot}")
 
-                # Wait before next cycle
-                await asyncio.sleep(5)  # Reduced sleep for better responsiveness
+        if self.core.timing_controller is not None:
+            self.core.timing_controller.record_phase(
+                phase.value, time.monotonic() - phase_started
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"{self.uid_prefix} Error in flexible consensus loop: {e}",
-                    exc_info=True,
-                )
-                await asyncio.sleep(30)  # Wait before retrying
+        if self.early_completion and phase == FlexibleSlotPhase.METAGRAPH_UPDATE:
+            await self._complete_slot_early(slot)
 
-    def _get_time_in_current_phase(self) -> float:
-        """Get seconds elapsed in current phase to prevent infinite loops"""
-        if not hasattr(self.core, "slot_coordinator"):
-            return 0.0
+    def _update_slot_timing(self, slot: int):
+        """
+        Activate timing agreed for this slot and agree on the next one.
 
-        try:
-            current_slot, current_phase, metadata = (
-                self.core.slot_coordinator.get_current_slot_and_phase()
+        Every validator merges the proposals announced for slot
+        slot - TIMING_AGREEMENT_LAG the same way, so they all switch to the
+        same phase lengths at slot + 1.
+        """
+        coordinator = self.core.slot_coordinator
+        activated = coordinator.activate_timing(slot)
+        controller = self.core.timing_controller
+        if controller is None:
+            return
+        if activated:
+            controller.active = activated
+
+        if coordinator.pending_timing is not None:
+            return
+        proposals = collect_timing_proposals(
+            coordinator.backend.announcements(
+                slot - TIMING_AGREEMENT_LAG, FlexibleSlotPhase.METAGRAPH_UPDATE
             )
+        )
+        agreed = controller.agree(proposals)
+        if agreed is None or agreed == controller.active:
+            return
+
+        schedule = coordinator.adopt_timing(agreed, slot + 1)
+        if self.slot_scheduler is not None:
+            self.slot_scheduler.set_schedule(schedule, slot + 1)
+
+    def _timing_extra_data(self) -> Optional[Dict[str, Any]]:
+        """Timing proposal and active timing published with metagraph entries."""
+        data = {}
+        controller = self.core.timing_controller
+        if controller is not None:
+            data[TIMING_PROPOSAL_KEY] = controller.propose().to_dict()
+        announced = self.core.slot_coordinator.timing_announcement()
+        if announced:
+            data[ACTIVE_TIMING_KEY] = announced
+        return data or None
+
+    def _slot_resolved(self, slot: int) -> bool:
+        """
+        Whether this validator is done with slot.
 
-            # Get phase timing info from coordinator
-            slot_duration = (
-                self.core.slot_coordinator.slot_config.slot_duration_minutes * 60
-            )
-            task_duration = (
-                self.core.slot_coordinator.slot_config.min_task_assignment_seconds
-            )
-            exec_duration = (
-                self.core.slot_coordinator.slot_config.min_task_execution_seconds
-            )
-            cons_duration = self.core.slot_coordinator.slot_config.min_consensus_seconds
+        All local tasks must have been answered, and the quorum tracker must
+        hold the scores of every validator participating in the slot (scores
+        published through the coordination layer are recorded first).
+        """
+        if not self.core.slot_tasks_resolved(slot):
+            return False
 
-            # Use FIXED EPOCH START if not already set
-            if hasattr(self.core.slot_coordinator, "_epoch_start"):
-                epoch_start = self.core.slot_coordinator._epoch_start
-            else:
-                epoch_start = get_fixed_epoch_start()
-                self.core.slot_coordinator._epoch_start = epoch_start
-            slot_start = epoch_start + (current_slot * slot_duration)
-            time_in_slot = time.time() - slot_start
-
-            # Calculate time in current phase - SIMPLIFIED 3 PHASES
-            if current_phase.value == "task_assignment":
-                return time_in_slot  # Includes execution time
-            elif current_phase.value == "consensus_scoring":
-                return max(0, time_in_slot - task_duration)  # After task assignment
-            elif current_phase.value == "metagraph_update":
-                return max(
-                    0, time_in_slot - task_duration - cons_duration
-                )  # After consensus
-            else:
-                return time_in_slot
+        coordinator = self.core.slot_coordinator
+        for announcement in coordinator.backend.announcements(
+            slot, FlexibleSlotPhase.CONSENSUS_SCORING
+        ):
+            if announcement.extra_data.get("scores") is not None:
+                self.core.quorum_tracker.record(slot, announcement.validator_uid)
 
-        except Exception:
-            return 0.0
+        received = self.core.quorum_tracker.participants(slot)
+        received.add(self.core.info.uid)
+        return set(coordinator.slot_participants(slot)) <= received
+
+    async def _complete_slot_early(self, slot: int):
+        """
+        Bring the next slot forward once every validator is done with this one.
+
+        A resolved validator announces it through the coordination layer and
+        waits for the other participants; when all of them have announced,
+        each validator moves the start of slot + 1 to the same agreed time.
+        Otherwise (a miner timed out, scores missing, a validator lagging) the
+        slot ends on its normal boundary.
+        """
+        try:
+            if not self._slot_resolved(slot):
+                logger.debug(
+                    f"{self.uid_prefix} Slot {slot} not fully resolved, keeping its boundary"
+                )
+                return
 
-    def _get_min_phase_duration(self, phase) -> int:
-        """Get minimum duration for a phase"""
-        if not hasattr(self.core, "slot_coordinator"):
-            return 30  # Default 30s
+            coordinator = self.core.slot_coordinator
+            await coordinator.announce_slot_complete(slot)
+            start = await coordinator.wait_for_slot_complete(
+                slot,
+                self.slot_scheduler.schedule.slot_start(slot + 1),
+                getattr(self.core.settings, "CONSENSUS_EARLY_COMPLETION_GRACE", 5.0),
+            )
+            if start is None:
+                logger.info(
+                    f"{self.uid_prefix} Not every validator completed slot {slot}, keeping its boundary"
+                )
+                return
 
-        config = self.core.slot_coordinator.slot_config
+            if self.core.timing_controller is not None:
+                timing = self.core.timing_controller.active
+            else:
+                timing = TimingProposal.from_slot_config(
+                    coordinator.slot_config, self.core.current_batch_timeout()
+                )
+            schedule = coordinator.shift_epoch(slot + 1, start, timing)
+            if schedule is not None:
+                self.slot_scheduler.set_schedule(schedule, slot + 1)
 
-        if phase.value == "task_assignment":
-            return config.min_task_assignment_seconds  # Includes execution
-        elif phase.value == "consensus_scoring":
-            return config.min_consensus_seconds
-        elif phase.value == "metagraph_update":
-            return config.min_metagraph_update_seconds
-        else:
-            return 30  # Default
+        except Exception as e:
+            logger.error(f"{self.uid_prefix} Error completing slot {slot} early: {e}")
 
     async def _traditional_slot_loop(self):
         """Traditional slot-based operation loop."""
         logger.info(f"{self.uid_prefix} Starting traditional slot-based loop")
 
-        while True:
-            try:
-                # Get current slot and phase
-                current_slot = self.core.get_current_blockchain_slot()
-                phase, time_in_phase, time_remaining = self.core.get_slot_phase(
-                    current_slot
-                )
+        await self._run_slot_scheduler(
+            self.core.slot_coordinator.slot_schedule(),
+            self._on_traditional_phase,
+            self.core.get_current_blockchain_slot(),
+        )
 
-                logger.debug(
-                    f"{self.uid_prefix} Slot {current_slot}, Phase: {phase}, "
-                    f"Time in phase: {time_in_phase}s, Remaining: {time_remaining}s"
+    async def _on_traditional_phase(self, slot: int, phase: SlotPhase):
+        """Run the handler of one traditional slot phase."""
+        logger.debug(f"{self.uid_prefix} Slot {slot}, Phase: {phase}")
+
+        if phase == SlotPhase.TASK_ASSIGNMENT:
+            await self._handle_task_assignment_phase(slot)
+        elif phase == SlotPhase.TASK_EXECUTION:
+            await self._handle_task_execution_phase(slot)
+            if not self.core.result_waiters:
+                self.core.signal_phase_complete(slot, phase, "all_results_in")
+        elif phase == SlotPhase.CONSENSUS_SCORING:
+            result = await self._handle_consensus_scoring_phase(slot)
+            if result and result.get("skipped"):
+                logger.info(
+                    f"⏭️ {self.uid_prefix} Skipped consensus for slot {slot} ({result.get('reason')})"
                 )
-
-                # Handle phase-specific operations
-                if phase == SlotPhase.TASK_ASSIGNMENT:
-                    await self._handle_task_assignment_phase(current_slot)
-                elif phase == SlotPhase.TASK_EXECUTION:
-                    await self._handle_task_execution_phase(current_slot)
-                elif phase == SlotPhase.CONSENSUS_SCORING:
-                    result = await self._handle_consensus_scoring_phase(current_slot)
-                    if result and result.get("skipped"):
-                        logger.info(
-                            f"⏭️ {self.uid_prefix} Skipped consensus for slot {current_slot} ({result.get('reason')})"
-                        )
-                        continue  # Skip to next iteration
-                elif phase == SlotPhase.METAGRAPH_UPDATE:
-                    await self._handle_metagraph_update_phase(current_slot)
-
-                # Wait before next iteration
-                await asyncio.sleep(10)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"{self.uid_prefix} Error in main operation loop: {e}")
-                await asyncio.sleep(30)  # Wait before retrying
+        elif phase == SlotPhase.METAGRAPH_UPDATE:
+            await self._handle_metagraph_update_phase(slot)
 
     # === Phase Handlers ===
 
@@ -934,6 +934,9 @@ class ValidatorNode:
                     f"🎯 {self.uid_prefix} Converted {len(local_scores_list)} ValidatorScore objects to dict: {local_scores}"
                 )
 
+                # Close the score stream: peers already hold most of our scores
+                await self.consensus.finish_score_stream(slot)
+
                 # Coordinate consensus with other validators (synchronized)
                 consensus_scores = (
                     await self.core.slot_coordinator.coordinate_consensus_round(
@@ -1008,6 +1011,11 @@ class ValidatorNode:
                     logger.info(
                         f"📊 {self.uid_prefix} Immediate submission result: {'SUCCESS' if submission_success else 'FAILED'}"
                     )
+
+                    # Consensus reached: no need to sit out the rest of the phase
+                    self.core.signal_phase_complete(
+                        slot, SlotPhase.CONSENSUS_SCORING, "quorum_reached"
+                    )
                 else:
                     logger.warning(
                         f"⚠️ {self.uid_prefix} No consensus scores to store for slot {slot}"
@@ -1031,6 +1039,9 @@ class ValidatorNode:
                     logger.info(
                         f"{self.uid_prefix} Consensus finalized for slot {slot}: {len(final_scores)} final scores"
                     )
+                    self.core.signal_phase_complete(
+                        slot, SlotPhase.CONSENSUS_SCORING, "consensus_finalized"
+                    )
 
                 logger.info(
                     f"{self.uid_prefix} Consensus scoring completed for slot {slot}"
@@ -1063,7 +1074,7 @@ class ValidatorNode:
 
                 # Coordinate metagraph update with other validators
                 await self.core.slot_coordinator.register_phase_entry(
-                    slot, SlotPhase.METAGRAPH_UPDATE
+                    slot, SlotPhase.METAGRAPH_UPDATE, self._timing_extra_data()
                 )
 
                 # Wait for all validators to reach metagraph phase
@@ -1171,7 +1182,7 @@ class ValidatorNode:
             logger.info(f"   - Initializing FlexibleSlotCoordinator...")
             self.core.slot_coordinator = FlexibleSlotCoordinator(
                 validator_uid=self.core.info.uid,
-                # coordination_dir can be customized if needed, default is fine
+                backend=self.core.coordination_backend,
             )
             logger.info(f"   - FlexibleSlotCoordinator assigned to core node.")
 
@@ -17,12 +17,20 @@ import random
 import time
 from typing import Dict, List, Any, Optional
 
-import httpx
 
 from ..core.datatypes import MinerInfo, TaskAssignment, MinerResult, ValidatorInfo
 from ..metagraph.metagraph_datum import STATUS_ACTIVE
+from ..network.batching import (
+    BATCH_TASKS_HEADER,
+    DEFAULT_MAX_BATCH,
+    MINER_CAPACITY_HEADER,
+    TASK_BATCH_ENDPOINT,
+    RequestCoalescer,
+    batch_limit,
+    partial_results,
+)
 from ..network.server import TaskModel
-from .selection import select_miners_logic
+from .selection import select_miners_logic, selection_seed
 from .slot_coordinator import SlotPhase
 
 logger = logging.getLogger(__name__)
@@ -162,10 +170,37 @@ class ValidatorNodeTasks:
             self.core.settings.CONSENSUS_NUM_MINERS_TO_SELECT, len(active_miners)
         )
 
-        # Use deterministic selection based on slot number
-        random.seed(slot)
-        selected_miners = random.sample(active_miners, num_to_select)
-        random.seed()  # Reset seed
+        # Rank every active miner with a sampler seeded by the slot, so every
+        # validator walks the same order from the same metagraph. Miners whose
+        # circuit breaker is open locally are skipped and their places go to
+        # the next miners in that order, which keeps the reachable picks
+        # identical across validators with different breaker states.
+        ranked_miners = select_miners_logic(
+            miners_info={m.uid: m for m in active_miners},
+            current_cycle=self.core.current_cycle,
+            num_to_select=len(active_miners),
+            beta=self.core.settings.CONSENSUS_PARAM_BETA,
+            max_time_bonus=self.core.settings.CONSENSUS_PARAM_MAX_TIME_BONUS,
+            seed=selection_seed(slot),
+        )
+        selected_miners = []
+        skipped = 0
+        for miner in ranked_miners:
+            if len(selected_miners) == num_to_select:
+                break
+            if self.core.miner_scheduler.reachable(miner):
+                selected_miners.append(miner)
+            else:
+                skipped += 1
+        if skipped:
+            logger.info(
+                f"{self.uid_prefix} Skipping {skipped} miners with open circuit breakers"
+            )
+        if not selected_miners:
+            logger.warning(
+                f"{self.uid_prefix} No reachable miners available for slot {slot}"
+            )
+            return []
 
         logger.info(
             f"{self.uid_prefix} Selected {len(selected_miners)} miners for slot {slot}: "
@@ -519,24 +554,43 @@ class ValidatorNodeTasks:
             )
             return False
 
+        endpoint = miner_endpoint.rstrip("/")
+        if not self.core.miner_breakers.allow_request(endpoint):
+            # Endpoint failed repeatedly: skip it instead of waiting for a timeout
+            logger.debug(
+                f"{self.uid_prefix} Circuit open for {endpoint}, not sending task {task.task_id}"
+            )
+            return False
+        if endpoint in self.core.batch_task_miners:
+            # One request carries every task headed for this miner right now
+            return await self._task_batcher().submit(endpoint, task)
+
         try:
-            url = f"{miner_endpoint.rstrip('/')}/receive-task"
+            url = f"{endpoint}/receive-task"
 
-            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-                response = await client.post(
-                    url, json=task.dict(), headers={"Content-Type": "application/json"}
+            try:
+                response = await self.core.http_pool.post(
+                    url,
+                    json=task.dict(),
+                    headers={"Content-Type": "application/json"},
+                    timeout=HTTP_TIMEOUT,
                 )
+            except Exception:
+                self.core.miner_breakers.record_failure(endpoint)
+                raise
+            self._record_miner_response(endpoint, response.status_code, [task.task_id])
+            self._learn_miner_headers(endpoint, response)
 
-                if response.status_code == 200:
-                    logger.debug(
-                        f"{self.uid_prefix} Task {task.task_id} sent successfully to {miner_endpoint}"
-                    )
-                    return True
-                else:
-                    logger.warning(
-                        f"{self.uid_prefix} Task {task.task_id} failed: HTTP {response.status_code}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.debug(
+                    f"{self.uid_prefix} Task {task.task_id} sent successfully to {miner_endpoint}"
+                )
+                return True
+            else:
+                logger.warning(
+                    f"{self.uid_prefix} Task {task.task_id} failed: HTTP {response.status_code}"
+                )
+                return False
 
         except Exception as e:
             logger.error(
@@ -544,6 +598,94 @@ class ValidatorNodeTasks:
             )
             return False
 
+    def _task_batcher(self) -> RequestCoalescer:
+        """The node's coalescer for batched task sends, created on first use."""
+        if self.core.task_batcher is None:
+            self.core.task_batcher = RequestCoalescer(
+                self._send_task_batch,
+                max_batch=self._max_task_batch(),
+                limit_of=lambda endpoint: self.core.batch_task_miners.get(endpoint, 0),
+                name=self.uid_prefix,
+            )
+        return self.core.task_batcher
+
+    def _max_task_batch(self) -> int:
+        return int(
+            getattr(self.core.settings, "CONSENSUS_TASK_BATCH_SIZE", DEFAULT_MAX_BATCH)
+        )
+
+    def _record_miner_response(self, endpoint: str, status_code: int, task_ids: List[str]):
+        """
+        Feed an HTTP answer to the miner's breaker: 5xx counts as a failure.
+
+        Accepting a task whose result is awaited is not a success yet: the
+        result (or its timeout) is recorded by the dispatcher, so a miner
+        that takes tasks but never answers still trips its breaker.
+        """
+        if status_code >= 500:
+            self.core.miner_breakers.record_failure(endpoint)
+        elif not any(task_id in self.core.result_waiters for task_id in task_ids):
+            self.core.miner_breakers.record_success(endpoint)
+
+    def _learn_miner_headers(self, endpoint: str, response):
+        """Remember the concurrency a miner advertises and whether it takes /receive-tasks."""
+        self.core.miner_scheduler.set_capacity(
+            endpoint, batch_limit(response.headers.get(MINER_CAPACITY_HEADER))
+        )
+        limit = batch_limit(response.headers.get(BATCH_TASKS_HEADER))
+        if limit > 1 and self._max_task_batch() > 1:
+            self.core.batch_task_miners[endpoint] = limit
+
+    async def _send_task_batch(self, endpoint: str, tasks: List[TaskModel]) -> List[bool]:
+        """
+        Send several tasks to one miner in a single request.
+
+        Returns:
+            Whether the miner queued each task
+        """
+        try:
+            response = await self.core.http_pool.post(
+                f"{endpoint}{TASK_BATCH_ENDPOINT}",
+                json={"tasks": [task.dict() for task in tasks]},
+                headers={"Content-Type": "application/json"},
+                timeout=HTTP_TIMEOUT,
+            )
+        except Exception as e:
+            self.core.miner_breakers.record_failure(endpoint)
+            logger.error(
+                f"{self.uid_prefix} Network error sending {len(tasks)} tasks to {endpoint}: {e}"
+            )
+            return [False] * len(tasks)
+
+        self._record_miner_response(
+            endpoint, response.status_code, [task.task_id for task in tasks]
+        )
+        if response.status_code == 404:
+            # Miner no longer takes batches: send these one by one
+            self.core.batch_task_miners.pop(endpoint, None)
+            return list(
+                await asyncio.gather(
+                    *(self._send_task_implementation(endpoint, task) for task in tasks)
+                )
+            )
+        if response.status_code not in (200, 429):
+            logger.warning(
+                f"{self.uid_prefix} Task batch to {endpoint} failed: HTTP {response.status_code}"
+            )
+            return [False] * len(tasks)
+
+        self._learn_miner_headers(endpoint, response)
+        body = response.json()
+        outcomes = partial_results(
+            [task.task_id for task in tasks],
+            body.get("accepted", []),
+            body.get("rejected", {}),
+        )
+        logger.debug(
+            f"{self.uid_prefix} Task batch to {endpoint}: {sum(outcomes)}/{len(tasks)} queued"
+        )
+        return outcomes
+
     async def _cardano_send_single_task(
         self,
         task_id: str,
@@ -607,6 +749,11 @@ class ValidatorNodeTasks:
                 # Mark miner as not busy
                 self.core.miner_is_busy.discard(result.miner_uid)
 
+                # Wake the minibatch dispatcher waiting on this task, if any
+                waiter = self.core.result_waiters.get(result.task_id)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(result)
+
                 logger.info(
                     f"✅ {self.uid_prefix} Added result for task {result.task_id} from miner {result.miner_uid}"
                 )
@@ -689,9 +836,7 @@ class ValidatorNodeTasks:
 
             # Also store in slot scores for current slot
             current_slot = self.core.get_current_blockchain_slot()
-            if current_slot not in self.core.slot_scores:
-                self.core.slot_scores[current_slot] = []
-            self.core.slot_scores[current_slot].append(validator_score)
+            self.core.score_store.add_local_score(current_slot, validator_score)
 
             logger.info(
                 f"✨ {self.uid_prefix} IMMEDIATE scoring complete: {score_value:.3f} for task {result.task_id}"
@@ -1040,11 +1185,14 @@ class ValidatorNodeTasks:
 
     async def cardano_send_minibatches(self, slot: int, miners: List[MinerInfo]):
         """
-        Send tasks to miners using minibatch approach within slot timing.
+        Send tasks to miners using a pipelined minibatch approach within slot timing.
 
-        This method combines:
-        - Slot-based consensus timing
-        - Minibatch processing (send batch → wait results → score → next batch)
+        Up to ``CONSENSUS_MAX_INFLIGHT_BATCHES`` minibatches' worth of tasks are
+        kept in flight at once. Each result is scored as soon as it arrives and
+        the freed capacity is refilled by the miner scheduler: every miner first
+        gets one task, then follow-up tasks as its own concurrency limit and
+        the remaining window allow, so fast miners are not left idle while slow
+        ones finish. No task waits past the end of the task assignment phase.
 
         Args:
             slot: Current slot number
@@ -1059,12 +1207,16 @@ class ValidatorNodeTasks:
             return
 
         # Get minibatch configuration
-        batch_size = getattr(
-            self.core.settings, "CONSENSUS_MINIBATCH_SIZE", 2
+        batch_size = max(
+            1, int(getattr(self.core.settings, "CONSENSUS_MINIBATCH_SIZE", 2))
         )  # Default 2 miners per batch
-        batch_timeout = getattr(
-            self.core.settings, "CONSENSUS_BATCH_TIMEOUT", 45.0
-        )  # 45s per batch - Increased from 30s for better task completion
+        batch_timeout = (
+            self.core.current_batch_timeout()
+        )  # Configured, or agreed by adaptive timing
+        max_inflight_batches = max(
+            1, int(getattr(self.core.settings, "CONSENSUS_MAX_INFLIGHT_BATCHES", 2))
+        )
+        capacity = batch_size * max_inflight_batches
 
         # Calculate available time for task assignment phase
         slot_config = self.core.slot_config
@@ -1072,74 +1224,103 @@ class ValidatorNodeTasks:
             slot_config.task_assignment_minutes * 60
         )  # Convert to seconds
 
-        # Split miners into batches
-        miner_batches = [
-            miners[i : i + batch_size] for i in range(0, len(miners), batch_size)
-        ]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + assignment_time_limit
+
         logger.info(
-            f"{self.uid_prefix} Created {len(miner_batches)} minibatches of size {batch_size}"
+            f"{self.uid_prefix} Pipelining {len(miners)} tasks: batch size {batch_size}, "
+            f"{max_inflight_batches} batches in flight, {assignment_time_limit}s budget"
         )
 
+        scheduler = self.core.miner_scheduler
+        scheduler.clear()
+        for miner in miners:
+            scheduler.push(miner, deadline, batch_timeout)
+
+        in_flight = set()
+        dispatched = 0
+        first_round = set()  # Miners that got their first task of the slot
         total_scores = []
-        batch_start_time = time.time()
+        miner_totals: Dict[str, List[float]] = {}  # uid -> [score sum, task count]
 
-        for batch_num, batch_miners in enumerate(miner_batches):
-            # Check if we have enough time for this batch
-            elapsed_time = time.time() - batch_start_time
-            remaining_time = assignment_time_limit - elapsed_time
+        while scheduler.pending or in_flight:
+            now = loop.time()
+            remaining_time = deadline - now
 
-            if remaining_time < batch_timeout:
-                logger.warning(
-                    f"{self.uid_prefix} Insufficient time for batch {batch_num + 1}, skipping remaining batches"
+            # Refill free capacity while the assignment phase is still open
+            while len(in_flight) < capacity and remaining_time > 0:
+                pending = scheduler.pop_ready(now)
+                if pending is None:
+                    break
+                first_round.add(pending.miner.uid)
+                batch_num = dispatched // batch_size + 1
+                dispatched += 1
+                in_flight.add(
+                    asyncio.create_task(
+                        self._dispatch_minibatch_task(
+                            slot,
+                            pending.miner,
+                            batch_num,
+                            min(batch_timeout, remaining_time),
+                            pending.round,
+                        )
+                    )
                 )
+
+            if not in_flight:
                 break
 
-            logger.info(
-                f"{self.uid_prefix} Processing minibatch {batch_num + 1}/{len(miner_batches)} with {len(batch_miners)} miners"
+            done, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
             )
 
-            try:
-                # Send tasks to this batch
-                batch_results = await self._send_cardano_minibatch(
-                    slot, batch_miners, batch_num + 1, batch_timeout
-                )
-
-                # Score results immediately
-                if batch_results:
-                    batch_scores = await self._score_minibatch_results(
-                        slot, batch_results
-                    )
-                    total_scores.extend(batch_scores)
-
-                    # CRITICAL FIX: Store scores in slot_scores for consensus to use
-                    if slot not in self.core.slot_scores:
-                        self.core.slot_scores[slot] = []
-                    self.core.slot_scores[slot].extend(batch_scores)
-
-                    # DEBUG: Log detailed score storage
-                    logger.info(
-                        f"💾 {self.uid_prefix} STORING {len(batch_scores)} scores in slot_scores[{slot}]"
-                    )
-                    for score in batch_scores:
-                        logger.info(
-                            f"💾 {self.uid_prefix} Stored: Miner {score.miner_uid} → {score.score:.4f} (Task: {score.task_id})"
-                        )
-                    logger.info(
-                        f"💾 {self.uid_prefix} Total slot_scores[{slot}] now has {len(self.core.slot_scores[slot])} scores"
+            for finished in done:
+                try:
+                    task_scores = finished.result()
+                except Exception as e:
+                    logger.error(f"{self.uid_prefix} Error processing minibatch task: {e}")
+                    continue
+
+                if not task_scores:
+                    continue
+
+                total_scores.extend(task_scores)
+
+                # Store scores in slot_scores as they arrive so consensus can use them
+                self.core.slot_scores[slot].extend(task_scores)
+                # A miner may run several tasks per slot; our score for it is
+                # the mean over its tasks
+                weight = self.core.validator_trust_weight(self.core.info.uid)
+                for score in task_scores:
+                    totals = miner_totals.setdefault(score.miner_uid, [0.0, 0])
+                    totals[0] += score.score
+                    totals[1] += 1
+                    self.core.score_aggregator.add_score(
+                        slot,
+                        score.miner_uid,
+                        self.core.info.uid,
+                        totals[0] / totals[1],
+                        weight,
                     )
+                # Stream the new scores to peers while the slot is still running
+                stream = getattr(self.core, "score_stream_sender", None)
+                if stream is not None:
+                    stream.notify(slot)
 
+                for score in task_scores:
                     logger.info(
-                        f"{self.uid_prefix} Batch {batch_num + 1} completed: {len(batch_scores)} scores generated and stored in slot_scores"
+                        f"💾 {self.uid_prefix} Stored: Miner {score.miner_uid} → {score.score:.4f} (Task: {score.task_id})"
                     )
 
-                # Clean up batch results
-                self._cleanup_batch_results(batch_results)
-
-            except Exception as e:
-                logger.error(
-                    f"{self.uid_prefix} Error processing batch {batch_num + 1}: {e}"
-                )
-                continue
+        undispatched = len({m.uid for m in miners} - first_round)
+        if undispatched:
+            logger.warning(
+                f"{self.uid_prefix} Assignment phase ended with {undispatched} miners not dispatched for slot {slot}"
+            )
+        logger.info(
+            f"{self.uid_prefix} Dispatched {dispatched} tasks to {len(first_round)} miners for slot {slot}"
+        )
+        scheduler.clear()
 
         # Store all scores for the slot
         if total_scores:
@@ -1157,117 +1338,97 @@ class ValidatorNodeTasks:
         else:
             logger.warning(f"{self.uid_prefix} No scores generated for slot {slot}")
 
-    async def _send_cardano_minibatch(
-        self, slot: int, miners: List[MinerInfo], batch_num: int, timeout: float
-    ) -> Dict[str, MinerResult]:
+    async def _dispatch_minibatch_task(
+        self,
+        slot: int,
+        miner: MinerInfo,
+        batch_num: int,
+        timeout: float,
+        task_round: int = 1,
+    ) -> List:
         """
-        Send tasks to a single minibatch and wait for results.
+        Send one minibatch task, wait for its result and score it.
 
         Args:
             slot: Current slot number
-            miners: Miners in this batch
-            batch_num: Batch number for logging
-            timeout: Timeout for receiving results
+            miner: Miner receiving the task
+            batch_num: Batch number the task belongs to (used in the task ID)
+            timeout: Maximum time to wait for the result, including sending
+            task_round: Which of the miner's tasks in this slot this is
 
         Returns:
-            Dictionary of received results {task_id: MinerResult}
+            List of scores generated (empty if the task failed or timed out)
         """
-        logger.info(
-            f"{self.uid_prefix} Sending batch {batch_num} tasks to {len(miners)} miners"
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        task_deadline = started + timeout
+
+        # Create task
+        task_data = self.cardano_create_task(slot, miner.uid)
+        task_id = f"slot_{slot}_batch_{batch_num}_{miner.uid}_{int(time.time())}"
+        if task_round > 1:
+            task_id += f"_r{task_round}"
+
+        # Create assignment
+        assignment = TaskAssignment(
+            task_id=task_id,
+            task_data=task_data,
+            miner_uid=miner.uid,
+            validator_uid=self.core.info.uid,
+            timestamp_sent=time.time(),
+            expected_result_format={},
         )
 
-        # Send tasks to all miners in batch concurrently
-        send_coroutines = []
-        batch_task_ids = []
+        # Register the waiter before sending so a fast result cannot be missed
+        waiter = loop.create_future()
+        self.core.result_waiters[task_id] = waiter
 
-        for miner in miners:
-            # Create task
-            task_data = self.cardano_create_task(slot, miner.uid)
-            task_id = f"slot_{slot}_batch_{batch_num}_{miner.uid}_{int(time.time())}"
+        # Track assignment and mark miner as busy
+        self.core.tasks_sent[task_id] = assignment
+        self.core.miner_is_busy.add(miner.uid)
+        scheduler = self.core.miner_scheduler
+        scheduler.started(miner)
+        latency = None
 
-            # Create assignment
-            assignment = TaskAssignment(
-                task_id=task_id,
-                task_data=task_data,
-                miner_uid=miner.uid,
-                validator_uid=self.core.info.uid,
-                timestamp_sent=time.time(),
-                expected_result_format={},
-            )
-
-            # Track assignment
-            self.core.tasks_sent[task_id] = assignment
-            batch_task_ids.append(task_id)
-
-            # Mark miner as busy
-            self.core.miner_is_busy.add(miner.uid)
-
-            # Prepare task model
+        try:
             task = TaskModel(task_id=task_id, **task_data)
+            if not await self._cardano_send_single_task(
+                task_id, assignment, miner, task
+            ):
+                # No more tasks for this miner in this slot
+                scheduler.drop_pending(miner)
+                self._record_unanswered(slot)
+                return []
 
-            # Add to send queue
-            send_coroutines.append(
-                self._cardano_send_single_task(task_id, assignment, miner, task)
-            )
-
-        # Send all tasks in batch
-        if send_coroutines:
-            results = await asyncio.gather(*send_coroutines, return_exceptions=True)
-            success_count = sum(
-                1 for result in results if isinstance(result, bool) and result
-            )
-            logger.info(
-                f"{self.uid_prefix} Batch {batch_num} sent: {success_count}/{len(send_coroutines)} successful"
-            )
-
-        # Wait for results with timeout
-        return await self._wait_for_batch_results(batch_task_ids, timeout)
-
-    async def _wait_for_batch_results(
-        self, task_ids: List[str], timeout: float
-    ) -> Dict[str, MinerResult]:
-        """
-        Wait for results from specific task IDs.
-
-        Args:
-            task_ids: List of task IDs to wait for
-            timeout: Maximum wait time
-
-        Returns:
-            Dictionary of received results
-        """
-        logger.debug(
-            f"{self.uid_prefix} Waiting for {len(task_ids)} batch results (timeout: {timeout}s)"
-        )
-
-        start_time = time.time()
-        received_results = {}
-
-        while time.time() - start_time < timeout and len(received_results) < len(
-            task_ids
-        ):
-            # Check for new results
-            async with self.core.results_buffer_lock:
-                for task_id in task_ids:
-                    if (
-                        task_id in self.core.results_buffer
-                        and task_id not in received_results
-                    ):
-                        received_results[task_id] = self.core.results_buffer[task_id]
-                        logger.debug(
-                            f"{self.uid_prefix} Received result for task {task_id}"
-                        )
-
-            if len(received_results) < len(task_ids):
-                await asyncio.sleep(0.5)  # Short polling interval
-
-        # Log results
-        success_rate = len(received_results) / len(task_ids) * 100 if task_ids else 0
-        logger.info(
-            f"{self.uid_prefix} Batch results: {len(received_results)}/{len(task_ids)} received ({success_rate:.1f}%)"
-        )
-
-        return received_results
+            try:
+                result = await asyncio.wait_for(
+                    waiter, max(0.0, task_deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                logger.info(
+                    f"{self.uid_prefix} Batch {batch_num}: no result from miner {miner.uid} within {timeout:.1f}s"
+                )
+                self.core.miner_breakers.record_failure(miner.api_endpoint)
+                if self.core.timing_controller is not None:
+                    self.core.timing_controller.record_timeout(miner.uid)
+                self._record_unanswered(slot)
+                return []
+
+            latency = loop.time() - started
+            self.core.miner_breakers.record_success(miner.api_endpoint)
+            if self.core.timing_controller is not None:
+                self.core.timing_controller.record_miner_latency(miner.uid, latency)
+
+            scores = await self._score_minibatch_results(slot, {task_id: result})
+            self._cleanup_batch_results({task_id: result})
+            return scores
+        finally:
+            scheduler.finished(miner, latency)
+            self.core.result_waiters.pop(task_id, None)
+
+    def _record_unanswered(self, slot: int):
+        """Count a task of slot that got no result (blocks early slot completion)."""
+        self.core.unanswered_tasks[slot] = self.core.unanswered_tasks.get(slot, 0) + 1
 
     async def _score_minibatch_results(
         self, slot: int, results: Dict[str, MinerResult]
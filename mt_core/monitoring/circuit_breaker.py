@@ -1,60 +1,207 @@
 import time
 import logging
-from typing import Any, Callable, Awaitable
+from collections import OrderedDict
+from typing import Any, Callable, Awaitable, List, Optional
 
 logger = logging.getLogger(__name__)
 
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_MINER_BREAKER_FAILURES = 3
+DEFAULT_MINER_BREAKER_RESET_SECONDS = 30.0
+
 class CircuitBreaker:
-    """Circuit breaker pattern implementation for handling failures gracefully"""
-    
+    """
+    Circuit breaker pattern implementation for handling failures gracefully
+
+    Closed: calls go through and consecutive failures are counted. Open (after
+    failure_threshold failures): calls are refused until reset_timeout has
+    passed. Half-open: one probe call is let through; its success closes the
+    breaker, its failure opens it again for another reset_timeout.
+    """
+
     def __init__(self, failure_threshold: int = 5, reset_timeout: int = 60):
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self.failures = 0
         self.last_failure_time = 0
+        self.is_open = False  # True while open or half-open
+        self.state = STATE_CLOSED
+        self.probe_in_flight = False
+        self.probe_started = 0
+
+    def available(self, now: Optional[float] = None) -> bool:
+        """Whether a call would be let through now (does not change state)."""
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.time() if now is None else now
+        if self.state == STATE_HALF_OPEN:
+            # A probe whose outcome was never recorded does not block forever
+            return not self.probe_in_flight or now - self.probe_started > self.reset_timeout
+        return now - self.last_failure_time > self.reset_timeout
+
+    def allow_request(self, now: Optional[float] = None) -> bool:
+        """
+        Ask to make a call; follow it with record_success() or record_failure().
+
+        Returns:
+            True if the call may go ahead (possibly as the half-open probe)
+        """
+        if not self.available(now):
+            return False
+        if self.state == STATE_OPEN:
+            logger.info("Circuit breaker half-open after timeout, probing")
+            self.state = STATE_HALF_OPEN
+        if self.state == STATE_HALF_OPEN:
+            self.probe_in_flight = True
+            self.probe_started = time.time() if now is None else now
+        return True
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            logger.info("Circuit breaker closed after successful probe")
+        self.state = STATE_CLOSED
         self.is_open = False
+        self.probe_in_flight = False
+        self.failures = 0
+
+    def record_failure(self, now: Optional[float] = None):
+        self.failures += 1
+        self.last_failure_time = time.time() if now is None else now
+        if self.state == STATE_HALF_OPEN:
+            logger.warning("Circuit breaker probe failed, opening again")
+            self._open()
+        elif self.state == STATE_CLOSED and self.failures >= self.failure_threshold:
+            logger.warning(f"Circuit breaker opened after {self.failures} failures")
+            self._open()
+
+    def _open(self):
+        self.state = STATE_OPEN
+        self.is_open = True
+        self.probe_in_flight = False
 
     async def execute(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
         """
         Execute a function with circuit breaker protection
-        
+
         Args:
             func: Async function to execute
             *args: Positional arguments for the function
             **kwargs: Keyword arguments for the function
-            
+
         Returns:
             Result from the function execution
-            
+
         Raises:
             Exception: If circuit breaker is open or function execution fails
         """
-        if self.is_open:
-            if time.time() - self.last_failure_time > self.reset_timeout:
-                logger.info("Circuit breaker resetting after timeout")
-                self.is_open = False
-                self.failures = 0
-            else:
-                raise Exception("Circuit breaker is open")
+        if not self.allow_request():
+            raise Exception("Circuit breaker is open")
 
         try:
             result = await func(*args, **kwargs)
-            self.failures = 0
-            return result
         except Exception as e:
-            self.failures += 1
-            self.last_failure_time = time.time()
-            if self.failures >= self.failure_threshold:
-                logger.warning(f"Circuit breaker opened after {self.failures} failures")
-                self.is_open = True
+            self.record_failure()
             raise e
+        self.record_success()
+        return result
 
     def get_status(self) -> dict:
         """Get current circuit breaker status"""
         return {
+            "state": self.state,
             "is_open": self.is_open,
             "failures": self.failures,
             "last_failure_time": self.last_failure_time,
             "failure_threshold": self.failure_threshold,
             "reset_timeout": self.reset_timeout
-        } 
\ No newline at end of file
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    One CircuitBreaker per key (a miner endpoint), created on first use.
+
+    Checking a key costs a dict lookup, so dispatch can skip a dead endpoint
+    instead of waiting for its request timeout. Breakers of the least
+    recently used keys are dropped beyond max_keys (a dropped key starts
+    closed again).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_MINER_BREAKER_FAILURES,
+        reset_timeout: float = DEFAULT_MINER_BREAKER_RESET_SECONDS,
+        max_keys: int = 4096,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_keys = max_keys
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self.refused = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "CircuitBreakerRegistry":
+        """Registry configured from the CONSENSUS_MINER_BREAKER_* settings."""
+        return cls(
+            failure_threshold=getattr(
+                settings, "CONSENSUS_MINER_BREAKER_FAILURES", DEFAULT_MINER_BREAKER_FAILURES
+            ),
+            reset_timeout=getattr(
+                settings,
+                "CONSENSUS_MINER_BREAKER_RESET_SECONDS",
+                DEFAULT_MINER_BREAKER_RESET_SECONDS,
+            ),
+        )
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return (key or "").rstrip("/")
+
+    def get(self, key: str) -> CircuitBreaker:
+        key = self._key(key)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout
+            )
+            if len(self._breakers) > self.max_keys:
+                self._breakers.popitem(last=False)
+        else:
+            self._breakers.move_to_end(key)
+        return breaker
+
+    def available(self, key: str, now: Optional[float] = None) -> bool:
+        """Whether a request to key would be let through (does not change state)."""
+        breaker = self._breakers.get(self._key(key))
+        return breaker is None or breaker.available(now)
+
+    def allow_request(self, key: str, now: Optional[float] = None) -> bool:
+        """Ask to send a request to key; see CircuitBreaker.allow_request."""
+        if self.get(key).allow_request(now):
+            return True
+        self.refused += 1
+        return False
+
+    def record_success(self, key: str):
+        breaker = self._breakers.get(self._key(key))
+        if breaker is not None:
+            breaker.record_success()
+
+    def record_failure(self, key: str, now: Optional[float] = None):
+        self.get(key).record_failure(now)
+
+    def open_keys(self) -> List[str]:
+        """Keys whose breaker is open or half-open."""
+        return [key for key, breaker in self._breakers.items() if breaker.is_open]
+
+    def get_status(self) -> dict:
+        return {
+            "breakers": len(self._breakers),
+            "open": self.open_keys(),
+            "refused": self.refused,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+        }
@@ -111,6 +111,55 @@ class MetricsManager:
                 'cpu_usage_percent',
                 'CPU usage percentage',
                 registry=self._registry
+            ),
+            'score_store_bytes': Gauge(
+                'score_store_bytes',
+                'Approximate memory held by the validator score store in bytes',
+                registry=self._registry
+            ),
+            'score_store_slots': Gauge(
+                'score_store_slots',
+                'Number of slots retained in the validator score store',
+                registry=self._registry
+            ),
+            'http_pool_connections': Gauge(
+                'http_pool_connections',
+                'Connections held by the shared HTTP pool',
+                registry=self._registry
+            ),
+            'http_pool_in_flight': Gauge(
+                'http_pool_in_flight',
+                'Requests in flight on the shared HTTP pool',
+                registry=self._registry
+            ),
+            'http_pool_requests': Gauge(
+                'http_pool_requests',
+                'Requests sent through the shared HTTP pool, by outcome',
+                ['status'],
+                registry=self._registry
+            ),
+            'ingress_queue_depth': Gauge(
+                'ingress_queue_depth',
+                'Validator API requests running or queued, by ingress lane',
+                ['lane'],
+                registry=self._registry
+            ),
+            'ingress_dropped_total': Counter(
+                'ingress_dropped_total',
+                'Validator API requests rejected with 429, by ingress lane and reason',
+                ['lane', 'reason'],
+                registry=self._registry
+            ),
+            'replay_filter_lookups': Gauge(
+                'replay_filter_lookups',
+                'Incoming P2P broadcasts checked by the replay filter, by result',
+                ['result'],
+                registry=self._registry
+            ),
+            'replay_filter_entries': Gauge(
+                'replay_filter_entries',
+                'Broadcast keys held in the replay filter LRU',
+                registry=self._registry
             )
         }
     
@@ -169,6 +218,25 @@ class MetricsManager:
         """Update CPU usage."""
         self._metrics['cpu_usage_percent'].set(cpu_percent)
     
+    def update_score_store_usage(self, memory_bytes: int, slots: int):
+        """Update score store memory footprint and retained slot count."""
+        self._metrics['score_store_bytes'].set(memory_bytes)
+        self._metrics['score_store_slots'].set(slots)
+    
+    def update_http_pool_usage(self, stats: Dict):
+        """Update shared HTTP pool connection and request figures."""
+        self._metrics['http_pool_connections'].set(stats.get('open_connections', 0))
+        self._metrics['http_pool_in_flight'].set(stats.get('in_flight', 0))
+        errors = stats.get('errors', 0)
+        self._metrics['http_pool_requests'].labels(status='success').set(stats.get('requests', 0) - errors)
+        self._metrics['http_pool_requests'].labels(status='failure').set(errors)
+    
+    def update_replay_filter_usage(self, stats: Dict):
+        """Update replay filter hit, miss and size figures."""
+        self._metrics['replay_filter_lookups'].labels(result='hit').set(stats.get('hits', 0))
+        self._metrics['replay_filter_lookups'].labels(result='miss').set(stats.get('misses', 0))
+        self._metrics['replay_filter_entries'].set(stats.get('entries', 0))
+    
     def record_task_send(self, success: bool):
         """Record a task send attempt."""
         status = 'success' if success else 'failure'
@@ -269,4 +337,8 @@ def update_memory_usage(memory_bytes: int):
 
 def update_cpu_usage(cpu_percent: float):
     """Update CPU usage."""
-    metrics_manager.update_cpu_usage(cpu_percent) 
\ No newline at end of file
+    metrics_manager.update_cpu_usage(cpu_percent)
+
+def update_score_store_usage(memory_bytes: int, slots: int):
+    """Update score store memory footprint."""
+    metrics_manager.update_score_store_usage(memory_bytes, slots) 
\ No newline at end of file
@@ -1,7 +1,7 @@
 import time
 import logging
 from typing import Optional
-from collections import deque
+from collections import OrderedDict, deque
 
 logger = logging.getLogger(__name__)
 
@@ -40,4 +40,77 @@ class RateLimiter:
             "max_requests": self.max_requests,
             "time_window": self.time_window,
             "oldest_request": self.requests[0] if self.requests else None
-        } 
\ No newline at end of file
+        } 
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens/s, holding at most `burst`."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic() if now is None else now
+
+    def take(self, now: Optional[float] = None) -> float:
+        """
+        Take one token.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class PeerRateLimiter:
+    """
+    Rate limiter with one token bucket per source (peer address or UID).
+
+    Each request costs O(1); buckets of the least recently seen sources are
+    dropped beyond max_sources (a dropped source starts again with a full
+    bucket). A rate of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: float, max_sources: int = 4096):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.max_sources = max_sources
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.limited = 0
+
+    def acquire(self, source: str, now: Optional[float] = None) -> float:
+        """
+        Take a token from a source's bucket.
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds to wait
+        """
+        if self.rate <= 0:
+            return 0.0
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            bucket = self._buckets[source] = TokenBucket(self.rate, self.burst, now)
+            if len(self._buckets) > self.max_sources:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(source)
+        wait = bucket.take(now)
+        if wait:
+            self.limited += 1
+        return wait
+
+    def get_status(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "sources": len(self._buckets),
+            "limited": self.limited,
+        }
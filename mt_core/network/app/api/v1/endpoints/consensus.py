@@ -21,7 +21,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, ValidationError
 
 # Import các kiểu dữ liệu và node từ SDK
-from mt_aptos.core.datatypes import (
+from mt_core.core.datatypes import (
     ValidatorScore,
     ValidatorInfo,
     ScoreSubmissionPayload,
@@ -35,7 +35,6 @@ from mt_core.consensus.scoring import canonical_json_serialize
 
 # Updated imports for Core blockchain
 from web3 import Web3
-from eth_account import Account
 from eth_utils import to_checksum_address
 
 # Remove Aptos SDK imports
@@ -48,6 +47,8 @@ from eth_utils import to_checksum_address
 import nacl.signing
 import nacl.exceptions
 
+from mt_core.network.signature_verifier import SCHEME_ETH, VerificationRequest
+
 # Add missing imports for Core blockchain
 import binascii
 
@@ -84,15 +85,20 @@ router = APIRouter(prefix="/consensus", tags=["Consensus P2P"])
 logger = logging.getLogger(__name__)
 
 
-# --- Hàm xác thực chữ ký (Đã sửa đổi cho Aptos) ---
+# --- Hàm xác thực chữ ký ---
 async def verify_payload_signature(
     receiver_node: "ValidatorNode",  # Node đang nhận request
     payload: ScoreSubmissionPayload,  # Dữ liệu nhận được
 ) -> bool:
-    """Xác minh chữ ký và Public Key trong payload nhận được từ một peer."""
+    """Xác minh chữ ký và Public Key trong payload nhận được từ một peer.
+
+    The check runs on the node's SignatureVerifier: payloads arriving together
+    are verified in batches on worker threads, key -> address derivations and
+    recently verified (digest, signature) pairs are cached, so replays and
+    bursts from many peers do not block the event loop.
+    """
     signature_hex = payload.signature
-    submitter_public_key_hex = payload.public_key_hex  # Fix field name
-    scores_list_dict = payload.scores  # Đây là list các dict
+    submitter_public_key_hex = payload.public_key_hex
     submitter_uid = payload.submitter_validator_uid  # UID của người gửi
 
     if not signature_hex or not submitter_public_key_hex:
@@ -101,8 +107,6 @@ async def verify_payload_signature(
         )
         return False
 
-    logger.debug(f"Verifying signature for payload from validator {submitter_uid}...")
-
     # --- Lấy thông tin người gửi đã biết từ state của node NHẬN ---
     submitter_info = receiver_node.validators_info.get(submitter_uid)
     if not submitter_info:
@@ -112,111 +116,51 @@ async def verify_payload_signature(
         return False  # Từ chối nếu không biết người gửi
 
     try:
-        # 1. Lấy address dự kiến từ thông tin người gửi đã biết
-        submitter_address = submitter_info.address
-        if not submitter_address.startswith("0x"):
-            logger.warning(
-                f"SigVerifyFail (Sender: {submitter_uid}): Expected Aptos address format starting with 0x, got {submitter_address}"
-            )
-            return False
-
-        # 2. Load Public Key từ payload
-        try:
-            public_key_bytes = binascii.unhexlify(submitter_public_key_hex)
-            # Create an Aptos SDK PublicKey object
-            received_public_key = PublicKey(public_key_bytes)
-        except (binascii.Error, ValueError, TypeError) as key_load_e:
-            logger.error(
-                f"SigVerifyFail (Sender: {submitter_uid}): Failed to load/decode public key from hex '{submitter_public_key_hex[:10]}...': {key_load_e}"
-            )
-            return False
-        except Exception as e:
-            logger.error(
-                f"SigVerifyFail (Sender: {submitter_uid}): Unexpected error processing received public key: {e}"
-            )
-            return False
-
-        # 3. Xác minh Public Key: Tạo địa chỉ từ public key và so sánh với địa chỉ đã biết
-        try:
-            # Create an Account with the received public key to get its address
-            temp_account = Account(None, received_public_key)
-            received_address = "0x" + temp_account.address().hex()
-
-            # Compare the address derived from the received public key with the known address
-            if received_address != submitter_address:
-                logger.warning(
-                    f"SigVerifyFail (Sender: {submitter_uid}): Address MISMATCH!"
-                )
-                logger.warning(
-                    f" -> Receiver expected address {submitter_address} (from metagraph)"
-                )
-                logger.warning(
-                    f" -> Derived address from public key is {received_address}"
-                )
-                return False
-
-            logger.debug(
-                f"Submitter public key matches expected address from known validator info."
-            )
-        except Exception as addr_e:
-            logger.error(
-                f"SigVerifyFail (Sender: {submitter_uid}): Error verifying address from public key: {addr_e}"
-            )
-            return False
-
-        # 4. Xác minh Chữ ký
-        try:
-            # Serialize data to bytes for verification
-            scores_objects_from_payload = payload.scores
-
-            # Check if the list of scores is empty after Pydantic parsing
-            if not scores_objects_from_payload:
-                logger.warning(
-                    f"SigVerifyFail (Sender: {submitter_uid}): Payload contained no valid score objects after Pydantic parsing."
-                )
-
-            # Serialize the score objects to JSON string
-            data_str_from_payload = canonical_json_serialize(
-                scores_objects_from_payload
-            )
-            data_to_verify_bytes = data_str_from_payload.encode("utf-8")
-            signature_bytes = binascii.unhexlify(signature_hex)
-
-            # Verify using Aptos SDK PublicKey's verify method
-            is_valid = received_public_key.verify(data_to_verify_bytes, signature_bytes)
-
-            if is_valid:
-                logger.info(
-                    f"Signature verification SUCCESSFUL for payload from {submitter_uid}"
-                )
-            else:
-                logger.warning(
-                    f"SigVerifyFail (Sender: {submitter_uid}): Invalid signature. Data or signature mismatch."
-                )
-                logger.debug(
-                    f" - Data used for verification: {data_str_from_payload[:200]}..."
-                )
-                logger.debug(f" - Signature hex received: {signature_hex}")
-
-            return is_valid
-
-        except binascii.Error:
-            logger.error(
-                f"SigVerifyFail (Sender: {submitter_uid}): Invalid signature hex format."
-            )
-            return False
-        except Exception as verify_e:
-            logger.exception(
-                f"SigVerifyFail (Sender: {submitter_uid}): Error during signature verification step: {verify_e}"
-            )
-            return False
+        public_key_bytes = binascii.unhexlify(submitter_public_key_hex)
+        signature_bytes = binascii.unhexlify(signature_hex)
+    except (binascii.Error, ValueError, TypeError) as e:
+        logger.error(
+            f"SigVerifyFail (Sender: {submitter_uid}): Invalid public key or signature hex: {e}"
+        )
+        return False
 
-    except Exception as outer_e:
+    if not payload.scores:
+        logger.warning(
+            f"SigVerifyFail (Sender: {submitter_uid}): Payload contained no score objects."
+        )
+
+    # Public key phải sinh ra đúng địa chỉ đã biết (cách chain tính địa chỉ)
+    verifier = receiver_node.signature_verifier
+    if verifier.address_of(public_key_bytes).lower() != submitter_info.address.lower():
+        logger.warning(
+            f"SigVerifyFail (Sender: {submitter_uid}): Public key does not match address {submitter_info.address}."
+        )
+        return False
+
+    try:
+        # Chữ ký trên dữ liệu canonical phải khôi phục ra cùng địa chỉ đó
+        is_valid = await verifier.verify(
+            VerificationRequest(
+                scheme=SCHEME_ETH,
+                message=canonical_json_serialize(payload.scores).encode("utf-8"),
+                signature=signature_bytes,
+                expected_address=submitter_info.address,
+            )
+        )
+    except Exception as e:
         logger.exception(
-            f"SigVerifyFail (Sender: {submitter_uid}): Unexpected outer error during verification: {outer_e}"
+            f"SigVerifyFail (Sender: {submitter_uid}): Error during signature verification: {e}"
         )
         return False
 
+    if is_valid:
+        logger.debug(f"Signature verification SUCCESSFUL for payload from {submitter_uid}")
+    else:
+        logger.warning(
+            f"SigVerifyFail (Sender: {submitter_uid}): Invalid signature or address mismatch."
+        )
+    return is_valid
+
 
 # --- API Endpoint ---
 @router.post(
@@ -282,21 +226,3 @@ async def receive_scores(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Server error processing scores submission: {str(e)}",
         )
-
-
-# Fallback implementations for missing functions
-def canonical_json_serialize(data):
-    """Fallback canonical JSON serialization"""
-    import json
-
-    return json.dumps(data, sort_keys=True, separators=(",", ":"))
-
-
-# Dummy PublicKey class for Core blockchain
-class PublicKey:
-    def __init__(self, public_key_bytes):
-        self.public_key_bytes = public_key_bytes
-
-    def verify(self, message_bytes, signature_bytes):
-        """Dummy verification - should implement proper Core blockchain signature verification"""
-        return True  # Placeholder
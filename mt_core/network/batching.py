@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Request Batching Module
+
+Batched task and result exchange between validators and miners:
+- Miners accept several tasks in one POST to /receive-tasks, validators
+  several results in one POST to /v1/miner/submit_results; both answer
+  per item, so one bad or rejected entry does not fail the others
+- Support is advertised in a response header (the batch size the peer
+  accepts), so each side switches to batches only once the other side has
+  shown it understands them, and falls back to single requests on a 404
+- Miners also advertise how many tasks they run at once, so validators can
+  keep several tasks in flight on a miner with spare workers
+- RequestCoalescer collects items headed for the same peer and sends them
+  together, once per event-loop iteration or after a short linger
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TASK_BATCH_ENDPOINT = "/receive-tasks"
+RESULT_BATCH_ENDPOINT = "/v1/miner/submit_results"
+BATCH_TASKS_HEADER = "X-MT-Batch-Tasks"
+BATCH_RESULTS_HEADER = "X-MT-Batch-Results"
+MINER_CAPACITY_HEADER = "X-MT-Miner-Capacity"
+
+DEFAULT_MAX_BATCH = 32
+
+
+def batch_limit(header_value: Optional[str]) -> int:
+    """Batch size advertised in a BATCH_*_HEADER value (0 if none or invalid)."""
+    try:
+        return max(0, int(header_value)) if header_value else 0
+    except ValueError:
+        return 0
+
+
+def partial_results(
+    item_ids: List[str], accepted: List[str], rejected: Dict[str, str]
+) -> List[bool]:
+    """Per-item outcome of a batch from the accepted IDs in its response."""
+    accepted_ids = set(accepted)
+    return [item_id in accepted_ids and item_id not in rejected for item_id in item_ids]
+
+
+class RequestCoalescer:
+    """
+    Groups items by destination and sends each group as one batch.
+
+    submit() resolves with the item's own outcome. A group is sent when it
+    reaches its size limit, or max_delay seconds after its first item
+    (0 = at the next event-loop iteration).
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[Hashable, List[Any]], Awaitable[List[bool]]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = 0.0,
+        limit_of: Optional[Callable[[Hashable], int]] = None,
+        name: str = "",
+    ):
+        """
+        Args:
+            send_batch: Sends (destination, items) and returns one bool per item
+            max_batch: Largest batch sent to any destination
+            max_delay: Seconds the first item of a group waits for company
+            limit_of: Batch size a destination accepts (capped by max_batch)
+            name: Prefix for log messages
+        """
+        self.send_batch = send_batch
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self.limit_of = limit_of
+        self.name = name
+
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.Handle] = {}
+
+        self.batches = 0
+        self.items = 0
+
+    def _limit(self, key: Hashable) -> int:
+        if self.limit_of is None:
+            return self.max_batch
+        return max(1, min(self.max_batch, self.limit_of(key) or self.max_batch))
+
+    async def submit(self, key: Hashable, item: Any) -> bool:
+        """Queue an item for a destination and wait for its outcome."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        group = self._pending.setdefault(key, [])
+        group.append((item, future))
+
+        if len(group) >= self._limit(key):
+            self._start_flush(key)
+        elif key not in self._timers:
+            if self.max_delay > 0:
+                self._timers[key] = loop.call_later(self.max_delay, self._start_flush, key)
+            else:
+                self._timers[key] = loop.call_soon(self._start_flush, key)
+        return await future
+
+    def _start_flush(self, key: Hashable):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        if group:
+            asyncio.create_task(self._flush(key, group))
+
+    async def _flush(self, key: Hashable, group: List[Tuple[Any, asyncio.Future]]):
+        items = [item for item, _ in group]
+        self.batches += 1
+        self.items += len(items)
+        try:
+            outcomes = await self.send_batch(key, items)
+        except Exception as e:
+            logger.warning(f"{self.name} Batch of {len(items)} to {key} failed: {e}")
+            outcomes = [False] * len(items)
+        for (_, future), outcome in zip(group, outcomes):
+            if not future.done():
+                future.set_result(bool(outcome))
+        for _, future in group[len(outcomes):]:
+            if not future.done():
+                future.set_result(False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch": self.items / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Compute Backend Module
+
+Where a miner's process_task runs:
+- ThreadBackend runs it on a thread pool (or awaits it if it is a coroutine
+  function); fine for I/O-bound work or libraries that release the GIL
+- ProcessBackend runs it in a process pool so CPU-bound inference can use
+  every core. The miner is sent to each worker once, where setup_worker()
+  loads its models; tasks then call its methods by name instead of pickling
+  the miner with every task
+- Results above a size threshold come back through shared memory instead of
+  the executor's result pipe. Buffer-protocol payloads (numpy arrays,
+  bytearrays, anywhere in the result, or a bytes result) are copied into the
+  segment as raw bytes with pickle protocol 5 out-of-band buffers; only the
+  rest of the result is pickled. Other objects, such as bytes nested in a
+  dict, are still pickled into the segment. A segment stays registered
+  with the resource tracker until the parent unlinks it, and results of
+  cancelled calls are unlinked when the worker finishes, so no segment
+  outlives the miner
+- Task and transfer counters for /health
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODE_ASYNC = "async"
+MODE_PROCESS = "process"
+
+DEFAULT_WORKERS = 4
+DEFAULT_SHM_THRESHOLD = 1 << 20  # Results of 1 MiB or more use shared memory
+
+SETUP_HOOK = "setup_worker"
+
+# Per-process state of ProcessBackend workers
+_worker_target: Any = None
+
+
+def _init_worker(target: Any):
+    """ProcessPoolExecutor initializer: keep the target and load its models."""
+    global _worker_target
+    _worker_target = target
+    setup = getattr(target, SETUP_HOOK, None)
+    if setup is not None:
+        setup()
+
+
+def _invoke(fn: Any, args: Tuple, shm_threshold: int) -> Tuple:
+    """Run one call in a worker and pack its result for the trip back."""
+    if isinstance(fn, str):
+        fn = getattr(_worker_target, fn)
+    if asyncio.iscoroutinefunction(fn):
+        result = asyncio.run(fn(*args))
+    else:
+        result = fn(*args)
+    return _pack(result, shm_threshold)
+
+
+def _pack(result: Any, shm_threshold: int) -> Tuple:
+    """
+    Split a result into a pickle stream and raw buffers.
+
+    Returns:
+        ("inline", kind, data, buffers) for small results, or
+        ("shm", kind, name, data size, buffer sizes) once the segment holds
+        the pickle stream followed by each raw buffer
+    """
+    if isinstance(result, bytes):
+        kind, data, raw = "bytes", b"", [memoryview(result)]
+    else:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+        kind, raw = "pickle", [buffer.raw() for buffer in buffers]
+    sizes = [view.nbytes for view in raw]
+    if shm_threshold <= 0 or len(data) + sum(sizes) < shm_threshold:
+        copy = bytes if kind == "bytes" else bytearray
+        return ("inline", kind, data, [copy(view) for view in raw])
+
+    # Left registered with the (shared) resource tracker: if the result never
+    # reaches the parent, the tracker unlinks the block when the miner exits
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) + sum(sizes)))
+    try:
+        shm.buf[: len(data)] = data
+        offset = len(data)
+        for view, size in zip(raw, sizes):
+            shm.buf[offset : offset + size] = view
+            offset += size
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return ("shm", kind, shm.name, len(data), sizes)
+
+
+def _load(kind: str, data: bytes, buffers: List[Any]) -> Any:
+    if kind == "bytes":
+        return bytes(buffers[0])
+    return pickle.loads(data, buffers=buffers)
+
+
+def _unpack(packed: Tuple) -> Any:
+    if packed[0] == "inline":
+        _, kind, data, buffers = packed
+        return _load(kind, data, buffers)
+    _, kind, name, data_size, sizes = packed
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:data_size])
+        # Copied out so the block can be unlinked; bytearrays keep arrays writable
+        copy = bytes if kind == "bytes" else bytearray
+        buffers, offset = [], data_size
+        for size in sizes:
+            buffers.append(copy(shm.buf[offset : offset + size]))
+            offset += size
+    finally:
+        shm.close()
+        shm.unlink()
+    return _load(kind, data, buffers)
+
+
+def _discard(future: Future):
+    """Done callback for a call nobody awaits any more: free its segment."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    packed = future.result()
+    if packed[0] != "shm":
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=packed[2])
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+class ThreadBackend:
+    """
+    Runs calls on a thread pool; coroutine functions are awaited directly.
+
+    If a target is given, its setup_worker() runs once on the pool before
+    the first call.
+    """
+
+    mode = MODE_ASYNC
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, target: Any = None, name: str = ""):
+        self.workers = max(1, workers)
+        self.target = target
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._ready: Optional[asyncio.Future] = None
+        self.calls = 0
+
+    def _start(self) -> asyncio.Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="miner-compute"
+            )
+        if self._ready is None:
+            setup = getattr(self.target, SETUP_HOOK, None) or (lambda: None)
+            self._ready = asyncio.get_running_loop().run_in_executor(self._executor, setup)
+        return self._ready
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) off the event loop."""
+        await self._start()
+        self.calls += 1
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._ready = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "workers": self.workers, "calls": self.calls}
+
+
+class ProcessBackend:
+    """
+    Runs calls in a process pool whose workers each hold a copy of the target.
+
+    Bound methods of the target are sent by name and run on the worker's
+    copy, so models loaded by setup_worker() stay loaded across tasks. Other
+    callables must be picklable module-level functions.
+    """
+
+    mode = MODE_PROCESS
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        target: Any = None,
+        shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+        start_method: Optional[str] = None,
+        name: str = "",
+    ):
+        """
+        Args:
+            workers: Worker processes
+            target: Object copied to each worker (its setup_worker() runs there)
+            shm_threshold: Pickled result size, in bytes, from which results
+                come back through shared memory (0 disables it)
+            start_method: multiprocessing start method (platform default if None)
+            name: Prefix for log messages
+        """
+        self.workers = max(1, workers)
+        self.target = target
+        self.shm_threshold = shm_threshold
+        self.start_method = start_method
+        self.name = name
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.calls = 0
+        self.shm_transfers = 0
+        self.shm_bytes = 0
+        self.raw_bytes = 0  # Part of shm_bytes carried as raw buffers, not pickled
+        self.cancelled = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = (
+                multiprocessing.get_context(self.start_method)
+                if self.start_method
+                else None
+            )
+            # Workers must share the parent's tracker, or each would unlink
+            # its segments on exit, read or not
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.target,),
+            )
+            logger.info(f"{self.name} Started process pool with {self.workers} workers")
+        return self._executor
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) in a worker process."""
+        if self.target is not None and getattr(fn, "__self__", None) is self.target:
+            fn = fn.__name__
+        future = self._get_executor().submit(_invoke, fn, args, self.shm_threshold)
+        try:
+            packed = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The worker may still finish; its result is dropped then
+            future.add_done_callback(_discard)
+            self.cancelled += 1
+            raise
+        self.calls += 1
+        if packed[0] == "shm":
+            self.shm_transfers += 1
+            self.shm_bytes += packed[3] + sum(packed[4])
+            self.raw_bytes += sum(packed[4])
+        return _unpack(packed)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "calls": self.calls,
+            "shm_transfers": self.shm_transfers,
+            "shm_bytes": self.shm_bytes,
+            "raw_bytes": self.raw_bytes,
+            "cancelled": self.cancelled,
+        }
+
+
+def create_backend(
+    mode: str = MODE_ASYNC,
+    workers: int = DEFAULT_WORKERS,
+    target: Any = None,
+    shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+    name: str = "",
+):
+    """
+    Backend for a worker mode.
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode == MODE_ASYNC:
+        return ThreadBackend(workers, target=target, name=name)
+    if mode == MODE_PROCESS:
+        return ProcessBackend(workers, target=target, shm_threshold=shm_threshold, name=name)
+    raise ValueError(f"Unknown miner worker mode: {mode}")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+HTTP Connection Pool Module
+
+One long-lived HTTP client per node for all outbound P2P and miner traffic:
+- Keep-alive connections reused across score broadcasts, health checks and
+  task sends instead of a TCP/TLS handshake per message
+- HTTP/2 multiplexing when the optional `h2` package is installed
+  (pip install "httpx[http2]") and the peer supports it
+- Per-host limit on concurrent requests, so one slow peer cannot take the
+  whole pool
+- Request, error and connection counters for monitoring
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_MAX_PER_HOST = 10
+
+
+class HttpPool:
+    """
+    Shared pooled AsyncClient with per-host concurrency limits and metrics.
+
+    The client is created on first use (inside the running event loop) and
+    recreated if it was closed. Call sites use request()/get()/post() with
+    the same arguments as httpx; a per-call timeout overrides the default.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        name: str = "",
+    ):
+        """
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections: Connections open at once across all hosts
+            max_keepalive_connections: Idle connections kept for reuse
+            keepalive_expiry: Seconds an idle connection is kept
+            max_per_host: Requests in flight at once to the same host
+            http2: Negotiate HTTP/2 when available
+            transport: Custom transport (tests)
+            name: Prefix for log messages
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_per_host = max_per_host
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.transport = transport
+        self.name = name
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.http2_requests = 0
+        self.total_latency = 0.0
+        self.host_requests: Dict[str, int] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Any, name: str = "") -> "HttpPool":
+        """Pool configured from the HTTP_POOL_* settings."""
+        return cls(
+            max_connections=getattr(
+                settings, "HTTP_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=getattr(
+                settings,
+                "HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS",
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            keepalive_expiry=getattr(
+                settings, "HTTP_POOL_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY
+            ),
+            max_per_host=getattr(settings, "HTTP_POOL_MAX_PER_HOST", DEFAULT_MAX_PER_HOST),
+            http2=getattr(settings, "HTTP_POOL_HTTP2", True),
+            name=name,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared AsyncClient, created on first access."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+            logger.debug(
+                f"{self.name} HTTP pool opened (http2={'on' if self.http2 else 'off'})"
+            )
+        return self._client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        self.host_requests[host] = self.host_requests.get(host, 0) + 1
+        return slot
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared client.
+
+        Raises:
+            httpx.HTTPError: On transport errors and timeouts, as httpx does
+        """
+        client = self.client
+        async with self._host_slot(url):
+            self.requests += 1
+            self.in_flight += 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.total_latency += time.perf_counter() - started
+        if response.http_version == "HTTP/2":
+            self.http2_requests += 1
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def open_connections(self) -> int:
+        """Connections currently held by the pool (active and idle)."""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        return len(getattr(pool, "connections", None) or ())
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool metrics for status endpoints and monitoring."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "http2_enabled": self.http2,
+            "http2_requests": self.http2_requests,
+            "open_connections": self.open_connections(),
+            "avg_latency_ms": (
+                1000.0 * self.total_latency / self.requests if self.requests else 0.0
+            ),
+            "hosts": len(self.host_requests),
+        }
+
+    async def aclose(self):
+        """Close all pooled connections (the pool reopens on next use)."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug(f"{self.name} HTTP pool closed")
+        self._client = None
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Ingest Module
+
+Parsing of the JSON bodies the validator API receives from miners and peers:
+- Bodies are validated straight from bytes with TypeAdapters built once at
+  import, instead of json -> dict -> model on every request
+- Scores come out as ValidatorScore records ready for the score store, and
+  miner results as MinerResult
+- A JSON score broadcast with some malformed entries keeps its valid ones,
+  as before; only that rare case takes the per-entry slow path
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from ..core.datatypes import MinerResult, ValidatorScore
+
+logger = logging.getLogger(__name__)
+
+
+class IngestError(ValueError):
+    """A request body that cannot be ingested."""
+
+
+class _Payload(BaseModel):
+    # Older senders add fields such as "cycle"; they are ignored
+    model_config = ConfigDict(extra="ignore")
+
+
+class SubmittedResult(_Payload):
+    """Body of /v1/miner/submit_result (ResultModel)."""
+
+    task_id: str
+    miner_uid: str
+    result_data: Any = None
+
+
+class LegacyResult(_Payload):
+    """Body of /result."""
+
+    task_id: str
+    miner_uid: str
+    result: Any
+
+
+class _LenientResultBatch(_Payload):
+    results: List[Any]
+
+
+class ScoreEntry(_Payload):
+    task_id: str
+    miner_uid: str
+    score: float
+    timestamp: float
+
+
+class ConsensusScores(_Payload):
+    """Body of /consensus/scores; entries take the envelope's validator_uid."""
+
+    validator_uid: str
+    slot: int
+    scores: List[ScoreEntry]
+
+
+class ScoreBroadcastEnvelope(_Payload):
+    """JSON score broadcast on /consensus/receive_scores."""
+
+    broadcast_id: str
+    sender_uid: str
+    timestamp: float
+    scores: List[ValidatorScore]
+
+
+class _LenientScoreBroadcast(_Payload):
+    broadcast_id: str
+    sender_uid: str
+    timestamp: float
+    scores: List[Any]
+
+
+_SUBMITTED_RESULT = TypeAdapter(SubmittedResult)
+_LEGACY_RESULT = TypeAdapter(LegacyResult)
+_RESULT_BATCH = TypeAdapter(_LenientResultBatch)
+_CONSENSUS_SCORES = TypeAdapter(ConsensusScores)
+_SCORE_BROADCAST = TypeAdapter(ScoreBroadcastEnvelope)
+_LENIENT_SCORE_BROADCAST = TypeAdapter(_LenientScoreBroadcast)
+_VALIDATOR_SCORE = TypeAdapter(ValidatorScore)
+
+
+def _validate(adapter: TypeAdapter, body: bytes) -> Any:
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        raise IngestError(f"Invalid payload: {e.error_count()} error(s)") from e
+
+
+def parse_miner_result(body: bytes, received_at: float, legacy: bool = False) -> MinerResult:
+    """
+    Parse a miner result body.
+
+    Args:
+        body: Raw request body
+        received_at: Receive timestamp recorded on the result
+        legacy: Body uses the /result shape ("result" instead of "result_data")
+
+    Raises:
+        IngestError: If the body is not a valid result
+    """
+    if legacy:
+        payload = _validate(_LEGACY_RESULT, body)
+        result_data = payload.result
+    else:
+        payload = _validate(_SUBMITTED_RESULT, body)
+        result_data = payload.result_data if payload.result_data is not None else {}
+    return MinerResult(
+        task_id=payload.task_id,
+        miner_uid=payload.miner_uid,
+        result_data=result_data,
+        timestamp_received=received_at,
+    )
+
+
+def parse_miner_results(
+    body: bytes, received_at: float
+) -> Tuple[List[MinerResult], Dict[str, str]]:
+    """
+    Parse a /v1/miner/submit_results body; malformed entries are rejected alone.
+
+    Returns:
+        (valid results, task ID -> reason for each rejected entry)
+
+    Raises:
+        IngestError: If the body is not a result batch
+    """
+    batch = _validate(_RESULT_BATCH, body)
+    results, rejected = [], {}
+    for index, entry in enumerate(batch.results):
+        try:
+            payload = _SUBMITTED_RESULT.validate_python(entry)
+        except ValidationError:
+            task_id = entry.get("task_id") if isinstance(entry, dict) else None
+            rejected[str(task_id or f"#{index}")] = "invalid"
+            continue
+        results.append(
+            MinerResult(
+                task_id=payload.task_id,
+                miner_uid=payload.miner_uid,
+                result_data=payload.result_data if payload.result_data is not None else {},
+                timestamp_received=received_at,
+            )
+        )
+    return results, rejected
+
+
+def parse_consensus_scores(body: bytes) -> Tuple[str, int, List[ValidatorScore]]:
+    """
+    Parse a /consensus/scores body.
+
+    Returns:
+        (validator UID, slot, list of ValidatorScore)
+
+    Raises:
+        IngestError: If the body or any entry is invalid
+    """
+    payload = _validate(_CONSENSUS_SCORES, body)
+    validator_uid = payload.validator_uid
+    # Entries are already validated; construct without a second pass
+    scores = [
+        ValidatorScore.model_construct(
+            task_id=entry.task_id,
+            miner_uid=entry.miner_uid,
+            validator_uid=validator_uid,
+            score=entry.score,
+            timestamp=entry.timestamp,
+        )
+        for entry in payload.scores
+    ]
+    return validator_uid, payload.slot, scores
+
+
+def parse_score_broadcast(
+    body: bytes, name: str = ""
+) -> Tuple[str, str, List[ValidatorScore]]:
+    """
+    Parse a JSON score broadcast; malformed entries are skipped.
+
+    Returns:
+        (sender UID, broadcast ID, list of ValidatorScore)
+
+    Raises:
+        IngestError: If the envelope itself is invalid
+    """
+    try:
+        payload = _SCORE_BROADCAST.validate_json(body)
+        return payload.sender_uid, payload.broadcast_id, payload.scores
+    except ValidationError:
+        pass
+
+    envelope = _validate(_LENIENT_SCORE_BROADCAST, body)
+    scores = []
+    for entry in envelope.scores:
+        parsed = _parse_score_entry(entry)
+        if parsed is None:
+            logger.warning(
+                f"{name} Failed to parse score from {envelope.sender_uid}: {entry!r:.200}"
+            )
+            continue
+        scores.append(parsed)
+    return envelope.sender_uid, envelope.broadcast_id, scores
+
+
+def _parse_score_entry(entry: Any) -> Optional[ValidatorScore]:
+    try:
+        return _VALIDATOR_SCORE.validate_python(entry)
+    except ValidationError:
+        return None
+
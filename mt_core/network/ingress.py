@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Validator Ingress Module
+
+Admission control in front of the validator API handlers:
+- Per-source token buckets, so one noisy miner or peer cannot use up a lane
+- Priority lanes: consensus traffic and miner results each get their own
+  bounded queue and concurrency, so a flood of results never delays scores
+- Overloaded lanes answer 429 with Retry-After instead of queueing forever
+- Queue depths and drops exported as metrics
+"""
+
+import asyncio
+import logging
+import math
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from ..monitoring.rate_limiter import PeerRateLimiter
+
+logger = logging.getLogger(__name__)
+
+LANE_CONSENSUS = "consensus"
+LANE_RESULTS = "results"
+
+DEFAULT_CONSENSUS_CONCURRENCY = 32
+DEFAULT_CONSENSUS_QUEUE = 256
+DEFAULT_PEER_RATE = 50.0  # Requests per second per validator
+DEFAULT_PEER_BURST = 100
+DEFAULT_RESULTS_CONCURRENCY = 16
+DEFAULT_RESULTS_QUEUE = 512
+DEFAULT_MINER_RATE = 20.0  # Requests per second per miner
+DEFAULT_MINER_BURST = 40
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class IngressLane:
+    """
+    Bounded queue with its own concurrency for one class of requests.
+
+    At most `concurrency` requests run at once and at most `max_queue` wait
+    behind them; anything beyond that is rejected rather than queued.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        max_queue: int,
+        rate_limiter: Optional[PeerRateLimiter] = None,
+    ):
+        """
+        Args:
+            name: Lane name, used as the metric label
+            concurrency: Requests handled at once
+            max_queue: Requests allowed to wait for a free slot
+            rate_limiter: Per-source limiter applied before queueing
+        """
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.max_queue = max(0, max_queue)
+        self.rate_limiter = rate_limiter
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rate_limited = 0
+        self.queue_full = 0
+
+    @property
+    def depth(self) -> int:
+        """Requests running or waiting in this lane."""
+        return self.active + self.waiting
+
+    def is_full(self) -> bool:
+        return self.depth >= self.concurrency + self.max_queue
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a free slot in the lane and hold it while handling."""
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "depth": self.depth,
+            "capacity": self.concurrency + self.max_queue,
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "queue_full": self.queue_full,
+        }
+
+
+class IngressController:
+    """
+    HTTP middleware routing requests into lanes by path.
+
+    Paths without a lane (health, metagraph, queries) pass straight through.
+    A request is first charged to its source's token bucket, then admitted to
+    its lane if there is room; either check failing answers 429.
+    """
+
+    def __init__(
+        self,
+        lanes: Dict[str, IngressLane],
+        routes: Dict[str, str],
+        retry_after: float = DEFAULT_RETRY_AFTER,
+        metrics: Any = None,
+        name: str = "",
+    ):
+        """
+        Args:
+            lanes: Lanes by name
+            routes: Request path -> lane name
+            retry_after: Seconds suggested to clients when a lane is full
+            metrics: MetricsManager receiving queue depths and drops
+            name: Prefix for log messages
+        """
+        self.lanes = lanes
+        self.routes = routes
+        self.retry_after = retry_after
+        self.metrics = metrics
+        self.name = name
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Any,
+        routes: Dict[str, str],
+        metrics: Any = None,
+        name: str = "",
+    ) -> "IngressController":
+        """Controller with consensus and results lanes from the INGRESS_* settings."""
+        lanes = {
+            LANE_CONSENSUS: IngressLane(
+                LANE_CONSENSUS,
+                concurrency=getattr(
+                    settings, "INGRESS_CONSENSUS_CONCURRENCY", DEFAULT_CONSENSUS_CONCURRENCY
+                ),
+                max_queue=getattr(settings, "INGRESS_CONSENSUS_QUEUE", DEFAULT_CONSENSUS_QUEUE),
+                rate_limiter=PeerRateLimiter(
+                    rate=getattr(settings, "INGRESS_PEER_RATE", DEFAULT_PEER_RATE),
+                    burst=getattr(settings, "INGRESS_PEER_BURST", DEFAULT_PEER_BURST),
+                ),
+            ),
+            LANE_RESULTS: IngressLane(
+                LANE_RESULTS,
+                concurrency=getattr(
+                    settings, "INGRESS_RESULTS_CONCURRENCY", DEFAULT_RESULTS_CONCURRENCY
+                ),
+                max_queue=getattr(settings, "INGRESS_RESULTS_QUEUE", DEFAULT_RESULTS_QUEUE),
+                rate_limiter=PeerRateLimiter(
+                    rate=getattr(settings, "INGRESS_MINER_RATE", DEFAULT_MINER_RATE),
+                    burst=getattr(settings, "INGRESS_MINER_BURST", DEFAULT_MINER_BURST),
+                ),
+            ),
+        }
+        return cls(
+            lanes,
+            routes,
+            retry_after=getattr(settings, "INGRESS_RETRY_AFTER", DEFAULT_RETRY_AFTER),
+            metrics=metrics,
+            name=name,
+        )
+
+    def lane_for(self, path: str) -> Optional[IngressLane]:
+        lane_name = self.routes.get(path)
+        return self.lanes.get(lane_name) if lane_name else None
+
+    @staticmethod
+    def source_of(request: Request) -> str:
+        """Key for the per-source bucket: the client's address."""
+        return request.client.host if request.client else "unknown"
+
+    async def dispatch(self, request: Request, call_next):
+        """Starlette HTTP middleware entry point."""
+        lane = self.lane_for(request.url.path)
+        if lane is None:
+            return await call_next(request)
+
+        if lane.rate_limiter is not None:
+            wait = lane.rate_limiter.acquire(self.source_of(request))
+            if wait:
+                lane.rate_limited += 1
+                return self._reject(lane, "rate_limited", wait)
+        if lane.is_full():
+            lane.queue_full += 1
+            return self._reject(lane, "queue_full", self.retry_after)
+
+        self._report_depth(lane, 1)
+        try:
+            async with lane.slot():
+                return await call_next(request)
+        finally:
+            self._report_depth(lane)
+
+    def _reject(self, lane: IngressLane, reason: str, retry_after: float) -> JSONResponse:
+        logger.debug(
+            f"{self.name} Ingress {lane.name} lane rejected a request ({reason})"
+        )
+        if self.metrics is not None:
+            self.metrics.increment_counter(
+                "ingress_dropped_total", {"lane": lane.name, "reason": reason}
+            )
+        return JSONResponse(
+            {"status": "error", "message": f"Too many requests ({reason})"},
+            status_code=429,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def _report_depth(self, lane: IngressLane, pending: int = 0):
+        if self.metrics is not None:
+            self.metrics.set_gauge(
+                "ingress_queue_depth", lane.depth + pending, {"lane": lane.name}
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {}
+        for name, lane in self.lanes.items():
+            stats[name] = lane.stats()
+            if lane.rate_limiter is not None:
+                stats[name]["sources"] = lane.rate_limiter.get_status()["sources"]
+        return stats
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Miner Runtime Module
+
+Task execution and result delivery for BaseMiner:
+- A bounded task queue drained by a fixed number of async workers, instead
+  of one thread per received task; a full queue is reported to the caller
+  so the miner can answer 429 rather than accept work it cannot start
+- process_task runs on a compute backend: worker threads ("async" mode, or
+  awaited directly if it is a coroutine function) or a process pool
+  ("process" mode) for CPU-bound work that the GIL would serialise
+- Results go back over one pooled HTTP client with retries and backoff,
+  honouring Retry-After from a busy validator up to max_backoff, and are
+  batched per validator once it advertises batched result submission
+- Queue depth, capacity and throughput counters for /health
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from .batching import (
+    BATCH_RESULTS_HEADER,
+    RESULT_BATCH_ENDPOINT,
+    RequestCoalescer,
+    batch_limit,
+    partial_results,
+)
+from .compute_backend import (
+    DEFAULT_SHM_THRESHOLD,
+    DEFAULT_WORKERS,
+    MODE_ASYNC,
+    create_backend,
+)
+from .http_pool import HttpPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_SEND_ATTEMPTS = 3
+DEFAULT_SEND_BACKOFF = 0.5
+DEFAULT_SEND_TIMEOUT = 10.0
+DEFAULT_SEND_MAX_BACKOFF = 30.0
+DEFAULT_RESULT_BATCH_DELAY = 0.02
+
+# Statuses worth retrying; other 4xx answers will not change on a resend
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class MinerRuntime:
+    """
+    Bounded queue of tasks handled by a fixed pool of async workers.
+
+    Workers start on the first submit() inside the running event loop.
+    Each worker takes a task and awaits handler(task); compute() runs the
+    CPU part of a handler on the compute backend.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        workers: int = DEFAULT_WORKERS,
+        mode: str = MODE_ASYNC,
+        name: str = "",
+        target: Any = None,
+        shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+    ):
+        """
+        Args:
+            handler: Coroutine function handling one task end to end
+            max_queue: Tasks accepted but not yet started
+            workers: Tasks handled at once (and backend size)
+            mode: "async" (threads / coroutines) or "process" (process pool)
+            name: Prefix for log messages
+            target: Object whose methods compute() runs, set up once per
+                worker (see compute_backend)
+            shm_threshold: Result size from which "process" mode returns
+                results through shared memory
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        self.handler = handler
+        self.max_queue = max(1, max_queue)
+        self.workers = max(1, workers)
+        self.mode = mode
+        self.name = name
+        self.backend = create_backend(
+            mode, self.workers, target=target, shm_threshold=shm_threshold, name=name
+        )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks = []
+
+        self.active = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_duration = 0.0
+
+    def start(self):
+        """Create the queue and start the workers (idempotent)."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"miner-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"{self.name} Miner runtime started: {self.workers} {self.mode} workers, queue {self.max_queue}"
+        )
+
+    async def stop(self):
+        """Cancel the workers and shut the backend down; queued tasks are dropped."""
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+        self.backend.shutdown()
+
+    def submit(self, task: Any) -> bool:
+        """
+        Queue a task.
+
+        Returns:
+            True if accepted, False if the queue is full
+        """
+        self.start()
+        try:
+            self._queue.put_nowait(task)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.accepted += 1
+        return True
+
+    @property
+    def depth(self) -> int:
+        """Tasks queued or being handled."""
+        return (self._queue.qsize() if self._queue is not None else 0) + self.active
+
+    async def _worker(self):
+        while True:
+            task = await self._queue.get()
+            self.active += 1
+            started = time.perf_counter()
+            try:
+                await self.handler(task)
+                self.completed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.exception(f"{self.name} Task handler failed: {e}")
+            finally:
+                self.active -= 1
+                self.total_duration += time.perf_counter() - started
+                self._queue.task_done()
+
+    async def compute(self, fn: Callable, *args) -> Any:
+        """
+        Run fn(*args) off the event loop, on the compute backend.
+
+        Coroutine functions are awaited directly in "async" mode. In
+        "process" mode the arguments must be picklable, and fn must be a
+        method of the target or a module-level function.
+        """
+        return await self.backend.run(fn, *args)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue and worker figures published on the miner's /health."""
+        handled = self.completed + self.failed
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "active": self.active,
+            "depth": self.depth,
+            "capacity": self.max_queue + self.workers,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_task_ms": 1000.0 * self.total_duration / handled if handled else 0.0,
+            "backend": self.backend.stats(),
+        }
+
+
+class ResultSender:
+    """
+    Delivers results to validators over a shared HttpPool.
+
+    Transient failures are retried. Validators that advertise batched result
+    submission get results coalesced into one POST per flush window.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[HttpPool] = None,
+        attempts: int = DEFAULT_SEND_ATTEMPTS,
+        backoff: float = DEFAULT_SEND_BACKOFF,
+        timeout: float = DEFAULT_SEND_TIMEOUT,
+        batch_delay: float = DEFAULT_RESULT_BATCH_DELAY,
+        max_backoff: float = DEFAULT_SEND_MAX_BACKOFF,
+        name: str = "",
+    ):
+        """
+        Args:
+            pool: HTTP pool to send through (one is created if omitted)
+            attempts: Tries per request, including the first
+            backoff: Delay before the first retry, doubled on each retry
+            timeout: Per-request timeout in seconds
+            batch_delay: Seconds a result waits for others bound to the same
+                validator before its batch is sent
+            max_backoff: Longest wait between retries, whatever the backoff
+                or a validator's Retry-After asks for
+            name: Prefix for log messages
+        """
+        self.pool = pool or HttpPool(timeout=timeout, name=name)
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.name = name
+
+        self.batch_peers: Dict[str, int] = {}  # validator URL -> advertised batch size
+        self._batcher = RequestCoalescer(
+            self._send_batch,
+            max_delay=batch_delay,
+            limit_of=lambda url: self.batch_peers.get(url, 0),
+            name=name,
+        )
+
+        self.sent = 0
+        self.retries = 0
+        self.failed = 0
+
+    async def submit(self, validator_url: str, result: Dict[str, Any]) -> bool:
+        """
+        Deliver one result to a validator, batched if the validator supports it.
+
+        Returns:
+            True if the validator accepted the result
+        """
+        validator_url = validator_url.rstrip("/")
+        if validator_url in self.batch_peers:
+            return await self._batcher.submit(validator_url, result)
+        response = await self.post(f"{validator_url}/v1/miner/submit_result", result)
+        if response is None:
+            return False
+        self._learn_batch_support(validator_url, response)
+        return response.status_code < 400
+
+    async def _send_batch(self, validator_url: str, results: List[Dict[str, Any]]) -> List[bool]:
+        response = await self.post(
+            f"{validator_url}{RESULT_BATCH_ENDPOINT}", {"results": results}
+        )
+        if response is not None and response.status_code == 404:
+            # Validator dropped batch support; send these one by one
+            self.batch_peers.pop(validator_url, None)
+            return list(
+                await asyncio.gather(*(self.submit(validator_url, r) for r in results))
+            )
+        if response is None or response.status_code >= 400:
+            return [False] * len(results)
+        self._learn_batch_support(validator_url, response)
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            logger.warning(
+                f"{self.name} {validator_url} answered a result batch with an unreadable body"
+            )
+            self.failed += 1
+            return [False] * len(results)
+        return partial_results(
+            [r.get("task_id") for r in results],
+            body.get("accepted", []),
+            body.get("rejected", {}),
+        )
+
+    def _learn_batch_support(self, validator_url: str, response: httpx.Response):
+        limit = batch_limit(response.headers.get(BATCH_RESULTS_HEADER))
+        if limit > 1:
+            self.batch_peers[validator_url] = limit
+
+    async def post(self, url: str, payload: Dict[str, Any]) -> Optional[httpx.Response]:
+        """
+        POST a JSON payload, retrying on connection errors, 429 and 5xx.
+
+        Returns:
+            The last response (check its status), or None if no attempt got one
+        """
+        delay = self.backoff
+        response = None
+        for attempt in range(1, self.attempts + 1):
+            wait = delay
+            try:
+                response = await self.pool.post(url, json=payload, timeout=self.timeout)
+                if response.status_code < 400:
+                    self.sent += 1
+                    return response
+                if response.status_code not in RETRYABLE_STATUSES:
+                    logger.warning(
+                        f"{self.name} {url} rejected the request: HTTP {response.status_code} {response.text[:200]}"
+                    )
+                    break
+                wait = max(delay, _retry_after(response))
+                logger.debug(
+                    f"{self.name} {url} answered HTTP {response.status_code} (attempt {attempt}/{self.attempts})"
+                )
+            except httpx.HTTPError as e:
+                logger.debug(
+                    f"{self.name} Sending to {url} failed (attempt {attempt}/{self.attempts}): {e}"
+                )
+            if attempt < self.attempts:
+                self.retries += 1
+                await asyncio.sleep(min(wait, self.max_backoff))
+                delay *= 2
+        self.failed += 1
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sent": self.sent,
+            "retries": self.retries,
+            "failed": self.failed,
+            "batch_validators": len(self.batch_peers),
+            "batches": self._batcher.stats(),
+            "pool": self.pool.stats(),
+        }
+
+    async def aclose(self):
+        await self.pool.aclose()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return float(response.headers.get("retry-after", 0))
+    except ValueError:
+        return 0.0
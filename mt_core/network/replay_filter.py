@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Replay Filter Module
+
+Duplicate detection for incoming P2P broadcasts, checked before signature
+verification and aggregation:
+- Broadcasts are keyed by (sender, broadcast_id, digest of the raw body),
+  so a retried or re-gossiped copy costs a hash and a dictionary lookup
+- A bounded LRU holds the most recent keys exactly
+- An optional rotating bloom filter remembers keys evicted from the LRU, for
+  nodes that see more broadcasts than the LRU can hold; a false positive
+  drops one broadcast and clears once the generation rotates
+- Hit and miss counters for monitoring
+"""
+
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 8192
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+
+ReplayKey = Tuple[str, str, bytes]
+
+
+def replay_key(sender_uid: str, broadcast_id: str, body: bytes) -> ReplayKey:
+    """Key of a broadcast: sender, broadcast ID and digest of the raw body."""
+    return sender_uid, broadcast_id, hashlib.sha256(body).digest()
+
+
+class BloomFilter:
+    """
+    Two-generation bloom filter sized for `capacity` keys per generation.
+
+    When the current generation is full it becomes the previous one and a
+    fresh generation starts, so memory stays fixed and old keys age out.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_BLOOM_ERROR_RATE):
+        self.capacity = max(1, capacity)
+        self.bits = max(
+            8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self._current = bytearray((self.bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+
+    def _positions(self, key: ReplayKey):
+        sender_uid, broadcast_id, digest = key
+        h = hashlib.blake2b(
+            f"{sender_uid}\x00{broadcast_id}\x00".encode() + digest, digest_size=16
+        ).digest()
+        h1 = int.from_bytes(h[:8], "little")
+        h2 = int.from_bytes(h[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key: ReplayKey):
+        if self._count >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(len(self._previous))
+            self._count = 0
+        for position in self._positions(key):
+            self._current[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: ReplayKey) -> bool:
+        positions = self._positions(key)
+        return any(
+            all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+            for bits in (self._current, self._previous)
+        )
+
+
+class ReplayFilter:
+    """
+    Remembers recently ingested broadcasts so duplicates can be dropped early.
+
+    check() records a new key and reports whether it was already known;
+    forget() removes a key whose broadcast was not ingested after all, so a
+    retry of it is processed again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        bloom_capacity: int = 0,
+        bloom_error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+    ):
+        """
+        Args:
+            max_entries: Keys held exactly in the LRU
+            bloom_capacity: Evicted keys remembered per bloom generation
+                (0 disables the bloom filter)
+            bloom_error_rate: Target false-positive rate of the bloom filter
+        """
+        self.max_entries = max(1, max_entries)
+        self._recent: "OrderedDict[ReplayKey, None]" = OrderedDict()
+        self._bloom: Optional[BloomFilter] = None
+        if bloom_capacity > 0:
+            self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+
+        self.hits = 0
+        self.bloom_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ReplayFilter":
+        """Filter configured from the REPLAY_FILTER_* settings."""
+        return cls(
+            max_entries=getattr(settings, "REPLAY_FILTER_SIZE", DEFAULT_MAX_ENTRIES),
+            bloom_capacity=getattr(settings, "REPLAY_FILTER_BLOOM_CAPACITY", 0),
+            bloom_error_rate=getattr(
+                settings, "REPLAY_FILTER_BLOOM_ERROR_RATE", DEFAULT_BLOOM_ERROR_RATE
+            ),
+        )
+
+    def check(self, key: ReplayKey) -> bool:
+        """
+        Record a broadcast key.
+
+        Returns:
+            True if the key was already seen (a duplicate), False if it is new
+        """
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            self.hits += 1
+            return True
+        if self._bloom is not None and key in self._bloom:
+            self.bloom_hits += 1
+            return True
+
+        self.misses += 1
+        self._recent[key] = None
+        if len(self._recent) > self.max_entries:
+            evicted, _ = self._recent.popitem(last=False)
+            if self._bloom is not None:
+                self._bloom.add(evicted)
+        return False
+
+    def forget(self, key: ReplayKey):
+        """Drop a key recorded by check() whose broadcast was rejected or failed."""
+        self._recent.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._recent),
+            "hits": self.hits + self.bloom_hits,
+            "bloom_hits": self.bloom_hits,
+            "misses": self.misses,
+            "bloom": self._bloom is not None,
+        }
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Result Cache Module
+
+Opt-in cache of deterministic miner results:
+- Tasks are keyed by a digest of the canonical JSON of the fields that
+  determine their output (for example prompt and seed), so the same task
+  sent by several validators or in several slots is computed once
+- A bounded in-memory LRU in front of an optional disk tier; both evict the
+  least recently used entries when over their byte budget and expire
+  entries older than the TTL
+- Identical tasks arriving while the first is still being computed wait for
+  its result instead of computing it again
+- Hit and miss counters for /health
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMORY_BYTES = 64 << 20
+DEFAULT_MAX_DISK_BYTES = 1 << 30
+DEFAULT_TTL = 24 * 3600.0
+
+
+def task_digest(values: Mapping[str, Any], fields: Iterable[str]) -> Optional[str]:
+    """
+    Digest of the given fields of a task.
+
+    Returns:
+        Hex SHA-256 of the canonical JSON of the fields, or None if a field is
+        missing or not JSON-serialisable (the task is then not cached)
+    """
+    selected = {}
+    for field in fields:
+        if field not in values:
+            return None
+        selected[field] = values[field]
+    if not selected:
+        return None
+    try:
+        canonical = json.dumps(
+            selected, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Memory and disk cache of JSON-serialisable results keyed by task digest.
+
+    Not thread-safe: use it from the event loop, as BaseMiner does.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        ttl: float = DEFAULT_TTL,
+        name: str = "",
+    ):
+        """
+        Args:
+            max_memory_bytes: Budget of the in-memory tier (serialised size)
+            cache_dir: Directory of the disk tier (None disables it)
+            max_disk_bytes: Budget of the disk tier
+            ttl: Seconds an entry stays valid (0 = no expiry)
+            name: Prefix for log messages
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.name = name
+
+        # key -> (stored_at, serialised result)
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._memory_bytes = 0
+        # key -> (stored_at, size); access order kept for eviction
+        self._disk: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load_disk_index()
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - stored_at > self.ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_disk_index(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[: -len(".json")], stat.st_size))
+        for stored_at, key, size in sorted(entries):
+            self._disk[key] = (stored_at, size)
+            self._disk_bytes += size
+        self._evict_disk(time.time())
+        if self._disk:
+            logger.info(
+                f"{self.name} Result cache: {len(self._disk)} entries on disk ({self._disk_bytes} bytes)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached result for a key, or None."""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if not self._expired(entry[0], now):
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(entry[1])
+            self._drop_memory(key)
+
+        entry = self._disk.get(key)
+        if entry is not None:
+            data = None
+            if not self._expired(entry[0], now):
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                except OSError:
+                    pass
+            if data is None:
+                self._drop_disk(key)
+            else:
+                self._disk.move_to_end(key)
+                self._store_memory(key, entry[0], data)
+                self.disk_hits += 1
+                return json.loads(data)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: Any):
+        """Store a result; results that are not JSON-serialisable are skipped."""
+        try:
+            data = json.dumps(result, separators=(",", ":")).encode()
+        except (TypeError, ValueError):
+            logger.debug(f"{self.name} Result for {key[:12]} is not JSON-serialisable, not cached")
+            return
+        now = time.time()
+        self._store_memory(key, now, data)
+        if self.cache_dir and len(data) <= self.max_disk_bytes:
+            try:
+                tmp = f"{self._path(key)}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self._path(key))
+            except OSError as e:
+                logger.warning(f"{self.name} Could not write result cache entry: {e}")
+                return
+            self._drop_disk(key, unlink=False)
+            self._disk[key] = (now, len(data))
+            self._disk_bytes += len(data)
+            self._evict_disk(now)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Cached result for a key, or compute, store and return it.
+
+        Callers asking for a key that is being computed wait for that result.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.misses -= 1  # Counted above; this one is served without computing
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters get it; do not log it as unretrieved
+            raise
+        else:
+            self.put(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store_memory(self, key: str, stored_at: float, data: bytes):
+        if len(data) > self.max_memory_bytes:
+            return
+        self._drop_memory(key)
+        self._memory[key] = (stored_at, data)
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            evicted = next(iter(self._memory))
+            self._drop_memory(evicted)
+            self.evictions += 1
+
+    def _drop_memory(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+    def _drop_disk(self, key: str, unlink: bool = True):
+        entry = self._disk.pop(key, None)
+        if entry is None:
+            return
+        self._disk_bytes -= entry[1]
+        if unlink:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def _evict_disk(self, now: float):
+        for key in [k for k, (stored_at, _) in self._disk.items() if self._expired(stored_at, now)]:
+            self._drop_disk(key)
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            self._drop_disk(next(iter(self._disk)))
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits + self.coalesced
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Score Wire Codec Module
+
+Compact binary encoding for P2P score broadcasts (/consensus/receive_scores):
+- UIDs, task IDs and the broadcast ID are interned into a per-message string
+  table, stored as one NUL-separated UTF-8 block
+- Each score is a fixed 36-byte record of table indices and doubles
+- The body is optionally zlib-compressed
+- The signature covers the uncompressed canonical body, so it does not depend
+  on whether compression was used
+
+Peers advertise support with an `Accept-Post` response header; senders keep
+posting JSON to peers that never advertised it.
+
+Wire layout:
+    MAGIC | version u8 | flags u8 | signature (uleb128 length + bytes) | body
+
+Body layout (BCS, see mt_core/bcs.py):
+    string table: uleb128 count, then the NUL-joined strings (uleb128 length
+        + UTF-8 bytes)
+    sender index, broadcast_id index: uleb128
+    timestamp: u64
+    scores: uleb128 count, then count fixed records "<IIIddd"
+        (task, miner, validator index, score, timestamp, deviation or NaN)
+"""
+
+import logging
+import math
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from ..bcs import BCSDecoder, BCSEncoder, BCSError
+from ..core.datatypes import ValidatorScore
+
+logger = logging.getLogger(__name__)
+
+SCORE_BATCH_CONTENT_TYPE = "application/x-mt-scores"
+JSON_CONTENT_TYPE = "application/json"
+ACCEPT_POST_HEADER = "Accept-Post"
+
+MAGIC = b"MTSC"
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+COMPRESS_THRESHOLD = 512  # Smaller bodies are not worth compressing
+MAX_BODY_BYTES = 16 * 1024 * 1024  # Decompression limit
+
+_SEPARATOR = "\0"
+_RECORD = struct.Struct("<IIIddd")
+
+
+class ScoreCodecError(ValueError):
+    """Malformed or unsupported binary score message."""
+
+
+@dataclass
+class ScoreBroadcast:
+    """One validator's score broadcast, independent of the wire format."""
+
+    sender_uid: str
+    broadcast_id: str
+    timestamp: int
+    scores: List[ValidatorScore] = field(default_factory=list)
+    signature: Optional[bytes] = None
+
+    def to_json_payload(self) -> Dict[str, Any]:
+        """The JSON form posted to peers without binary support."""
+        return {
+            "broadcast_id": self.broadcast_id,
+            "sender_uid": self.sender_uid,
+            "scores": [
+                {
+                    "task_id": score.task_id,
+                    "miner_uid": score.miner_uid,
+                    "score": score.score,
+                    "timestamp": score.timestamp,
+                    "validator_uid": score.validator_uid,
+                    "cycle": getattr(score, "cycle", 0),
+                }
+                for score in self.scores
+            ],
+            "timestamp": self.timestamp,
+        }
+
+
+def canonical_bytes(broadcast: ScoreBroadcast) -> bytes:
+    """
+    Uncompressed body of a broadcast; this is what gets signed.
+
+    Strings enter the table in order of first use, so the same broadcast
+    always produces the same bytes.
+
+    Raises:
+        ScoreCodecError: If a string contains a NUL character
+    """
+    table: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = table.get(value)
+        if index is None:
+            index = table[value] = len(table)
+        return index
+
+    sender = intern(broadcast.sender_uid)
+    broadcast_id = intern(broadcast.broadcast_id)
+    records = bytearray()
+    for score in broadcast.scores:
+        deviation = score.deviation
+        records += _RECORD.pack(
+            intern(score.task_id),
+            intern(score.miner_uid),
+            intern(score.validator_uid),
+            score.score,
+            score.timestamp,
+            math.nan if deviation is None else deviation,
+        )
+
+    strings = _SEPARATOR.join(table)
+    if strings.count(_SEPARATOR) != len(table) - 1:
+        raise ScoreCodecError("Strings in a binary score message cannot contain NUL")
+
+    encoder = BCSEncoder()
+    encoder.encode_uleb128(len(table)).encode_string(strings)
+    encoder.encode_uleb128(sender).encode_uleb128(broadcast_id)
+    encoder.encode_u64(max(0, int(broadcast.timestamp)))
+    encoder.encode_uleb128(len(broadcast.scores))
+    return encoder.to_bytes() + bytes(records)
+
+
+def encode_score_broadcast(
+    broadcast: ScoreBroadcast,
+    compress: bool = True,
+    body: Optional[bytes] = None,
+) -> bytes:
+    """
+    Binary wire form of a broadcast.
+
+    Args:
+        broadcast: Broadcast to encode (its signature is included as is)
+        compress: zlib-compress bodies above COMPRESS_THRESHOLD
+        body: Canonical bytes if already computed (e.g. for signing)
+    """
+    if body is None:
+        body = canonical_bytes(broadcast)
+    flags = 0
+    if compress and len(body) > COMPRESS_THRESHOLD:
+        packed = zlib.compress(body, 6)
+        if len(packed) < len(body):
+            body, flags = packed, FLAG_ZLIB
+
+    header = BCSEncoder().encode_u8(VERSION).encode_u8(flags)
+    header.encode_bytes(broadcast.signature or b"")
+    return MAGIC + header.to_bytes() + body
+
+
+def decode_score_broadcast(data: bytes) -> Tuple[ScoreBroadcast, bytes]:
+    """
+    Parse a binary broadcast.
+
+    Returns:
+        The broadcast and its canonical bytes (for signature checks)
+
+    Raises:
+        ScoreCodecError: If the message is malformed, truncated or too large
+    """
+    if not data.startswith(MAGIC):
+        raise ScoreCodecError("Not a binary score message")
+    try:
+        header = BCSDecoder(data[len(MAGIC) :])
+        version = header.decode_u8()
+        if version != VERSION:
+            raise ScoreCodecError(f"Unsupported score message version {version}")
+        flags = header.decode_u8()
+        signature = header.decode_bytes() or None
+        body = header.data[header.offset :]
+
+        if flags & FLAG_ZLIB:
+            inflater = zlib.decompressobj()
+            body = inflater.decompress(body, MAX_BODY_BYTES)
+            if inflater.unconsumed_tail:
+                raise ScoreCodecError("Score message exceeds the size limit")
+
+        decoder = BCSDecoder(body)
+        table_size = decoder.decode_uleb128()
+        strings = decoder.decode_string().split(_SEPARATOR)
+        if len(strings) != table_size:
+            raise ScoreCodecError(
+                f"String table holds {len(strings)} entries, expected {table_size}"
+            )
+        sender = strings[decoder.decode_uleb128()]
+        broadcast_id = strings[decoder.decode_uleb128()]
+        timestamp = decoder.decode_u64()
+        count = decoder.decode_uleb128()
+
+        records = body[decoder.offset :]
+        if len(records) != count * _RECORD.size:
+            raise ScoreCodecError(
+                f"Expected {count} score records, got {len(records)} bytes"
+            )
+        scores = [
+            ValidatorScore(
+                task_id=strings[task],
+                miner_uid=strings[miner],
+                validator_uid=strings[validator],
+                score=score,
+                timestamp=at,
+                deviation=None if math.isnan(deviation) else deviation,
+            )
+            for task, miner, validator, score, at, deviation in _RECORD.iter_unpack(
+                records
+            )
+        ]
+    except (BCSError, IndexError, UnicodeDecodeError, zlib.error) as e:
+        raise ScoreCodecError(f"Malformed score message: {e}")
+
+    broadcast = ScoreBroadcast(sender, broadcast_id, timestamp, scores, signature)
+    return broadcast, bytes(body)
+
+
+def sign_score_broadcast(body: bytes, account: Any) -> bytes:
+    """Signature of the canonical body with the validator's account."""
+    return bytes(account.sign_message(encode_defunct(primitive=body)).signature)
+
+
+def verify_score_broadcast(
+    body: bytes, signature: Optional[bytes], expected_address: Optional[str]
+) -> bool:
+    """Check the canonical body was signed by the expected address."""
+    if not signature or not expected_address:
+        return False
+    try:
+        recovered = Account.recover_message(
+            encode_defunct(primitive=body), signature=signature
+        )
+    except Exception as e:
+        logger.debug(f"Score signature recovery failed: {e}")
+        return False
+    return recovered.lower() == expected_address.lower()
+
+
+def accepts_binary_scores(header_value: Optional[str]) -> bool:
+    """Whether an Accept/Accept-Post header lists the binary score format."""
+    if not header_value:
+        return False
+    return any(
+        part.split(";")[0].strip().lower() == SCORE_BATCH_CONTENT_TYPE
+        for part in header_value.split(",")
+    )
@@ -1,13 +1,22 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 import uvicorn
 import requests
 import time
-import threading
-import json
-from typing import Optional
+from typing import List, Optional
 import logging
 
+from .batching import (
+    BATCH_TASKS_HEADER,
+    DEFAULT_MAX_BATCH,
+    MINER_CAPACITY_HEADER,
+    TASK_BATCH_ENDPOINT,
+)
+from .compute_backend import DEFAULT_SHM_THRESHOLD, DEFAULT_WORKERS, MODE_ASYNC
+from .miner_runtime import DEFAULT_MAX_QUEUE, MinerRuntime, ResultSender
+from .result_cache import ResultCache, task_digest
+
 # Get logger instance
 logger = logging.getLogger(__name__)
 
@@ -45,10 +54,41 @@ class ResultModel(BaseModel):
     )
 
 
+class TaskBatchModel(BaseModel):
+    """
+    Several tasks sent to a miner in one request (/receive-tasks).
+    """
+
+    tasks: List[TaskModel] = Field(..., description="Tasks to queue on the miner")
+
+
+class ResultBatchModel(BaseModel):
+    """
+    Several results sent to a validator in one request (/v1/miner/submit_results).
+    """
+
+    results: List[ResultModel] = Field(..., description="Results being submitted")
+
+
 # Base class for Miner
 class BaseMiner:
+    # Task fields that fully determine process_task's output (looked up in
+    # task_data, then on the task), e.g. ("prompt", "seed"). Subclasses set
+    # this to let a result_cache serve repeated tasks; empty = never cached.
+    deterministic_fields: tuple = ()
+
     def __init__(
-        self, validator_url, host="0.0.0.0", port=8000, miner_uid="miner_default_001"
+        self,
+        validator_url,
+        host="0.0.0.0",
+        port=8000,
+        miner_uid="miner_default_001",
+        max_queue=DEFAULT_MAX_QUEUE,
+        workers=DEFAULT_WORKERS,
+        worker_mode=MODE_ASYNC,
+        max_batch=DEFAULT_MAX_BATCH,
+        shm_threshold=DEFAULT_SHM_THRESHOLD,
+        result_cache: Optional[ResultCache] = None,
     ):
         """
         Initialize BaseMiner.
@@ -58,12 +98,37 @@ class BaseMiner:
             host (str): Host address for the miner server.
             port (int): Port for the miner server.
             miner_uid (str): Unique identifier for this miner.
+            max_queue (int): Tasks accepted but not yet started; beyond this
+                /receive-task answers 429.
+            workers (int): Tasks processed at once.
+            worker_mode (str): "async" runs process_task on worker threads (or
+                awaits it if it is a coroutine); "process" runs it in a process
+                pool, so the miner must be picklable. Either way setup_worker()
+                runs once per worker before its first task.
+            max_batch (int): Tasks accepted per /receive-tasks request, advertised
+                to validators in the X-MT-Batch-Tasks header.
+            shm_threshold (int): In "process" mode, results of this many bytes
+                or more (pickled) come back through shared memory; 0 disables it.
+            result_cache (ResultCache): Opt-in cache of results of tasks that
+                agree on deterministic_fields; unused if those are not set.
         """
         self.app = FastAPI()
         self.validator_url = validator_url
         self.host = host
         self.port = port
         self.miner_uid = miner_uid
+        self.runtime = MinerRuntime(
+            self.handle_task,
+            max_queue=max_queue,
+            workers=workers,
+            mode=worker_mode,
+            name=f"[Miner:{miner_uid}]",
+            target=self,
+            shm_threshold=shm_threshold,
+        )
+        self.result_sender = ResultSender(name=f"[Miner:{miner_uid}]")
+        self.result_cache = result_cache if self.deterministic_fields else None
+        self.max_batch = max_batch
         self.setup_routes()
         logger.info(
             f":robot: [Miner:{self.miner_uid}] Initialized. Default Validator target: [link={self.validator_url}]{self.validator_url}[/link]"
@@ -78,7 +143,11 @@ class BaseMiner:
             return {
                 "status": "healthy",
                 "miner_uid": self.miner_uid,
-                "timestamp": time.time()
+                "timestamp": time.time(),
+                "queue": self.runtime.stats(),
+                "results": self.result_sender.stats(),
+                "cache": self.result_cache.stats() if self.result_cache else None,
+                "max_task_batch": self.max_batch,
             }
 
         @self.app.post("/receive-task")
@@ -86,8 +155,73 @@ class BaseMiner:
             logger.info(
                 f":inbox_tray: [Miner:{self.miner_uid}] Received task [yellow]{task.task_id}[/yellow] - Desc: '{task.description}' - Prio: {task.priority}"
             )
-            threading.Thread(target=self.handle_task, args=(task,)).start()
-            return {"message": f"Task {task.task_id} received and processing"}
+            if not self.runtime.submit(task):
+                logger.warning(
+                    f":no_entry: [Miner:{self.miner_uid}] Task queue full, rejected task [yellow]{task.task_id}[/yellow]"
+                )
+                return JSONResponse(
+                    {"message": f"Task queue full, task {task.task_id} rejected"},
+                    status_code=429,
+                    headers={"Retry-After": "1", **self._advertised_headers()},
+                )
+            return JSONResponse(
+                {"message": f"Task {task.task_id} received and processing"},
+                headers=self._advertised_headers(),
+            )
+
+        @self.app.post(TASK_BATCH_ENDPOINT)
+        async def receive_tasks(batch: TaskBatchModel):
+            """Queue several tasks; each is accepted or rejected on its own."""
+            accepted, rejected = [], {}
+            for index, task in enumerate(batch.tasks):
+                if index >= self.max_batch:
+                    rejected[task.task_id] = "batch_too_large"
+                elif self.runtime.submit(task):
+                    accepted.append(task.task_id)
+                else:
+                    rejected[task.task_id] = "queue_full"
+            logger.info(
+                f":inbox_tray: [Miner:{self.miner_uid}] Received batch of {len(batch.tasks)} tasks: {len(accepted)} queued, {len(rejected)} rejected"
+            )
+            headers = self._advertised_headers()
+            if rejected and not accepted:
+                return JSONResponse(
+                    {"accepted": accepted, "rejected": rejected},
+                    status_code=429,
+                    headers={"Retry-After": "1", **headers},
+                )
+            return JSONResponse(
+                {"accepted": accepted, "rejected": rejected}, headers=headers
+            )
+
+        @self.app.on_event("shutdown")
+        async def shutdown():
+            await self.runtime.stop()
+            await self.result_sender.aclose()
+
+    def _advertised_headers(self) -> dict:
+        """Advertise task concurrency, /receive-tasks and its batch size to validators."""
+        headers = {MINER_CAPACITY_HEADER: str(self.runtime.workers)}
+        if self.max_batch > 1:
+            headers[BATCH_TASKS_HEADER] = str(self.max_batch)
+        return headers
+
+    def __getstate__(self):
+        # "process" mode copies the miner to each worker process; leave out
+        # the server, runtime and HTTP pool, which stay in the main process
+        state = self.__dict__.copy()
+        for attr in ("app", "runtime", "result_sender", "result_cache"):
+            state.pop(attr, None)
+        return state
+
+    def setup_worker(self):
+        """
+        Load models and other per-worker state (can be overridden).
+
+        Called once in each worker process in "process" mode, so heavy state
+        is loaded once per worker rather than per task; called once on the
+        worker threads in "async" mode.
+        """
 
     def process_task(self, task: TaskModel) -> dict:
         """
@@ -114,9 +248,25 @@ class BaseMiner:
         )
         return result_payload
 
-    def handle_task(self, task: TaskModel):
+    def cache_key(self, task: TaskModel) -> Optional[str]:
+        """Digest of the task's deterministic_fields, or None if it is not cacheable."""
+        values = {}
+        for field in self.deterministic_fields:
+            if field in task.task_data:
+                values[field] = task.task_data[field]
+            elif getattr(task, field, None) is not None:
+                values[field] = getattr(task, field)
+        return task_digest(values, self.deterministic_fields)
+
+    async def handle_task(self, task: TaskModel):
         """Processes the task and sends the ResultModel back to the validator."""
-        result_data_payload = self.process_task(task)
+        cache_key = self.cache_key(task) if self.result_cache else None
+        if cache_key:
+            result_data_payload = await self.result_cache.get_or_compute(
+                cache_key, lambda: self.runtime.compute(self.process_task, task)
+            )
+        else:
+            result_data_payload = await self.runtime.compute(self.process_task, task)
 
         result_to_send = ResultModel(
             task_id=task.task_id,
@@ -131,34 +281,17 @@ class BaseMiner:
             )
             return
 
-        result_submit_url = f"{target_validator_url.rstrip('/')}/v1/miner/submit_result"
-
-        try:
-            logger.debug(
-                f":outbox_tray: [Miner:{self.miner_uid}] Sending result for task [yellow]{task.task_id}[/yellow] to [link={result_submit_url}]{result_submit_url}[/link]"
-                + f" Payload: {str(result_to_send.dict())[:100]}..."
-            )
-            response = requests.post(
-                result_submit_url, json=result_to_send.dict(), timeout=10
+        logger.debug(
+            f":outbox_tray: [Miner:{self.miner_uid}] Sending result for task [yellow]{task.task_id}[/yellow] to [link={target_validator_url}]{target_validator_url}[/link]"
+            + f" Payload: {str(result_to_send.dict())[:100]}..."
+        )
+        if await self.result_sender.submit(target_validator_url, result_to_send.dict()):
+            logger.info(
+                f":mailbox_with_mail: [Miner:{self.miner_uid}] Result sent for task [yellow]{task.task_id}[/yellow]"
             )
-            response.raise_for_status()
-            try:
-                response_data = response.json()
-                logger.info(
-                    f":mailbox_with_mail: [Miner:{self.miner_uid}] Result sent. Validator response for task [yellow]{task.task_id}[/yellow]: {response_data}"
-                )
-            except json.JSONDecodeError:
-                logger.info(
-                    f":mailbox_with_mail: [Miner:{self.miner_uid}] Result sent. Validator response for task [yellow]{task.task_id}[/yellow]: Status {response.status_code} (Non-JSON)"
-                )
-
-        except requests.exceptions.RequestException as e:
+        else:
             logger.error(
-                f":x: [Miner:{self.miner_uid}] Error sending result for task [yellow]{task.task_id}[/yellow] to {result_submit_url}: {e}"
-            )
-        except Exception as e:
-            logger.exception(
-                f":rotating_light: [Miner:{self.miner_uid}] Unexpected error handling task [yellow]{task.task_id}[/yellow]: {e}"
+                f":x: [Miner:{self.miner_uid}] Error sending result for task [yellow]{task.task_id}[/yellow] to {target_validator_url}: not accepted"
             )
 
     def run(self):
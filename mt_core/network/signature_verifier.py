@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Signature Verification Module
+
+Verification service for signed peer messages (score broadcasts):
+- Requests arriving in the same event-loop iteration are collected and
+  verified in batches on a small thread pool, so a burst of signed payloads
+  from many peers does not block result ingestion on the event loop
+- ed25519 (PyNaCl) signatures with a public key and an expected address, and
+  eth_account (secp256k1) signatures recovered to an address
+- Addresses are derived from public keys the way the chain does it: the last
+  20 bytes of the keccak-256 of the (uncompressed) key
+- LRU caches for public key -> address derivations and for recently
+  verified (digest, signature) pairs, so replays and re-broadcasts of the
+  same payload cost a hash and a dictionary lookup
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import nacl.signing
+from eth_account import Account
+from eth_utils import keccak
+from eth_account.messages import encode_defunct
+from nacl.exceptions import BadSignatureError
+
+logger = logging.getLogger(__name__)
+
+SCHEME_ED25519 = "ed25519"
+SCHEME_ETH = "eth"
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_WORKERS = 2
+
+
+def public_key_address(public_key: bytes) -> str:
+    """
+    Chain address of a public key: last 20 bytes of its keccak-256.
+
+    An uncompressed secp256k1 key may carry its 0x04 prefix; the address
+    then matches the validator's eth_account address.
+    """
+    if len(public_key) == 65 and public_key[0] == 4:
+        public_key = public_key[1:]
+    return "0x" + keccak(public_key)[-20:].hex()
+
+
+@dataclass(frozen=True)
+class VerificationRequest:
+    """One signature to check."""
+
+    scheme: str
+    message: bytes
+    signature: bytes
+    public_key: Optional[bytes] = None  # ed25519 only
+    expected_address: Optional[str] = None
+
+
+class _LRU:
+    """Bounded mapping that drops the least recently used entry."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SignatureVerifier:
+    """
+    Batched, cached signature verification off the event loop.
+
+    verify() answers from the caches when it can; otherwise the request is
+    queued and the queue is flushed once per event-loop iteration, in
+    batches of at most max_batch requests per worker call.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        name: str = "",
+    ):
+        """
+        Args:
+            max_batch: Requests verified per worker call
+            cache_size: Entries kept in each cache
+            workers: Threads used for verification
+            name: Prefix for log messages
+        """
+        self.max_batch = max_batch
+        self.workers = workers
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._addresses = _LRU(cache_size)  # public key -> address
+        self._verified = _LRU(cache_size)  # (scheme, digest, signature, key) -> outcome
+        self._pending: List[Tuple[VerificationRequest, Tuple, asyncio.Future]] = []
+        self._flush_scheduled = False
+
+        self.requests = 0
+        self.cache_hits = 0
+        self.batches = 0
+        self.verified = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any, name: str = "") -> "SignatureVerifier":
+        """Verifier configured from the SIGNATURE_VERIFY_* settings."""
+        return cls(
+            max_batch=getattr(settings, "SIGNATURE_VERIFY_BATCH_SIZE", DEFAULT_MAX_BATCH),
+            cache_size=getattr(settings, "SIGNATURE_VERIFY_CACHE_SIZE", DEFAULT_CACHE_SIZE),
+            workers=getattr(settings, "SIGNATURE_VERIFY_WORKERS", DEFAULT_WORKERS),
+            name=name,
+        )
+
+    # === Derivations ===
+
+    def address_of(self, public_key: bytes) -> str:
+        """Cached chain address of a public key."""
+        address = self._addresses.get(public_key)
+        if address is None:
+            address = public_key_address(public_key)
+            self._addresses.put(public_key, address)
+        return address
+
+    @staticmethod
+    def _cache_key(request: VerificationRequest) -> Tuple:
+        digest = hashlib.sha256(request.message).digest()
+        return (request.scheme, digest, request.signature, request.public_key)
+
+    def _outcome_matches(self, request: VerificationRequest, outcome: Any) -> bool:
+        """Whether a cached or fresh outcome verifies the request."""
+        if request.scheme == SCHEME_ETH:
+            # outcome: the recovered address ("" when recovery failed)
+            return bool(outcome) and bool(request.expected_address) and (
+                outcome.lower() == request.expected_address.lower()
+            )
+        if outcome is not True:
+            return False
+        if request.expected_address is None:
+            return True
+        return self.address_of(request.public_key).lower() == (
+            request.expected_address.lower()
+        )
+
+    # === Verification ===
+
+    @staticmethod
+    def _check(request: VerificationRequest) -> Any:
+        """Cryptographic check of one request (runs on a worker thread)."""
+        try:
+            if request.scheme == SCHEME_ED25519:
+                nacl.signing.VerifyKey(request.public_key).verify(
+                    request.message, request.signature
+                )
+                return True
+            if request.scheme == SCHEME_ETH:
+                return Account.recover_message(
+                    encode_defunct(primitive=request.message),
+                    signature=request.signature,
+                )
+        except (BadSignatureError, ValueError, TypeError) as e:
+            logger.debug(f"Signature check failed ({request.scheme}): {e}")
+            return False if request.scheme == SCHEME_ED25519 else ""
+        except Exception as e:
+            logger.debug(f"Unexpected error checking {request.scheme} signature: {e}")
+            return False if request.scheme == SCHEME_ED25519 else ""
+        raise ValueError(f"Unknown signature scheme {request.scheme}")
+
+    @classmethod
+    def _check_batch(cls, requests: Sequence[VerificationRequest]) -> List[Any]:
+        return [cls._check(request) for request in requests]
+
+    async def verify(self, request: VerificationRequest) -> bool:
+        """
+        Check one signature.
+
+        Raises:
+            ValueError: If the scheme is unknown or an ed25519 request has no key
+        """
+        if request.scheme not in (SCHEME_ED25519, SCHEME_ETH):
+            raise ValueError(f"Unknown signature scheme {request.scheme}")
+        if request.scheme == SCHEME_ED25519 and not request.public_key:
+            raise ValueError("ed25519 verification needs a public key")
+
+        self.requests += 1
+        key = self._cache_key(request)
+        outcome = self._verified.get(key)
+        if outcome is not None:
+            self.cache_hits += 1
+            return self._record(self._outcome_matches(request, outcome))
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, key, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+        return self._record(self._outcome_matches(request, await future))
+
+    async def verify_many(self, requests: Sequence[VerificationRequest]) -> List[bool]:
+        """Check several signatures; they share batches with concurrent callers."""
+        return list(await asyncio.gather(*(self.verify(r) for r in requests)))
+
+    def _record(self, valid: bool) -> bool:
+        if valid:
+            self.verified += 1
+        else:
+            self.rejected += 1
+        return valid
+
+    def _flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        # Identical requests queued together are checked once
+        unique: Dict[Tuple, List[Tuple[VerificationRequest, asyncio.Future]]] = {}
+        for request, key, future in pending:
+            unique.setdefault(key, []).append((request, future))
+        keys = list(unique)
+        for start in range(0, len(keys), self.max_batch):
+            batch = keys[start : start + self.max_batch]
+            asyncio.ensure_future(self._run_batch(batch, unique))
+
+    async def _run_batch(self, keys: List[Tuple], waiting: Dict):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="sig-verify"
+            )
+        requests = [waiting[key][0][0] for key in keys]
+        self.batches += 1
+        try:
+            outcomes = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._check_batch, requests
+            )
+        except Exception as e:
+            logger.error(f"{self.name} Signature batch failed: {e}")
+            outcomes = [None] * len(keys)
+
+        for key, outcome in zip(keys, outcomes):
+            if outcome is not None:
+                self._verified.put(key, outcome)
+            for _, future in waiting[key]:
+                if not future.done():
+                    future.set_result(outcome)
+
+    def stats(self) -> Dict[str, Any]:
+        """Verification counters for status endpoints and monitoring."""
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "batches": self.batches,
+            "verified": self.verified,
+            "rejected": self.rejected,
+            "cached_results": len(self._verified),
+            "cached_addresses": len(self._addresses),
+        }
+
+    def close(self):
+        """Stop the worker threads (they are recreated on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
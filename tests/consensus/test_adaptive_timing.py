@@ -0,0 +1,169 @@
+# tests/consensus/test_adaptive_timing.py
+import asyncio
+import time
+
+import pytest
+
+from mt_core.consensus.adaptive_timing import (
+    ACTIVE_TIMING_KEY,
+    TIMING_PROPOSAL_KEY,
+    AdaptiveTimingController,
+    LatencyHistogram,
+    TimingProposal,
+    collect_timing_proposals,
+)
+from mt_core.consensus.coordination_backend import (
+    InMemoryCoordinationBackend,
+    PhaseAnnouncement,
+    PhaseIndex,
+)
+from mt_core.consensus.flexible_slot_coordinator import (
+    FlexibleSlotCoordinator,
+    FlexibleSlotPhase,
+)
+from mt_core.consensus.slot_scheduler import PhaseWindow, SlotSchedule, SlotScheduler
+
+BASELINE = TimingProposal(120, 15, 15, 30.0)
+
+
+def test_histogram_percentiles_over_window():
+    histogram = LatencyHistogram(window=100)
+    assert histogram.percentile(0.5) is None
+
+    for _ in range(100):
+        histogram.record(1.0)
+    assert histogram.percentile(0.95) == pytest.approx(1.0, rel=0.25)
+
+    # Cửa sổ trượt: 100 mẫu chậm mới đẩy hết mẫu nhanh cũ ra
+    for _ in range(100):
+        histogram.record(8.0)
+    assert histogram.count == 100
+    assert histogram.percentile(0.05) == pytest.approx(8.0, rel=0.25)
+
+
+def test_proposal_stays_at_baseline_without_samples():
+    controller = AdaptiveTimingController(BASELINE, min_samples=10)
+    assert controller.propose() == BASELINE
+
+
+def test_fast_network_shrinks_windows_but_slow_miner_is_covered():
+    controller = AdaptiveTimingController(BASELINE, min_samples=10)
+    for _ in range(50):
+        controller.record_miner_latency("fast", 1.0)
+        controller.record_miner_latency("slow_but_valid", 6.0)
+        controller.record_timeout("dead")  # Không kéo dài cửa sổ
+        controller.record_phase("consensus_scoring", 3.0)
+        controller.record_phase("metagraph_update", 2.0)
+
+    proposal = controller.propose()
+    assert proposal.batch_timeout_seconds >= 6.0 * 1.25  # Miner chậm vẫn kịp
+    assert proposal.batch_timeout_seconds < BASELINE.batch_timeout_seconds
+    assert proposal.task_assignment_seconds < BASELINE.task_assignment_seconds
+    assert proposal.task_assignment_seconds >= 3 * proposal.batch_timeout_seconds
+    assert proposal.consensus_seconds == 10  # Chặn dưới
+    assert proposal.metagraph_update_seconds == 10
+    assert proposal.slot_duration_seconds < BASELINE.slot_duration_seconds
+    assert all(v % 5 == 0 for v in proposal.to_dict().values())
+
+
+def test_slow_network_never_exceeds_configured_lengths():
+    controller = AdaptiveTimingController(BASELINE, min_samples=5)
+    for _ in range(20):
+        controller.record_miner_latency("m", 120.0)
+        controller.record_phase("consensus_scoring", 60.0)
+    proposal = controller.propose()
+    assert proposal.batch_timeout_seconds == BASELINE.batch_timeout_seconds
+    assert proposal.consensus_seconds == BASELINE.consensus_seconds
+    # Cửa sổ giao task chỉ cần đủ cho 3 lượt với timeout tối đa
+    assert 3 * 30 <= proposal.task_assignment_seconds <= BASELINE.task_assignment_seconds
+
+
+def test_agreement_is_order_independent_median():
+    controller = AdaptiveTimingController(BASELINE, min_proposals=2)
+    proposals = [
+        TimingProposal(60, 10, 10, 15.0),
+        TimingProposal(90, 15, 10, 20.0),
+        TimingProposal(45, 10, 15, 10.0),
+    ]
+    agreed = controller.agree(proposals)
+    assert agreed == controller.agree(list(reversed(proposals)))
+    assert agreed == TimingProposal(60, 10, 10, 15.0)
+
+    assert controller.agree(proposals[:1]) is None
+    # Đề xuất vượt cấu hình bị chặn lại
+    assert controller.agree([TimingProposal(999, 99, 99, 99.0)] * 2) == BASELINE
+
+
+def test_collect_timing_proposals_skips_malformed():
+    announcements = [
+        PhaseAnnouncement("v1", 1, "metagraph_update", extra_data={TIMING_PROPOSAL_KEY: BASELINE.to_dict()}),
+        PhaseAnnouncement("v2", 1, "metagraph_update", extra_data={TIMING_PROPOSAL_KEY: {"consensus_seconds": 1}}),
+        PhaseAnnouncement("v3", 1, "metagraph_update"),
+    ]
+    assert collect_timing_proposals(announcements) == [BASELINE]
+
+
+def test_adopted_timing_keeps_slot_numbers_continuous():
+    coordinator = FlexibleSlotCoordinator("v1", backend=InMemoryCoordinationBackend())
+    old = coordinator.slot_schedule()
+    effective = 500000
+    faster = TimingProposal(60, 10, 10, 15.0)
+
+    schedule = coordinator.adopt_timing(faster, effective)
+    assert schedule.slot_start(effective) == pytest.approx(old.slot_start(effective))
+    assert schedule.slot_duration == 80
+    assert schedule.slot_start(effective + 1) - schedule.slot_start(effective) == 80
+
+    assert coordinator.activate_timing(effective - 1) is None  # Chưa tới slot hiệu lực
+    assert coordinator.slot_config.min_task_assignment_seconds == 120
+    assert coordinator.activate_timing(effective) == faster
+    assert coordinator.slot_config.min_task_assignment_seconds == 60
+    assert coordinator.slot_schedule().slot_start(effective + 3) == pytest.approx(
+        schedule.slot_start(effective + 3)
+    )
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_adopts_announced_timing():
+    index = PhaseIndex()
+    veteran = FlexibleSlotCoordinator("v1", backend=InMemoryCoordinationBackend(index))
+    faster = TimingProposal(60, 10, 10, 15.0)
+    veteran.adopt_timing(faster, 100)
+    veteran.activate_timing(100)
+    await veteran.register_phase_entry_flexible(
+        101,
+        FlexibleSlotPhase.METAGRAPH_UPDATE,
+        {ACTIVE_TIMING_KEY: veteran.timing_announcement()},
+    )
+
+    joiner = FlexibleSlotCoordinator("v2", backend=InMemoryCoordinationBackend(index))
+    assert joiner.adopt_announced_timing() == faster
+    assert joiner.slot_schedule().slot_start(120) == pytest.approx(
+        veteran.slot_schedule().slot_start(120)
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_switches_schedule_at_slot_boundary():
+    epoch = time.time()
+    windows = [PhaseWindow("a", 0.0, 0.1), PhaseWindow("b", 0.1, 0.3)]
+    scheduler = None
+    fired = []
+
+    async def on_phase(slot, phase):
+        fired.append((slot, phase, time.monotonic()))
+        if (slot, phase) == (0, "a"):
+            # Slot 1 trở đi ngắn hơn: 0.2s, neo lại epoch tại mốc slot 1
+            short = [PhaseWindow("a", 0.0, 0.05), PhaseWindow("b", 0.05, 0.2)]
+            scheduler.set_schedule(SlotSchedule(epoch + 0.3 - 0.2, 0.2, short), 1)
+        if len(fired) == 5:
+            scheduler.stop()
+
+    scheduler = SlotScheduler(SlotSchedule(epoch, 0.3, windows), on_phase)
+    scheduler.start(0)
+    await asyncio.wait_for(scheduler.run(), timeout=2)
+
+    start = fired[0][2]
+    offsets = [round(at - start, 2) for _, _, at in fired]
+    assert [(s, p) for s, p, _ in fired] == [(0, "a"), (0, "b"), (1, "a"), (1, "b"), (2, "a")]
+    assert offsets == pytest.approx([0.0, 0.1, 0.3, 0.35, 0.5], abs=0.04)
@@ -0,0 +1,199 @@
+# tests/consensus/test_consensus_kernel.py
+import random
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mt_core.consensus.state import (
+    SparseScoreMatrix,
+    calculate_historical_consistency,
+    calculate_historical_consistency_batch,
+    run_consensus_logic,
+)
+from mt_core.core.datatypes import ValidatorInfo, ValidatorScore
+from mt_core.formulas.performance import calculate_adjusted_miner_performance
+from mt_core.metagraph.metagraph_datum import STATUS_ACTIVE, STATUS_INACTIVE
+
+SETTINGS = SimpleNamespace(
+    CONSENSUS_PARAM_DELTA_TRUST=0.1,
+    CONSENSUS_PARAM_ALPHA_BASE=0.1,
+    CONSENSUS_PARAM_K_ALPHA=1.0,
+    CONSENSUS_PARAM_UPDATE_SIG_L=1.0,
+    CONSENSUS_PARAM_UPDATE_SIG_K=5.0,
+    CONSENSUS_PARAM_UPDATE_SIG_X0=0.5,
+    CONSENSUS_PARAM_THETA1=0.1,
+    CONSENSUS_PARAM_THETA2=0.6,
+    CONSENSUS_PARAM_THETA3=0.3,
+    CONSENSUS_PARAM_PENALTY_THRESHOLD_DEV=0.05,
+    CONSENSUS_PARAM_PENALTY_K_PENALTY=10.0,
+    CONSENSUS_PARAM_PENALTY_P_PENALTY=1.0,
+    CONSENSUS_PARAM_INCENTIVE_SIG_L=1.0,
+    CONSENSUS_PARAM_INCENTIVE_SIG_K=10.0,
+    CONSENSUS_PARAM_INCENTIVE_SIG_X0=0.5,
+)
+
+
+def make_cycle(num_validators, num_miners, tasks_per_miner=1, coverage=0.5, seed=0):
+    """Sinh dữ liệu điểm P2P ngẫu nhiên cho một chu kỳ."""
+    rng = random.Random(seed)
+    validators = {}
+    for v in range(num_validators):
+        uid = f"validator_{v:04d}"
+        validators[uid] = ValidatorInfo(
+            uid=uid,
+            address=f"addr_{v}",
+            trust_score=rng.random(),
+            weight=rng.random(),
+            stake=rng.uniform(100, 1000),
+            last_performance=rng.random(),
+            status=STATUS_INACTIVE if v % 17 == 16 else STATUS_ACTIVE,
+            performance_history=[rng.random() for _ in range(rng.randint(0, 12))],
+        )
+    validator_uids = list(validators)
+
+    received_scores = {}
+    for m in range(num_miners):
+        miner_uid = f"miner_{m:05d}"
+        for t in range(tasks_per_miner):
+            task_id = f"task_{m:05d}_{t}"
+            scorers = [uid for uid in validator_uids if rng.random() < coverage]
+            received_scores[task_id] = {
+                uid: ValidatorScore(
+                    task_id=task_id,
+                    miner_uid=miner_uid,
+                    validator_uid=uid,
+                    score=rng.random(),
+                )
+                for uid in scorers
+            }
+    return validators, received_scores
+
+
+def reference_miner_scores_and_deviations(received_scores, validators_info):
+    """Cách tính dạng vòng lặp ban đầu, dùng làm chuẩn so sánh."""
+    scores_by_miner = defaultdict(list)
+    tasks_processed_by_miner = defaultdict(set)
+    validator_scores_by_task = defaultdict(dict)
+    for task_id, validator_scores_dict in received_scores.items():
+        first_score = next(iter(validator_scores_dict.values()), None)
+        if not first_score:
+            continue
+        miner_uid = first_score.miner_uid
+        tasks_processed_by_miner[miner_uid].add(task_id)
+        for validator_uid, score_entry in validator_scores_dict.items():
+            validator = validators_info.get(validator_uid)
+            if validator and validator.status == STATUS_ACTIVE:
+                scores_by_miner[miner_uid].append(
+                    (score_entry.score, validator.trust_score)
+                )
+                validator_scores_by_task[task_id][validator_uid] = score_entry.score
+
+    final_miner_scores = {}
+    validator_deviations = defaultdict(list)
+    for miner_uid, scores_trusts in scores_by_miner.items():
+        p_adj = calculate_adjusted_miner_performance(
+            [s for s, _ in scores_trusts], [t for _, t in scores_trusts]
+        )
+        final_miner_scores[miner_uid] = p_adj
+        for task_id in tasks_processed_by_miner.get(miner_uid, set()):
+            for validator_uid, score in validator_scores_by_task.get(
+                task_id, {}
+            ).items():
+                validator_deviations[validator_uid].append(abs(score - p_adj))
+
+    avg_devs = {
+        uid: (sum(devs) / len(devs) if devs else 0.0)
+        for uid, devs in validator_deviations.items()
+    }
+    return final_miner_scores, avg_devs
+
+
+def test_sparse_matrix_matches_reference_exactly():
+    validators, received_scores = make_cycle(20, 300, tasks_per_miner=3, seed=1)
+    expected_scores, expected_devs = reference_miner_scores_and_deviations(
+        received_scores, validators
+    )
+
+    matrix = SparseScoreMatrix(received_scores, validators)
+    p_adj = matrix.adjusted_miner_performance()
+    avg_dev = matrix.average_validator_deviations(p_adj)
+
+    assert dict(zip(matrix.miner_index, p_adj.tolist())) == expected_scores
+    assert list(matrix.miner_index) == list(expected_scores)
+    assert dict(zip(matrix.validator_index, avg_dev.tolist())) == expected_devs
+
+
+def test_historical_consistency_batch_matches_scalar():
+    rng = random.Random(3)
+    histories = [[rng.random() for _ in range(rng.randint(0, 20))] for _ in range(200)]
+    batch = calculate_historical_consistency_batch(histories, 0.2)
+    assert batch.tolist() == [calculate_historical_consistency(h, 0.2) for h in histories]
+
+
+def test_run_consensus_logic_outputs_are_consistent():
+    validators, received_scores = make_cycle(12, 50, tasks_per_miner=2, seed=2)
+    expected_scores, expected_devs = reference_miner_scores_and_deviations(
+        received_scores, validators
+    )
+
+    final_scores, states = run_consensus_logic(
+        current_cycle=10,
+        tasks_sent={},
+        received_scores=received_scores,
+        validators_info=validators,
+        settings=SETTINGS,
+        consensus_possible=True,
+        self_validator_uid="validator_0000",
+    )
+
+    assert final_scores == expected_scores
+    assert set(states) == set(validators)
+    for uid, state in states.items():
+        assert state["avg_deviation"] == expected_devs.get(uid, 0.0)
+        if validators[uid].status != STATUS_ACTIVE:
+            assert state["reward"] == 0.0
+
+
+def test_empty_cycle_produces_no_miner_scores():
+    validators, _ = make_cycle(3, 0)
+    final_scores, states = run_consensus_logic(
+        current_cycle=1,
+        tasks_sent={},
+        received_scores={},
+        validators_info=validators,
+        settings=SETTINGS,
+        consensus_possible=True,
+        self_validator_uid="validator_0000",
+    )
+    assert final_scores == {}
+    assert all(state["avg_deviation"] == 0.0 for state in states.values())
+
+
+@pytest.mark.slow
+def test_benchmark_100_validators_10k_miners():
+    """Benchmark: 100 validator × 10k miner, so sánh với vòng lặp ban đầu."""
+    validators, received_scores = make_cycle(100, 10_000, coverage=0.3, seed=4)
+
+    start = time.perf_counter()
+    expected_scores, expected_devs = reference_miner_scores_and_deviations(
+        received_scores, validators
+    )
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = SparseScoreMatrix(received_scores, validators)
+    build_time = time.perf_counter() - start
+    p_adj = matrix.adjusted_miner_performance()
+    avg_dev = matrix.average_validator_deviations(p_adj)
+    kernel_time = time.perf_counter() - start
+
+    print(
+        f"\n{len(matrix.scores)} scores: reference {reference_time:.3f}s, "
+        f"sparse kernel {kernel_time:.3f}s (matrix build {build_time:.3f}s)"
+    )
+    assert dict(zip(matrix.miner_index, p_adj.tolist())) == expected_scores
+    assert dict(zip(matrix.validator_index, avg_dev.tolist())) == expected_devs
+    assert np.all((p_adj >= 0.0) & (p_adj <= 1.0))
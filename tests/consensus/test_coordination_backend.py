@@ -0,0 +1,190 @@
+# tests/consensus/test_coordination_backend.py
+import os
+import time
+
+import pytest
+from eth_account import Account
+
+from mt_core.consensus.coordination_backend import (
+    COORDINATION_PHASE_ENDPOINT,
+    FileCoordinationBackend,
+    InMemoryCoordinationBackend,
+    NetworkCoordinationBackend,
+    PhaseAnnouncement,
+    PhaseIndex,
+    create_coordination_backend,
+    parse_coordination_filename,
+)
+from mt_core.consensus.flexible_slot_coordinator import (
+    FlexibleSlotCoordinator,
+    FlexibleSlotPhase,
+)
+from mt_core.consensus.slot_coordinator import SlotCoordinator, SlotPhase
+from mt_core.core.datatypes import ValidatorScore
+
+
+def test_parse_coordination_filename():
+    assert parse_coordination_filename(
+        "slot_12_consensus_scoring_validator_1.json"
+    ) == (12, "consensus_scoring", "validator_1")
+    assert parse_coordination_filename("slot_x_task_assignment_v.json") is None
+    assert parse_coordination_filename("slot_3_unknown_v.json") is None
+
+
+@pytest.mark.asyncio
+async def test_file_backend_shared_directory(tmp_path):
+    """Hai coordinator dùng chung thư mục thấy được pha của nhau."""
+    v1 = SlotCoordinator("validator_1", coordination_dir=str(tmp_path))
+    v2 = SlotCoordinator("validator_2", coordination_dir=str(tmp_path))
+
+    await v1.register_phase_entry(
+        7, SlotPhase.CONSENSUS_SCORING, {"scores": {"miner_a": 0.4}}
+    )
+    await v2.register_phase_entry(
+        7,
+        SlotPhase.CONSENSUS_SCORING,
+        {"scores": [{"miner_uid": "miner_a", "score": 0.8}]},
+    )
+
+    assert (tmp_path / "slot_7_consensus_scoring_validator_1.json").exists()
+    assert sorted(v1._get_ready_validators(7, SlotPhase.CONSENSUS_SCORING)) == [
+        "validator_1",
+        "validator_2",
+    ]
+    scores = v1._calculate_consensus_scores(7, ["validator_1", "validator_2"])
+    assert scores == {"miner_a": pytest.approx(0.6)}
+    assert v1._detect_active_slot_from_coordination() == 7
+
+    # Xoá file của validator_2 thì lần truy vấn sau không còn thấy nó
+    os.unlink(tmp_path / "slot_7_consensus_scoring_validator_2.json")
+    assert v1._get_ready_validators(7, SlotPhase.CONSENSUS_SCORING) == ["validator_1"]
+
+    v1.cleanup_old_coordination_files(current_slot=20, keep_slots=5)
+    assert list(tmp_path.glob("slot_*.json")) == []
+    assert v1._get_all_active_validators_in_slot(7) == []
+
+
+@pytest.mark.asyncio
+async def test_file_backend_serializes_score_objects(tmp_path):
+    backend = FileCoordinationBackend(str(tmp_path))
+    score = ValidatorScore(task_id="t", miner_uid="m", validator_uid="v", score=0.5)
+    assert await backend.publish(
+        PhaseAnnouncement("v", 1, "consensus_scoring", extra_data={"scores": [score]})
+    )
+    entry = backend.announcement(1, "consensus_scoring", "v")
+    assert entry.extra_data["scores"][0]["miner_uid"] == "m"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_readiness_queries():
+    index = PhaseIndex()
+    coordinators = [
+        SlotCoordinator(f"validator_{i}", backend=InMemoryCoordinationBackend(index))
+        for i in range(3)
+    ]
+    for coordinator in coordinators[:2]:
+        await coordinator.register_phase_entry(4, SlotPhase.TASK_EXECUTION)
+
+    backend = coordinators[2].backend
+    assert backend.ready_count(4, SlotPhase.TASK_EXECUTION) == 2
+    assert backend.is_ready(4, "task_execution", "validator_1")
+    assert not backend.is_ready(4, "task_execution", "validator_2")
+    ready = await coordinators[2].wait_for_phase_consensus(
+        4, SlotPhase.TASK_EXECUTION, timeout=1
+    )
+    assert sorted(ready) == ["validator_0", "validator_1"]
+
+    backend.prune(5)
+    assert backend.ready_count(4, SlotPhase.TASK_EXECUTION) == 0
+
+
+@pytest.mark.asyncio
+async def test_flexible_coordinator_uses_backend(tmp_path):
+    index = PhaseIndex()
+    v1 = FlexibleSlotCoordinator(
+        "validator_1", backend=InMemoryCoordinationBackend(index)
+    )
+    v2 = FlexibleSlotCoordinator(
+        "validator_2", backend=InMemoryCoordinationBackend(index)
+    )
+    await v1.register_phase_entry_flexible(
+        3, FlexibleSlotPhase.CONSENSUS_SCORING, {"scores": {"m": 1.0}}
+    )
+    await v2.register_phase_entry_flexible(
+        3, FlexibleSlotPhase.CONSENSUS_SCORING, {"scores": {"m": 0.0}}
+    )
+
+    assert sorted(
+        v1._get_ready_validators_flexible(3, FlexibleSlotPhase.CONSENSUS_SCORING)
+    ) == ["validator_1", "validator_2"]
+    ready = await v1._wait_for_flexible_consensus(3, timeout_seconds=1)
+    assert sorted(ready) == ["validator_1", "validator_2"]
+    assert v1._calculate_flexible_consensus_scores(3, ready) == {"m": 0.5}
+    assert v1._detect_active_slot_from_coordination() == (
+        3,
+        FlexibleSlotPhase.CONSENSUS_SCORING,
+    )
+    assert not list(tmp_path.iterdir())  # Không ghi file nào
+
+
+@pytest.mark.asyncio
+async def test_network_backend_signs_and_verifies():
+    accounts = {uid: Account.create() for uid in ("validator_1", "validator_2")}
+    addresses = {uid: acct.address for uid, acct in accounts.items()}
+    sent = []
+
+    async def transport(endpoint, payload):
+        sent.append((endpoint, payload))
+
+    sender = NetworkCoordinationBackend(
+        "validator_1",
+        account=accounts["validator_1"],
+        address_of=addresses.get,
+        transport=transport,
+    )
+    receiver = NetworkCoordinationBackend(
+        "validator_2", account=accounts["validator_2"], address_of=addresses.get
+    )
+
+    await sender.publish(
+        PhaseAnnouncement("validator_1", 9, "consensus_scoring", extra_data={"n": 1})
+    )
+    assert sender.is_ready(9, "consensus_scoring", "validator_1")
+    endpoint, payload = sent[0]
+    assert endpoint == COORDINATION_PHASE_ENDPOINT
+
+    assert receiver.receive(dict(payload))
+    assert receiver.is_ready(9, "consensus_scoring", "validator_1")
+
+    tampered = dict(payload, slot=10)
+    assert not receiver.receive(tampered)
+    assert not receiver.is_ready(10, "consensus_scoring", "validator_1")
+
+    # Chữ ký hợp lệ nhưng mạo danh validator khác
+    impersonated = dict(payload, validator_uid="validator_2")
+    assert not receiver.receive(impersonated)
+    assert not receiver.receive({"slot": 1})
+
+
+def test_prune_older_than_uses_arrival_time():
+    backend = InMemoryCoordinationBackend()
+    old = PhaseAnnouncement("v1", 1, "task_assignment", received_at=time.time() - 100)
+    backend.index.add(old)
+    backend.index.add(PhaseAnnouncement("v2", 1, "task_assignment"))
+    assert backend.prune_older_than(50) == 1
+    assert backend.active_validators(1) == ["v2"]
+    assert backend.ready_validators(1, "task_assignment", max_age=10) == ["v2"]
+
+
+def test_create_coordination_backend(tmp_path):
+    assert isinstance(
+        create_coordination_backend("file", coordination_dir=str(tmp_path)),
+        FileCoordinationBackend,
+    )
+    assert isinstance(create_coordination_backend("memory"), InMemoryCoordinationBackend)
+    assert isinstance(
+        create_coordination_backend("network", validator_uid="v"),
+        NetworkCoordinationBackend,
+    )
+    with pytest.raises(ValueError):
+        create_coordination_backend("carrier_pigeon")
@@ -0,0 +1,119 @@
+# tests/consensus/test_coordination_index.py
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from mt_core.consensus.coordination_backend import (
+    FileCoordinationBackend,
+    PhaseAnnouncement,
+)
+from mt_core.consensus.flexible_slot_coordinator import FlexibleSlotCoordinator
+
+
+def write_entry(directory, slot, phase, uid, age=0.0):
+    """Ghi file pha giống một validator khác, lùi mtime `age` giây."""
+    path = directory / f"slot_{slot}_{phase}_{uid}.json"
+    data = PhaseAnnouncement(uid, slot, phase, timestamp=time.time()).to_dict()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    tmp.rename(path)
+    if age:
+        past = time.time() - age
+        os.utime(path, (past, past))
+    return path
+
+
+def age_directory(directory, age=10.0):
+    past = time.time() - age
+    os.utime(directory, (past, past))
+
+
+def test_refresh_only_parses_changed_files(tmp_path):
+    for i in range(20):
+        write_entry(tmp_path, 1, "consensus_scoring", f"validator_{i}", age=30)
+    backend = FileCoordinationBackend(str(tmp_path))
+
+    assert backend.ready_count(1, "consensus_scoring") == 20
+    assert backend.files_parsed == 20
+
+    # Thư mục thay đổi: chỉ file mới được đọc lại
+    write_entry(tmp_path, 1, "consensus_scoring", "validator_new")
+    assert backend.ready_count(1, "consensus_scoring") == 21
+    assert backend.files_parsed == 21
+
+    # Ghi đè một file cũ (đổi mtime) thì chỉ file đó được đọc lại
+    write_entry(tmp_path, 1, "consensus_scoring", "validator_3")
+    assert backend.is_ready(1, "consensus_scoring", "validator_3")
+    assert backend.files_parsed == 22
+
+
+def test_unchanged_directory_skips_listing(tmp_path):
+    for i in range(5):
+        write_entry(tmp_path, 2, "task_assignment", f"validator_{i}", age=30)
+    age_directory(tmp_path)
+    backend = FileCoordinationBackend(str(tmp_path), rescan_interval=60)
+
+    backend.ready_validators(2, "task_assignment")
+    scans = backend.scans
+    for _ in range(100):
+        assert backend.ready_count(2, "task_assignment") == 5
+    assert backend.scans == scans
+
+    # Xoá file làm thay đổi mtime của thư mục nên được phát hiện
+    os.unlink(tmp_path / "slot_2_task_assignment_validator_0.json")
+    assert backend.ready_count(2, "task_assignment") == 4
+    assert backend.scans == scans + 1
+
+
+def test_invalid_files_are_cached_but_not_indexed(tmp_path):
+    (tmp_path / "slot_3_task_assignment_validator_x.json").write_text("{broken")
+    write_entry(tmp_path, 3, "task_assignment", "validator_y")
+    backend = FileCoordinationBackend(str(tmp_path))
+
+    assert backend.ready_validators(3, "task_assignment") == ["validator_y"]
+    parsed = backend.files_parsed
+    backend._last_scan = 0  # buộc quét lại
+    backend.refresh()
+    assert backend.files_parsed == parsed
+
+
+@pytest.mark.asyncio
+async def test_own_entries_are_not_reparsed(tmp_path):
+    backend = FileCoordinationBackend(str(tmp_path))
+    await backend.publish(PhaseAnnouncement("validator_1", 4, "consensus_scoring"))
+    assert backend.is_ready(4, "consensus_scoring", "validator_1")
+    assert backend.files_parsed == 0
+
+
+@pytest.mark.asyncio
+async def test_compaction_runs_in_background(tmp_path):
+    for slot in range(10):
+        write_entry(tmp_path, slot, "consensus_scoring", "validator_1")
+    backend = FileCoordinationBackend(str(tmp_path))
+    backend.refresh()
+
+    backend.request_compaction(8)
+    backend.request_compaction(7)  # Mục tiêu thấp hơn không làm lùi
+    await backend._compaction_task
+
+    assert sorted(p.name for p in tmp_path.glob("slot_*.json")) == [
+        "slot_8_consensus_scoring_validator_1.json",
+        "slot_9_consensus_scoring_validator_1.json",
+    ]
+    assert backend.index.slots() == [8, 9]
+
+
+@pytest.mark.asyncio
+async def test_slot_lookup_does_not_delete_inline(tmp_path):
+    coordinator = FlexibleSlotCoordinator("validator_1", coordination_dir=str(tmp_path))
+    stale = write_entry(tmp_path, 1, "consensus_scoring", "validator_2")
+
+    coordinator.get_current_slot_and_phase()
+    assert stale.exists()  # Chưa xoá trong lúc tính slot
+
+    await asyncio.sleep(0)
+    await coordinator.backend._compaction_task
+    assert not stale.exists()
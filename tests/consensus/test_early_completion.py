@@ -0,0 +1,140 @@
+# tests/consensus/test_early_completion.py
+import asyncio
+import time
+
+import pytest
+
+from mt_core.consensus.adaptive_timing import TimingProposal
+from mt_core.consensus.coordination_backend import (
+    SLOT_COMPLETE_PHASE,
+    InMemoryCoordinationBackend,
+    PhaseIndex,
+    parse_coordination_filename,
+)
+from mt_core.consensus.flexible_slot_coordinator import (
+    FlexibleSlotCoordinator,
+    FlexibleSlotPhase,
+)
+from mt_core.consensus.slot_scheduler import PhaseWindow, SlotSchedule, SlotScheduler
+
+BASELINE = TimingProposal(120, 15, 15, 30.0)
+
+
+def make_validators(*uids):
+    index = PhaseIndex()
+    return [
+        FlexibleSlotCoordinator(uid, backend=InMemoryCoordinationBackend(index))
+        for uid in uids
+    ]
+
+
+def test_slot_complete_files_are_recognised():
+    assert parse_coordination_filename("slot_7_slot_complete_validator_1.json") == (
+        7,
+        SLOT_COMPLETE_PHASE,
+        "validator_1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_early_start_needs_every_participant():
+    v1, v2 = make_validators("v1", "v2")
+    for validator in (v1, v2):
+        await validator.register_phase_entry_flexible(5, FlexibleSlotPhase.TASK_ASSIGNMENT)
+
+    await v1.announce_slot_complete(5)
+    assert v1.early_slot_start(5) is None  # v2 vẫn còn việc
+
+    await v2.announce_slot_complete(5)
+    start = v1.early_slot_start(5, grace=3.0)
+    latest = max(e.timestamp for e in v1.backend.announcements(5, SLOT_COMPLETE_PHASE))
+    assert start == pytest.approx(latest + 3.0)
+    assert v2.early_slot_start(5, grace=3.0) == start  # Cùng một mốc cho mọi validator
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_at_deadline():
+    v1, v2 = make_validators("v1", "v2")
+    await v2.register_phase_entry_flexible(5, FlexibleSlotPhase.CONSENSUS_SCORING)
+    await v1.announce_slot_complete(5)
+
+    started = time.monotonic()
+    assert await v1.wait_for_slot_complete(5, until=time.time() + 0.5) is None
+    assert time.monotonic() - started < 1.0
+
+
+def test_shift_epoch_keeps_slot_numbers_continuous():
+    (coordinator,) = make_validators("v1")
+    old = coordinator.slot_schedule()
+    slot = 500000
+    start = old.slot_start(slot) - 20.0
+
+    schedule = coordinator.shift_epoch(slot, start, BASELINE)
+    assert schedule.slot_start(slot) == pytest.approx(start)
+    assert schedule.slot_start(slot + 1) - schedule.slot_start(slot) == old.slot_duration
+    assert schedule.locate(start + 1.0) == (slot, 0)
+    assert coordinator.timing_announcement()["effective_slot"] == slot
+
+    # Không bao giờ lùi mốc slot về sau
+    assert coordinator.shift_epoch(slot, start + 1.0, BASELINE) is None
+
+
+@pytest.mark.asyncio
+async def test_shifted_anchor_reaches_late_joiners():
+    veteran, joiner = make_validators("v1", "v2")
+    slot = 500000
+    start = veteran.slot_schedule().slot_start(slot) - 30.0
+    veteran.shift_epoch(slot, start, BASELINE)
+    await veteran.register_phase_entry_flexible(
+        slot,
+        FlexibleSlotPhase.METAGRAPH_UPDATE,
+        {"active_timing": veteran.timing_announcement()},
+    )
+
+    assert joiner.adopt_announced_timing() == BASELINE
+    assert joiner.slot_schedule().slot_start(slot + 5) == pytest.approx(
+        veteran.slot_schedule().slot_start(slot + 5)
+    )
+
+
+def test_shift_applies_to_timing_adopted_for_the_same_slot():
+    (coordinator,) = make_validators("v1")
+    slot = 500000
+    faster = TimingProposal(60, 10, 10, 15.0)
+    adopted = coordinator.adopt_timing(faster, slot)
+    start = adopted.slot_start(slot) - 10.0
+
+    schedule = coordinator.shift_epoch(slot, start, BASELINE)
+    assert schedule.slot_duration == faster.slot_duration_seconds
+    assert schedule.slot_start(slot) == pytest.approx(start)
+
+    assert coordinator.activate_timing(slot) == faster
+    assert coordinator.slot_schedule().slot_start(slot + 2) == pytest.approx(
+        schedule.slot_start(slot + 2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_brings_queued_slot_forward():
+    epoch = time.time()
+    windows = [PhaseWindow("a", 0.0, 0.1), PhaseWindow("b", 0.1, 0.4)]
+    scheduler = None
+    fired = []
+
+    async def on_phase(slot, phase):
+        fired.append((slot, phase, time.monotonic()))
+        if (slot, phase) == (0, "b"):
+            # Mọi validator đã xong: slot 1 bắt đầu ở 0.25s thay vì 0.4s
+            scheduler.set_schedule(SlotSchedule(epoch - 0.15, 0.4, windows), 1)
+        if len(fired) == 4:
+            scheduler.stop()
+
+    scheduler = SlotScheduler(SlotSchedule(epoch, 0.4, windows), on_phase)
+    scheduler.start(0)
+    await asyncio.wait_for(scheduler.run(), timeout=2)
+
+    start = fired[0][2]
+    assert [(s, p) for s, p, _ in fired] == [(0, "a"), (0, "b"), (1, "a"), (1, "b")]
+    assert [at - start for _, _, at in fired] == pytest.approx(
+        [0.0, 0.1, 0.25, 0.35], abs=0.04
+    )
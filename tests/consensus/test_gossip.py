@@ -0,0 +1,222 @@
+# tests/consensus/test_gossip.py
+import asyncio
+import hashlib
+import math
+import time
+
+import pytest
+
+from mt_core.consensus.gossip import (
+    ScoreGossip,
+    bundle_slot,
+    decode_envelope,
+    encode_envelope,
+    gossip_bundle_id,
+    gossip_neighbours,
+)
+from mt_core.core.datatypes import ValidatorScore
+from mt_core.network.score_codec import ScoreBroadcast, encode_score_broadcast
+
+SLOT = 42
+
+
+def make_bundle(origin, slot=SLOT, scores=3):
+    broadcast = ScoreBroadcast(
+        sender_uid=origin,
+        broadcast_id=gossip_bundle_id(slot),
+        timestamp=1760000000,
+        scores=[
+            ValidatorScore(
+                task_id=f"slot_{slot}_{origin}_miner_{i}",
+                miner_uid=f"miner_{i}",
+                validator_uid=origin,
+                score=0.5,
+                timestamp=1760000000.0,
+            )
+            for i in range(scores)
+        ],
+        signature=b"sig",
+    )
+    return encode_score_broadcast(broadcast)
+
+
+async def run_network(n, fanout=3, redundancy=2, faulty=(), flush_interval=0.001):
+    """Mạng mô phỏng trong tiến trình: n validator, validator lỗi không chuyển tiếp."""
+    uids = [f"validator_{i:04d}" for i in range(n)]
+    faulty = set(faulty)
+    delivered = {uid: [] for uid in uids}
+    hops = {uid: {} for uid in uids}  # khoá bundle -> số bước nhảy
+    stats = {"messages": 0}
+    nodes = {}
+
+    def make_transport(sender):
+        async def transport(peer, message):
+            stats["messages"] += 1
+            if peer in faulty:
+                return
+            for bundle in decode_envelope(message):
+                key = hashlib.sha256(bundle).digest()
+                hop = hops[sender][key] + 1
+                hops[peer][key] = min(hops[peer].get(key, hop), hop)
+            await nodes[peer].receive(message, sender)
+
+        return transport
+
+    for uid in uids:
+
+        async def deliver(slot, broadcast, uid=uid):
+            delivered[uid].append(broadcast.sender_uid)
+
+        nodes[uid] = ScoreGossip(
+            uid,
+            members=lambda slot: uids,
+            transport=make_transport(uid),
+            deliver=deliver,
+            fanout=fanout,
+            redundancy=redundancy,
+            flush_interval=flush_interval,
+        )
+
+    for uid in uids:
+        if uid in faulty:
+            continue
+        bundle = make_bundle(uid)
+        hops[uid][hashlib.sha256(bundle).digest()] = 0
+        await nodes[uid].publish(SLOT, bundle)
+
+    while True:
+        before = stats["messages"]
+        await asyncio.gather(*(node.drain() for node in nodes.values()))
+        if stats["messages"] == before:
+            break
+
+    honest = [uid for uid in uids if uid not in faulty]
+    return {
+        "nodes": nodes,
+        "honest": honest,
+        "delivered": delivered,
+        "messages": stats["messages"],
+        "max_hops": max(max(h.values()) for uid, h in hops.items() if uid in honest),
+        "max_degree": max(len(nodes[uid].neighbours(SLOT)) for uid in uids),
+    }
+
+
+def test_neighbours_are_deterministic_symmetric_and_bounded():
+    uids = [f"v{i}" for i in range(100)]
+    overlay = {uid: gossip_neighbours(uid, uids, SLOT, fanout=3, redundancy=2) for uid in uids}
+
+    assert overlay["v7"] == gossip_neighbours("v7", list(reversed(uids)), SLOT, 3, 2)
+    assert all(len(peers) <= 2 * (3 + 1) for peers in overlay.values())
+    assert all(uid in overlay[peer] for uid, peers in overlay.items() for peer in peers)
+    # Mỗi slot một cây khác, tải chuyển tiếp được luân phiên
+    assert overlay["v7"] != gossip_neighbours("v7", uids, SLOT + 1, 3, 2)
+
+
+def test_envelope_and_bundle_id_round_trip():
+    bundles = [make_bundle("a"), make_bundle("b")]
+    assert decode_envelope(encode_envelope(bundles)) == bundles
+    with pytest.raises(ValueError):
+        decode_envelope(encode_envelope(bundles)[:-3])
+    assert bundle_slot(gossip_bundle_id(17)) == 17
+    assert bundle_slot("flexible_broadcast_17") is None
+
+
+@pytest.mark.asyncio
+async def test_every_validator_gets_every_bundle_once_in_log_hops():
+    n = 60
+    result = await run_network(n)
+
+    for uid in result["honest"]:
+        others = sorted(set(result["honest"]) - {uid})
+        assert sorted(result["delivered"][uid]) == others  # Đủ và không lặp
+    assert result["max_degree"] <= 2 * (3 + 1)
+    assert result["max_hops"] <= 2 * math.ceil(math.log(n, 3))
+    assert sum(node.duplicates for node in result["nodes"].values()) > 0
+
+
+@pytest.mark.asyncio
+async def test_redundant_trees_route_around_faulty_relays():
+    n = 80
+    faulty = {f"validator_{i:04d}" for i in (3, 17, 41, 66)}
+    result = await run_network(n, redundancy=3, faulty=faulty)
+
+    for uid in result["honest"]:
+        assert set(result["delivered"][uid]) == set(result["honest"]) - {uid}
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_stale_bundles_are_not_relayed():
+    sent = []
+
+    async def transport(peer, message):
+        sent.append(peer)
+
+    async def verify(broadcast, body):
+        return broadcast.sender_uid != "forger"
+
+    gossip = ScoreGossip(
+        "v0",
+        members=lambda slot: ["v0", "v1", "v2"],
+        transport=transport,
+        verify=verify,
+        flush_interval=0.0,
+        retention_slots=2,
+    )
+    assert await gossip.receive(encode_envelope([make_bundle("forger")]), "v1") == 0
+    assert gossip.rejected == 1
+
+    for slot in (10, 11):
+        assert await gossip.receive(encode_envelope([make_bundle("v1", slot)]), "v1") == 1
+    assert await gossip.receive(encode_envelope([make_bundle("v1", 11)]), "v2") == 0
+    assert await gossip.receive(encode_envelope([make_bundle("v2", 3)]), "v1") == 0
+    await gossip.drain()
+    assert sent and set(sent) == {"v2"}  # Không gửi ngược về người gửi
+
+
+@pytest.mark.asyncio
+async def test_bundles_for_far_off_slots_cannot_evict_the_current_slot():
+    delivered = []
+
+    async def deliver(slot, broadcast):
+        delivered.append((slot, broadcast.sender_uid))
+
+    current = 100
+    gossip = ScoreGossip(
+        "v0",
+        members=lambda slot: ["v0", "v1", "v2"],
+        deliver=deliver,
+        accepts_slot=lambda slot: current - 4 < slot <= current + 1,
+        flush_interval=0.0,
+        retention_slots=2,
+    )
+    assert await gossip.receive(encode_envelope([make_bundle("v1", current)]), "v1") == 1
+
+    # Bundle ký hợp lệ nhưng slot quá xa: bị loại trước khi đánh dấu, chuyển tiếp hay giao
+    bogus = [make_bundle("v1", current + 10**6 + i) for i in range(3)]
+    assert await gossip.receive(encode_envelope(bogus), "v1") == 0
+    assert gossip.rejected == 3
+    assert gossip.stats()["tracked_slots"] == 1
+
+    # Bundle của slot hiện tại từ validator khác vẫn được nhận
+    assert await gossip.receive(encode_envelope([make_bundle("v2", current)]), "v2") == 1
+    assert delivered == [(current, "v1"), (current, "v2")]
+    await gossip.drain()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_benchmark_gossip_300_validators():
+    n = 300
+    started = time.perf_counter()
+    result = await run_network(n)
+    elapsed = time.perf_counter() - started
+
+    all_to_all = n * (n - 1)
+    print(
+        f"\n{n} validators: {result['messages']} gossip messages vs {all_to_all} all-to-all, "
+        f"max hops {result['max_hops']}, max degree {result['max_degree']}, {elapsed:.2f}s"
+    )
+    for uid in result["honest"]:
+        assert len(result["delivered"][uid]) == n - 1
+    assert result["max_hops"] <= 2 * math.ceil(math.log(n, 3))
+    assert result["messages"] < all_to_all
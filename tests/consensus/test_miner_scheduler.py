@@ -0,0 +1,110 @@
+# tests/consensus/test_miner_scheduler.py
+from types import SimpleNamespace
+
+import pytest
+
+from mt_core.consensus.miner_scheduler import MinerScheduler
+from mt_core.core.datatypes import MinerInfo
+from mt_core.monitoring.circuit_breaker import CircuitBreakerRegistry
+
+
+def miner(uid, endpoint=None):
+    return MinerInfo(uid=uid, address=f"addr_{uid}", api_endpoint=endpoint or f"http://{uid}")
+
+
+def test_limit_follows_capacity_cap_and_success_rate():
+    scheduler = MinerScheduler(max_tasks_per_miner=4)
+    m = miner("m1")
+    assert scheduler.limit(m) == 1  # Chưa quảng bá capacity
+
+    scheduler.set_capacity("http://m1/", 8)
+    # Capacity 8 bị chặn ở 4, rồi nhân với tỉ lệ thành công ban đầu 0.5
+    assert scheduler.limit(m) == 2
+    for _ in range(8):
+        scheduler.started(m)
+        scheduler.finished(m, 1.0)
+    assert scheduler.limit(m) == 4
+
+    for _ in range(20):
+        scheduler.started(m)
+        scheduler.finished(m, None)
+    assert scheduler.limit(m) == 1  # Miner hay lỗi quay về 1 task
+
+
+def test_latency_ewma():
+    scheduler = MinerScheduler(latency_alpha=0.5)
+    m = miner("m1")
+    assert scheduler.expected_latency(m, default=9.0) == 9.0
+    scheduler.started(m)
+    scheduler.finished(m, 2.0)
+    scheduler.started(m)
+    scheduler.finished(m, 4.0)
+    assert scheduler.expected_latency(m, default=9.0) == pytest.approx(3.0)
+
+
+def test_first_tasks_go_before_follow_ups_and_by_urgency():
+    scheduler = MinerScheduler(max_tasks_per_miner=2, tasks_per_miner_per_slot=2)
+    fast, slow = miner("fast"), miner("slow")
+    scheduler.set_capacity("http://fast", 4)
+    for _ in range(4):
+        scheduler.started(fast)
+        scheduler.finished(fast, 1.0)
+    scheduler.started(slow)
+    scheduler.finished(slow, 8.0)
+
+    scheduler.push(fast, window_end=20.0, default_latency=5.0)
+    scheduler.push(slow, window_end=20.0, default_latency=5.0)
+
+    # Miner chậm phải bắt đầu sớm hơn nên được gửi trước
+    order = []
+    for _ in range(3):
+        item = scheduler.pop_ready(now=0.0)
+        scheduler.started(item.miner)
+        order.append((item.miner.uid, item.round))
+    assert order == [("slow", 1), ("fast", 1), ("fast", 2)]
+    # Task thứ 2 của miner chậm chờ tới khi miner rảnh
+    assert scheduler.pop_ready(now=0.0) is None
+    scheduler.finished(slow, 8.0)
+    assert scheduler.pop_ready(now=0.0).miner.uid == "slow"
+
+
+def test_follow_ups_wait_for_a_free_slot_and_expire():
+    scheduler = MinerScheduler(tasks_per_miner_per_slot=3)
+    m = miner("m1")
+    scheduler.push(m, window_end=10.0, default_latency=4.0)
+
+    first = scheduler.pop_ready(now=0.0)
+    scheduler.started(m)
+    assert first.round == 1
+    assert scheduler.pop_ready(now=0.0) is None  # Miner đang bận (limit 1)
+    assert scheduler.pending == 1
+
+    scheduler.finished(m, 4.0)
+    assert scheduler.pop_ready(now=7.0) is None  # Không còn kịp hoàn thành trước 10s
+    assert scheduler.pending == 0
+
+
+def test_drop_pending_and_from_settings():
+    scheduler = MinerScheduler.from_settings(
+        SimpleNamespace(CONSENSUS_MAX_TASKS_PER_MINER=2, CONSENSUS_TASKS_PER_MINER_PER_SLOT=5)
+    )
+    assert (scheduler.max_tasks_per_miner, scheduler.tasks_per_miner_per_slot) == (2, 5)
+    a, b = miner("a"), miner("b")
+    scheduler.push(a, 10.0, 1.0)
+    scheduler.push(b, 10.0, 1.0)
+    scheduler.drop_pending(a)
+    assert scheduler.pop_ready(now=0.0).miner.uid == "b"
+
+
+def test_open_breaker_drops_miner_tasks():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=60)
+    scheduler = MinerScheduler(tasks_per_miner_per_slot=1, breakers=breakers)
+    a, b = miner("a"), miner("b")
+    scheduler.push(a, 10.0, 1.0)
+    scheduler.push(b, 10.0, 1.0)
+    breakers.record_failure("http://a")
+    assert not scheduler.reachable(a) and scheduler.reachable(b)
+    # Task của miner "a" bị bỏ, không chờ lượt
+    assert scheduler.pop_ready(now=0.0).miner.uid == "b"
+    assert scheduler.pending == 0
+    assert scheduler.stats()["skipped_open"] == 1
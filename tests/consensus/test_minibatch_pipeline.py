@@ -0,0 +1,337 @@
+# tests/consensus/test_minibatch_pipeline.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mt_core.consensus.miner_scheduler import MinerScheduler
+from mt_core.consensus.online_aggregator import OnlineScoreAggregator
+from mt_core.consensus.score_store import ScoreStore
+from mt_core.consensus.validator_node_consensus import ValidatorNodeConsensus
+from mt_core.consensus.validator_node_tasks import ValidatorNodeTasks
+from mt_core.core.datatypes import MinerInfo, MinerResult, ValidatorScore
+from mt_core.monitoring.circuit_breaker import CircuitBreakerRegistry
+
+
+def make_core(
+    batch_size=2, inflight=2, batch_timeout=5.0, assignment_minutes=1, tasks_per_slot=1
+):
+    """Tạo core giả với các thuộc tính mà dispatcher sử dụng."""
+    score_store = ScoreStore()
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=60)
+    return SimpleNamespace(
+        uid_prefix="[validator_test]",
+        info=SimpleNamespace(uid="validator_test", api_endpoint="http://localhost:8001"),
+        settings=SimpleNamespace(
+            CONSENSUS_MINIBATCH_SIZE=batch_size,
+            CONSENSUS_BATCH_TIMEOUT=batch_timeout,
+            CONSENSUS_MAX_INFLIGHT_BATCHES=inflight,
+        ),
+        slot_config=SimpleNamespace(task_assignment_minutes=assignment_minutes),
+        tasks_sent={},
+        miner_is_busy=set(),
+        miner_breakers=breakers,
+        miner_scheduler=MinerScheduler(
+            tasks_per_miner_per_slot=tasks_per_slot, breakers=breakers
+        ),
+        batch_task_miners={},
+        results_buffer={},
+        results_buffer_lock=asyncio.Lock(),
+        result_waiters={},
+        unanswered_tasks={},
+        timing_controller=None,
+        current_batch_timeout=lambda: batch_timeout,
+        score_store=score_store,
+        slot_scores=score_store.slot_scores,
+        score_aggregator=OnlineScoreAggregator(),
+        validator_trust_weight=lambda uid: 1.0,
+        cycle_scores=score_store.task_view("cycle", lambda: 0),
+        current_cycle=0,
+        get_current_blockchain_slot=lambda: 7,
+    )
+
+
+def make_miners(count):
+    return [
+        MinerInfo(uid=f"miner_{i}", address=f"addr_{i}", api_endpoint=f"http://miner{i}")
+        for i in range(count)
+    ]
+
+
+def install_fake_network(tasks, delays, sent_log):
+    """Thay thế việc gửi HTTP bằng việc trả kết quả sau một độ trễ cho từng miner."""
+
+    async def deliver(task_id, miner_uid, delay):
+        await asyncio.sleep(delay)
+        await tasks.add_miner_result(
+            MinerResult(
+                task_id=task_id,
+                miner_uid=miner_uid,
+                result_data={"output": "ok"},
+                timestamp_received=time.time(),
+            )
+        )
+
+    async def fake_send(miner_endpoint, task):
+        miner_uid = tasks.core.tasks_sent[task.task_id].miner_uid
+        sent_log.append((time.monotonic(), miner_uid))
+        delay = delays.get(miner_uid)
+        if delay is not None:
+            asyncio.create_task(deliver(task.task_id, miner_uid, delay))
+        return True
+
+    tasks._send_task_implementation = fake_send
+
+
+@pytest.mark.asyncio
+async def test_slow_miner_does_not_stall_queued_miners():
+    """Miner chậm chỉ làm chậm task của chính nó, không chặn các miner phía sau."""
+    core = make_core(batch_size=2, inflight=1, batch_timeout=2.0)
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(4)
+    sent_log = []
+    delays = {"miner_0": 1.5, "miner_1": 0.05, "miner_2": 0.05, "miner_3": 0.05}
+    install_fake_network(tasks, delays, sent_log)
+
+    start = time.monotonic()
+    await tasks.cardano_send_minibatches(5, miners)
+    elapsed = time.monotonic() - start
+
+    assert sorted(s.miner_uid for s in core.slot_scores[5]) == [
+        "miner_0",
+        "miner_1",
+        "miner_2",
+        "miner_3",
+    ]
+    # Miners 2 and 3 are dispatched as soon as miner_1 frees capacity, not after miner_0
+    dispatch_times = {uid: t for t, uid in sent_log}
+    assert dispatch_times["miner_3"] - start < 1.0
+    assert elapsed < 2.0
+    assert core.result_waiters == {}
+    assert core.tasks_sent == {}
+    assert core.miner_is_busy == set()
+
+
+@pytest.mark.asyncio
+async def test_inflight_limit_is_respected():
+    """Số task đang chạy không vượt quá batch_size * số batch in-flight."""
+    core = make_core(batch_size=2, inflight=2, batch_timeout=2.0)
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(10)
+    sent_log = []
+    install_fake_network(tasks, {m.uid: 0.05 for m in miners}, sent_log)
+
+    peak = 0
+    original_dispatch = tasks._dispatch_minibatch_task
+
+    async def tracking_dispatch(*args, **kwargs):
+        nonlocal peak
+        peak = max(peak, len(core.result_waiters) + 1)
+        return await original_dispatch(*args, **kwargs)
+
+    tasks._dispatch_minibatch_task = tracking_dispatch
+    await tasks.cardano_send_minibatches(3, miners)
+
+    assert len(core.slot_scores[3]) == 10
+    assert peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_miner_times_out_within_batch_timeout():
+    """Miner không trả kết quả chỉ bị chờ tối đa CONSENSUS_BATCH_TIMEOUT."""
+    core = make_core(batch_size=2, inflight=1, batch_timeout=0.3)
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(2)
+    sent_log = []
+    install_fake_network(tasks, {"miner_1": 0.05}, sent_log)
+
+    start = time.monotonic()
+    await tasks.cardano_send_minibatches(9, miners)
+
+    assert time.monotonic() - start < 1.0
+    assert [s.miner_uid for s in core.slot_scores[9]] == ["miner_1"]
+    assert core.result_waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_fast_miners_get_follow_up_tasks_within_window():
+    """Miner nhanh nhận thêm task trong cửa sổ; miner chậm không chặn họ."""
+    core = make_core(batch_size=4, inflight=1, batch_timeout=0.6, tasks_per_slot=3)
+    core.slot_config.task_assignment_minutes = 0.02  # Cửa sổ 1.2s
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(3)
+    core.miner_scheduler.set_capacity("http://miner0", 2)
+    sent_log = []
+    install_fake_network(
+        tasks, {"miner_0": 0.05, "miner_1": 0.05, "miner_2": 0.5}, sent_log
+    )
+
+    await tasks.cardano_send_minibatches(11, miners)
+
+    per_miner = {}
+    for score in core.slot_scores[11]:
+        per_miner[score.miner_uid] = per_miner.get(score.miner_uid, 0) + 1
+    assert per_miner["miner_0"] == 3 and per_miner["miner_1"] == 3
+    assert per_miner["miner_2"] >= 1
+    # miner_0 quảng bá capacity 2 nên có 2 task chạy song song ngay từ đầu
+    first_sends = [uid for _, uid in sent_log[:4]]
+    assert first_sends.count("miner_0") == 2
+    # Điểm của validator cho mỗi miner là trung bình các task của miner đó
+    miner_0_scores = [s.score for s in core.slot_scores[11] if s.miner_uid == "miner_0"]
+    assert core.score_aggregator.miner_consensus(11, "miner_0") == pytest.approx(
+        sum(miner_0_scores) / len(miner_0_scores)
+    )
+    assert core.miner_scheduler.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dead_miner_is_skipped_after_breaker_opens():
+    """Miner không kết nối được chỉ tốn một lần thử; slot của nó dành cho miner khỏe."""
+    core = make_core(batch_size=2, inflight=1, batch_timeout=0.5, tasks_per_slot=3)
+    core.slot_config.task_assignment_minutes = 0.02  # Cửa sổ 1.2s
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(2)
+    posts = []
+
+    async def deliver(task_id, miner_uid):
+        await asyncio.sleep(0.05)
+        await tasks.add_miner_result(
+            MinerResult(
+                task_id=task_id,
+                miner_uid=miner_uid,
+                result_data={"output": "ok"},
+                timestamp_received=time.time(),
+            )
+        )
+
+    class FakePool:
+        async def post(self, url, json, headers, timeout):
+            posts.append(url)
+            if url.startswith("http://miner0"):
+                raise ConnectionError("connection refused")
+            asyncio.create_task(deliver(json["task_id"], json["task_data"]["miner_uid"]))
+            return SimpleNamespace(status_code=200, headers={})
+
+    core.http_pool = FakePool()
+
+    await tasks.cardano_send_minibatches(12, miners)
+    assert core.miner_breakers.open_keys() == ["http://miner0"]
+    assert [s.miner_uid for s in core.slot_scores[12]] == ["miner_1"] * 3
+
+    # Slot sau: miner_0 bị bỏ qua ngay, không chờ timeout của request
+    start = time.monotonic()
+    await tasks.cardano_send_minibatches(13, miners)
+    assert time.monotonic() - start < 1.0
+    assert sum(url.startswith("http://miner0") for url in posts) == 1
+    assert [s.miner_uid for s in core.slot_scores[13]] == ["miner_1"] * 3
+    assert core.miner_scheduler.stats()["skipped_open"] == 1
+
+    # Gửi trực tiếp tới miner đã chết trả về False ngay, không gọi HTTP
+    assert not core.miner_scheduler.reachable(miners[0])
+    assert await tasks._send_task_implementation("http://miner0", SimpleNamespace(task_id="t")) is False
+    assert sum(url.startswith("http://miner0") for url in posts) == 1
+
+
+@pytest.mark.asyncio
+async def test_miner_that_accepts_but_never_answers_trips_its_breaker():
+    """Miner nhận task (HTTP 200) nhưng không bao giờ trả kết quả vẫn bị ngắt mạch."""
+    core = make_core(batch_size=2, inflight=1, batch_timeout=0.2)
+    core.miner_breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60)
+    core.miner_scheduler.breakers = core.miner_breakers
+    tasks = ValidatorNodeTasks(core)
+    miners = make_miners(2)
+    posts = []
+
+    async def deliver(task_id, miner_uid):
+        await asyncio.sleep(0.02)
+        await tasks.add_miner_result(
+            MinerResult(
+                task_id=task_id,
+                miner_uid=miner_uid,
+                result_data={"output": "ok"},
+                timestamp_received=time.time(),
+            )
+        )
+
+    class FakePool:
+        async def post(self, url, json, headers, timeout):
+            posts.append(url)
+            if not url.startswith("http://miner0"):
+                asyncio.create_task(deliver(json["task_id"], json["task_data"]["miner_uid"]))
+            return SimpleNamespace(status_code=200, headers={})
+
+    core.http_pool = FakePool()
+
+    # Hai slot hết thời gian chờ kết quả thì breaker của miner_0 mở
+    for slot in (20, 21):
+        await tasks.cardano_send_minibatches(slot, miners)
+    assert core.miner_breakers.open_keys() == ["http://miner0"]
+    assert core.miner_breakers.get("http://miner1").failures == 0
+
+    # Slot sau không còn gửi tới miner_0, nên không phải chờ timeout nữa
+    start = time.monotonic()
+    await tasks.cardano_send_minibatches(22, miners)
+    assert time.monotonic() - start < 0.15
+    assert sum(url.startswith("http://miner0") for url in posts) == 2
+    assert [s.miner_uid for s in core.slot_scores[22]] == ["miner_1"]
+
+
+def test_validators_with_different_breakers_agree_on_reachable_picks():
+    """Breaker cục bộ khác nhau không làm các validator chọn miner khác nhau."""
+    miners = make_miners(12)
+    for i, miner in enumerate(miners):
+        miner.trust_score = 0.2 + 0.05 * i
+
+    def make_validator(dead_endpoints):
+        core = make_core()
+        core.settings.CONSENSUS_NUM_MINERS_TO_SELECT = 5
+        core.settings.CONSENSUS_PARAM_BETA = 0.1
+        core.settings.CONSENSUS_PARAM_MAX_TIME_BONUS = 10
+        core.miners_info = {m.uid: m for m in miners}
+        for endpoint in dead_endpoints:
+            core.miner_breakers.record_failure(endpoint)
+        return ValidatorNodeTasks(core)
+
+    # Validator B thấy miner đứng đầu thứ tự của slot bị ngắt mạch
+    healthy = make_validator([])
+    for slot in range(30, 40):
+        picks_a = healthy.cardano_select_miners(slot)
+        dead = picks_a[0].api_endpoint
+        picks_b = make_validator([dead]).cardano_select_miners(slot)
+
+        uids_a = [m.uid for m in picks_a]
+        uids_b = [m.uid for m in picks_b]
+        assert len(uids_a) == len(uids_b) == 5
+        assert picks_a[0].uid not in uids_b
+        # Mọi miner B chọn mà A cũng chọn giữ nguyên thứ tự; chỗ trống được
+        # lấp bằng miner kế tiếp trong cùng thứ tự
+        assert uids_b[:4] == uids_a[1:]
+        # Cùng trạng thái breaker thì cùng kết quả
+        assert uids_a == [m.uid for m in make_validator([]).cardano_select_miners(slot)]
+
+
+@pytest.mark.asyncio
+async def test_flexible_aggregation_keeps_mean_over_miner_tasks():
+    """Miner chạy hai task trong slot: điểm cục bộ là trung bình, không phải điểm cuối."""
+    core = make_core()
+    core.slot_aggregated_scores = {}
+    consensus = ValidatorNodeConsensus.__new__(ValidatorNodeConsensus)
+    consensus.core = core
+    consensus.uid_prefix = core.uid_prefix
+
+    # Dispatcher lưu từng điểm và đưa trung bình vào aggregator khi kết quả về
+    scores = [
+        ValidatorScore(task_id="t1", miner_uid="miner_0", validator_uid="validator_test", score=0.2),
+        ValidatorScore(task_id="t2", miner_uid="miner_0", validator_uid="validator_test", score=0.8),
+    ]
+    core.slot_scores[14].extend(scores)
+    core.score_aggregator.add_score(14, "miner_0", "validator_test", 0.5)
+    core.score_aggregator.add_score(14, "miner_0", "validator_peer", 0.7)
+
+    await consensus.aggregate_scores_flexible(14)
+
+    assert core.slot_aggregated_scores[14]["miner_0"] == pytest.approx(0.6)
+    assert await consensus._collect_local_scores_for_consensus(14) == {
+        "miner_0": pytest.approx(0.5)
+    }
@@ -0,0 +1,90 @@
+# tests/consensus/test_online_aggregator.py
+import random
+
+import numpy as np
+import pytest
+
+from mt_core.consensus.online_aggregator import OnlineScoreAggregator
+from mt_core.core.datatypes import ValidatorScore
+
+
+def make_score(miner_uid, validator_uid, score, task_id="task_0"):
+    return ValidatorScore(
+        task_id=task_id, miner_uid=miner_uid, validator_uid=validator_uid, score=score
+    )
+
+
+def test_trust_weighted_mean_and_variance():
+    aggregator = OnlineScoreAggregator()
+    aggregator.add_score(1, "miner_a", "v1", 0.8, weight=1.0)
+    aggregator.add_score(1, "miner_a", "v2", 0.4, weight=3.0)
+
+    # (1*0.8 + 3*0.4) / 4 = 0.5
+    assert aggregator.miner_consensus(1, "miner_a") == pytest.approx(0.5)
+    stats = aggregator.miner_stats(1, "miner_a")
+    assert stats.count == 2
+    assert stats.total_weight == pytest.approx(4.0)
+    expected_var = (1.0 * (0.8 - 0.5) ** 2 + 3.0 * (0.4 - 0.5) ** 2) / 4.0
+    assert stats.variance == pytest.approx(expected_var)
+
+
+def test_resubmission_replaces_previous_contribution():
+    """Điểm mới của cùng validator thay thế điểm cũ (last score wins)."""
+    aggregator = OnlineScoreAggregator()
+    aggregator.add_score(5, "miner_a", "v1", 0.2)
+    aggregator.add_score(5, "miner_a", "v2", 0.6)
+    aggregator.add_score(5, "miner_a", "v1", 1.0)
+
+    assert aggregator.miner_stats(5, "miner_a").count == 2
+    assert aggregator.miner_consensus(5, "miner_a") == pytest.approx(0.8)
+    assert aggregator.validators(5) == {"v1", "v2"}
+
+
+def test_zero_trust_falls_back_to_plain_mean():
+    aggregator = OnlineScoreAggregator()
+    aggregator.add_score(2, "miner_a", "v1", 0.3, weight=0.0)
+    aggregator.add_score(2, "miner_a", "v2", 0.5, weight=0.0)
+    assert aggregator.miner_consensus(2, "miner_a") == pytest.approx(0.4)
+
+
+def test_interim_consensus_matches_batch_recomputation():
+    """Kết quả tăng dần phải khớp với việc tính lại toàn bộ ở cuối."""
+    rng = random.Random(7)
+    aggregator = OnlineScoreAggregator()
+    weights = {f"v{i}": rng.random() for i in range(10)}
+    latest = {}
+    for _ in range(2000):
+        miner = f"miner_{rng.randrange(50)}"
+        validator = rng.choice(list(weights))
+        score = rng.random()
+        aggregator.add_score(9, miner, validator, score, weights[validator])
+        latest[(miner, validator)] = score
+
+    expected = {}
+    for miner in {m for m, _ in latest}:
+        pairs = [(s, weights[v]) for (m, v), s in latest.items() if m == miner]
+        expected[miner] = np.average([s for s, _ in pairs], weights=[w for _, w in pairs])
+
+    result = aggregator.consensus(9)
+    assert set(result) == set(expected)
+    for miner, value in expected.items():
+        assert result[miner] == pytest.approx(value, rel=1e-9)
+
+
+def test_add_scores_merge_and_prune():
+    aggregator = OnlineScoreAggregator()
+    added = aggregator.add_scores(
+        100, "v2", [make_score("miner_a", "v2", 0.9), make_score("miner_b", "v2", 0.1)]
+    )
+    assert added == 2
+
+    aggregator.add_score(3, "miner_a", "v1", 0.5)
+    assert aggregator.merge_slot(100, 3) == 2
+    assert aggregator.consensus(3) == {
+        "miner_a": pytest.approx(0.7),
+        "miner_b": pytest.approx(0.1),
+    }
+
+    assert aggregator.prune(keep_from_slot=50) == 1
+    assert aggregator.slots() == [100]
+    assert aggregator.consensus(3) == {}
@@ -0,0 +1,86 @@
+# tests/consensus/test_quorum.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mt_core.consensus.quorum import (
+    QuorumRule,
+    QuorumTracker,
+    quorum_rule_from_settings,
+)
+
+
+def test_count_rule_uses_fraction_and_minimum():
+    rule = QuorumRule(fraction=0.6, min_count=2)
+    expected = {f"v{i}": 1.0 for i in range(5)}  # cần ceil(0.6 * 5) = 3
+
+    assert not rule.is_met({"v1"}, expected, local_uid="v0")
+    assert rule.is_met({"v1", "v2"}, expected, local_uid="v0")
+    # Không có validator kỳ vọng: chỉ còn điều kiện min_count
+    assert not rule.is_met(set(), {}, local_uid="v0")
+    assert rule.is_met({"v1"}, {}, local_uid="v0")
+
+
+def test_stake_weighted_rule():
+    rule = QuorumRule(fraction=0.5, min_count=1, stake_weighted=True)
+    expected = {"whale": 900.0, "a": 50.0, "b": 50.0}
+
+    assert not rule.is_met({"a", "b"}, expected)
+    assert rule.is_met({"whale"}, expected)
+    # Không có thông tin stake: quay về đếm số lượng
+    assert rule.is_met({"a", "b"}, {"a": 0.0, "b": 0.0, "c": 0.0})
+
+
+def test_rule_from_settings():
+    settings = SimpleNamespace(
+        validators=SimpleNamespace(
+            min_for_consensus=3, required_percentage=0.75, quorum_stake_weighted=True
+        )
+    )
+    assert quorum_rule_from_settings(settings) == QuorumRule(0.75, 3, True)
+    assert quorum_rule_from_settings(SimpleNamespace()) == QuorumRule()
+
+
+@pytest.mark.asyncio
+async def test_waiter_wakes_on_record_without_polling():
+    tracker = QuorumTracker()
+    rule = QuorumRule(fraction=1.0, min_count=1)
+    expected = {"self": 1.0, "v1": 1.0, "v2": 1.0}
+
+    async def deliver():
+        await asyncio.sleep(0.05)
+        tracker.record(10, "v1")
+        await asyncio.sleep(0.05)
+        tracker.record(10, "v2")
+
+    asyncio.create_task(deliver())
+    start = time.monotonic()
+    reached = await tracker.wait_for(10, rule, expected, local_uid="self", timeout=5)
+    elapsed = time.monotonic() - start
+
+    assert reached
+    assert elapsed < 0.5
+    assert tracker.participants(10) == {"v1", "v2"}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_and_cleans_up():
+    tracker = QuorumTracker()
+    rule = QuorumRule(fraction=1.0, min_count=3)
+    reached = await tracker.wait_for(1, rule, {"a": 1.0}, timeout=0.05)
+    assert not reached
+    assert tracker._waiters == {}
+
+    # Quorum đã đạt trước khi chờ: trả về ngay
+    tracker.record(2, "a")
+    assert await tracker.wait_for(2, QuorumRule(1.0, 1), {"a": 1.0}, timeout=0)
+
+
+def test_prune_keeps_recent_slots():
+    tracker = QuorumTracker()
+    for slot in range(5):
+        tracker.record(slot, "v1")
+    assert tracker.prune(keep_from=3) == 3
+    assert tracker.count(4) == 1 and tracker.count(0) == 0
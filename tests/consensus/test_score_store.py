@@ -0,0 +1,167 @@
+# tests/consensus/test_score_store.py
+import pytest
+
+from mt_core.consensus.online_aggregator import OnlineScoreAggregator
+from mt_core.consensus.score_store import ScoreStore
+from mt_core.core.datatypes import ValidatorScore
+
+
+def make_score(miner_uid, validator_uid="validator_1", task_id=None, score=0.5):
+    return ValidatorScore(
+        task_id=task_id or f"task_{miner_uid}",
+        miner_uid=miner_uid,
+        validator_uid=validator_uid,
+        score=score,
+    )
+
+
+def test_slot_scores_view_behaves_like_defaultdict():
+    store = ScoreStore()
+    assert 5 not in store.slot_scores
+    assert store.slot_scores.get(5, []) == []
+    assert 5 not in store.slot_scores  # get() không tạo slot mới
+
+    store.slot_scores[5].append(make_score("miner_a"))
+    store.slot_scores[5].extend([make_score("miner_b")])
+    assert 5 in store.slot_scores
+    assert [s.miner_uid for s in store.slot_scores[5]] == ["miner_a", "miner_b"]
+
+    store.slot_scores[5] = [make_score("miner_c")]
+    assert [s.miner_uid for s in store.slot_scores[5]] == ["miner_c"]
+
+    del store.slot_scores[5]
+    assert 5 not in store.slot_scores
+    assert list(store.slot_scores) == []
+
+
+def test_miner_lookup_covers_local_task_and_received_scores():
+    store = ScoreStore()
+    cycle_scores = store.task_view("cycle", lambda: 3)
+
+    store.add_local_score(3, make_score("miner_a", task_id="t1", score=0.9))
+    cycle_scores["t2"].append(make_score("miner_a", task_id="t2", score=0.7))
+    store.add_received_scores(
+        3,
+        "validator_2",
+        [make_score("miner_a", "validator_2", "t1", 0.8), make_score("miner_b", "validator_2", "t3")],
+    )
+
+    assert sorted(s.score for s in store.scores_for_miner(3, "miner_a")) == [0.7, 0.8, 0.9]
+    assert store.get_score(3, "miner_a", "validator_2", "t1").score == 0.8
+    assert store.get_score(3, "miner_b", "validator_1", "t3") is None
+    assert sorted(store.miners(3)) == ["miner_a", "miner_b"]
+    assert store.received_validator_scores[3]["validator_2"]["t3"].miner_uid == "miner_b"
+
+    # Thay thế bài nộp của validator_2 cập nhật lại chỉ mục
+    store.add_received_scores(3, "validator_2", [make_score("miner_b", "validator_2", "t3")])
+    assert sorted(s.score for s in store.scores_for_miner(3, "miner_a")) == [0.7, 0.9]
+
+    # Ghi đè danh sách điểm cục bộ cũng cập nhật chỉ mục
+    store.slot_scores[3] = []
+    assert [s.score for s in store.scores_for_miner(3, "miner_a")] == [0.7]
+
+
+def test_task_view_files_tasks_under_current_slot():
+    current = {"slot": 1}
+    store = ScoreStore()
+    cycle_scores = store.task_view("cycle", lambda: current["slot"])
+
+    cycle_scores["t1"].append(make_score("miner_a", task_id="t1"))
+    current["slot"] = 2
+    cycle_scores["t1"].append(make_score("miner_a", "validator_2", task_id="t1"))
+    cycle_scores["t2"].append(make_score("miner_b", task_id="t2"))
+
+    assert len(cycle_scores["t1"]) == 2
+    assert len(store.scores_for_miner(1, "miner_a")) == 2
+    assert sorted(cycle_scores) == ["t1", "t2"]
+    assert cycle_scores.get("missing") is None
+    assert "missing" not in cycle_scores
+
+
+def test_retention_evicts_oldest_slots_and_notifies():
+    aggregator = OnlineScoreAggregator()
+    store = ScoreStore(retention_slots=3)
+    store.on_evict(aggregator.discard_slot)
+    cycle_scores = store.task_view("cycle", lambda: 0)
+
+    cycle_scores["t0"].append(make_score("miner_a", task_id="t0"))
+    aggregator.add_score(0, "miner_a", "validator_1", 0.5)
+    for slot in range(1, 6):
+        store.add_local_score(slot, make_score("miner_a", task_id=f"t{slot}"))
+        store.slot_aggregated_scores[slot] = {"miner_a": 0.5}
+
+    assert store.keys() == [3, 4, 5]
+    assert list(store.slot_scores) == [3, 4, 5]
+    assert list(store.slot_aggregated_scores) == [3, 4, 5]
+    assert "t0" not in cycle_scores
+    assert not aggregator.has_slot(0)
+    assert store.scores_for_miner(1, "miner_a") == []
+
+
+def test_memory_footprint_is_bounded_by_retention():
+    store = ScoreStore(retention_slots=4)
+    sizes = []
+    for slot in range(40):
+        for m in range(50):
+            store.add_local_score(slot, make_score(f"miner_{m}", task_id=f"t_{slot}_{m}"))
+        sizes.append(store.memory_bytes())
+
+    assert store.score_count() == 4 * 50
+    assert sizes[-1] <= sizes[3] * 1.5
+    assert sizes[-1] > 0
+
+
+def test_aggregated_view_raises_for_missing_slot():
+    store = ScoreStore()
+    with pytest.raises(KeyError):
+        store.slot_aggregated_scores[9]
+    assert store.slot_aggregated_scores.get(9, {}) == {}
+    store.slot_aggregated_scores[9] = {"miner_a": 0.4}
+    assert store.slot_aggregated_scores[9] == {"miner_a": 0.4}
+    del store.slot_aggregated_scores[9]
+    assert 9 not in store.slot_aggregated_scores
+
+
+def test_made_up_slots_cannot_evict_the_current_slot():
+    evicted = []
+    store = ScoreStore(retention_slots=8)
+    store.on_evict(evicted.append)
+    store.add_local_score(5000, make_score("miner_a"))
+
+    # Peer gửi điểm cho các slot bịa đặt: bị bỏ qua, không mở bảng mới
+    for key in range(1, 9):
+        assert store.add_received_scores(key, "validator_2", [make_score("miner_b")]) == 0
+    assert store.add_received_scores(9000, "validator_2", [make_score("miner_b")]) == 0
+    assert store.keys() == [5000]
+    assert evicted == []
+    assert store.rejected == 9
+
+    # Slot kế tiếp và các slot trong cửa sổ vẫn được nhận
+    assert store.accepts(5001) and store.accepts(4993) and not store.accepts(4992)
+    assert store.add_received_scores(5001, "validator_2", [make_score("miner_b")]) == 1
+
+
+def test_retention_follows_the_clock_with_separate_cycle_window():
+    current = {"slot": 100, "cycle": 3}
+    store = ScoreStore(retention_slots=2, clock=lambda: (current["slot"], current["cycle"]))
+    store.add_received_scores(100, "validator_2", [make_score("miner_a")])
+    store.add_received_scores(3, "validator_2", [make_score("miner_a")])
+    assert not store.accepts(50)
+
+    current["slot"] = 102
+    store.add_received_scores(102, "validator_2", [make_score("miner_a")])
+    # Slot 100 ra khỏi cửa sổ của slot hiện tại; cycle 3 vẫn nằm trong cửa sổ riêng
+    assert store.keys() == [3, 102]
+
+
+def test_reading_a_missing_slot_does_not_open_a_table():
+    store = ScoreStore()
+    scores = store.slot_scores[7]
+    assert scores == [] and store.keys() == []
+    assert list(store.slot_scores[8]) == [] and 8 not in store.slot_scores
+
+    # Ghi vào danh sách đã đọc thì mở bảng và giữ lại điểm
+    scores.append(make_score("miner_a"))
+    assert store.keys() == [7]
+    assert store.slot_scores[7] is scores
+    assert [s.miner_uid for s in store.scores_for_miner(7, "miner_a")] == ["miner_a"]
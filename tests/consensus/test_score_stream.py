@@ -0,0 +1,204 @@
+# tests/consensus/test_score_stream.py
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from eth_account import Account
+
+from mt_core.consensus.gossip import decode_envelope
+from mt_core.consensus.online_aggregator import OnlineScoreAggregator
+from mt_core.consensus.quorum import QuorumTracker
+from mt_core.consensus.score_store import ScoreStore
+from mt_core.consensus.score_stream import (
+    ScoreStreamReceiver,
+    ScoreStreamSender,
+    parse_score_delta_id,
+    score_delta_id,
+)
+from mt_core.consensus.validator_node_consensus import ValidatorNodeConsensus
+from mt_core.core.datatypes import ValidatorInfo, ValidatorScore
+from mt_core.network.http_pool import HttpPool
+from mt_core.network.score_codec import decode_score_broadcast, verify_score_broadcast
+
+SLOT = 5
+
+
+def score(miner, value, validator="validator_1"):
+    return ValidatorScore(
+        task_id=f"task_{miner}_{value}",
+        miner_uid=miner,
+        validator_uid=validator,
+        score=value,
+        timestamp=1760000000.0,
+    )
+
+
+def make_consensus(uid, **core):
+    consensus = ValidatorNodeConsensus.__new__(ValidatorNodeConsensus)
+    consensus.uid_prefix = f"[V:{uid}]"
+    consensus._stream_sends = {}
+    consensus._stream_dirty = set()
+    store = ScoreStore()
+    consensus.core = SimpleNamespace(
+        info=SimpleNamespace(uid=uid),
+        settings=SimpleNamespace(CONSENSUS_SCORE_COMPRESSION=True),
+        score_store=store,
+        slot_scores=store.slot_scores,
+        received_validator_scores=store.received_validator_scores,
+        score_aggregator=OnlineScoreAggregator(),
+        quorum_tracker=QuorumTracker(),
+        received_scores_lock=asyncio.Lock(),
+        validator_trust_weight=lambda uid: 1.0,
+        score_gossip=None,
+        **core,
+    )
+    return consensus
+
+
+def make_pair(drop=()):
+    """Validator 1 stream điểm sang validator 2; các delta trong `drop` bị mất ở lần gửi đầu."""
+    account = Account.create()
+    receiver = make_consensus("validator_2", score_stream_receiver=ScoreStreamReceiver())
+    receiver.core.score_stream_receiver.attach_delivery(receiver.deliver_score_delta)
+    dropped, posts = set(), []
+
+    async def handler(request):
+        deltas = [decode_score_broadcast(b) for b in decode_envelope(request.content)]
+        seqs = [parse_score_delta_id(d.broadcast_id)[1] for d, _ in deltas]
+        posts.append(seqs)
+        for seq in seqs:
+            if seq in drop and seq not in dropped:
+                dropped.add(seq)
+                return httpx.Response(503)
+        ack = {}
+        for delta, body in deltas:
+            assert verify_score_broadcast(body, delta.signature, account.address)
+            ack = await receiver.core.score_stream_receiver.receive(delta)
+        return httpx.Response(200, json={"status": "success", **ack})
+
+    sender = make_consensus(
+        "validator_1",
+        account=account,
+        score_stream_sender=ScoreStreamSender(),
+        validators_info={
+            "validator_2": ValidatorInfo(
+                uid="validator_2", address="0x0", api_endpoint="http://v2:8002"
+            )
+        },
+        http_pool=HttpPool(transport=httpx.MockTransport(handler)),
+    )
+    return sender, receiver, posts
+
+
+def test_delta_id_round_trip():
+    assert parse_score_delta_id(score_delta_id(12, 3)) == (12, 3, False)
+    assert parse_score_delta_id(score_delta_id(12, 4, final=True)) == (12, 4, True)
+    assert parse_score_delta_id("gossip_slot_12") is None
+
+
+@pytest.mark.asyncio
+async def test_receiver_orders_deltas_and_reports_gaps():
+    delivered = []
+
+    async def deliver(sender_uid, slot, scores, complete):
+        delivered.append(([s.miner_uid for s in scores], complete))
+
+    receiver = ScoreStreamReceiver(deliver)
+
+    def delta(seq, miner, final=False):
+        return SimpleNamespace(
+            sender_uid="v1",
+            broadcast_id=score_delta_id(SLOT, seq, final),
+            scores=[score(miner, 0.5)],
+        )
+
+    ack = await receiver.receive(delta(2, "m2", final=True))
+    assert ack["missing"] == [0, 1] and not ack["complete"]
+    ack = await receiver.receive(delta(0, "m0"))
+    assert ack["missing"] == [1]
+    assert (await receiver.receive(delta(0, "m0")))["next_seq"] == 1  # Trùng lặp bị bỏ qua
+    ack = await receiver.receive(delta(1, "m1"))
+
+    assert ack["complete"] and ack["missing"] == []
+    # Áp dụng đúng thứ tự; chỉ delta cuối cùng đánh dấu hoàn tất
+    assert delivered == [(["m0"], False), (["m1"], False), (["m2"], True)]
+    assert receiver.duplicates == 1
+    with pytest.raises(ValueError):
+        await receiver.receive(delta(3, "m3"))  # Sau delta cuối
+
+
+@pytest.mark.asyncio
+async def test_receiver_refuses_deltas_for_far_off_slots():
+    delivered = []
+
+    async def deliver(sender_uid, slot, scores, complete):
+        delivered.append(slot)
+
+    receiver = ScoreStreamReceiver(
+        deliver, retention_slots=2, accepts_slot=lambda slot: SLOT - 4 < slot <= SLOT + 1
+    )
+
+    def delta(slot, seq=0):
+        return SimpleNamespace(
+            sender_uid="v1", broadcast_id=score_delta_id(slot, seq), scores=[score("m0", 0.5)]
+        )
+
+    await receiver.receive(delta(SLOT))
+    # Delta ký hợp lệ cho slot bịa đặt bị từ chối (endpoint trả 400), luồng hiện tại còn nguyên
+    for bogus in (SLOT + 1000, SLOT + 2000, 1):
+        with pytest.raises(ValueError, match="out of range"):
+            await receiver.receive(delta(bogus))
+    assert (await receiver.receive(delta(SLOT, 1)))["next_seq"] == 2
+    assert delivered == [SLOT, SLOT]
+
+
+@pytest.mark.asyncio
+async def test_stream_delivers_averages_and_repairs_lost_delta():
+    sender, receiver, posts = make_pair(drop={2})
+    local = sender.core.slot_scores[SLOT]
+
+    # Ba minibatch; miner_1 được chấm hai lần nên trung bình của nó thay đổi
+    for batch in (
+        [score("miner_0", 0.4), score("miner_1", 0.6)],
+        [score("miner_1", 0.8), score("miner_2", 0.5)],
+        [score("miner_3", 0.9)],
+    ):
+        local.extend(batch)
+        assert await sender.stream_score_delta(SLOT) in (0, 1)
+
+    received = receiver.core.received_validator_scores[SLOT]["validator_1"]
+    assert set(received) == {f"averaged_slot_{SLOT}_miner_{i}" for i in range(3)}
+    assert receiver.core.quorum_tracker.count(SLOT) == 0  # Chưa có delta cuối
+
+    assert await sender.finish_score_stream(SLOT) == {"validator_2"}
+    assert posts[-2:] == [[3], [2]]  # Delta cuối báo thiếu 2, gửi lại 2
+
+    expected = sender._average_scores_by_miner(local)
+    received = receiver.core.received_validator_scores[SLOT]["validator_1"]
+    assert {s.miner_uid: s.score for s in received.values()} == pytest.approx(expected)
+    assert receiver.core.score_aggregator.consensus(SLOT) == pytest.approx(expected)
+    assert receiver.core.quorum_tracker.participants(SLOT) == {"validator_1"}
+
+    # Đã hoàn tất: gọi lại không gửi gì thêm
+    sent = len(posts)
+    assert await sender.finish_score_stream(SLOT) == {"validator_2"}
+    assert len(posts) == sent
+
+
+@pytest.mark.asyncio
+async def test_scheduled_deltas_coalesce_while_one_is_in_flight():
+    sender, receiver, posts = make_pair()
+    local = sender.core.slot_scores[SLOT]
+
+    for i in range(10):
+        local.append(score(f"miner_{i}", 0.5))
+        sender.schedule_score_delta(SLOT)
+    await sender.finish_score_stream(SLOT)
+
+    # Một delta đang gửi, phần còn lại gom vào delta kế tiếp, rồi delta cuối
+    assert len(posts) <= 3
+    received = receiver.core.received_validator_scores[SLOT]["validator_1"]
+    assert len(received) == 10
+    assert receiver.core.quorum_tracker.count(SLOT) == 1
+    assert sender.core.score_stream_sender.stats()["deltas_sent"] == len(posts)
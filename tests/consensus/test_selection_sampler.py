@@ -0,0 +1,92 @@
+# tests/consensus/test_selection_sampler.py
+import random
+import time
+
+import numpy as np
+import pytest
+
+from mt_core.consensus.selection import (
+    select_miners_logic,
+    selection_factors,
+    selection_seed,
+    weighted_sample_without_replacement,
+)
+from mt_core.core.datatypes import MinerInfo
+from mt_core.formulas.trust_score import calculate_selection_probability
+from mt_core.metagraph.metagraph_datum import STATUS_ACTIVE, STATUS_INACTIVE
+
+
+def make_miners(n, rng=None):
+    rng = rng or random.Random(0)
+    return {
+        f"miner_{i:05d}": MinerInfo(
+            uid=f"miner_{i:05d}",
+            address=f"addr_{i}",
+            trust_score=rng.random(),
+            last_selected_time=rng.randint(0, 100),
+        )
+        for i in range(n)
+    }
+
+
+def test_factors_match_scalar_formula():
+    miners = list(make_miners(50).values())
+    factors = selection_factors(
+        np.array([m.trust_score for m in miners]),
+        np.array([m.last_selected_time for m in miners], dtype=float),
+        current_cycle=90,
+        beta=0.2,
+        max_time_bonus=10,
+    )
+    expected = [
+        calculate_selection_probability(m.trust_score, max(0, 90 - m.last_selected_time), 0.2, 10)
+        for m in miners
+    ]
+    assert factors == pytest.approx(expected)
+
+
+def test_always_fills_k_distinct_and_skips_zero_weights_when_possible():
+    rng = np.random.default_rng(1)
+    weights = np.array([0.0, 5.0, 0.0, 1.0, 2.0])
+    for _ in range(100):
+        picked = weighted_sample_without_replacement(weights, 3, rng)
+        assert sorted(picked) == [1, 3, 4]
+
+    # Không đủ miner trọng số dương: bổ sung ngẫu nhiên từ miner trọng số 0
+    picked = weighted_sample_without_replacement(weights, 5, rng)
+    assert sorted(picked) == [0, 1, 2, 3, 4]
+    assert len(weighted_sample_without_replacement(weights, 10, rng)) == 5
+
+
+def test_inclusion_follows_weights():
+    rng = np.random.default_rng(7)
+    weights = np.array([1.0, 2.0, 7.0])
+    firsts = np.bincount(
+        [weighted_sample_without_replacement(weights, 1, rng)[0] for _ in range(20000)],
+        minlength=3,
+    )
+    assert firsts / 20000 == pytest.approx([0.1, 0.2, 0.7], abs=0.02)
+
+
+def test_seeded_selection_is_reproducible_across_dict_order():
+    miners = make_miners(200)
+    miners["miner_00003"].status = STATUS_INACTIVE
+    shuffled = dict(reversed(list(miners.items())))
+    seed = selection_seed(42)
+
+    a = select_miners_logic(miners, 100, 20, 0.2, 10, seed=seed)
+    b = select_miners_logic(shuffled, 100, 20, 0.2, 10, seed=seed)
+    assert [m.uid for m in a] == [m.uid for m in b]
+    assert len({m.uid for m in a}) == 20
+    assert all(m.status == STATUS_ACTIVE for m in a)
+    assert selection_seed(42) != selection_seed(43)
+
+
+def test_selection_benchmark_50k_miners():
+    miners = make_miners(50_000)
+    started = time.perf_counter()
+    selected = select_miners_logic(miners, 100, 1000, 0.2, 10, seed=selection_seed(1))
+    elapsed = time.perf_counter() - started
+    print(f"\n50k miners, k=1000: {elapsed * 1e3:.1f}ms")
+    assert len({m.uid for m in selected}) == 1000
+    assert elapsed < 1.0
@@ -0,0 +1,145 @@
+# tests/consensus/test_slot_scheduler.py
+import asyncio
+import time
+
+import pytest
+
+from mt_core.consensus.coordination_backend import InMemoryCoordinationBackend
+from mt_core.consensus.flexible_slot_coordinator import FlexibleSlotCoordinator
+from mt_core.consensus.slot_coordinator import SlotConfig, SlotPhase
+from mt_core.consensus.slot_scheduler import PhaseWindow, SlotSchedule, SlotScheduler
+
+
+def short_schedule(epoch=None):
+    """Slot 0.3s: a@0, b@0.1, c@0.2 — đủ ngắn cho test thời gian thực."""
+    windows = [PhaseWindow("a", 0.0, 0.1), PhaseWindow("b", 0.1, 0.2), PhaseWindow("c", 0.2, 0.3)]
+    return SlotSchedule(time.time() if epoch is None else epoch, 0.3, windows)
+
+
+def recorder(limit, scheduler_ref, delays=None):
+    fired = []
+
+    async def on_phase(slot, phase):
+        fired.append((slot, phase, time.monotonic()))
+        if delays and (slot, phase) in delays:
+            await asyncio.sleep(delays[(slot, phase)])
+        if len(fired) >= limit:
+            scheduler_ref[0].stop()
+
+    return fired, on_phase
+
+
+def test_schedule_from_slot_config_keeps_merged_phases_together():
+    config = SlotConfig()
+    schedule = SlotSchedule.from_boundaries(0.0, 150.0, config.get_phase_boundaries())
+
+    assert [w.phase for w in schedule.windows] == [
+        SlotPhase.TASK_ASSIGNMENT,
+        SlotPhase.TASK_EXECUTION,
+        SlotPhase.CONSENSUS_SCORING,
+        SlotPhase.METAGRAPH_UPDATE,
+    ]
+    assert schedule.locate(30.0) == (0, 0)  # TASK_ASSIGNMENT và TASK_EXECUTION cùng mốc
+    assert schedule.locate(125.0) == (0, 2)
+    assert schedule.locate(150.0 * 3 + 140.0) == (3, 3)
+
+
+def test_flexible_schedule_matches_time_based_phase():
+    coordinator = FlexibleSlotCoordinator(
+        "validator_1", backend=InMemoryCoordinationBackend()
+    )
+    schedule = coordinator.slot_schedule()
+    slot_start = schedule.slot_start(1000)
+    for offset in (0.0, 60.0, 119.9, 120.0, 134.0, 136.0, 149.0):
+        _, index = schedule.locate(slot_start + offset)
+        assert schedule.windows[index].phase == coordinator._calculate_current_phase(
+            1000, slot_start + offset
+        )
+
+
+def test_invalid_schedule_rejected():
+    with pytest.raises(ValueError):
+        SlotSchedule(0.0, 0.0, [PhaseWindow("a", 0.0, 1.0)])
+    with pytest.raises(ValueError):
+        SlotSchedule(0.0, 10.0, [PhaseWindow("a", 5.0, 6.0), PhaseWindow("b", 1.0, 2.0)])
+
+
+@pytest.mark.asyncio
+async def test_phases_fire_at_boundaries_across_slots():
+    ref = [None]
+    fired, on_phase = recorder(5, ref)
+    scheduler = SlotScheduler(short_schedule(), on_phase)
+    ref[0] = scheduler
+    scheduler.start(0)
+
+    await asyncio.wait_for(scheduler.run(), timeout=2)
+
+    assert [(slot, phase) for slot, phase, _ in fired] == [
+        (0, "a"), (0, "b"), (0, "c"), (1, "a"), (1, "b"),
+    ]
+    start = fired[0][2]
+    for i, (_, _, at) in enumerate(fired):
+        assert at - start == pytest.approx(0.1 * i, abs=0.05)
+    assert scheduler.skipped == 0
+
+
+@pytest.mark.asyncio
+async def test_advance_fires_next_phase_immediately():
+    fired = []
+
+    async def on_phase(slot, phase):
+        fired.append((phase, time.monotonic()))
+        if phase == "a":
+            # Ví dụ: đã đủ quorum ngay trong pha a
+            assert not scheduler.advance(slot, "b")  # tín hiệu cũ/sai pha bị bỏ qua
+            assert scheduler.advance(slot, "a", "quorum_reached")
+        if phase == "c":
+            assert not scheduler.advance(slot, "c")  # pha cuối: giữ mốc slot
+            scheduler.stop()
+
+    # Slot dài hơn để thấy rõ việc chuyển pha sớm
+    windows = [PhaseWindow("a", 0.0, 0.5), PhaseWindow("b", 0.5, 0.6), PhaseWindow("c", 0.6, 1.0)]
+    scheduler = SlotScheduler(SlotSchedule(time.time(), 1.0, windows), on_phase)
+    scheduler.start(0)
+
+    await asyncio.wait_for(scheduler.run(), timeout=3)
+
+    assert [phase for phase, _ in fired] == ["a", "b", "c"]
+    assert fired[1][1] - fired[0][1] < 0.1  # không chờ đến mốc 0.5s
+    assert fired[2][1] - fired[0][1] == pytest.approx(0.6, abs=0.05)
+    assert scheduler.early_advances == 1
+
+
+@pytest.mark.asyncio
+async def test_overrunning_callback_skips_closed_windows():
+    ref = [None]
+    fired, on_phase = recorder(3, ref, delays={(0, "a"): 0.25})
+    scheduler = SlotScheduler(short_schedule(), on_phase)
+    ref[0] = scheduler
+    scheduler.start(0)
+
+    await asyncio.wait_for(scheduler.run(), timeout=2)
+
+    assert [(slot, phase) for slot, phase, _ in fired] == [(0, "a"), (0, "c"), (1, "a")]
+    assert scheduler.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_start_joins_phase_in_progress_and_survives_errors():
+    ref = [None]
+    fired = []
+
+    async def on_phase(slot, phase):
+        fired.append((slot, phase))
+        if len(fired) == 2:
+            ref[0].stop()
+        raise RuntimeError("handler lỗi không làm dừng scheduler")
+
+    # Bắt đầu khi đang ở giữa pha b của slot 0
+    scheduler = SlotScheduler(short_schedule(time.time() - 0.15), on_phase)
+    ref[0] = scheduler
+    scheduler.start()
+
+    await asyncio.wait_for(scheduler.run(), timeout=2)
+
+    assert fired == [(0, "b"), (0, "c")]
@@ -0,0 +1,97 @@
+# tests/monitoring/test_circuit_breaker_registry.py
+from types import SimpleNamespace
+
+import pytest
+
+from mt_core.monitoring.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+
+
+def test_breaker_opens_then_probes_once_when_half_open():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure(now=100.0)
+    assert breaker.state == STATE_CLOSED
+    breaker.record_failure(now=101.0)
+    assert breaker.state == STATE_OPEN and breaker.is_open
+    assert not breaker.allow_request(now=105.0)
+
+    # Hết reset_timeout: chỉ cho một request thăm dò đi qua
+    assert breaker.available(now=112.0)
+    assert breaker.allow_request(now=112.0)
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request(now=112.5)
+
+    # Thăm dò thất bại thì mở lại ngay, không cần đủ failure_threshold
+    breaker.record_failure(now=113.0)
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request(now=120.0)
+
+    assert breaker.allow_request(now=124.0)
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0 and not breaker.is_open
+    assert breaker.get_status()["state"] == STATE_CLOSED
+
+
+def test_unrecorded_probe_does_not_block_forever():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure(now=0.0)
+    assert breaker.allow_request(now=11.0)
+    assert not breaker.allow_request(now=15.0)
+    assert breaker.allow_request(now=22.0)  # Lần thăm dò trước không bao giờ báo kết quả
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1)
+
+    async def fail():
+        raise RuntimeError("down")
+
+    async def ok():
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await breaker.execute(fail)
+    assert breaker.is_open
+    with pytest.raises(Exception, match="open"):
+        await breaker.execute(ok)
+    breaker.last_failure_time -= 2  # Giả lập đã hết reset_timeout
+    assert await breaker.execute(ok) == "ok"
+    assert breaker.state == STATE_CLOSED
+
+
+def test_registry_keeps_one_breaker_per_endpoint():
+    registry = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=30)
+    assert registry.available("http://a")  # Endpoint chưa gặp coi như đóng
+    registry.record_failure("http://a/", now=0.0)
+    assert not registry.available("http://a", now=1.0)
+    assert registry.available("http://b", now=1.0)
+    assert not registry.allow_request("http://a", now=1.0)
+    assert registry.allow_request("http://b", now=1.0)
+    assert registry.open_keys() == ["http://a"]
+
+    registry.record_success("http://b")
+    status = registry.get_status()
+    assert status["open"] == ["http://a"] and status["refused"] == 1
+
+
+def test_registry_from_settings_and_bound():
+    registry = CircuitBreakerRegistry.from_settings(
+        SimpleNamespace(
+            CONSENSUS_MINER_BREAKER_FAILURES=5, CONSENSUS_MINER_BREAKER_RESET_SECONDS=7.5
+        )
+    )
+    assert (registry.failure_threshold, registry.reset_timeout) == (5, 7.5)
+
+    small = CircuitBreakerRegistry(failure_threshold=1, max_keys=2)
+    for key in ("a", "b", "c"):
+        small.record_failure(key, now=0.0)
+    # Breaker ít dùng nhất bị loại, endpoint đó bắt đầu lại ở trạng thái đóng
+    assert small.available("a", now=1.0)
+    assert not small.available("c", now=1.0)
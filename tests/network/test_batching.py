@@ -0,0 +1,117 @@
+# tests/network/test_batching.py
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from mt_core.network.batching import (
+    BATCH_RESULTS_HEADER,
+    BATCH_TASKS_HEADER,
+    MINER_CAPACITY_HEADER,
+    RESULT_BATCH_ENDPOINT,
+    RequestCoalescer,
+    partial_results,
+)
+from mt_core.network.http_pool import HttpPool
+from mt_core.network.miner_runtime import ResultSender
+from mt_core.network.server import BaseMiner
+
+
+@pytest.mark.asyncio
+async def test_coalescer_groups_by_destination_and_limit():
+    sent = []
+
+    async def send_batch(key, items):
+        sent.append((key, list(items)))
+        return [item % 2 == 0 for item in items]
+
+    coalescer = RequestCoalescer(send_batch, max_batch=3)
+    outcomes = await asyncio.gather(
+        *(coalescer.submit("a", i) for i in range(5)),
+        coalescer.submit("b", 10),
+    )
+
+    assert outcomes == [True, False, True, False, True, True]
+    # "a": một batch đầy 3 phần tử rồi một batch 2 phần tử; "b" đi riêng
+    assert sorted(sent) == [("a", [0, 1, 2]), ("a", [3, 4]), ("b", [10])]
+    assert coalescer.stats()["batches"] == 3
+
+
+def test_partial_results_follow_accepted_ids():
+    assert partial_results(["t1", "t2", "t3"], ["t1", "t3"], {"t2": "queue_full"}) == [
+        True,
+        False,
+        True,
+    ]
+
+
+def test_miner_batch_endpoint_accepts_what_fits():
+    miner = BaseMiner("http://validator:8001", max_queue=2, workers=1, max_batch=8)
+    client = TestClient(miner.app)
+    tasks = [{"task_id": f"t{i}", "description": "d"} for i in range(4)]
+
+    response = client.post("/receive-tasks", json={"tasks": tasks})
+    assert response.status_code == 200
+    assert response.headers[BATCH_TASKS_HEADER] == "8"
+    assert response.headers[MINER_CAPACITY_HEADER] == "1"  # Số worker của miner
+    body = response.json()
+    # Hàng đợi chỉ chứa 2 task, phần còn lại bị từ chối riêng lẻ
+    assert body["accepted"] == ["t0", "t1"]
+    assert body["rejected"] == {"t2": "queue_full", "t3": "queue_full"}
+
+
+@pytest.mark.asyncio
+async def test_result_sender_switches_to_batches_once_advertised():
+    requests_seen = []
+
+    async def handler(request):
+        payload = json.loads(request.content)
+        requests_seen.append(request.url.path)
+        headers = {BATCH_RESULTS_HEADER: "16"}
+        if request.url.path == RESULT_BATCH_ENDPOINT:
+            ids = [r["task_id"] for r in payload["results"]]
+            return httpx.Response(
+                200,
+                json={"accepted": ids[:-1], "rejected": {ids[-1]: "unknown_task"}},
+                headers=headers,
+            )
+        return httpx.Response(200, json={"message": "ok"}, headers=headers)
+
+    sender = ResultSender(
+        pool=HttpPool(transport=httpx.MockTransport(handler)), batch_delay=0.01
+    )
+    url = "http://validator:8001"
+    assert await sender.submit(url, {"task_id": "t0", "miner_uid": "m"})
+    outcomes = await asyncio.gather(
+        *(sender.submit(url, {"task_id": f"t{i}", "miner_uid": "m"}) for i in range(1, 4))
+    )
+
+    assert outcomes == [True, True, False]
+    assert requests_seen == ["/v1/miner/submit_result", RESULT_BATCH_ENDPOINT]
+    await sender.aclose()
+
+
+@pytest.mark.asyncio
+async def test_result_sender_treats_unreadable_batch_answer_as_failed():
+    """Validator trả body không phải JSON cho batch: các kết quả tính là gửi thất bại."""
+
+    async def handler(request):
+        headers = {BATCH_RESULTS_HEADER: "16"}
+        if request.url.path == RESULT_BATCH_ENDPOINT:
+            return httpx.Response(200, content=b"<html>proxy error</html>", headers=headers)
+        return httpx.Response(200, json={"message": "ok"}, headers=headers)
+
+    sender = ResultSender(
+        pool=HttpPool(transport=httpx.MockTransport(handler)), batch_delay=0.01
+    )
+    url = "http://validator:8001"
+    assert await sender.submit(url, {"task_id": "t0", "miner_uid": "m"})
+    outcomes = await asyncio.gather(
+        *(sender.submit(url, {"task_id": f"t{i}", "miner_uid": "m"}) for i in range(1, 3))
+    )
+
+    assert outcomes == [False, False]
+    assert sender.failed == 1
+    await sender.aclose()
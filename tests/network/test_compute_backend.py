@@ -0,0 +1,134 @@
+# tests/network/test_compute_backend.py
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+
+from mt_core.network.compute_backend import ProcessBackend, ThreadBackend, create_backend
+
+
+class FakeModelMiner:
+    """Miner giả: setup_worker "nạp model" một lần cho mỗi worker."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def setup_worker(self):
+        self.loads += 1
+
+    def process_task(self, size):
+        return {"pid": os.getpid(), "loads": self.loads, "payload": b"x" * size}
+
+
+def square(x):
+    return x * x
+
+
+def make_outputs(n):
+    return {"logits": np.arange(n, dtype=np.float64), "meta": "ok"}
+
+
+def make_blob(n):
+    return b"y" * n
+
+
+def make_blob_slowly(n, delay):
+    time.sleep(delay)
+    return b"z" * n
+
+
+def shm_segments():
+    return set(os.listdir("/dev/shm"))
+
+
+@pytest.mark.asyncio
+async def test_process_backend_loads_once_per_worker_and_uses_shared_memory():
+    miner = FakeModelMiner()
+    backend = ProcessBackend(workers=2, target=miner, shm_threshold=64 * 1024)
+    try:
+        small = await asyncio.gather(*(backend.run(miner.process_task, 10) for _ in range(8)))
+        # Mỗi worker chỉ nạp model một lần, dù xử lý nhiều task
+        assert all(r["loads"] == 1 for r in small)
+        assert {r["pid"] for r in small} - {os.getpid()}
+        assert miner.loads == 0  # Tiến trình chính không nạp model
+
+        large = await backend.run(miner.process_task, 256 * 1024)
+        assert large["payload"] == b"x" * 256 * 1024
+        stats = backend.stats()
+        assert (stats["calls"], stats["shm_transfers"]) == (9, 1)
+        assert stats["shm_bytes"] > 256 * 1024
+
+        # Hàm module-level vẫn chạy được
+        assert await backend.run(square, 7) == 49
+    finally:
+        backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_backend_sends_buffers_as_raw_bytes():
+    backend = ProcessBackend(workers=1, shm_threshold=64 * 1024)
+    try:
+        # Mảng numpy đi qua shared memory dưới dạng byte thô, không bị pickle
+        outputs = await backend.run(make_outputs, 100_000)
+        assert outputs["meta"] == "ok"
+        assert np.array_equal(outputs["logits"], np.arange(100_000, dtype=np.float64))
+        outputs["logits"][0] = -1.0  # Mảng nhận về vẫn ghi được
+        assert await backend.run(make_blob, 200_000) == b"y" * 200_000
+
+        stats = backend.stats()
+        assert stats["shm_transfers"] == 2
+        assert stats["raw_bytes"] == 800_000 + 200_000
+        assert stats["shm_bytes"] - stats["raw_bytes"] < 1024
+
+        # Kết quả nhỏ vẫn đi qua pipe
+        small = await backend.run(make_outputs, 10)
+        assert small["logits"].tolist() == list(range(10))
+        assert backend.stats()["shm_transfers"] == 2
+    finally:
+        backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_leaves_no_shared_memory_behind():
+    backend = ProcessBackend(workers=1, shm_threshold=64 * 1024)
+    try:
+        await backend.run(square, 2)  # Khởi động pool trước khi đo
+        before = shm_segments()
+
+        # Huỷ khi worker vẫn đang chạy; kết quả lớn của nó không ai đọc nữa
+        call = asyncio.create_task(backend.run(make_blob_slowly, 256 * 1024, 0.3))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert backend.stats()["cancelled"] == 1
+
+        # Worker xong việc thì segment được giải phóng
+        await backend.run(square, 3)
+        for _ in range(50):
+            if shm_segments() <= before:
+                break
+            await asyncio.sleep(0.02)
+        assert shm_segments() - before == set()
+
+        # Các lần chạy sau vẫn nhận kết quả qua shared memory bình thường
+        assert await backend.run(make_blob, 200_000) == b"y" * 200_000
+        assert shm_segments() - before == set()
+    finally:
+        backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thread_backend_runs_setup_before_first_call():
+    miner = FakeModelMiner()
+    backend = create_backend("async", workers=2, target=miner)
+    assert isinstance(backend, ThreadBackend)
+
+    results = await asyncio.gather(*(backend.run(miner.process_task, 1) for _ in range(4)))
+    assert [r["loads"] for r in results] == [1, 1, 1, 1]
+    backend.shutdown()
+
+    with pytest.raises(ValueError):
+        create_backend("gpu")
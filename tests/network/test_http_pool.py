@@ -0,0 +1,83 @@
+# tests/network/test_http_pool.py
+import asyncio
+
+import httpx
+import pytest
+
+from mt_core.network.http_pool import HttpPool
+
+
+def counting_transport(delay=0.0, fail_hosts=()):
+    """Transport giả: đếm số request đồng thời theo host."""
+    state = {"active": {}, "peak": {}, "seen": 0}
+
+    async def handler(request):
+        host = request.url.host
+        if host in fail_hosts:
+            raise httpx.ConnectError("refused", request=request)
+        state["seen"] += 1
+        state["active"][host] = state["active"].get(host, 0) + 1
+        state["peak"][host] = max(state["peak"].get(host, 0), state["active"][host])
+        await asyncio.sleep(delay)
+        state["active"][host] -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    return httpx.MockTransport(handler), state
+
+
+@pytest.mark.asyncio
+async def test_one_client_serves_every_call():
+    transport, state = counting_transport()
+    pool = HttpPool(transport=transport)
+
+    client = pool.client
+    for _ in range(5):
+        response = await pool.post("http://validator-1:8001/consensus/scores", json={})
+        assert response.status_code == 200
+    await pool.get("http://miner-1:9000/status", timeout=5.0)
+
+    assert pool.client is client  # Không tạo client mới cho từng request
+    stats = pool.stats()
+    assert stats["requests"] == 6
+    assert stats["errors"] == 0
+    assert stats["hosts"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_does_not_block_other_hosts():
+    transport, state = counting_transport(delay=0.05)
+    pool = HttpPool(transport=transport, max_per_host=2)
+
+    await asyncio.gather(
+        *[pool.get(f"http://{host}:8001/health") for host in ("a", "b") for _ in range(6)]
+    )
+
+    assert state["peak"] == {"a": 2, "b": 2}
+    assert pool.in_flight == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted_and_raised():
+    transport, _ = counting_transport(fail_hosts={"down"})
+    pool = HttpPool(transport=transport)
+
+    with pytest.raises(httpx.ConnectError):
+        await pool.post("http://down:8001/receive-task", json={})
+    assert pool.stats()["errors"] == 1
+    assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_reopens_after_close():
+    transport, _ = counting_transport()
+    pool = HttpPool(transport=transport)
+    first = pool.client
+    await pool.aclose()
+    assert first.is_closed
+
+    response = await pool.get("http://validator-2:8001/health")
+    assert response.status_code == 200
+    assert pool.client is not first
+    await pool.aclose()
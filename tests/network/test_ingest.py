@@ -0,0 +1,127 @@
+# tests/network/test_ingest.py
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from mt_core.core.datatypes import ValidatorScore
+from mt_core.network.ingest import (
+    IngestError,
+    parse_consensus_scores,
+    parse_miner_result,
+    parse_score_broadcast,
+)
+
+
+def score_entries(n, validator_uid=None):
+    entries = []
+    for i in range(n):
+        entry = {
+            "task_id": f"task_{i}",
+            "miner_uid": f"miner_{i % 50}",
+            "score": (i % 100) / 100,
+            "timestamp": 1_700_000_000.0 + i,
+            "cycle": 7,
+        }
+        if validator_uid:
+            entry["validator_uid"] = validator_uid
+        entries.append(entry)
+    return entries
+
+
+def test_miner_result_shapes():
+    result = parse_miner_result(
+        b'{"task_id": "t1", "miner_uid": "m1", "result_data": {"out": 1}}', 5.0
+    )
+    assert (result.task_id, result.miner_uid, result.result_data) == ("t1", "m1", {"out": 1})
+    assert result.timestamp_received == 5.0
+
+    legacy = parse_miner_result(
+        b'{"task_id": "t2", "miner_uid": "m2", "result": [1, 2]}', 6.0, legacy=True
+    )
+    assert legacy.result_data == [1, 2]
+
+    # Thiếu result_data thì dùng dict rỗng như ResultModel
+    assert parse_miner_result(b'{"task_id": "t3", "miner_uid": "m3"}', 0.0).result_data == {}
+    with pytest.raises(IngestError):
+        parse_miner_result(b'{"task_id": "t4"}', 0.0)
+    with pytest.raises(IngestError):
+        parse_miner_result(b"not json", 0.0)
+
+
+def test_consensus_scores_take_envelope_validator():
+    body = json.dumps({"validator_uid": "v1", "slot": 3, "scores": score_entries(3)}).encode()
+    validator_uid, slot, scores = parse_consensus_scores(body)
+
+    assert (validator_uid, slot) == ("v1", 3)
+    assert [s.task_id for s in scores] == ["task_0", "task_1", "task_2"]
+    assert all(isinstance(s, ValidatorScore) and s.validator_uid == "v1" for s in scores)
+    assert scores[1].score == pytest.approx(0.01)
+
+    with pytest.raises(IngestError):
+        parse_consensus_scores(b'{"validator_uid": "v1", "scores": []}')
+
+
+def test_score_broadcast_skips_malformed_entries():
+    entries = score_entries(2, validator_uid="v2") + [{"task_id": "broken"}]
+    body = json.dumps(
+        {"broadcast_id": "b1", "sender_uid": "v2", "timestamp": 1.0, "scores": entries}
+    ).encode()
+
+    sender_uid, broadcast_id, scores = parse_score_broadcast(body)
+    assert (sender_uid, broadcast_id) == ("v2", "b1")
+    assert [s.task_id for s in scores] == ["task_0", "task_1"]
+
+    # Envelope sai thì cả broadcast bị từ chối
+    with pytest.raises(IngestError):
+        parse_score_broadcast(b'{"sender_uid": "v2", "scores": []}')
+
+
+def test_ingest_cost_against_dict_path():
+    body = json.dumps(
+        {
+            "broadcast_id": "b1",
+            "sender_uid": "v1",
+            "timestamp": 1.0,
+            "scores": score_entries(500, validator_uid="v1"),
+        }
+    ).encode()
+
+    def dict_path():
+        # Cách cũ: json -> dict -> ValidatorScore từng phần tử
+        data = json.loads(body)
+        return [
+            ValidatorScore(
+                task_id=s["task_id"],
+                miner_uid=s["miner_uid"],
+                validator_uid=s["validator_uid"],
+                score=s["score"],
+                timestamp=s["timestamp"],
+            )
+            for s in data["scores"]
+        ]
+
+    def ingest_path():
+        return parse_score_broadcast(body)[2]
+
+    def measure(fn, rounds=20):
+        fn()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        elapsed = (time.perf_counter() - started) / rounds
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
+
+    dict_time, dict_peak = measure(dict_path)
+    ingest_time, ingest_peak = measure(ingest_path)
+    print(
+        f"\n500 scores | dict path {dict_time * 1e3:.2f}ms peak {dict_peak / 1024:.0f}KiB | "
+        f"ingest {ingest_time * 1e3:.2f}ms peak {ingest_peak / 1024:.0f}KiB"
+    )
+    assert ingest_path() == dict_path()
+    assert ingest_peak < dict_peak
@@ -0,0 +1,106 @@
+# tests/network/test_ingress.py
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mt_core.monitoring.rate_limiter import PeerRateLimiter, TokenBucket
+from mt_core.network.ingress import (
+    LANE_CONSENSUS,
+    LANE_RESULTS,
+    IngressController,
+    IngressLane,
+)
+
+ROUTES = {"/v1/miner/submit_result": LANE_RESULTS, "/consensus/receive_scores": LANE_CONSENSUS}
+
+
+def fake_request(path, host="10.0.0.1"):
+    return SimpleNamespace(url=SimpleNamespace(path=path), client=SimpleNamespace(host=host))
+
+
+def controller(**lane_kwargs):
+    lanes = {
+        LANE_CONSENSUS: IngressLane(LANE_CONSENSUS, concurrency=2, max_queue=2),
+        LANE_RESULTS: IngressLane(LANE_RESULTS, **lane_kwargs),
+    }
+    return IngressController(lanes, ROUTES)
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(rate=2.0, burst=2, now=0.0)
+    assert bucket.take(now=0.0) == 0.0
+    assert bucket.take(now=0.0) == 0.0
+    assert bucket.take(now=0.0) == pytest.approx(0.5)
+    assert bucket.take(now=0.5) == 0.0  # Nạp lại đủ một token sau 0.5s
+
+
+def test_peer_rate_limiter_isolates_sources_and_bounds_memory():
+    limiter = PeerRateLimiter(rate=1.0, burst=1, max_sources=2)
+    assert limiter.acquire("miner-a", now=0.0) == 0.0
+    assert limiter.acquire("miner-a", now=0.0) > 0  # miner-a hết token
+    assert limiter.acquire("miner-b", now=0.0) == 0.0  # Không ảnh hưởng miner-b
+    limiter.acquire("miner-c", now=0.0)
+
+    status = limiter.get_status()
+    assert status["sources"] == 2
+    assert status["limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_lane_answers_429_with_retry_after():
+    ingress = controller(concurrency=1, max_queue=1)
+    release = asyncio.Event()
+
+    async def slow_handler(request):
+        await release.wait()
+        return "ok"
+
+    path = "/v1/miner/submit_result"
+    pending = [
+        asyncio.create_task(ingress.dispatch(fake_request(path, f"m{i}"), slow_handler))
+        for i in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    response = await ingress.dispatch(fake_request(path, "m9"), slow_handler)
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert ingress.lanes[LANE_RESULTS].stats()["depth"] == 2
+
+    # Làn consensus vẫn thông dù làn results đã đầy
+    async def fast_handler(request):
+        return "scores"
+
+    assert (
+        await ingress.dispatch(fake_request("/consensus/receive_scores"), fast_handler)
+        == "scores"
+    )
+
+    release.set()
+    assert await asyncio.gather(*pending) == ["ok", "ok"]
+    stats = ingress.stats()[LANE_RESULTS]
+    assert stats["depth"] == 0
+    assert stats["queue_full"] == 1
+    assert stats["admitted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_noisy_source_is_rate_limited_alone():
+    ingress = controller(
+        concurrency=4, max_queue=4, rate_limiter=PeerRateLimiter(rate=1.0, burst=2)
+    )
+
+    async def handler(request):
+        return "ok"
+
+    path = "/v1/miner/submit_result"
+    assert await ingress.dispatch(fake_request(path, "noisy"), handler) == "ok"
+    assert await ingress.dispatch(fake_request(path, "noisy"), handler) == "ok"
+    response = await ingress.dispatch(fake_request(path, "noisy"), handler)
+    assert response.status_code == 429
+    assert await ingress.dispatch(fake_request(path, "quiet"), handler) == "ok"
+
+    # Endpoint không thuộc làn nào thì đi thẳng
+    assert await ingress.dispatch(fake_request("/health", "noisy"), handler) == "ok"
+    assert ingress.stats()[LANE_RESULTS]["rate_limited"] == 1
@@ -0,0 +1,113 @@
+# tests/network/test_miner_runtime.py
+import asyncio
+
+import httpx
+import pytest
+
+from mt_core.network.http_pool import HttpPool
+from mt_core.network.miner_runtime import MinerRuntime, ResultSender
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_workers_are_fixed():
+    release = asyncio.Event()
+    running = {"now": 0, "peak": 0}
+
+    async def handler(task):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await release.wait()
+        running["now"] -= 1
+
+    runtime = MinerRuntime(handler, max_queue=3, workers=2)
+    assert runtime.submit(0) and runtime.submit(1)
+    await asyncio.sleep(0.01)  # Hai worker nhận task
+    accepted = [runtime.submit(i) for i in range(2, 8)]
+
+    # 2 worker đang chạy + 3 task trong hàng đợi, phần còn lại bị từ chối
+    assert accepted.count(True) == 3
+    stats = runtime.stats()
+    assert (stats["active"], stats["depth"], stats["capacity"]) == (2, 5, 5)
+    assert stats["rejected"] == 3
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert running["peak"] == 2
+    assert runtime.stats()["completed"] == 5
+    assert runtime.stats()["depth"] == 0
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_compute_runs_blocking_work_off_the_loop():
+    runtime = MinerRuntime(lambda task: None, workers=2)
+
+    def blocking(x):
+        import time
+
+        time.sleep(0.05)
+        return x * 2
+
+    async def coroutine(x):
+        return x + 1
+
+    started = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(runtime.compute(blocking, i) for i in range(2)))
+    assert results == [0, 2]
+    assert asyncio.get_running_loop().time() - started < 0.09  # Chạy song song
+    assert await runtime.compute(coroutine, 1) == 2
+    await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_result_sender_retries_transient_failures():
+    calls = {"n": 0}
+
+    async def handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if calls["n"] == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"message": "ok"})
+
+    sender = ResultSender(
+        pool=HttpPool(transport=httpx.MockTransport(handler)), backoff=0.001
+    )
+    response = await sender.post("http://validator:8001/v1/miner/submit_result", {})
+    assert response.status_code == 200
+    assert (sender.sent, sender.retries, sender.failed) == (1, 2, 0)
+
+    # 400 không được gửi lại
+    async def reject(request):
+        return httpx.Response(400, json={"detail": "bad"})
+
+    sender = ResultSender(pool=HttpPool(transport=httpx.MockTransport(reject)))
+    response = await sender.post("http://validator:8001/v1/miner/submit_result", {})
+    assert response.status_code == 400
+    assert (sender.retries, sender.failed) == (0, 1)
+    await sender.aclose()
+
+
+@pytest.mark.asyncio
+async def test_result_sender_caps_retry_after():
+    """Retry-After quá lớn không giữ kết quả lâu hơn max_backoff."""
+    calls = {"n": 0}
+
+    async def handler(request):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(503, headers={"Retry-After": "3600"})
+        return httpx.Response(200, json={"message": "ok"})
+
+    sender = ResultSender(
+        pool=HttpPool(transport=httpx.MockTransport(handler)),
+        backoff=0.001,
+        max_backoff=0.01,
+    )
+    response = await asyncio.wait_for(
+        sender.post("http://validator:8001/v1/miner/submit_result", {}), timeout=1.0
+    )
+    assert response.status_code == 200
+    assert (sender.sent, sender.retries) == (1, 1)
+    await sender.aclose()
@@ -0,0 +1,52 @@
+# tests/network/test_replay_filter.py
+from mt_core.network.replay_filter import BloomFilter, ReplayFilter, replay_key
+
+
+def test_duplicates_are_hits_and_changed_bodies_are_not():
+    replay = ReplayFilter(max_entries=16)
+    key = replay_key("v1", "broadcast_1", b"scores")
+
+    assert not replay.check(key)
+    assert replay.check(key)  # Gửi lại y hệt
+    assert not replay.check(replay_key("v1", "broadcast_1", b"other scores"))
+    assert not replay.check(replay_key("v2", "broadcast_1", b"scores"))
+
+    stats = replay.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 3)
+
+
+def test_forgotten_broadcast_is_processed_again():
+    replay = ReplayFilter(max_entries=16, bloom_capacity=64)
+    key = replay_key("v1", "broadcast_1", b"scores")
+
+    assert not replay.check(key)
+    replay.forget(key)  # Ví dụ: chữ ký sai hoặc lỗi khi xử lý
+    assert not replay.check(key)
+
+
+def test_lru_is_bounded_and_bloom_keeps_evicted_keys():
+    plain = ReplayFilter(max_entries=4)
+    with_bloom = ReplayFilter(max_entries=4, bloom_capacity=1000)
+    keys = [replay_key("v1", f"b{i}", b"x") for i in range(10)]
+    for key in keys:
+        plain.check(key)
+        with_bloom.check(key)
+
+    assert plain.stats()["entries"] == 4
+    assert not plain.check(keys[0])  # Đã bị đẩy khỏi LRU
+    assert with_bloom.check(keys[0])
+    assert with_bloom.stats()["bloom_hits"] == 1
+
+
+def test_bloom_false_positive_rate_and_rotation():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(replay_key("v", f"b{i}", b""))
+    assert all(replay_key("v", f"b{i}", b"") in bloom for i in range(2000))
+    false_positives = sum(replay_key("w", f"b{i}", b"") in bloom for i in range(5000))
+    assert false_positives < 5000 * 0.03
+
+    # Hai thế hệ đầy thì khoá cũ nhất bị quên
+    for i in range(4000):
+        bloom.add(replay_key("u", f"b{i}", b""))
+    assert sum(replay_key("v", f"b{i}", b"") in bloom for i in range(2000)) < 100
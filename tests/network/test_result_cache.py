@@ -0,0 +1,73 @@
+# tests/network/test_result_cache.py
+import asyncio
+import time
+
+import pytest
+
+from mt_core.network.result_cache import ResultCache, task_digest
+from mt_core.network.server import BaseMiner, TaskModel
+
+
+def test_digest_is_canonical_and_requires_all_fields():
+    a = task_digest({"prompt": "p", "seed": 1, "other": 2}, ("prompt", "seed"))
+    b = task_digest({"seed": 1, "prompt": "p"}, ("seed", "prompt"))
+    assert a == b
+    assert a != task_digest({"prompt": "p", "seed": 2}, ("prompt", "seed"))
+    # Thiếu field -> không cache
+    assert task_digest({"prompt": "p"}, ("prompt", "seed")) is None
+
+
+def test_memory_and_disk_tiers_with_eviction_and_ttl(tmp_path):
+    cache = ResultCache(max_memory_bytes=30, cache_dir=str(tmp_path), max_disk_bytes=40)
+    cache.put("k1", {"out": "a" * 10})
+    cache.put("k2", {"out": "b" * 10})
+    # Bộ nhớ chỉ giữ 1 entry 18 byte, k1 bị đẩy xuống chỉ còn trên đĩa
+    assert cache.stats()["memory_entries"] == 1
+    assert cache.get("k1") == {"out": "a" * 10}
+    assert cache.disk_hits == 1
+
+    # Instance mới đọc lại tầng đĩa
+    reopened = ResultCache(cache_dir=str(tmp_path), max_disk_bytes=40)
+    assert reopened.get("k2") == {"out": "b" * 10}
+    reopened.put("k3", {"out": "c" * 10})
+    assert reopened.stats()["disk_entries"] == 2  # Vượt 40 byte -> bỏ entry ít dùng nhất
+
+    expiring = ResultCache(ttl=0.01)
+    expiring.put("k", {"v": 1})
+    time.sleep(0.02)
+    assert expiring.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_tasks_compute_once():
+    cache = ResultCache()
+    calls = {"n": 0}
+
+    async def compute():
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return {"out": 42}
+
+    results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(3)))
+    assert results == [{"out": 42}] * 3
+    assert await cache.get_or_compute("k", compute) == {"out": 42}
+    assert calls["n"] == 1
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["memory_hits"]) == (1, 2, 1)
+    assert stats["hit_rate"] == pytest.approx(0.75)
+
+
+class DeterministicMiner(BaseMiner):
+    deterministic_fields = ("prompt", "seed")
+
+
+def test_miner_cache_key_uses_declared_fields():
+    miner = DeterministicMiner("http://validator:8001", result_cache=ResultCache())
+    task = TaskModel(task_id="t1", description="d", task_data={"prompt": "p", "seed": 7})
+    same = TaskModel(task_id="t2", description="x", task_data={"prompt": "p", "seed": 7})
+    other = TaskModel(task_id="t3", description="d", task_data={"prompt": "p"})
+
+    assert miner.cache_key(task) == miner.cache_key(same)
+    assert miner.cache_key(other) is None
+    # BaseMiner không khai báo field nào thì không bật cache
+    assert BaseMiner("http://validator:8001", result_cache=ResultCache()).result_cache is None
@@ -0,0 +1,200 @@
+# tests/network/test_score_codec.py
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from eth_account import Account
+
+from mt_core.consensus.validator_node_consensus import ValidatorNodeConsensus
+from mt_core.core.datatypes import ValidatorInfo, ValidatorScore
+from mt_core.network.http_pool import HttpPool
+from mt_core.network.score_codec import (
+    ACCEPT_POST_HEADER,
+    FLAG_ZLIB,
+    MAGIC,
+    SCORE_BATCH_CONTENT_TYPE,
+    ScoreBroadcast,
+    ScoreCodecError,
+    accepts_binary_scores,
+    canonical_bytes,
+    decode_score_broadcast,
+    encode_score_broadcast,
+    sign_score_broadcast,
+    verify_score_broadcast,
+)
+
+
+def make_broadcast(count=500, sender="validator_1"):
+    scores = [
+        ValidatorScore(
+            task_id=f"slot_12_batch_{i % 3}_miner_{i % 50}_{1760000000 + i}",
+            miner_uid=f"miner_{i % 50}",
+            validator_uid=sender,
+            score=0.5 + i / 1e4,
+            deviation=0.01 if i % 2 else None,
+            timestamp=1760000000.25 + i,
+        )
+        for i in range(count)
+    ]
+    return ScoreBroadcast(sender, "flexible_broadcast_12_1760000000", 1760000000, scores)
+
+
+def test_round_trip_keeps_every_field():
+    broadcast = make_broadcast()
+    broadcast.scores[0] = broadcast.scores[0].model_copy(
+        update={"task_id": "ab" * 16, "miner_uid": "Miner_Ü"}
+    )
+    decoded, body = decode_score_broadcast(encode_score_broadcast(broadcast))
+
+    assert decoded.scores == broadcast.scores  # Kể cả deviation None và chuỗi Unicode
+    assert (decoded.sender_uid, decoded.broadcast_id, decoded.timestamp) == (
+        broadcast.sender_uid,
+        broadcast.broadcast_id,
+        broadcast.timestamp,
+    )
+    assert body == canonical_bytes(broadcast)
+
+
+def test_binary_is_several_times_smaller_than_json():
+    broadcast = make_broadcast()
+    json_size = len(json.dumps(broadcast.to_json_payload()).encode())
+    plain = encode_score_broadcast(broadcast, compress=False)
+    packed = encode_score_broadcast(broadcast)
+
+    assert packed[len(MAGIC) + 1] & FLAG_ZLIB
+    assert len(plain) * 2 < json_size  # Chỉ nhờ bảng UID và bản ghi cố định
+    assert len(packed) * 5 < json_size
+
+
+def test_signature_covers_canonical_bytes_not_compression():
+    account = Account.create()
+    broadcast = make_broadcast(50)
+    body = canonical_bytes(broadcast)
+    broadcast.signature = sign_score_broadcast(body, account)
+
+    for compress in (True, False):
+        decoded, received_body = decode_score_broadcast(
+            encode_score_broadcast(broadcast, compress=compress)
+        )
+        assert verify_score_broadcast(received_body, decoded.signature, account.address)
+
+    tampered = make_broadcast(50)
+    tampered.scores[3] = tampered.scores[3].model_copy(update={"score": 1.0})
+    assert not verify_score_broadcast(
+        canonical_bytes(tampered), broadcast.signature, account.address
+    )
+    assert not verify_score_broadcast(body, None, account.address)
+
+
+def test_malformed_messages_are_rejected():
+    data = encode_score_broadcast(make_broadcast(20), compress=False)
+    for bad in (b"{}", data[:-5], MAGIC + b"\x09\x00\x00", data + b"\x00"):
+        with pytest.raises(ScoreCodecError):
+            decode_score_broadcast(bad)
+
+
+def test_accept_header_parsing():
+    assert accepts_binary_scores(f"application/json, {SCORE_BATCH_CONTENT_TYPE};q=0.9")
+    assert not accepts_binary_scores("application/json")
+    assert not accepts_binary_scores(None)
+
+
+def make_sender(account=None, binary=True):
+    consensus = ValidatorNodeConsensus.__new__(ValidatorNodeConsensus)
+    consensus.uid_prefix = "[V:validator_1]"
+    consensus._score_wire_cache = None
+    consensus.core = SimpleNamespace(
+        info=SimpleNamespace(uid="validator_1"),
+        settings=SimpleNamespace(CONSENSUS_BINARY_SCORES=binary),
+        account=account,
+        binary_score_peers=set(),
+        http_pool=None,
+    )
+    return consensus
+
+
+def peer_transport(supports_binary):
+    """Peer giả: ghi lại định dạng nhận được, quảng bá binary nếu hỗ trợ."""
+    received = []
+
+    async def handler(request):
+        content_type = request.headers["content-type"]
+        if content_type == SCORE_BATCH_CONTENT_TYPE:
+            if not supports_binary:
+                return httpx.Response(415)
+            received.append(decode_score_broadcast(request.content))
+        else:
+            received.append(json.loads(request.content))
+        headers = {}
+        if supports_binary:
+            headers[ACCEPT_POST_HEADER] = f"{SCORE_BATCH_CONTENT_TYPE}, application/json"
+        return httpx.Response(200, json={"status": "success"}, headers=headers)
+
+    return httpx.MockTransport(handler), received
+
+
+@pytest.mark.asyncio
+async def test_sender_switches_to_binary_after_peer_advertises_it():
+    account = Account.create()
+    sender = make_sender(account)
+    transport, received = peer_transport(supports_binary=True)
+    sender.core.http_pool = HttpPool(transport=transport)
+    peer = ValidatorInfo(uid="validator_2", address="0x0", api_endpoint="http://v2:8002")
+    scores = make_broadcast(30).scores
+
+    assert await sender._send_scores_to_validator_p2p(peer, scores, "b1")
+    assert await sender._send_scores_to_validator_p2p(peer, scores, "b1")
+
+    assert isinstance(received[0], dict)  # Lần đầu: JSON
+    broadcast, body = received[1]  # Sau khi peer quảng bá: binary, có chữ ký
+    assert broadcast.scores == scores
+    assert verify_score_broadcast(body, broadcast.signature, account.address)
+
+
+@pytest.mark.asyncio
+async def test_json_only_peer_keeps_receiving_json():
+    sender = make_sender()
+    transport, received = peer_transport(supports_binary=False)
+    sender.core.http_pool = HttpPool(transport=transport)
+    peer = ValidatorInfo(uid="validator_3", address="0x0", api_endpoint="http://v3:8003")
+    scores = make_broadcast(10).scores
+
+    sender.core.binary_score_peers.add("http://v3:8003/consensus/receive_scores")
+    for _ in range(3):
+        assert await sender._send_scores_to_validator_p2p(peer, scores, "b2")
+
+    assert all(isinstance(message, dict) for message in received)
+    assert not sender.core.binary_score_peers  # 415 xoá peer khỏi danh sách binary
+
+
+@pytest.mark.slow
+def test_benchmark_codec_vs_json():
+    broadcast = make_broadcast(2000)
+    payload = broadcast.to_json_payload()
+    encoded_json = json.dumps(payload).encode()
+    encoded = encode_score_broadcast(broadcast)
+
+    def timed(fn, rounds=20):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        return (time.perf_counter() - started) / rounds
+
+    json_encode = timed(lambda: json.dumps(broadcast.to_json_payload()).encode())
+    binary_encode = timed(lambda: encode_score_broadcast(broadcast))
+    json_decode = timed(
+        lambda: [
+            ValidatorScore(**{k: v for k, v in s.items() if k != "cycle"})
+            for s in json.loads(encoded_json)["scores"]
+        ]
+    )
+    binary_decode = timed(lambda: decode_score_broadcast(encoded))
+    print(
+        f"\nsize json={len(encoded_json)}B binary={len(encoded)}B | "
+        f"encode json={json_encode * 1e3:.2f}ms binary={binary_encode * 1e3:.2f}ms | "
+        f"decode json={json_decode * 1e3:.2f}ms binary={binary_decode * 1e3:.2f}ms"
+    )
+    assert len(encoded) * 5 < len(encoded_json)
+    assert binary_encode < json_encode
@@ -0,0 +1,185 @@
+# tests/network/test_signature_verifier.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+import nacl.signing
+import pytest
+from eth_account import Account
+from eth_keys import keys
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mt_core.consensus.scoring import ScoreSubmissionPayload, canonical_json_serialize
+from mt_core.core.datatypes import ValidatorInfo, ValidatorScore
+from mt_core.network.app.api.v1.endpoints import consensus as consensus_endpoints
+from mt_core.network.score_codec import sign_score_broadcast
+from mt_core.network.signature_verifier import (
+    SCHEME_ED25519,
+    SCHEME_ETH,
+    SignatureVerifier,
+    VerificationRequest,
+    public_key_address,
+)
+
+
+def ed25519_request(key, message, expected_address=None, signature=None):
+    public_key = key.verify_key.encode()
+    return VerificationRequest(
+        scheme=SCHEME_ED25519,
+        message=message,
+        signature=signature or key.sign(message).signature,
+        public_key=public_key,
+        expected_address=expected_address or public_key_address(public_key),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ed25519_checks_signature_and_address():
+    verifier = SignatureVerifier()
+    key, other = nacl.signing.SigningKey.generate(), nacl.signing.SigningKey.generate()
+    message = b'[{"score":0.5}]'
+
+    assert await verifier.verify(ed25519_request(key, message))
+    assert not await verifier.verify(
+        ed25519_request(key, message, signature=other.sign(message).signature)
+    )
+    # Khoá hợp lệ nhưng không khớp địa chỉ đã biết của validator
+    assert not await verifier.verify(
+        ed25519_request(key, message, expected_address=public_key_address(b"x" * 32))
+    )
+    verifier.close()
+
+
+@pytest.mark.asyncio
+async def test_eth_recovery_matches_expected_address():
+    verifier = SignatureVerifier()
+    account = Account.create()
+    body = b"canonical score body"
+    signature = sign_score_broadcast(body, account)
+
+    request = VerificationRequest(SCHEME_ETH, body, signature, expected_address=account.address)
+    assert await verifier.verify(request)
+    assert not await verifier.verify(
+        VerificationRequest(SCHEME_ETH, body + b"!", signature, expected_address=account.address)
+    )
+    assert not await verifier.verify(VerificationRequest(SCHEME_ETH, body, signature))
+    verifier.close()
+
+
+@pytest.mark.asyncio
+async def test_burst_is_batched_and_replays_hit_the_cache():
+    verifier = SignatureVerifier(max_batch=16)
+    keys = [nacl.signing.SigningKey.generate() for _ in range(40)]
+    requests = [ed25519_request(k, f"payload {i}".encode()) for i, k in enumerate(keys)]
+
+    assert all(await verifier.verify_many(requests))
+    assert verifier.stats()["batches"] == 3  # 40 yêu cầu cùng lượt -> 3 lô
+
+    assert all(await verifier.verify_many(requests))  # Phát lại
+    stats = verifier.stats()
+    assert stats["batches"] == 3
+    assert stats["cache_hits"] == 40
+    assert stats["cached_addresses"] == 40
+    verifier.close()
+
+
+@pytest.mark.asyncio
+async def test_verification_does_not_block_the_event_loop():
+    verifier = SignatureVerifier(max_batch=8)
+    account = Account.create()
+    requests = [
+        VerificationRequest(
+            SCHEME_ETH,
+            f"body {i}".encode(),
+            sign_score_broadcast(f"body {i}".encode(), account),
+            expected_address=account.address,
+        )
+        for i in range(40)
+    ]
+
+    ticks = []
+
+    async def ingest_results():
+        # Mô phỏng việc nhận kết quả miner trong lúc xác minh chữ ký
+        while len(ticks) < 1000:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0)
+
+    ingest = asyncio.create_task(ingest_results())
+    results = await verifier.verify_many(requests)
+    ingest.cancel()
+
+    assert all(results)
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    assert max(gaps) < 0.05  # Vòng lặp sự kiện không bị chặn lâu
+    verifier.close()
+
+
+def test_unknown_scheme_is_rejected():
+    verifier = SignatureVerifier()
+    with pytest.raises(ValueError):
+        asyncio.run(verifier.verify(VerificationRequest("rsa", b"m", b"s")))
+
+
+def test_public_key_address_matches_the_account_address():
+    account = Account.create()
+    public_key = keys.PrivateKey(bytes(account.key)).public_key
+    assert public_key_address(public_key.to_bytes()).lower() == account.address.lower()
+    assert public_key_address(b"\x04" + public_key.to_bytes()).lower() == account.address.lower()
+
+
+def signed_score_payload(account, uid, cycle, signer=None):
+    """Payload giống broadcast_scores_logic tạo ra: điểm ValidatorScore ký bằng account."""
+    scores = [
+        ValidatorScore(task_id="task_1", miner_uid="miner_1", validator_uid=uid, score=0.75),
+        ValidatorScore(task_id="task_2", miner_uid="miner_2", validator_uid=uid, score=0.5),
+    ]
+    body = canonical_json_serialize(scores).encode("utf-8")
+    public_key = keys.PrivateKey(bytes(account.key)).public_key.to_bytes()
+    return ScoreSubmissionPayload(
+        submitter_validator_uid=uid,
+        cycle=cycle,
+        scores=scores,
+        signature=sign_score_broadcast(body, signer or account).hex(),
+        public_key_hex=public_key.hex(),
+    ).model_dump()
+
+
+def test_receive_scores_endpoint_accepts_a_signed_payload():
+    account = Account.create()
+    received = []
+
+    async def handle_scores_submission(uid, scores, cycle):
+        received.append((uid, scores, cycle))
+
+    node = SimpleNamespace(
+        info=SimpleNamespace(uid="validator_receiver"),
+        current_cycle=3,
+        validators_info={
+            "validator_sender": ValidatorInfo(uid="validator_sender", address=account.address)
+        },
+        signature_verifier=SignatureVerifier(),
+        handle_scores_submission=handle_scores_submission,
+    )
+    app = FastAPI()
+    app.include_router(consensus_endpoints.router)
+    app.dependency_overrides[consensus_endpoints.get_validator_node] = lambda: node
+    client = TestClient(app)
+
+    response = client.post(
+        "/consensus/receive-scores",
+        json=signed_score_payload(account, "validator_sender", 3),
+    )
+    assert response.status_code == 202
+    assert [(uid, cycle) for uid, _, cycle in received] == [("validator_sender", 3)]
+    assert [s["score"] for s in received[0][1]] == [0.75, 0.5]
+
+    # Ký bằng khoá khác với địa chỉ đã đăng ký thì bị từ chối
+    response = client.post(
+        "/consensus/receive-scores",
+        json=signed_score_payload(account, "validator_sender", 3, signer=Account.create()),
+    )
+    assert response.status_code == 401
+    assert len(received) == 1
+    node.signature_verifier.close()